@@ -0,0 +1,131 @@
+"""
+pytest configuration for the real API integration tests.
+
+The test functions in test_real_api.py also run as a plain script (see its
+main()). Under pytest they get a shared session client and voice IDs from the
+fixtures below. Read-only tests are marked ``readonly`` and can be spread over
+workers with pytest-xdist; everything else is marked ``serial``:
+
+    pytest -n 4 -m readonly custom_test/test_real_api.py
+    pytest -m serial custom_test/test_real_api.py
+
+The discovered preset voice ID is kept in the pytest cache between runs; use
+``--cache-clear`` to look it up again.
+"""
+
+import inspect
+
+import pytest
+
+VOICE_ID_CACHE_KEY = "supertone/preset_voice_id"
+
+READONLY_TESTS = {
+    "test_credit_balance",
+    "test_get_usage",
+    "test_get_voice_usage",
+    "test_list_voices",
+    "test_search_voices",
+    "test_get_voice",
+    "test_list_custom_voices",
+    "test_search_custom_voices",
+    "test_get_custom_voice",
+    "test_predict_duration",
+    "test_predict_duration_with_voice_settings",
+    "test_predict_duration_sona_speech_2",
+    "test_predict_duration_supertonic_api_1",
+    "test_predict_duration_invalid_model",
+    "test_predict_duration_multilang",
+}
+
+# Tests whose voice_id argument is a custom voice rather than a preset one
+CUSTOM_VOICE_TESTS = {"test_get_custom_voice", "test_edit_custom_voice"}
+
+created_voice_key = pytest.StashKey[str]()
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "readonly: read-only API test, safe to parallelize"
+    )
+    config.addinivalue_line("markers", "serial: mutating or credit-consuming API test")
+
+
+def _is_real_api_test(item):
+    return item.module.__name__.rsplit(".", 1)[-1] == "test_real_api"
+
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        if not _is_real_api_test(item):
+            continue
+        if item.originalname in READONLY_TESTS:
+            item.add_marker(pytest.mark.readonly)
+        else:
+            item.add_marker(pytest.mark.serial)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Fail tests that report failure through their (success, result) return value
+
+    Only test_real_api.py uses that convention; other modules keep pytest's
+    default handling.
+    """
+    if not _is_real_api_test(pyfuncitem) or inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+
+    argnames = pyfuncitem._fixtureinfo.argnames
+    result = pyfuncitem.obj(**{arg: pyfuncitem.funcargs[arg] for arg in argnames})
+
+    success, detail = result if isinstance(result, tuple) else (result, None)
+    if success is False:
+        pytest.fail(f"{pyfuncitem.name} reported failure: {detail!r}")
+
+    if pyfuncitem.originalname == "test_create_cloned_voice" and detail is not None:
+        pyfuncitem.config.stash[created_voice_key] = detail.voice_id
+
+    return True
+
+
+@pytest.fixture(scope="session")
+def client():
+    # Imported here rather than at module level: test_real_api.py loads
+    # custom_test/.env and reads the API key when it is imported
+    from test_real_api import open_client
+
+    with open_client() as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def preset_voice_id(client, pytestconfig):
+    voice_id = pytestconfig.cache.get(VOICE_ID_CACHE_KEY, None)
+    if voice_id is None:
+        response = client.voices.list_voices(page_size=10)
+        if not response.items:
+            pytest.skip("No preset voices available")
+        voice_id = response.items[0].voice_id
+        pytestconfig.cache.set(VOICE_ID_CACHE_KEY, voice_id)
+    return voice_id
+
+
+@pytest.fixture(scope="session")
+def custom_voice_id(client):
+    response = client.custom_voices.list_custom_voices(page_size=10)
+    if not response.items:
+        pytest.skip("No custom voices available")
+    return response.items[0].voice_id
+
+
+@pytest.fixture
+def voice_id(request):
+    name = request.node.originalname
+    if name == "test_delete_custom_voice":
+        # Only ever delete the voice created earlier in this session
+        created = request.config.stash.get(created_voice_key, None)
+        if created is None:
+            pytest.skip("No custom voice was created in this session")
+        return created
+    if name in CUSTOM_VOICE_TESTS:
+        return request.getfixturevalue("custom_voice_id")
+    return request.getfixturevalue("preset_voice_id")
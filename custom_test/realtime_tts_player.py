@@ -7,18 +7,9 @@ import sys
 import os
 import asyncio
 import struct
-import wave
-import io
-from threading import Thread, Event
-from queue import Queue
 import time
 import threading
-import numpy as np
-import sounddevice as sd
-from queue import Queue, Empty
-import time
-import struct
-import io
+import logging
 
 # Load environment variables from .env file
 try:
@@ -36,176 +27,261 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 # Real API Key
 API_KEY = os.getenv("SUPERTONE_API_KEY", "your-api-key-here")
 
+# Per-chunk progress output (off by default to keep the receive loop print-free)
+DEBUG = os.getenv("SUPERTONE_PLAYER_DEBUG", "0") == "1"
+
+logger = logging.getLogger(__name__)
+
 try:
     import sounddevice as sd
     import numpy as np
 
     AUDIO_AVAILABLE = True
     print("🔊 sounddevice library available")
-except ImportError:
+except (ImportError, OSError):  # OSError: PortAudio shared library missing
+    sd = None
+    np = None
     AUDIO_AVAILABLE = False
     print("⚠️ sounddevice installation required: pip install sounddevice numpy")
     print("   or brew install portaudio (macOS)")
 
+# PCM -> float32 scale factors (int16 / 32768 and int32 / 2^31 stay within [-1, 1])
+if AUDIO_AVAILABLE:
+    INT16_SCALE = np.float32(1.0 / 32768.0)
+    INT32_SCALE = np.float32(1.0 / 2147483648.0)
+else:
+    INT16_SCALE = INT32_SCALE = None
+
+# WAV "fmt " chunk body at offset 20:
+# audio format, channels, sample rate, byte rate, block align, bits per sample
+_WAV_FMT = struct.Struct("<HHIIHH")
+# RIFF sub-chunk size field
+_U32 = struct.Struct("<I")
+
+# Maximum number of received chunks waiting to be written into the player
+CHUNK_QUEUE_SIZE = 32
+
+# Streaming loops print a progress line every 32 chunks (chunk_count & mask == 0)
+CHUNK_PROGRESS_MASK = 0x1F
+
+
+def _aligned_bytes(nbytes, alignment=64):
+    """Return a zeroed uint8 array whose data pointer is aligned to `alignment` bytes"""
+    raw = np.zeros(nbytes + alignment, dtype=np.uint8)
+    offset = -raw.ctypes.data % alignment
+    return raw[offset : offset + nbytes]
+
 
 class RealTimeAudioPlayer:
     """Real-time audio streaming player - Simple and stable version"""
 
     def __init__(self):
-        self.audio_queue = Queue()
         self.stop_event = threading.Event()
         self.sample_rate = None
         self.channels = None
         self.sample_width = None
         self.is_playing = False
 
-        # Continuous audio stream (simplified)
-        self.audio_stream = io.BytesIO()
-        self.stream_lock = threading.Lock()
-        self.current_position = 0
+        # Preallocated SPSC ring buffer (allocated once the format is known)
+        # _w is only advanced by add_audio_chunk, _r only by the audio callback
+        self.ring_seconds = 2.0
+        self._ring = None
+        self._ring_view = None
+        self._ring_size = 0
+        self._w = 0
+        self._r = 0
+        self._space_available = threading.Event()
+        self._input_done = False
+        self._drained = threading.Event()
+        self._out_buffer = None
+        self._partial_frame = b""
+        self._chunks_written = 0
+        self._bytes_written = 0
+
+        # Format invariants, filled in by _snapshot_format
+        self._sw = None
+        self._ch = None
+        self._bpf = None
+        self._min_fill = 0
+        self._dtype = None
+        self._scale = None
+        self._cb = None
 
         # sounddevice stream
         self.output_stream = None
-        self.feeder_thread = None
+        # ~43ms @ 24kHz; safe now that the callback is lock/alloc-free
+        self.blocksize = 1024
 
         # Simple buffering (noise removal logic removed)
         self.buffer_size = 32768  # Increased from 16384 to 32768 (more stable)
 
-        # Accumulation buffer for small chunk filtering
-        self.chunk_accumulator = bytearray()
-        self.accumulator_lock = threading.Lock()
-        self.min_chunk_size = 4096  # Minimum chunk size (4KB)
-
-    def audio_callback(self, outdata, frames, time, status):
-        """sounddevice callback - Small chunk noise removal version"""
-        if status:
-            print(f"⚠️ Audio status: {status}")
-
-        try:
-            with self.stream_lock:
-                # Read required data from current position
-                self.audio_stream.seek(self.current_position)
-                requested_bytes = frames * self.sample_width * self.channels
-
-                # **Key improvement**: Check minimum buffer size
-                available_bytes = self.audio_stream.seek(0, io.SEEK_END)
-                self.audio_stream.seek(self.current_position)
-                remaining_bytes = available_bytes - self.current_position
+    def _build_raw_callback(self):
+        """Build a RawOutputStream callback that copies int16 PCM straight from the ring"""
+        ring_size = self._ring_size
+        bpf = self._bpf
+        min_fill = self._min_fill
+        ring_read = self._ring_read
+        # Preallocated zero block; slicing the memoryview copies nothing
+        silence = memoryview(bytes(self.blocksize * bpf))
+
+        def audio_callback(outdata, frames, time, status):
+            """sounddevice raw callback - no sample conversion"""
+            if status:
+                print(f"⚠️ Audio status: {status}")
+
+            requested_bytes = frames * bpf
+            filled = 0
+            try:
+                available_bytes = (self._w - self._r) % ring_size
 
                 # Play only when sufficient data is available (key noise solution)
-                min_required = max(
-                    requested_bytes, self.buffer_size // 4
-                )  # At least 1/4 of buffer
-
-                if remaining_bytes < min_required:
-                    # Wait with silence when data is insufficient (prevent noise)
-                    outdata.fill(0)
-                    return
-
-                audio_data = self.audio_stream.read(requested_bytes)
-
-                if len(audio_data) >= requested_bytes:  # **Process only complete data**
-                    # Sample boundary alignment
-                    sample_boundary = (
-                        len(audio_data)
-                        // (self.sample_width * self.channels)
-                        * (self.sample_width * self.channels)
-                    )
-                    if sample_boundary != len(audio_data):
-                        audio_data = audio_data[:sample_boundary]
-
-                    if len(audio_data) == 0:
-                        outdata.fill(0)
-                        return
-
-                    # Type conversion (add clipping to prevent noise)
-                    if self.sample_width == 2:
-                        audio_array = np.frombuffer(audio_data, dtype=np.int16)
-                        # **Add clipping**: Prevent range overflow
-                        audio_array = np.clip(
-                            audio_array.astype(np.float32) / 32768.0, -1.0, 1.0
-                        )
-                    else:
-                        audio_array = np.frombuffer(audio_data, dtype=np.int32)
-                        audio_array = np.clip(
-                            audio_array.astype(np.float32) / 2147483648.0, -1.0, 1.0
-                        )
-
-                    # Channel handling (safer)
-                    if self.channels == 2:
-                        if len(audio_array) % 2 == 0:
-                            audio_array = audio_array.reshape(-1, 2)
-                        else:
-                            # Remove last one if odd samples
-                            audio_array = audio_array[:-1].reshape(-1, 2)
-
-                    # **Output only complete frames**: Wait if partial frame
-                    samples_available = len(audio_array)
-                    if samples_available >= frames:  # **Only complete frames**
-                        if self.channels == 1:
-                            outdata[:frames, 0] = audio_array[:frames]
-                        else:
-                            outdata[:frames] = audio_array[:frames]
-
-                        # Move position by used data
-                        used_bytes = frames * self.sample_width * self.channels
-                        self.current_position += used_bytes
-                    else:
-                        # Wait if incomplete frame (prevent noise)
-                        outdata.fill(0)
-                else:
-                    outdata.fill(0)
+                if available_bytes >= max(requested_bytes, min_fill):
+                    filled = requested_bytes
+                elif self._input_done:
+                    # Input finished: flush the tail, padded with silence
+                    filled = min(available_bytes, requested_bytes)
+                    if filled == available_bytes:
+                        self._drained.set()
 
-        except Exception as e:
-            print(f"⚠️ Callback error: {e}")
-            outdata.fill(0)
-
-    def audio_feeder_worker(self):
-        """Simple audio feeder"""
-        print("🎵 Audio feeder started")
+                if filled:
+                    ring_read(memoryview(outdata)[:filled])
 
-        while not self.stop_event.is_set():
+            except Exception as e:
+                print(f"⚠️ Callback error: {e}")
+                filled = 0
+
+            # Single silence exit (prevents noise when data is insufficient)
+            if filled < requested_bytes:
+                outdata[filled:requested_bytes] = silence[filled:requested_bytes]
+
+        return audio_callback
+
+    def _build_callback(self):
+        """Build a float32 sounddevice callback specialized for the parsed stream format"""
+        # Format invariants are bound once here instead of looked up per block
+        ring_size = self._ring_size
+        ch = self._ch
+        bpf = self._bpf
+        min_fill = self._min_fill
+        dtype = self._dtype
+        scale = self._scale
+        ring_read = self._ring_read
+
+        def audio_callback(outdata, frames, time, status):
+            """sounddevice callback - Small chunk noise removal version"""
+            if status:
+                print(f"⚠️ Audio status: {status}")
+
+            played = False
             try:
-                audio_data = self.audio_queue.get(timeout=0.1)
+                requested_bytes = frames * bpf
+                available_bytes = (self._w - self._r) % ring_size
 
-                if audio_data is None:
-                    break
-
-                if not AUDIO_AVAILABLE:
-                    continue
-
-                # Wait for settings
-                if (
-                    self.sample_rate is None
-                    or self.channels is None
-                    or self.sample_width is None
-                ):
-                    self.audio_queue.put(audio_data)
-                    time.sleep(0.01)
-                    continue
+                # Play only when sufficient data is available (key noise solution)
+                read_bytes = 0
+                if available_bytes >= max(requested_bytes, min_fill):
+                    read_bytes = requested_bytes
+                elif self._input_done:
+                    # Input finished: flush the tail, padded with silence
+                    read_bytes = min(available_bytes, requested_bytes)
+                    if read_bytes == available_bytes:
+                        self._drained.set()
+
+                if read_bytes:
+                    # Copy one frame-aligned block out of the ring
+                    audio_data = self._out_buffer
+                    if audio_data is None or len(audio_data) != requested_bytes:
+                        audio_data = self._out_buffer = _aligned_bytes(requested_bytes)
+                    ring_read(memoryview(audio_data)[:read_bytes])
+                    if read_bytes < requested_bytes:
+                        audio_data[read_bytes:] = 0
+
+                    # Zero-copy [frames, channels] view of the interleaved samples
+                    src = np.ndarray(shape=(frames, ch), dtype=dtype, buffer=audio_data)
+
+                    # Fused cast + scale written straight into the interleaved output
+                    # (|x * scale| <= 1, no clip)
+                    np.multiply(src, scale, out=outdata[:frames], casting="unsafe")
+                    played = True
 
-                if len(audio_data) == 0:
-                    continue
+            except Exception as e:
+                print(f"⚠️ Callback error: {e}")
+                played = False
+
+            # Single silence exit (prevents noise when data is insufficient)
+            if not played:
+                outdata.fill(0)
+
+        return audio_callback
+
+    def _snapshot_format(self):
+        """Cache the stream format once the WAV header is known"""
+        self._sw = self.sample_width
+        self._ch = self.channels
+        self._bpf = self.sample_width * self.channels
+        self._min_fill = self.buffer_size // 4  # At least 1/4 of buffer
+        if self.sample_width == 2:
+            self._dtype, self._scale = np.int16, INT16_SCALE
+        else:
+            self._dtype, self._scale = np.int32, INT32_SCALE
+
+    def _warmup(self):
+        """Preallocate the block buffer and run the conversion once off the RT thread"""
+        self._out_buffer = _aligned_bytes(self.blocksize * self._bpf)
+        src = np.ndarray(
+            shape=(self.blocksize, self._ch), dtype=self._dtype, buffer=self._out_buffer
+        )
+        out = np.empty((self.blocksize, self._ch), dtype=np.float32)
+        np.multiply(src, self._scale, out=out, casting="unsafe")
+
+    def _allocate_ring(self):
+        """Allocate the ring buffer once the stream format is known"""
+        ring_frames = max(int(self.sample_rate * self.ring_seconds), 4 * self.blocksize)
+        self._ring_size = ring_frames * self._bpf
+        self._ring = bytearray(self._ring_size)
+        self._ring_view = memoryview(self._ring)
+        self._w = 0
+        self._r = 0
+
+    def _ring_write(self, data):
+        """Copy data into the ring buffer, waiting while it is full (producer side)"""
+        src = memoryview(data)
+        ring = self._ring_view
+        size = self._ring_size
+
+        while len(src) > 0 and not self.stop_event.is_set():
+            # Clear before checking so a concurrent read cannot be missed
+            self._space_available.clear()
+            w = self._w
+            free = (self._r - w - 1) % size
+            if free == 0:
+                self._space_available.wait(0.1)
+                continue
 
-                # Minimal alignment only
-                if self.sample_width == 2 and len(audio_data) % 2 != 0:
-                    audio_data = audio_data[:-1]
+            n = min(free, len(src))
+            first = min(n, size - w)
+            ring[w : w + first] = src[:first]
+            if n > first:
+                ring[: n - first] = src[first:n]
 
-                if len(audio_data) == 0:
-                    continue
+            # Publish only after the bytes are in place
+            self._w = (w + n) % size
+            src = src[n:]
 
-                # Add to stream immediately (remove complex buffering)
-                with self.stream_lock:
-                    self.audio_stream.seek(0, io.SEEK_END)
-                    self.audio_stream.write(audio_data)
+    def _ring_read(self, dst):
+        """Copy len(dst) bytes out of the ring buffer (consumer side)"""
+        ring = self._ring_view
+        size = self._ring_size
+        n = len(dst)
+        r = self._r
 
-            except Empty:
-                continue
-            except Exception as e:
-                print(f"⚠️ Feeder error: {e}")
-                continue
+        first = min(n, size - r)
+        dst[:first] = ring[r : r + first]
+        if n > first:
+            dst[first:n] = ring[: n - first]
 
-        print("🛑 Audio feeder stopped")
+        self._r = (r + n) % size
+        self._space_available.set()
 
     def start_streaming_playback(self):
         """Start simple sounddevice stream"""
@@ -216,20 +292,48 @@ class RealTimeAudioPlayer:
             print(f"🔊 Simple output stream starting")
             print(f"   Sample rate: {self.sample_rate} Hz, Channels: {self.channels}")
 
-            self.output_stream = sd.OutputStream(
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                callback=self.audio_callback,
-                dtype=np.float32,
-                blocksize=4096,  # Appropriate size
-                latency="high",  # Stability first
-            )
+            self._snapshot_format()
+            self._allocate_ring()
+
+            if self._sw == 2:
+                # int16 PCM is played as-is: bytes in, bytes out
+                self._cb = self._build_raw_callback()
+                self.output_stream = self._open_stream(sd.RawOutputStream, "int16")
+            else:
+                self._cb = self._build_callback()
+                self._warmup()
+                self.output_stream = self._open_stream(sd.OutputStream, np.float32)
 
             self.output_stream.start()
             print("✅ Simple stream started")
 
         except Exception as e:
             print(f"⚠️ Stream start error: {e}")
+            # Nothing will drain the ring, so drop further chunks instead of
+            # blocking the producer once it fills up
+            if self.output_stream is not None:
+                self.output_stream.close()
+                self.output_stream = None
+            self._ring = None
+
+    def _open_stream(self, stream_cls, dtype):
+        """Open the output stream with low latency, falling back to high latency"""
+        for latency in ("low", "high"):
+            try:
+                return stream_cls(
+                    samplerate=self.sample_rate,
+                    channels=self.channels,
+                    callback=self._cb,
+                    dtype=dtype,
+                    blocksize=self.blocksize,
+                    latency=latency,
+                )
+            except sd.PortAudioError as e:
+                if latency == "high":
+                    raise
+                print(
+                    f"⚠️ Low-latency stream rejected ({e}), retrying with high latency"
+                )
 
     def add_audio_chunk(self, chunk_data):
         """Add chunk with small chunk filtering applied"""
@@ -242,36 +346,31 @@ class RealTimeAudioPlayer:
 
             if (
                 len(chunk_data) >= 44
-                and chunk_data[:4] == b"RIFF"
-                and chunk_data[8:12] == b"WAVE"
+                and chunk_data.startswith(b"RIFF")
+                and chunk_data.startswith(b"WAVE", 8)
             ):
                 try:
-                    self.channels = struct.unpack("<H", chunk_data[22:24])[0]
-                    self.sample_rate = struct.unpack("<I", chunk_data[24:28])[0]
-                    self.sample_width = struct.unpack("<H", chunk_data[34:36])[0] // 8
+                    _, channels, sample_rate, _, _, bits = _WAV_FMT.unpack_from(
+                        chunk_data, 20
+                    )
+                    self.channels = channels
+                    self.sample_rate = sample_rate
+                    self.sample_width = bits // 8
 
                     print(
                         f"✅ Header: {self.sample_rate}Hz, {self.channels}ch, {self.sample_width*8}bit"
                     )
 
-                    # Adjust minimum chunk size based on sample rate (0.1 seconds)
-                    self.min_chunk_size = int(
-                        0.1 * self.sample_rate * self.sample_width * self.channels
-                    )
-                    print(f"🎯 Minimum chunk size: {self.min_chunk_size} bytes")
-
-                    # Find data chunk
+                    # Find data chunk (memoryview slices, no copies)
+                    mv = memoryview(chunk_data)
                     pos = 36
-                    audio_data = chunk_data[44:]  # Default
+                    audio_data = mv[44:]  # Default
 
                     while pos < len(chunk_data) - 8:
-                        chunk_id = chunk_data[pos : pos + 4]
-                        chunk_size = struct.unpack("<I", chunk_data[pos + 4 : pos + 8])[
-                            0
-                        ]
+                        chunk_size = _U32.unpack_from(mv, pos + 4)[0]
 
-                        if chunk_id == b"data":
-                            audio_data = chunk_data[pos + 8 :]
+                        if chunk_data.startswith(b"data", pos):
+                            audio_data = mv[pos + 8 :]
                             break
                         pos += 8 + chunk_size
 
@@ -295,75 +394,47 @@ class RealTimeAudioPlayer:
                 self._add_chunk_with_filtering(chunk_data)
 
     def _add_chunk_with_filtering(self, chunk_data):
-        """Small chunk filtering logic"""
-        if len(chunk_data) == 0:
+        """Copy whole frames into the ring buffer, carrying a partial frame over"""
+        if len(chunk_data) == 0 or self._ring is None:
             return
 
-        with self.accumulator_lock:
-            # Add to accumulation buffer
-            self.chunk_accumulator.extend(chunk_data)
+        if self._partial_frame:
+            chunk_data = self._partial_frame + chunk_data
+        aligned = len(chunk_data) - len(chunk_data) % self._bpf
+        self._partial_frame = bytes(chunk_data[aligned:])
 
-            # Detect and log small chunks
-            if len(chunk_data) < 1024:
-                print(
-                    f"🟡 Small chunk accumulated: {len(chunk_data)} bytes → Buffer: {len(self.chunk_accumulator)} bytes"
-                )
-            else:
-                print(
-                    f"📊 Chunk accumulated: {len(chunk_data)} bytes → Buffer: {len(self.chunk_accumulator)} bytes"
-                )
-
-            # Send to playback queue when sufficient size is accumulated
-            while len(self.chunk_accumulator) >= self.min_chunk_size:
-                # Extract stable size
-                stable_chunk = bytes(self.chunk_accumulator[: self.min_chunk_size])
-                self.chunk_accumulator = self.chunk_accumulator[self.min_chunk_size :]
-
-                print(
-                    f"✅ Stable chunk sent to playback queue: {len(stable_chunk)} bytes (Remaining buffer: {len(self.chunk_accumulator)} bytes)"
-                )
-
-                # Add to actual playback queue
-                self.audio_queue.put(stable_chunk)
+        if aligned > 0:
+            self._ring_write(memoryview(chunk_data)[:aligned])
+            self._chunks_written += 1
+            self._bytes_written += aligned
 
     def _set_default_settings(self):
         """Default settings"""
         self.sample_rate = 44100
         self.channels = 1
         self.sample_width = 2
-        self.min_chunk_size = int(
-            0.1 * self.sample_rate * self.sample_width * self.channels
-        )  # 0.1 seconds
         print(f"🎛️ Default settings: {self.sample_rate}Hz, {self.channels}ch")
-        print(f"🎯 Default minimum chunk size: {self.min_chunk_size} bytes")
         self.start_streaming_playback()
 
     def start_player(self):
         """Start player"""
         if not self.is_playing:
             self.stop_event.clear()
-            self.feeder_thread = threading.Thread(
-                target=self.audio_feeder_worker, daemon=True
-            )
-            self.feeder_thread.start()
             self.is_playing = True
 
     def stop_player(self):
-        """Stop player (including remaining buffer processing)"""
+        """Stop player"""
         print("🛑 Stopping player...")
-
-        # Process remaining accumulation buffer
-        with self.accumulator_lock:
-            if len(self.chunk_accumulator) > 0:
-                print(
-                    f"📤 Sending remaining buffer: {len(self.chunk_accumulator)} bytes"
-                )
-                self.audio_queue.put(bytes(self.chunk_accumulator))
-                self.chunk_accumulator.clear()
+        logger.debug(
+            "Ring buffer received %d chunks, %d bytes",
+            self._chunks_written,
+            self._bytes_written,
+        )
 
         self.is_playing = False
         self.stop_event.set()
-        self.audio_queue.put(None)
+        # Wake a producer blocked on a full ring so it sees stop_event at once
+        self._space_available.set()
 
         if self.output_stream:
             try:
@@ -373,27 +444,48 @@ class RealTimeAudioPlayer:
             except:
                 pass
 
-        if self.feeder_thread:
-            self.feeder_thread.join(timeout=2.0)
+    def mark_input_complete(self):
+        """Signal that no more chunks will arrive so the buffered tail can play out"""
+        self._input_done = True
 
     def wait_for_playback_complete(self, timeout=10):
         """Wait for playback completion"""
         print("⏳ Waiting for playback completion...")
-        start_time = time.time()
 
-        while time.time() - start_time < timeout:
-            with self.stream_lock:
-                total_bytes = self.audio_stream.tell()
-                remaining = total_bytes - self.current_position
+        if self.output_stream is None:
+            print("✅ Playback completed")
+            return True
+
+        # Set by the audio callback once the ring is empty after mark_input_complete
+        if self._drained.wait(timeout):
+            print("✅ Playback completed")
+            return True
+
+        print(f"⚠️ Playback did not complete within {timeout:.1f}s")
+        return False
+
 
-                if remaining <= 1024:  # Almost complete
-                    break
+async def _feed_player(player, chunk_queue):
+    """Write received chunks into the player from a worker thread
 
-            time.sleep(0.5)
+    If a write fails, the error is kept and the queue is still drained, so the
+    producer never blocks on a full queue; the error is raised once the end
+    marker arrives.
+    """
+    error = None
+    while True:
+        chunk = await chunk_queue.get()
+        if chunk is None:
+            break
+        if error is not None:
+            continue
+        try:
+            await asyncio.to_thread(player.add_audio_chunk, chunk)
+        except Exception as e:
+            error = e
 
-        # Additional wait (safely)
-        time.sleep(1.0)
-        print("✅ Playback completed")
+    if error is not None:
+        raise error
 
 
 async def streaming_tts_with_realtime_playback(voice_id, text):
@@ -407,6 +499,7 @@ async def streaming_tts_with_realtime_playback(voice_id, text):
         return False
 
     player = RealTimeAudioPlayer()
+    feeder_task = None
 
     try:
         from supertone import Supertone, errors, models
@@ -432,6 +525,10 @@ async def streaming_tts_with_realtime_playback(voice_id, text):
                 print("🎵 Starting audio player...")
                 player.start_player()
 
+                # Bounded hand-off so socket reads and ring writes never block each other
+                chunk_queue = asyncio.Queue(maxsize=CHUNK_QUEUE_SIZE)
+                feeder_task = asyncio.create_task(_feed_player(player, chunk_queue))
+
                 chunk_count = 0
                 total_bytes = 0
                 first_chunk_time = None
@@ -456,23 +553,21 @@ async def streaming_tts_with_realtime_playback(voice_id, text):
                                 f"🎉 First chunk playback started! @ {first_playback_delay:.3f}s"
                             )
 
-                        # Add to playback queue immediately
-                        player.add_audio_chunk(chunk)
+                        # Hand off to the player thread immediately
+                        await chunk_queue.put(chunk)
 
-                        elapsed = current_time - start_time
-
-                        if chunk_count <= 10:
-                            print(
-                                f"📡 Chunk {chunk_count}: {chunk_size} bytes → Playing immediately! @ {elapsed:.3f}s"
-                            )
-                        elif chunk_count == 11:
-                            print("🎵 ... (Real-time playback continuing)")
-                        elif chunk_count % 20 == 0:
-                            print(
-                                f"🎵 Progress: {chunk_count} chunks, {total_bytes} bytes @ {elapsed:.3f}s"
-                            )
-
-                        await asyncio.sleep(0.001)
+                        if DEBUG:
+                            elapsed = current_time - start_time
+                            if chunk_count <= 10:
+                                print(
+                                    f"📡 Chunk {chunk_count}: {chunk_size} bytes → Playing immediately! @ {elapsed:.3f}s"
+                                )
+                            elif chunk_count == 11:
+                                print("🎵 ... (Real-time playback continuing)")
+                            elif (chunk_count & CHUNK_PROGRESS_MASK) == 0:
+                                print(
+                                    f"🎵 Progress: {chunk_count} chunks, {total_bytes} bytes @ {elapsed:.3f}s"
+                                )
 
                 elif hasattr(response.result.iter_bytes, "__call__"):
                     # iter_bytes is callable method (fallback)
@@ -491,23 +586,21 @@ async def streaming_tts_with_realtime_playback(voice_id, text):
                                     f"🎉 First chunk playback started! @ {first_playback_delay:.3f}s"
                                 )
 
-                            # Add to playback queue immediately
-                            player.add_audio_chunk(chunk)
-
-                            elapsed = current_time - start_time
-
-                            if chunk_count <= 10:
-                                print(
-                                    f"📡 Chunk {chunk_count}: {chunk_size} bytes → Playing immediately! @ {elapsed:.3f}s"
-                                )
-                            elif chunk_count == 11:
-                                print("🎵 ... (Real-time playback continuing)")
-                            elif chunk_count % 20 == 0:
-                                print(
-                                    f"🎵 Progress: {chunk_count} chunks, {total_bytes} bytes @ {elapsed:.3f}s"
-                                )
-
-                            await asyncio.sleep(0.001)
+                            # Hand off to the player thread immediately
+                            await chunk_queue.put(chunk)
+
+                            if DEBUG:
+                                elapsed = current_time - start_time
+                                if chunk_count <= 10:
+                                    print(
+                                        f"📡 Chunk {chunk_count}: {chunk_size} bytes → Playing immediately! @ {elapsed:.3f}s"
+                                    )
+                                elif chunk_count == 11:
+                                    print("🎵 ... (Real-time playback continuing)")
+                                elif (chunk_count & CHUNK_PROGRESS_MASK) == 0:
+                                    print(
+                                        f"🎵 Progress: {chunk_count} chunks, {total_bytes} bytes @ {elapsed:.3f}s"
+                                    )
 
                     except TypeError:
                         # Fallback to sync for if async for fails (this case won't occur)
@@ -525,33 +618,36 @@ async def streaming_tts_with_realtime_playback(voice_id, text):
                                     f"🎉 First chunk playback started! @ {first_playback_delay:.3f}s"
                                 )
 
-                            # Add to playback queue immediately
-                            player.add_audio_chunk(chunk)
-
-                            elapsed = current_time - start_time
-
-                            if chunk_count <= 10:
-                                print(
-                                    f"📡 Chunk {chunk_count}: {chunk_size} bytes → Playing immediately! @ {elapsed:.3f}s"
-                                )
-                            elif chunk_count == 11:
-                                print("🎵 ... (Real-time playback continuing)")
-                            elif chunk_count % 20 == 0:
-                                print(
-                                    f"🎵 Progress: {chunk_count} chunks, {total_bytes} bytes @ {elapsed:.3f}s"
-                                )
-
-                            await asyncio.sleep(0.001)
+                            # Hand off to the player thread immediately
+                            await chunk_queue.put(chunk)
+
+                            if DEBUG:
+                                elapsed = current_time - start_time
+                                if chunk_count <= 10:
+                                    print(
+                                        f"📡 Chunk {chunk_count}: {chunk_size} bytes → Playing immediately! @ {elapsed:.3f}s"
+                                    )
+                                elif chunk_count == 11:
+                                    print("🎵 ... (Real-time playback continuing)")
+                                elif (chunk_count & CHUNK_PROGRESS_MASK) == 0:
+                                    print(
+                                        f"🎵 Progress: {chunk_count} chunks, {total_bytes} bytes @ {elapsed:.3f}s"
+                                    )
 
                 total_time = time.time() - start_time
 
+                # Let the player thread drain everything received so far
+                await chunk_queue.put(None)
+                await feeder_task
+
                 print(f"\n📥 Streaming reception completed!")
                 print(f"📊 Total {chunk_count} chunks, {total_bytes} bytes")
                 print(f"⏱️ Total reception time: {total_time:.3f}s")
                 if first_chunk_time:
                     print(f"🚀 Time to first playback: {first_playback_delay:.3f}s")
 
-                # **Simple wait**: Wait for estimated playback time
+                # Wait until the callback drains the ring (estimated time as upper bound)
+                player.mark_input_complete()
                 if player.sample_rate and player.sample_width:
                     estimated_duration = (
                         total_bytes
@@ -561,10 +657,9 @@ async def streaming_tts_with_realtime_playback(voice_id, text):
                     )
                     wait_time = estimated_duration + 2  # 2 seconds margin
                     print(f"🎵 Estimated playback time: {estimated_duration:.1f}s")
-                    print(f"⏳ Waiting {wait_time:.1f}s...")
-                    await asyncio.sleep(wait_time)
                 else:
-                    await asyncio.sleep(5)
+                    wait_time = 5
+                await asyncio.to_thread(player.wait_for_playback_complete, wait_time)
 
                 return True
 
@@ -583,6 +678,8 @@ async def streaming_tts_with_realtime_playback(voice_id, text):
 
     finally:
         # Cleanup player
+        if feeder_task is not None and not feeder_task.done():
+            feeder_task.cancel()
         player.stop_player()
 
 
@@ -670,8 +767,12 @@ def test_audio_playback():
         sample_rate = 24000
         frequency = 440
 
-        t = np.linspace(0, duration, int(sample_rate * duration))
-        tone = 0.3 * np.sin(2 * np.pi * frequency * t)
+        # One float32 allocation; phase, sin and gain are computed in place
+        n = int(sample_rate * duration)
+        tone = np.arange(n, dtype=np.float32)
+        tone *= np.float32(2 * np.pi * frequency / sample_rate)
+        np.sin(tone, out=tone)
+        tone *= np.float32(0.3)
 
         print(f"📡 Playing test tone: {frequency}Hz, {duration}s")
         sd.play(tone, samplerate=sample_rate, blocking=True)
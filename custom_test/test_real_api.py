@@ -5,11 +5,52 @@ Tests all SDK functionality with real Supertone API calls.
 """
 import sys
 import os
+import asyncio
 import json
 import base64
-from datetime import datetime, timedelta
+import binascii
+import contextlib
+import hashlib
+import math
+import queue
+import re
+import struct
+import threading
+from datetime import datetime, timedelta, timezone
+import functools
+import itertools
 import time
 
+import httpx
+import numpy as np
+
+# Optional faster JSON parser for NDJSON responses (pip install orjson).
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so the existing
+# except clauses catch parse errors from either parser.
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+# Optional SIMD base64 decoder for the audio payloads (pip install pybase64).
+# Both decoders take the ASCII str from the JSON response directly, whereas
+# base64.b64decode() first encodes the whole str to bytes.
+try:
+    import pybase64
+
+    decode_audio_base64 = pybase64.b64decode
+except ImportError:
+    decode_audio_base64 = binascii.a2b_base64
+
+# Optional faster event loop for the concurrent read-only phase (pip install uvloop)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
@@ -32,24 +73,311 @@ except ImportError:
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+from supertone import Supertone, errors, models
+from supertone.utils import BackoffStrategy, RetryConfig
+
 # API Key for testing (from environment variable or hardcoded for testing)
 API_KEY = os.getenv("SUPERTONE_API_KEY", "your-api-key-here")
 
+# WAV header sanity check on streamed output; set TEST_VALIDATE_WAV=0 to skip it
+VALIDATE_WAV = os.environ.get("TEST_VALIDATE_WAV", "1") == "1"
+
+# WAV "fmt " chunk body at offset 20:
+# audio format, channels, sample rate, byte rate, block align, bits per sample
+_WAV_FMT = struct.Struct("<HHIIHH")
+
+# RuntimeError messages that come from the auto-chunking/merge logic
+_CHUNK_ERR_RE = re.compile(r"chunk|merge", re.IGNORECASE)
+
+# Korean TTS payloads, built once at import time
+SHORT_KO_TEXT = "안녕하세요! 이것은 SDK 테스트를 위한 한국어 텍스트입니다. 정상적으로 작동하는지 확인해보겠습니다."
+STREAM_KO_TEXT = "안녕하세요! 이것은 스트리밍 TTS 테스트를 위한 한국어 텍스트입니다. 스트리밍 기능이 정상적으로 작동하는지 확인하기 위해 조금 더 긴 텍스트를 사용하고 있습니다."
+
+# Long text over 500 characters
+LONG_KO_TEXT = """
+        안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 자동 청킹 TTS 테스트입니다.
+        새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 처리합니다.
+        실시간 스트리밍 텍스트 음성 변환 기술은 현대 AI 애플리케이션에서 핵심적인 역할을 담당하고 있습니다.
+        특히 대화형 서비스, 라이브 방송, 실시간 번역 서비스 등에서 없어서는 안 될 중요한 기술입니다.
+        자동 청킹 기능을 통해 긴 텍스트도 자연스럽게 여러 개의 작은 세그먼트로 나누어져 처리됩니다.
+        각 세그먼트는 문장 경계와 단어 경계를 고려하여 지능적으로 분할되며, 이를 통해 자연스러운 음성을 생성할 수 있습니다.
+        이제 사용자는 텍스트 길이에 대해 걱정할 필요가 없으며, SDK가 모든 것을 자동으로 처리해줍니다.
+        """.strip()
+LONG_KO_LEN = len(LONG_KO_TEXT)
+
+# Per-test long-text variants (WAV/MP3 streaming, phonemes)
+LONG_KO_STREAM_TEXT = """
+        안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 WAV 스트리밍 TTS 테스트입니다.
+        새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 스트리밍으로 처리합니다.
+        실시간 스트리밍 텍스트 음성 변환 기술은 현대 AI 애플리케이션에서 핵심적인 역할을 담당하고 있습니다.
+        특히 대화형 서비스, 라이브 방송, 실시간 번역 서비스 등에서 없어서는 안 될 중요한 기술입니다.
+        자동 청킹 기능을 통해 긴 텍스트도 자연스럽게 여러 개의 작은 세그먼트로 나누어져 처리됩니다.
+        각 세그먼트는 문장 경계와 단어 경계를 고려하여 지능적으로 분할되며, 이를 통해 자연스러운 음성을 생성할 수 있습니다.
+        스트리밍 방식으로 WAV 형식 처리되기 때문에 사용자는 전체 텍스트의 음성 변환이 완료되기를 기다릴 필요가 없습니다.
+        첫 번째 청크의 음성이 생성되는 즉시 재생을 시작할 수 있어 반응성이 크게 향상됩니다.
+        """.strip()
+LONG_KO_MP3_TEXT = """
+        안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 MP3 자동 청킹 TTS 테스트입니다.
+        새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 처리합니다.
+        실시간 스트리밍 텍스트 음성 변환 기술은 현대 AI 애플리케이션에서 핵심적인 역할을 담당하고 있습니다.
+        특히 대화형 서비스, 라이브 방송, 실시간 번역 서비스 등에서 없어서는 안 될 중요한 기술입니다.
+        자동 청킹 기능을 통해 긴 텍스트도 자연스럽게 여러 개의 작은 세그먼트로 나누어져 처리됩니다.
+        각 세그먼트는 문장 경계와 단어 경계를 고려하여 지능적으로 분할되며, 이를 통해 자연스러운 음성을 생성할 수 있습니다.
+        이제 사용자는 텍스트 길이나 출력 형식에 대해 걱정할 필요가 없으며, SDK가 MP3 형식으로도 모든 것을 자동으로 처리해줍니다.
+        """.strip()
+LONG_KO_MP3_STREAM_TEXT = """
+        안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 MP3 스트리밍 TTS 테스트입니다.
+        새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 스트리밍으로 처리합니다.
+        실시간 스트리밍 텍스트 음성 변환 기술은 현대 AI 애플리케이션에서 핵심적인 역할을 담당하고 있습니다.
+        특히 대화형 서비스, 라이브 방송, 실시간 번역 서비스 등에서 없어서는 안 될 중요한 기술입니다.
+        자동 청킹 기능을 통해 긴 텍스트도 자연스럽게 여러 개의 작은 세그먼트로 나누어져 처리됩니다.
+        각 세그먼트는 문장 경계와 단어 경계를 고려하여 지능적으로 분할되며, 이를 통해 자연스러운 음성을 생성할 수 있습니다.
+        스트리밍 방식으로 MP3 형식 처리되기 때문에 사용자는 전체 텍스트의 음성 변환이 완료되기를 기다릴 필요가 없습니다.
+        첫 번째 청크의 음성이 생성되는 즉시 재생을 시작할 수 있어 반응성이 크게 향상됩니다.
+        """.strip()
+LONG_KO_PHONEME_TEXT = """
+        안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 자동 청킹과 Phoneme 정보를 동시에 테스트합니다.
+        새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 처리하고 각 청크의 Phoneme 정보를 병합합니다.
+        실시간 스트리밍 텍스트 음성 변환 기술은 현대 AI 애플리케이션에서 핵심적인 역할을 담당하고 있습니다.
+        특히 대화형 서비스, 라이브 방송, 실시간 번역 서비스 등에서 없어서는 안 될 중요한 기술입니다.
+        자동 청킹 기능과 Phoneme 병합을 통해 긴 텍스트도 자연스럽게 음성으로 변환할 수 있습니다.
+        """.strip()
+LONG_KO_PHONEME_STREAM_TEXT = """
+        안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 Phoneme + 스트리밍 테스트입니다.
+        현재 SDK는 긴 텍스트를 자동으로 청킹하지만, Phoneme + 스트리밍 조합에서는 제한사항이 있을 수 있습니다.
+        실시간 스트리밍 텍스트 음성 변환 기술은 현대 AI 애플리케이션에서 핵심적인 역할을 담당하고 있습니다.
+        특히 대화형 서비스, 라이브 방송, 실시간 번역 서비스 등에서 없어서는 안 될 중요한 기술입니다.
+        자동 청킹과 Phoneme 병합 기능을 통해 긴 텍스트도 자연스럽게 음성으로 변환하고 정확한 발음 정보를 제공할 수 있습니다.
+        """.strip()
+
+# Preset voice lookups (list, search, get) are cached on disk per API key so
+# re-runs skip the network. Credits, usage and custom voices change during a
+# run and always go to the API. Set SUPERTONE_REFRESH_CACHE=1 to ignore the
+# cache and re-record it.
+CACHE_DIR = os.path.join(os.path.dirname(__file__), ".api_cache")
+REFRESH_CACHE = os.getenv("SUPERTONE_REFRESH_CACHE", "0") == "1"
+CACHEABLE_PATH = "/v1/voices"
+
+# Read size for streamed responses that are only collected, not timed. Tests
+# that measure time-to-first-byte keep httpx's default so the first chunk is
+# yielded as soon as it arrives.
+STREAM_CHUNK_SIZE = 1 << 16
+
+# Streaming loops print a progress line every 32 chunks (chunk_count & mask == 0)
+CHUNK_PROGRESS_MASK = 0x1F
+
+# Connection pool sized for the concurrent read-only phase, and SDK-level
+# retries (429/5XX and connection errors) with exponential backoff
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+RETRY_CONFIG = RetryConfig(
+    "backoff", BackoffStrategy(300, 5000, 1.5, 30000), retry_connection_errors=True
+)
+
+
+class CachingTransport(httpx.BaseTransport):
+    """httpx transport that records preset voice GET responses and replays them"""
+
+    def __init__(self, cache_dir=CACHE_DIR, refresh=REFRESH_CACHE):
+        self._transport = httpx.HTTPTransport(limits=HTTP_LIMITS)
+        self._cache_dir = cache_dir
+        self._refresh = refresh
+
+    @staticmethod
+    def _is_cacheable(request):
+        path = request.url.path
+        return request.method == "GET" and (
+            path == CACHEABLE_PATH or path.startswith(CACHEABLE_PATH + "/")
+        )
+
+    def _cache_path(self, request):
+        key = hashlib.sha256()
+        # Key on the credential too, so responses recorded with one key are
+        # never replayed for another
+        key.update(request.headers.get("x-sup-api-key", "").encode())
+        key.update(b"\0")
+        key.update(request.method.encode())
+        key.update(str(request.url).encode())
+        key.update(request.content)
+        return os.path.join(self._cache_dir, key.hexdigest() + ".json")
+
+    def handle_request(self, request):
+        if not self._is_cacheable(request):
+            return self._transport.handle_request(request)
+
+        path = self._cache_path(request)
+        if not self._refresh and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            return httpx.Response(
+                cached["status_code"],
+                headers=cached["headers"],
+                content=base64.b64decode(cached["content"]),
+                request=request,
+            )
+
+        response = self._transport.handle_request(request)
+        content = b"".join(response.iter_raw())
+        response.close()
+
+        if response.status_code == 200:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "status_code": response.status_code,
+                        "headers": list(response.headers.multi_items()),
+                        "content": base64.b64encode(content).decode("ascii"),
+                    },
+                    f,
+                )
+
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            content=content,
+            request=request,
+        )
+
+    def close(self):
+        self._transport.close()
+
+
+class ChunkLog:
+    """Buffers per-chunk log lines and writes them out at most once per interval
+
+    Lines are stored as a %-format string plus arguments and only formatted
+    when flushed. Set SUPERTONE_CHUNK_LOG=0 to drop them entirely.
+    """
+
+    enabled = os.getenv("SUPERTONE_CHUNK_LOG", "1") != "0"
+
+    def __init__(self, interval=1.0):
+        self._lines = []
+        self._interval = interval
+        self._last_flush = time.monotonic()
+
+    def add(self, fmt, *args):
+        if not self.enabled:
+            return
+        self._lines.append((fmt, args))
+        if time.monotonic() - self._last_flush >= self._interval:
+            self.flush()
+
+    def flush(self):
+        if self._lines:
+            sys.stdout.write("\n".join(fmt % args for fmt, args in self._lines) + "\n")
+            self._lines.clear()
+        self._last_flush = time.monotonic()
+
+
+class BackgroundFileWriter:
+    """Writes streamed chunks to a file on a worker thread
+
+    write() only queues the chunk, so the next network read in a streaming loop
+    overlaps with the disk write of the previous one. close() waits for all
+    queued chunks to be written. bytes_written is the total size once close()
+    has returned, so callers need not count chunk lengths themselves.
+    """
+
+    def __init__(self, path, max_pending=64):
+        self._file = open(path, "wb", buffering=1 << 20)
+        self.bytes_written = 0
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        # Record any failure and keep draining the queue, so write() and close()
+        # never block on a dead worker; the file is closed (and flushed) either way
+        try:
+            while (chunk := self._queue.get()) is not None:
+                if self._error is None:
+                    try:
+                        self.bytes_written += self._file.write(chunk)
+                    except BaseException as e:
+                        self._error = e
+        finally:
+            try:
+                self._file.close()
+            except BaseException as e:
+                if self._error is None:
+                    self._error = e
+
+    def write(self, chunk):
+        self._queue.put(chunk)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+def write_audio_base64(data, path, window=1 << 16):
+    """Decode base64 audio into a file one window at a time
+
+    The window is a multiple of 4 characters, so each slice decodes on its own
+    and only one decoded window is held at once. Returns the number of bytes
+    written and the first decoded window (for header checks).
+    """
+    total = 0
+    first = b""
+    with open(path, "wb", buffering=1 << 20) as f:
+        for start in range(0, len(data), window):
+            decoded = decode_audio_base64(data[start : start + window])
+            if not first:
+                first = decoded
+            total += f.write(decoded)
+    return total, first
+
+
+def dump_json(data, path):
+    """Write data to path as indented UTF-8 JSON, with orjson when installed"""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+@functools.lru_cache(maxsize=1)
+def _utc_at(second):
+    """UTC datetime for a whole epoch second (cached per second)"""
+    return datetime.fromtimestamp(second, timezone.utc)
+
+
+def _utc_now():
+    """Current UTC time at one-second resolution"""
+    return _utc_at(int(time.time()))
 
-def test_credit_balance():
+
+def _rfc3339(dt):
+    """Format an aware UTC datetime as RFC3339 with a Z suffix"""
+    return dt.isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def _top_k_indices(values, k):
+    """Indices of the k largest values, largest first"""
+    if len(values) > k:
+        idx = np.argpartition(-values, k)[:k]
+    else:
+        idx = np.arange(len(values))
+    return idx[np.argsort(-values[idx], kind="stable")]
+
+
+def test_credit_balance(client):
     """Test credit balance retrieval - safest API call"""
     print("💰 Credit Balance Test")
 
     try:
-        from supertone import Supertone, errors
+        print("  🔍 Retrieving credit balance...")
 
-        with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Retrieving credit balance...")
+        response = client.usage.get_credit_balance()
 
-            response = client.usage.get_credit_balance()
-
-            print(f"  ✅ Credit balance: {response.balance}")
-            return True, response
+        print(f"  ✅ Credit balance: {response.balance}")
+        return True, response
 
     except errors.UnauthorizedErrorResponse as e:
         print(f"  ❌ Authentication failed: Invalid API key")
@@ -64,56 +392,57 @@ def test_credit_balance():
         return False, e
 
 
-def test_get_usage():
+def test_get_usage(client):
     """Test usage retrieval (Advanced Usage Analytics)"""
     print("📊 Usage Retrieval Test")
 
     try:
-        from supertone import Supertone, errors
-
         # Query usage for the last 7 days - RFC3339 format
-        end_time = datetime.now()
+        end_time = _utc_now()
         start_time = end_time - timedelta(days=7)
 
-        with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Retrieving usage from {start_time.strftime('%Y-%m-%d')} to {end_time.strftime('%Y-%m-%d')}..."
-            )
-
-            # Using start_time/end_time with RFC3339 format
-            response = client.usage.get_usage(
-                start_time=start_time.isoformat() + "Z",
-                end_time=end_time.isoformat() + "Z",
-            )
-
-            print(f"  ✅ Query successful: {len(response.data)} usage record buckets")
-            print(f"  📊 Total buckets: {response.total}")
+        print(
+            f"  🔍 Retrieving usage from {start_time.strftime('%Y-%m-%d')} to {end_time.strftime('%Y-%m-%d')}..."
+        )
 
-            if response.data:
-                # Show first 3 buckets
-                for bucket in response.data[:3]:
-                    print(f"  📅 Bucket start: {bucket.starting_at}")
-                    print(f"     Bucket end: {bucket.ending_at}")
-                    print(f"     Results count: {len(bucket.results)}")
+        # Using start_time/end_time with RFC3339 format
+        response = client.usage.get_usage(
+            start_time=_rfc3339(start_time),
+            end_time=_rfc3339(end_time),
+        )
 
-                    # Calculate total minutes from results array
-                    total_minutes = sum(
-                        result.minutes_used for result in bucket.results
+        print(f"  ✅ Query successful: {len(response.data)} usage record buckets")
+        print(f"  📊 Total buckets: {response.total}")
+
+        if response.data:
+            # Show first 3 buckets
+            for bucket in response.data[:3]:
+                print(f"  📅 Bucket start: {bucket.starting_at}")
+                print(f"     Bucket end: {bucket.ending_at}")
+                print(f"     Results count: {len(bucket.results)}")
+
+                # Calculate total minutes from results array
+                minutes = np.fromiter(
+                    (result.minutes_used for result in bucket.results),
+                    dtype=np.float64,
+                    count=len(bucket.results),
+                )
+                total_minutes = float(minutes.sum())
+                print(f"     Total usage: {total_minutes:.2f} minutes")
+
+                # Show top 3 voice usages
+                for idx in _top_k_indices(minutes, 3):
+                    result = bucket.results[idx]
+                    voice_info = (
+                        result.voice_name
+                        if result.voice_name
+                        else f"Voice {result.voice_id[:8] if result.voice_id else 'Unknown'}"
                     )
-                    print(f"     Total usage: {total_minutes:.2f} minutes")
-
-                    # Show top 3 voice usages
-                    for result in bucket.results[:3]:
-                        voice_info = (
-                            result.voice_name
-                            if result.voice_name
-                            else f"Voice {result.voice_id[:8] if result.voice_id else 'Unknown'}"
-                        )
-                        print(f"       🎤 {voice_info}: {result.minutes_used:.2f} min")
-            else:
-                print("  📝 No usage records found for this period")
+                    print(f"       🎤 {voice_info}: {result.minutes_used:.2f} min")
+        else:
+            print("  📝 No usage records found for this period")
 
-            return True, response
+        return True, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
@@ -123,42 +452,43 @@ def test_get_usage():
         return False, e
 
 
-def test_get_voice_usage():
+def test_get_voice_usage(client):
     """Test voice-specific usage retrieval"""
     print("🎤 Voice Usage Retrieval Test")
 
     try:
-        from supertone import Supertone, errors
-
         # Query voice usage for the last 7 days
-        end_date = datetime.now()
+        end_date = _utc_now()
         start_date = end_date - timedelta(days=7)
 
-        with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Retrieving voice usage from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}..."
-            )
+        print(
+            f"  🔍 Retrieving voice usage from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}..."
+        )
 
-            response = client.usage.get_voice_usage(
-                start_date=start_date.strftime("%Y-%m-%d"),
-                end_date=end_date.strftime("%Y-%m-%d"),
-            )
+        response = client.usage.get_voice_usage(
+            start_date=start_date.strftime("%Y-%m-%d"),
+            end_date=end_date.strftime("%Y-%m-%d"),
+        )
 
-            print(f"  ✅ Query successful: {len(response.usages)} voice usage records")
+        print(f"  ✅ Query successful: {len(response.usages)} voice usage records")
 
-            if response.usages:
-                for usage in response.usages[:5]:  # Show top 5 voices
-                    voice_name = (
-                        usage.name if usage.name else f"Voice {usage.voice_id[:8]}"
-                    )
-                    print(f"  🎤 {voice_name}: {usage.total_minutes_used:.2f} min")
-                    print(f"     Voice ID: {usage.voice_id}")
-                    if usage.language:
-                        print(f"     Language: {usage.language}")
-            else:
-                print("  📝 No voice usage records found for this period")
+        if response.usages:
+            minutes = np.fromiter(
+                (usage.total_minutes_used for usage in response.usages),
+                dtype=np.float64,
+                count=len(response.usages),
+            )
+            for idx in _top_k_indices(minutes, 5):  # Show top 5 voices
+                usage = response.usages[idx]
+                voice_name = usage.name if usage.name else f"Voice {usage.voice_id[:8]}"
+                print(f"  🎤 {voice_name}: {usage.total_minutes_used:.2f} min")
+                print(f"     Voice ID: {usage.voice_id}")
+                if usage.language:
+                    print(f"     Language: {usage.language}")
+        else:
+            print("  📝 No voice usage records found for this period")
 
-            return True, response
+        return True, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
@@ -168,37 +498,34 @@ def test_get_voice_usage():
         return False, e
 
 
-def test_list_voices():
+def test_list_voices(client):
     """Test voice list retrieval"""
     print("🎵 Voice List Retrieval Test")
 
     try:
-        from supertone import Supertone, errors
+        print("  🔍 Retrieving voice list...")
 
-        with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Retrieving voice list...")
-
-            response = client.voices.list_voices(
-                page_size=10  # API requirement: between 10-100
-            )
+        response = client.voices.list_voices(
+            page_size=10  # API requirement: between 10-100
+        )
 
-            print(f"  ✅ Query successful: {len(response.items)} voices")
-            print(f"  📊 Total voices: {response.total}")
+        print(f"  ✅ Query successful: {len(response.items)} voices")
+        print(f"  📊 Total voices: {response.total}")
 
-            # Display first voice information
-            if response.items:
-                first_voice = response.items[0]
-                print(f"  🎤 First voice:")
-                print(f"     ID: {first_voice.voice_id}")
-                print(f"     Name: {first_voice.name}")
-                print(f"     Description: {first_voice.description[:50]}...")
-                print(f"     Language: {first_voice.language}")
-                print(f"     Gender: {first_voice.gender}")
+        # Display first voice information
+        if response.items:
+            first_voice = response.items[0]
+            print(f"  🎤 First voice:")
+            print(f"     ID: {first_voice.voice_id}")
+            print(f"     Name: {first_voice.name}")
+            print(f"     Description: {first_voice.description[:50]}...")
+            print(f"     Language: {first_voice.language}")
+            print(f"     Gender: {first_voice.gender}")
 
-                return True, (response, first_voice.voice_id)
-            else:
-                print("  ⚠️ Voice list is empty")
-                return True, (response, None)
+            return True, (response, first_voice.voice_id)
+        else:
+            print("  ⚠️ Voice list is empty")
+            return True, (response, None)
 
     except errors.UnauthorizedErrorResponse as e:
         print(f"  ❌ Authentication failed: Invalid API key")
@@ -211,30 +538,27 @@ def test_list_voices():
         return False, e
 
 
-def test_search_voices():
+def test_search_voices(client):
     """Test voice search"""
     print("🔍 Voice Search Test")
 
     try:
-        from supertone import Supertone, errors
-
-        with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Searching for female English voices...")
+        print("  🔍 Searching for female English voices...")
 
-            response = client.voices.search_voices(
-                language="en",
-                gender="female",
-                page_size=10,  # API requirement: between 10-100
-            )
+        response = client.voices.search_voices(
+            language="en",
+            gender="female",
+            page_size=10,  # API requirement: between 10-100
+        )
 
-            print(f"  ✅ Search successful: {len(response.items)} voices")
+        print(f"  ✅ Search successful: {len(response.items)} voices")
 
-            for voice in response.items:
-                print(f"  🎤 {voice.name} ({voice.voice_id})")
-                print(f"     Language: {voice.language}, Gender: {voice.gender}")
-                print(f"     Use case: {voice.use_case}")
+        for voice in response.items:
+            print(f"  🎤 {voice.name} ({voice.voice_id})")
+            print(f"     Language: {voice.language}, Gender: {voice.gender}")
+            print(f"     Use case: {voice.use_case}")
 
-            return True, response
+        return True, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
@@ -244,7 +568,7 @@ def test_search_voices():
         return False, e
 
 
-def test_get_voice(voice_id):
+def test_get_voice(client, voice_id):
     """Test specific voice detail retrieval"""
     print("📄 Voice Detail Retrieval Test")
 
@@ -253,21 +577,18 @@ def test_get_voice(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors
-
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Retrieving voice '{voice_id}' details...")
+        print(f"  🔍 Retrieving voice '{voice_id}' details...")
 
-            response = client.voices.get_voice(voice_id=voice_id)
+        response = client.voices.get_voice(voice_id=voice_id)
 
-            print(f"  ✅ Query successful:")
-            print(f"     Name: {response.name}")
-            print(f"     ID: {response.voice_id}")
-            print(f"     Description: {response.description}")
-            print(f"     Language: {response.language}")
-            print(f"     Gender: {response.gender}")
+        print(f"  ✅ Query successful:")
+        print(f"     Name: {response.name}")
+        print(f"     ID: {response.voice_id}")
+        print(f"     Description: {response.description}")
+        print(f"     Language: {response.language}")
+        print(f"     Gender: {response.gender}")
 
-            return True, response
+        return True, response
 
     except errors.NotFoundErrorResponse as e:
         print(f"  ❌ Voice not found: {voice_id}")
@@ -280,29 +601,26 @@ def test_get_voice(voice_id):
         return False, e
 
 
-def test_list_custom_voices():
+def test_list_custom_voices(client):
     """Test custom voice list retrieval"""
     print("🎨 Custom Voice List Retrieval Test")
 
     try:
-        from supertone import Supertone, errors
-
-        with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Retrieving custom voice list...")
+        print("  🔍 Retrieving custom voice list...")
 
-            response = client.custom_voices.list_custom_voices(page_size=10)
+        response = client.custom_voices.list_custom_voices(page_size=10)
 
-            print(f"  ✅ Query successful: {len(response.items)} custom voices")
-            print(f"  📊 Total custom voices: {response.total}")
+        print(f"  ✅ Query successful: {len(response.items)} custom voices")
+        print(f"  📊 Total custom voices: {response.total}")
 
-            custom_voice_id = None
-            for voice in response.items:
-                print(f"  🎤 {voice.name} ({voice.voice_id})")
-                print(f"     Description: {voice.description}")
-                if custom_voice_id is None:
-                    custom_voice_id = voice.voice_id
+        custom_voice_id = None
+        for voice in response.items:
+            print(f"  🎤 {voice.name} ({voice.voice_id})")
+            print(f"     Description: {voice.description}")
+            if custom_voice_id is None:
+                custom_voice_id = voice.voice_id
 
-            return True, (response, custom_voice_id)
+        return True, (response, custom_voice_id)
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
@@ -312,25 +630,22 @@ def test_list_custom_voices():
         return False, e
 
 
-def test_search_custom_voices():
+def test_search_custom_voices(client):
     """Test custom voice search"""
     print("🔍 Custom Voice Search Test")
 
     try:
-        from supertone import Supertone, errors
+        print("  🔍 Searching custom voices...")
 
-        with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Searching custom voices...")
+        response = client.custom_voices.search_custom_voices(page_size=10)
 
-            response = client.custom_voices.search_custom_voices(page_size=10)
+        print(f"  ✅ Search successful: {len(response.items)} custom voices")
 
-            print(f"  ✅ Search successful: {len(response.items)} custom voices")
+        for voice in response.items:
+            print(f"  🎤 {voice.name} ({voice.voice_id})")
+            print(f"     Description: {voice.description}")
 
-            for voice in response.items:
-                print(f"  🎤 {voice.name} ({voice.voice_id})")
-                print(f"     Description: {voice.description}")
-
-            return True, response
+        return True, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
@@ -340,7 +655,7 @@ def test_search_custom_voices():
         return False, e
 
 
-def test_get_custom_voice(voice_id):
+def test_get_custom_voice(client, voice_id):
     """Test specific custom voice detail retrieval"""
     print("📄 Custom Voice Detail Retrieval Test")
 
@@ -349,19 +664,16 @@ def test_get_custom_voice(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors
+        print(f"  🔍 Retrieving custom voice '{voice_id}' details...")
 
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Retrieving custom voice '{voice_id}' details...")
+        response = client.custom_voices.get_custom_voice(voice_id=voice_id)
 
-            response = client.custom_voices.get_custom_voice(voice_id=voice_id)
+        print(f"  ✅ Query successful:")
+        print(f"     Name: {response.name}")
+        print(f"     ID: {response.voice_id}")
+        print(f"     Description: {response.description}")
 
-            print(f"  ✅ Query successful:")
-            print(f"     Name: {response.name}")
-            print(f"     ID: {response.voice_id}")
-            print(f"     Description: {response.description}")
-
-            return True, response
+        return True, response
 
     except errors.NotFoundErrorResponse as e:
         print(f"  ❌ Custom voice not found: {voice_id}")
@@ -374,19 +686,21 @@ def test_get_custom_voice(voice_id):
         return False, e
 
 
-def test_create_cloned_voice():
+def test_create_cloned_voice(client):
     """Test custom voice creation (using voice_sample.wav file)"""
     print("🎨 Custom Voice Creation Test")
 
     # Check file path
     audio_file_path = "voice_sample.wav"
 
-    if not os.path.exists(audio_file_path):
+    try:
+        file_stat = os.stat(audio_file_path)
+    except FileNotFoundError:
         print(f"  ❌ Audio file not found: {audio_file_path}")
         return False, None
 
     # Check file size (3MB limit)
-    file_size = os.path.getsize(audio_file_path)
+    file_size = file_stat.st_size
     max_size = 3 * 1024 * 1024  # 3MB
 
     print(f"  📏 File size: {file_size:,} bytes ({file_size/1024/1024:.2f} MB)")
@@ -396,43 +710,37 @@ def test_create_cloned_voice():
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        with Supertone(api_key=API_KEY) as client:
-            # Test voice name and description
-            timestamp = datetime.now().strftime("%m%d_%H%M")
-            voice_name = f"Test Sample Voice {timestamp}"
-            voice_description = f"Test custom voice created at {timestamp}"
-
-            print(f"  🔍 Creating custom voice...")
-            print(f"     File: {audio_file_path}")
-            print(f"     Name: {voice_name}")
-            print(f"     Description: {voice_description}")
-            print(
-                "  ⚠️ This test will consume credits and create an actual custom voice!"
+        # Test voice name and description
+        timestamp = time.strftime("%m%d_%H%M")
+        voice_name = f"Test Sample Voice {timestamp}"
+        voice_description = f"Test custom voice created at {timestamp}"
+
+        print(f"  🔍 Creating custom voice...")
+        print(f"     File: {audio_file_path}")
+        print(f"     Name: {voice_name}")
+        print(f"     Description: {voice_description}")
+        print("  ⚠️ This test will consume credits and create an actual custom voice!")
+
+        # Create file upload object; the open handle is streamed by httpx
+        # rather than read into memory first
+        with open(audio_file_path, "rb") as audio_file:
+            files_obj = models.Files(
+                file_name="voice_sample.wav",
+                content=audio_file,
+                content_type="audio/wav",
             )
 
-            # Create file upload object
-            with open(audio_file_path, "rb") as audio_file:
-                audio_content = audio_file.read()
-
-                files_obj = models.Files(
-                    file_name="voice_sample.wav",
-                    content=audio_content,
-                    content_type="audio/wav",
-                )
-
-                response = client.custom_voices.create_cloned_voice(
-                    files=files_obj,
-                    name=voice_name,
-                    description=voice_description,
-                )
+            response = client.custom_voices.create_cloned_voice(
+                files=files_obj,
+                name=voice_name,
+                description=voice_description,
+            )
 
-            print(f"  ✅ Custom voice creation request successful!")
-            print(f"     Voice ID: {response.voice_id}")
-            print(f"     Status: {getattr(response, 'status', 'Unknown')}")
+        print(f"  ✅ Custom voice creation request successful!")
+        print(f"     Voice ID: {response.voice_id}")
+        print(f"     Status: {getattr(response, 'status', 'Unknown')}")
 
-            return True, response
+        return True, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please top up your credits")
@@ -451,7 +759,7 @@ def test_create_cloned_voice():
         return False, e
 
 
-def test_edit_custom_voice(voice_id):
+def test_edit_custom_voice(client, voice_id):
     """Test custom voice information update"""
     print("✏️ Custom Voice Update Test")
 
@@ -460,29 +768,26 @@ def test_edit_custom_voice(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors
-
-        with Supertone(api_key=API_KEY) as client:
-            # New test name and description
-            timestamp = datetime.now().strftime("%H%M%S")
-            test_name = f"Updated Test Voice {timestamp}"
-            test_description = f"Updated description at {timestamp}"
-
-            print(f"  🔄 Updating custom voice '{voice_id}'...")
-            print(f"     New name: {test_name}")
-            print(f"     New description: {test_description}")
-
-            response = client.custom_voices.edit_custom_voice(
-                voice_id=voice_id,
-                name=test_name,
-                description=test_description,
-            )
+        # New test name and description
+        timestamp = time.strftime("%H%M%S")
+        test_name = f"Updated Test Voice {timestamp}"
+        test_description = f"Updated description at {timestamp}"
+
+        print(f"  🔄 Updating custom voice '{voice_id}'...")
+        print(f"     New name: {test_name}")
+        print(f"     New description: {test_description}")
+
+        response = client.custom_voices.edit_custom_voice(
+            voice_id=voice_id,
+            name=test_name,
+            description=test_description,
+        )
 
-            print(f"  ✅ Update successful:")
-            print(f"     Updated name: {response.name}")
-            print(f"     Updated description: {response.description}")
+        print(f"  ✅ Update successful:")
+        print(f"     Updated name: {response.name}")
+        print(f"     Updated description: {response.description}")
 
-            return True, response
+        return True, response
 
     except errors.NotFoundErrorResponse as e:
         print(f"  ❌ Custom voice not found: {voice_id}")
@@ -495,7 +800,7 @@ def test_edit_custom_voice(voice_id):
         return False, e
 
 
-def test_delete_custom_voice(voice_id):
+def test_delete_custom_voice(client, voice_id):
     """Test custom voice deletion"""
     print("🗑️ Custom Voice Deletion Test")
 
@@ -504,20 +809,17 @@ def test_delete_custom_voice(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors
-
         print("  ⚠️ This test will actually delete the custom voice!")
         print("     Use for testing purposes only.")
 
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Deleting custom voice '{voice_id}'...")
+        print(f"  🔍 Deleting custom voice '{voice_id}'...")
 
-            response = client.custom_voices.delete_custom_voice(voice_id=voice_id)
+        response = client.custom_voices.delete_custom_voice(voice_id=voice_id)
 
-            print(f"  ✅ Deletion successful:")
-            print(f"     Response: {response}")
+        print(f"  ✅ Deletion successful:")
+        print(f"     Response: {response}")
 
-            return True, response
+        return True, response
 
     except errors.NotFoundErrorResponse as e:
         print(f"  ❌ Custom voice not found: {voice_id}")
@@ -530,7 +832,7 @@ def test_delete_custom_voice(voice_id):
         return False, e
 
 
-def test_predict_duration(voice_id):
+def test_predict_duration(client, voice_id):
     """Test audio duration prediction - safe test before TTS call"""
     print("⏱️ Audio Duration Prediction Test")
 
@@ -539,21 +841,18 @@ def test_predict_duration(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Predicting duration with voice '{voice_id}'...")
-
-            response = client.text_to_speech.predict_duration(
-                voice_id=voice_id,
-                text="Hello, this is a test message for duration prediction!",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model="sona_speech_1",
-            )
+        print(f"  🔍 Predicting duration with voice '{voice_id}'...")
+
+        response = client.text_to_speech.predict_duration(
+            voice_id=voice_id,
+            text="Hello, this is a test message for duration prediction!",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model="sona_speech_1",
+        )
 
-            print(f"  ✅ Prediction complete: {response} seconds")
-            return True, response
+        print(f"  ✅ Prediction complete: {response} seconds")
+        return True, response
 
     except errors.NotFoundErrorResponse as e:
         print(f"  ❌ Voice not found: {voice_id}")
@@ -566,7 +865,7 @@ def test_predict_duration(voice_id):
         return False, e
 
 
-def test_create_speech(voice_id):
+def test_create_speech(client, voice_id):
     """Test actual TTS conversion - test that consumes credits"""
     print("🎤 TTS Conversion Test (Consumes Credits)")
 
@@ -575,52 +874,46 @@ def test_create_speech(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Converting TTS with voice '{voice_id}'...")
-            print("  ⚠️ This test will consume credits!")
-
-            # Test with approximately 50 Korean characters
-            response = client.text_to_speech.create_speech(
-                voice_id=voice_id,
-                text="안녕하세요! 이것은 SDK 테스트를 위한 한국어 텍스트입니다. 정상적으로 작동하는지 확인해보겠습니다.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=None,
-            )
-
-            # Handle TTS response
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                audio_size = len(audio_data)
-                print(
-                    f"  ✅ TTS conversion successful: {audio_size} bytes audio generated"
-                )
-
-                # Save and validate audio file
-                output_file = "test_create_speech_output.wav"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 Audio file saved: {output_file}")
-
-                # Check file size and WAV header
-                file_size = os.path.getsize(output_file)
-                print(f"  📏 Saved file size: {file_size} bytes")
-
-                with open(output_file, "rb") as f:
-                    header = f.read(12)
-                    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
-                        print(f"  ✅ Valid WAV file generated")
-                    else:
-                        print(f"  ⚠️ WAV header needs verification: {header[:12]}")
+        print(f"  🔍 Converting TTS with voice '{voice_id}'...")
+        print("  ⚠️ This test will consume credits!")
+
+        # Test with approximately 50 Korean characters
+        response = client.text_to_speech.create_speech(
+            voice_id=voice_id,
+            text=SHORT_KO_TEXT,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=None,
+        )
 
-                return True, response
+        # Handle TTS response
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            audio_size = len(audio_data)
+            print(f"  ✅ TTS conversion successful: {audio_size} bytes audio generated")
+
+            # Save and validate audio file
+            output_file = "test_create_speech_output.wav"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 Audio file saved: {output_file}")
+
+            # Check file size and WAV header
+            file_size = len(audio_data)
+            print(f"  📏 Saved file size: {file_size} bytes")
+
+            header = audio_data[:12]
+            if header.startswith(b"RIFF") and header.startswith(b"WAVE", 8):
+                print(f"  ✅ Valid WAV file generated")
             else:
-                print(f"  ❌ Response structure needs verification: {type(response)}")
-                return False, response
+                print(f"  ⚠️ WAV header needs verification: {header[:12]}")
+
+            return True, response
+        else:
+            print(f"  ❌ Response structure needs verification: {type(response)}")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please top up your credits")
@@ -636,7 +929,7 @@ def test_create_speech(voice_id):
         return False, e
 
 
-def test_create_speech_long_text(voice_id):
+def test_create_speech_long_text(client, voice_id):
     """Test auto-chunking TTS conversion for text over 300 characters"""
     print("📜 Auto-Chunking TTS Test for Text Over 300 Characters")
 
@@ -645,98 +938,83 @@ def test_create_speech_long_text(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        # Long text over 500 characters
-        long_text = """
-        안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 자동 청킹 TTS 테스트입니다.
-        새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 처리합니다.
-        실시간 스트리밍 텍스트 음성 변환 기술은 현대 AI 애플리케이션에서 핵심적인 역할을 담당하고 있습니다.
-        특히 대화형 서비스, 라이브 방송, 실시간 번역 서비스 등에서 없어서는 안 될 중요한 기술입니다.
-        자동 청킹 기능을 통해 긴 텍스트도 자연스럽게 여러 개의 작은 세그먼트로 나누어져 처리됩니다.
-        각 세그먼트는 문장 경계와 단어 경계를 고려하여 지능적으로 분할되며, 이를 통해 자연스러운 음성을 생성할 수 있습니다.
-        이제 사용자는 텍스트 길이에 대해 걱정할 필요가 없으며, SDK가 모든 것을 자동으로 처리해줍니다.
-        """.strip()
+        long_text = LONG_KO_TEXT
 
-        actual_length = len(long_text)
+        actual_length = LONG_KO_LEN
         print(f"  📏 Test text length: {actual_length} characters (over 300)")
         print(f"  🔧 Auto-chunking enabled, text will be automatically split")
 
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Converting auto-chunking TTS with voice '{voice_id}'...")
-            print("  ⚠️ This test will consume credits!")
-            print("  ✨ SDK will automatically chunk and process the text")
-
-            response = client.text_to_speech.create_speech(
-                voice_id=voice_id,
-                text=long_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=None,
-            )
+        print(f"  🔍 Converting auto-chunking TTS with voice '{voice_id}'...")
+        print("  ⚠️ This test will consume credits!")
+        print("  ✨ SDK will automatically chunk and process the text")
+
+        response = client.text_to_speech.create_speech(
+            voice_id=voice_id,
+            text=long_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=None,
+        )
 
-            # Handle auto-chunking success
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                audio_size = len(audio_data)
-                print(
-                    f"  ✅ Auto-chunking TTS conversion successful: {audio_size} bytes audio generated"
-                )
-                print(f"  🎯 Long text successfully chunked and processed!")
+        # Handle auto-chunking success
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            audio_size = len(audio_data)
+            print(
+                f"  ✅ Auto-chunking TTS conversion successful: {audio_size} bytes audio generated"
+            )
+            print(f"  🎯 Long text successfully chunked and processed!")
 
-                output_file = "test_auto_chunking_speech_output.wav"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 Auto-chunking audio file saved: {output_file}")
+            output_file = "test_auto_chunking_speech_output.wav"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 Auto-chunking audio file saved: {output_file}")
 
-                # Check file size and WAV header
-                file_size = os.path.getsize(output_file)
-                print(f"  📏 Saved file size: {file_size} bytes")
+            # Check file size and WAV header
+            file_size = len(audio_data)
+            print(f"  📏 Saved file size: {file_size} bytes")
 
-                with open(output_file, "rb") as f:
-                    header = f.read(12)
-                    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
-                        print(f"  ✅ Valid auto-chunking WAV file generated")
-                    else:
-                        print(f"  ⚠️ WAV header needs verification: {header[:12]}")
+            header = audio_data[:12]
+            if header.startswith(b"RIFF") and header.startswith(b"WAVE", 8):
+                print(f"  ✅ Valid auto-chunking WAV file generated")
+            else:
+                print(f"  ⚠️ WAV header needs verification: {header[:12]}")
 
-                # Calculate and display estimated chunk count
-                estimated_chunks = (actual_length + 299) // 300  # Ceiling division
-                print(
-                    f"  📊 Estimated chunk count: {estimated_chunks} (based on text length)"
-                )
-                print(
-                    f"  🔀 Each chunk processed concurrently through parallel processing"
-                )
+            # Calculate and display estimated chunk count
+            estimated_chunks = (actual_length + 299) // 300
+            print(
+                f"  📊 Estimated chunk count: {estimated_chunks} (based on text length)"
+            )
+            print(f"  🔀 Each chunk processed concurrently through parallel processing")
 
-                return True, {
-                    "audio_size": audio_size,
-                    "text_length": actual_length,
-                    "estimated_chunks": estimated_chunks,
-                    "output_file": output_file,
-                }
-            elif hasattr(response, "result") and hasattr(response.result, "content"):
-                # If content attribute exists
-                audio_data = response.result.content
-                audio_size = len(audio_data)
-                print(
-                    f"  ✅ Auto-chunking TTS conversion successful: {audio_size} bytes audio generated"
-                )
+            return True, {
+                "audio_size": audio_size,
+                "text_length": actual_length,
+                "estimated_chunks": estimated_chunks,
+                "output_file": output_file,
+            }
+        elif hasattr(response, "result") and hasattr(response.result, "content"):
+            # If content attribute exists
+            audio_data = response.result.content
+            audio_size = len(audio_data)
+            print(
+                f"  ✅ Auto-chunking TTS conversion successful: {audio_size} bytes audio generated"
+            )
 
-                output_file = "test_auto_chunking_speech_output.wav"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 Auto-chunking audio file saved: {output_file}")
+            output_file = "test_auto_chunking_speech_output.wav"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 Auto-chunking audio file saved: {output_file}")
 
-                return True, {"audio_size": audio_size, "text_length": actual_length}
-            else:
-                print(f"  ❌ Response structure needs verification: {type(response)}")
-                print(
-                    f"  🔍 Response attributes: {[attr for attr in dir(response) if not attr.startswith('_')]}"
-                )
-                return False, response
+            return True, {"audio_size": audio_size, "text_length": actual_length}
+        else:
+            print(f"  ❌ Response structure needs verification: {type(response)}")
+            print(
+                f"  🔍 Response attributes: {', '.join(a for a in dir(response) if not a.startswith('_'))}"
+            )
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please top up your credits")
@@ -746,8 +1024,7 @@ def test_create_speech_long_text(voice_id):
         return False, e
     except RuntimeError as e:
         # Errors that may occur in auto-chunking logic
-        error_message = str(e).lower()
-        if "chunk" in error_message or "merge" in error_message:
+        if _CHUNK_ERR_RE.search(str(e)):
             print(f"  ❌ Error during auto-chunking processing: {e}")
             print("  🔧 Please check the chunking logic")
             return False, e
@@ -766,7 +1043,7 @@ def test_create_speech_long_text(voice_id):
         return False, e
 
 
-def test_stream_speech(voice_id):
+def test_stream_speech(client, voice_id):
     """Test TTS streaming"""
     print("🎵 TTS Streaming Test")
 
@@ -775,102 +1052,114 @@ def test_stream_speech(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔄 Testing streaming TTS with voice '{voice_id}'...")
-            print("  ⚠️ This test may consume credits!")
-
-            # Record request start time
-            request_start_time = time.time()
-
-            response = client.text_to_speech.stream_speech(
-                voice_id=voice_id,
-                text="안녕하세요! 이것은 스트리밍 TTS 테스트를 위한 한국어 텍스트입니다. 스트리밍 기능이 정상적으로 작동하는지 확인하기 위해 조금 더 긴 텍스트를 사용하고 있습니다.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                style="neutral",
-                model="sona_speech_1",
-            )
+        print(f"  🔄 Testing streaming TTS with voice '{voice_id}'...")
+        print("  ⚠️ This test may consume credits!")
+
+        # Record request start time
+        request_start_ns = time.perf_counter_ns()
+
+        response = client.text_to_speech.stream_speech(
+            voice_id=voice_id,
+            text=STREAM_KO_TEXT,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            style="neutral",
+            model="sona_speech_1",
+        )
 
-            # Handle streaming response
-            print("  📡 Receiving streaming data...")
+        # Handle streaming response
+        print("  📡 Receiving streaming data...")
 
-            if hasattr(response, "result") and hasattr(response.result, "iter_bytes"):
-                chunk_count = 0
-                total_bytes = 0
-                audio_chunks = []
-                first_byte_time = None  # Record first byte time
+        if hasattr(response, "result") and hasattr(response.result, "iter_bytes"):
+            chunk_count = 0
+            first_byte_ns = None  # Record first byte time
 
-                try:
-                    for chunk in response.result.iter_bytes():
-                        # Record and display first byte arrival time
-                        if chunk_count == 0:
-                            first_byte_time = time.time()
-                            first_byte_latency = first_byte_time - request_start_time
-                            print(f"  🚀 First byte arrived: {first_byte_latency:.3f}s")
+            # Write chunks straight to disk as they arrive
+            output_file = "test_stream_speech_output.wav"
+            out = BackgroundFileWriter(output_file)
+            header = b""  # First bytes, kept for format validation
 
-                        chunk_count += 1
-                        chunk_size = len(chunk)
-                        total_bytes += chunk_size
-                        audio_chunks.append(chunk)
-
-                        # Detailed log for first 20 chunks only
-                        if chunk_count <= 20:
-                            print(f"     Chunk {chunk_count}: {chunk_size} bytes")
-                        elif chunk_count == 21:
-                            print(f"     ... (more chunks - logs omitted)")
-                        elif chunk_count % 50 == 0:
-                            print(
-                                f"     Chunk {chunk_count}: {chunk_size} bytes (in progress...)"
-                            )
+            chunk_log = ChunkLog()
 
-                except Exception as iter_error:
-                    print(f"  ⚠️ Error during streaming: {str(iter_error)[:100]}...")
+            # Bind per-chunk calls once; the loop runs for every received chunk
+            write_chunk = out.write
+            log_chunk = chunk_log.add
 
-                # Display completion time and statistics
-                end_time = time.time()
-                total_time = end_time - request_start_time
+            try:
+                chunks = iter(response.result.iter_bytes())
 
-                print(
-                    f"  ✅ Streaming complete: {chunk_count} chunks, {total_bytes} bytes"
-                )
-                print(f"  ⏱️ Total elapsed time: {total_time:.3f}s")
+                # Detailed log for first 20 chunks only
+                for chunk in itertools.islice(chunks, 20):
+                    # Record first byte arrival time (reported after the loop)
+                    if chunk_count == 0:
+                        first_byte_ns = time.perf_counter_ns()
 
-                if first_byte_time:
-                    streaming_time = end_time - first_byte_time
-                    print(
-                        f"  📊 Streaming time: {streaming_time:.3f}s (after first byte)"
-                    )
-                    if streaming_time > 0:
-                        throughput = total_bytes / streaming_time
-                        print(f"  🚀 Average throughput: {throughput:.0f} bytes/sec")
+                    chunk_count += 1
+                    write_chunk(chunk)
+                    if len(header) < 12:
+                        header += chunk[: 12 - len(header)]
+                    log_chunk("     Chunk %d: %d bytes", chunk_count, len(chunk))
 
-                # Save received data to file if available
-                if audio_chunks and total_bytes > 0:
-                    output_file = "test_stream_speech_output.wav"
-                    with open(output_file, "wb") as f:
-                        for chunk in audio_chunks:
-                            f.write(chunk)
-                    print(f"  💾 Streaming audio saved: {output_file}")
+                # Remaining chunks: write and count, with a progress line every 32
+                rest = next(chunks, None)
+                if rest is not None:
+                    log_chunk("     ... (more chunks - logs omitted)")
+                    for chunk in itertools.chain((rest,), chunks):
+                        chunk_count += 1
+                        write_chunk(chunk)
+                        if (chunk_count & CHUNK_PROGRESS_MASK) == 0:
+                            log_chunk(
+                                "     Chunk %d: %d bytes (in progress...)",
+                                chunk_count,
+                                len(chunk),
+                            )
 
-                    # Validate file
-                    file_size = os.path.getsize(output_file)
-                    print(f"  📏 Saved file size: {file_size} bytes")
+            except Exception as iter_error:
+                chunk_log.flush()
+                print(f"  ⚠️ Error during streaming: {str(iter_error)[:100]}...")
+            finally:
+                out.close()
+                total_bytes = out.bytes_written
+            chunk_log.flush()
+
+            # Display completion time and statistics
+            end_ns = time.perf_counter_ns()
+            total_time = (end_ns - request_start_ns) / 1e9
+
+            print(f"  ✅ Streaming complete: {chunk_count} chunks, {total_bytes} bytes")
+            print(f"  ⏱️ Total elapsed time: {total_time:.3f}s")
+
+            if first_byte_ns is not None:
+                first_byte_latency = (first_byte_ns - request_start_ns) / 1e9
+                print(f"  🚀 First byte arrived: {first_byte_latency:.3f}s")
+                streaming_time = (end_ns - first_byte_ns) / 1e9
+                print(f"  📊 Streaming time: {streaming_time:.3f}s (after first byte)")
+                if streaming_time > 0:
+                    throughput = total_bytes / streaming_time
+                    print(f"  🚀 Average throughput: {throughput:.0f} bytes/sec")
+
+            # Keep the saved file only if data was received
+            if total_bytes > 0:
+                print(f"  💾 Streaming audio saved: {output_file}")
 
-                    with open(output_file, "rb") as f:
-                        header = f.read(12)
-                        if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
-                            print(f"  ✅ Valid streaming WAV file generated")
-                        else:
-                            print(f"  📄 File header: {header[:12]} (may not be WAV)")
+                # Validate file
+                file_size = total_bytes
+                print(f"  📏 Saved file size: {file_size} bytes")
 
-                    return True, f"{chunk_count} chunks, {total_bytes} bytes"
+                if not VALIDATE_WAV:
+                    print("  ⏭️ WAV header check skipped (TEST_VALIDATE_WAV=0)")
+                elif header.startswith(b"RIFF") and header.startswith(b"WAVE", 8):
+                    print(f"  ✅ Valid streaming WAV file generated")
                 else:
-                    print(f"  ⚠️ No audio data received")
-                    return False, "No audio data received"
+                    print(f"  📄 File header: {header[:12]} (may not be WAV)")
+
+                return True, f"{chunk_count} chunks, {total_bytes} bytes"
             else:
-                print(f"  ❌ Response missing iter_bytes attribute: {type(response)}")
-                return False, response
+                os.remove(output_file)
+                print(f"  ⚠️ No audio data received")
+                return False, "No audio data received"
+        else:
+            print(f"  ❌ Response missing iter_bytes attribute: {type(response)}")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please top up your credits")
@@ -886,7 +1175,7 @@ def test_stream_speech(voice_id):
         return False, e
 
 
-def test_stream_speech_long_text(voice_id):
+def test_stream_speech_long_text(client, voice_id):
     """Test WAV streaming TTS for text over 300 characters (auto-chunking)"""
     print("📜 Long Text WAV Streaming TTS Test (Over 300 Characters, Auto-Chunking)")
 
@@ -895,220 +1184,200 @@ def test_stream_speech_long_text(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         # Long text over 500 characters
-        long_text = """
-        안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 WAV 스트리밍 TTS 테스트입니다.
-        새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 스트리밍으로 처리합니다.
-        실시간 스트리밍 텍스트 음성 변환 기술은 현대 AI 애플리케이션에서 핵심적인 역할을 담당하고 있습니다.
-        특히 대화형 서비스, 라이브 방송, 실시간 번역 서비스 등에서 없어서는 안 될 중요한 기술입니다.
-        자동 청킹 기능을 통해 긴 텍스트도 자연스럽게 여러 개의 작은 세그먼트로 나누어져 처리됩니다.
-        각 세그먼트는 문장 경계와 단어 경계를 고려하여 지능적으로 분할되며, 이를 통해 자연스러운 음성을 생성할 수 있습니다.
-        스트리밍 방식으로 WAV 형식 처리되기 때문에 사용자는 전체 텍스트의 음성 변환이 완료되기를 기다릴 필요가 없습니다.
-        첫 번째 청크의 음성이 생성되는 즉시 재생을 시작할 수 있어 반응성이 크게 향상됩니다.
-        """.strip()
+        long_text = LONG_KO_STREAM_TEXT
 
         actual_length = len(long_text)
         print(f"  📏 Test text length: {actual_length} characters (over 300)")
         print(f"  🔧 Auto-chunking + WAV streaming enabled")
 
-        with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Converting long text WAV streaming TTS with voice '{voice_id}'..."
-            )
-            print("  ⚠️ This test will consume credits with auto-chunking applied!")
-            print("  ✨ SDK will automatically chunk text for WAV streaming")
-
-            # Record request start time
-            request_start_time = time.time()
-
-            response = client.text_to_speech.stream_speech(
-                voice_id=voice_id,
-                text=long_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model="sona_speech_1",
-            )
+        print(f"  🔍 Converting long text WAV streaming TTS with voice '{voice_id}'...")
+        print("  ⚠️ This test will consume credits with auto-chunking applied!")
+        print("  ✨ SDK will automatically chunk text for WAV streaming")
 
-            # Handle WAV streaming response
-            print(f"  🔍 Response type: {type(response)}")
-            print(f"  🔍 Result type: {type(response.result)}")
+        # Record request start time
+        request_start_time = time.time()
 
-            # Handle new JSON format response (chunked case)
-            if hasattr(response, "result") and isinstance(response.result, str):
-                try:
+        response = client.text_to_speech.stream_speech(
+            voice_id=voice_id,
+            text=long_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model="sona_speech_1",
+        )
 
-                    # Parse JSON
-                    result_data = json.loads(response.result)
-                    print(f"  ✅ Detected chunked JSON response")
-                    print(f"  🔍 JSON keys: {list(result_data.keys())}")
+        # Handle WAV streaming response
+        print(f"  🔍 Response type: {type(response)}")
+        print(f"  🔍 Result type: {type(response.result)}")
 
-                    if "audio_base64" in result_data:
-                        # Record first byte time (JSON response processing start)
-                        first_byte_time = time.time()
-                        first_byte_latency = first_byte_time - request_start_time
-                        print(
-                            f"  🚀 First byte arrived: {first_byte_latency:.3f}s (chunked merged response)"
-                        )
+        # Handle new JSON format response (chunked case)
+        if hasattr(response, "result") and isinstance(response.result, str):
+            try:
 
-                        # Decode base64 to extract audio data
-                        audio_data = base64.b64decode(result_data["audio_base64"])
-                        total_bytes = len(audio_data)
+                # Parse JSON
+                result_data = json_loads(response.result)
+                print(f"  ✅ Detected chunked JSON response")
+                print(f"  🔍 JSON keys: {', '.join(result_data)}")
 
-                        print(f"  ✅ Merged WAV audio data: {total_bytes} bytes")
+                if "audio_base64" in result_data:
+                    # Record first byte time (JSON response processing start)
+                    first_byte_time = time.time()
+                    first_byte_latency = first_byte_time - request_start_time
+                    print(
+                        f"  🚀 First byte arrived: {first_byte_latency:.3f}s (chunked merged response)"
+                    )
 
-                        # Display completion time and statistics
-                        end_time = time.time()
-                        total_time = end_time - request_start_time
-                        streaming_time = end_time - first_byte_time
+                    # Decode base64 to extract audio data
+                    audio_data = decode_audio_base64(result_data["audio_base64"])
+                    total_bytes = len(audio_data)
 
-                        print(f"  ⏱️ Total elapsed time: {total_time:.3f}s")
-                        print(
-                            f"  📊 Processing time: {streaming_time:.3f}s (after first byte)"
-                        )
-                        if streaming_time > 0:
-                            throughput = total_bytes / streaming_time
-                            print(
-                                f"  🚀 Average throughput: {throughput:.0f} bytes/sec"
-                            )
+                    print(f"  ✅ Merged WAV audio data: {total_bytes} bytes")
 
-                        # Save file
-                        output_file = "test_stream_speech_long_output.wav"
-                        with open(output_file, "wb") as f:
-                            f.write(audio_data)
-                        print(
-                            f"  💾 Long text WAV streaming audio saved: {output_file}"
-                        )
+                    # Display completion time and statistics
+                    end_time = time.time()
+                    total_time = end_time - request_start_time
+                    streaming_time = end_time - first_byte_time
 
-                        # Validate file
-                        file_size = os.path.getsize(output_file)
-                        print(f"  📏 Saved file size: {file_size} bytes")
+                    print(f"  ⏱️ Total elapsed time: {total_time:.3f}s")
+                    print(
+                        f"  📊 Processing time: {streaming_time:.3f}s (after first byte)"
+                    )
+                    if streaming_time > 0:
+                        throughput = total_bytes / streaming_time
+                        print(f"  🚀 Average throughput: {throughput:.0f} bytes/sec")
 
-                        with open(output_file, "rb") as f:
-                            header = f.read(12)
-                            if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
-                                print(
-                                    f"  ✅ Valid long text WAV streaming file generated"
-                                )
-                            else:
-                                print(
-                                    f"  ⚠️ WAV header needs verification: {header[:12]}"
-                                )
+                    # Save file
+                    output_file = "test_stream_speech_long_output.wav"
+                    with open(output_file, "wb") as f:
+                        f.write(audio_data)
+                    print(f"  💾 Long text WAV streaming audio saved: {output_file}")
 
-                        # Check Phoneme information
-                        if "phonemes" in result_data and result_data["phonemes"]:
-                            phonemes = result_data["phonemes"]
-                            print(f"  🔤 Phoneme information included:")
+                    # Validate file
+                    file_size = len(audio_data)
+                    print(f"  📏 Saved file size: {file_size} bytes")
+
+                    header = audio_data[:12]
+                    if header.startswith(b"RIFF") and header.startswith(b"WAVE", 8):
+                        print(f"  ✅ Valid long text WAV streaming file generated")
+                    else:
+                        print(f"  ⚠️ WAV header needs verification: {header[:12]}")
+
+                    # Check Phoneme information
+                    if "phonemes" in result_data and result_data["phonemes"]:
+                        phonemes = result_data["phonemes"]
+                        print(f"  🔤 Phoneme information included:")
+                        print(f"    - Symbol count: {len(phonemes.get('symbols', []))}")
+                        if phonemes.get("start_times_seconds"):
                             print(
-                                f"    - Symbol count: {len(phonemes.get('symbols', []))}"
+                                f"    - Start times: {len(phonemes['start_times_seconds'])} items"
+                            )
+                        if phonemes.get("durations_seconds"):
+                            print(
+                                f"    - Durations: {len(phonemes['durations_seconds'])} items"
                             )
-                            if phonemes.get("start_times_seconds"):
-                                print(
-                                    f"    - Start times: {len(phonemes['start_times_seconds'])} items"
-                                )
-                            if phonemes.get("durations_seconds"):
-                                print(
-                                    f"    - Durations: {len(phonemes['durations_seconds'])} items"
-                                )
 
-                        # Calculate estimated chunk count
-                        estimated_chunks = (actual_length + 299) // 300
-                        print(
-                            f"  📊 Estimated text chunk count: {estimated_chunks} (based on text length)"
-                        )
-                        print(f"  🔀 Auto-chunked segments merged and processed as WAV")
+                    # Calculate estimated chunk count
+                    estimated_chunks = (actual_length + 299) // 300
+                    print(
+                        f"  📊 Estimated text chunk count: {estimated_chunks} (based on text length)"
+                    )
+                    print(f"  🔀 Auto-chunked segments merged and processed as WAV")
 
-                        return True, {
-                            "total_bytes": total_bytes,
-                            "text_length": actual_length,
-                            "estimated_chunks": estimated_chunks,
-                            "format": "wav",
-                            "has_phonemes": "phonemes" in result_data
-                            and result_data["phonemes"] is not None,
-                            "first_byte_latency": first_byte_latency,
-                            "total_time": total_time,
-                        }
-                    else:
-                        print(f"  ❌ Missing audio_base64 key: {result_data}")
-                        return False, result_data
+                    return True, {
+                        "total_bytes": total_bytes,
+                        "text_length": actual_length,
+                        "estimated_chunks": estimated_chunks,
+                        "format": "wav",
+                        "has_phonemes": "phonemes" in result_data
+                        and result_data["phonemes"] is not None,
+                        "first_byte_latency": first_byte_latency,
+                        "total_time": total_time,
+                    }
+                else:
+                    print(f"  ❌ Missing audio_base64 key: {result_data}")
+                    return False, result_data
 
-                except json.JSONDecodeError as e:
-                    print(f"  ❌ JSON parsing failed: {e}")
-                    return False, e
-                except Exception as e:
-                    print(f"  ❌ Error during response processing: {e}")
-                    return False, e
+            except json.JSONDecodeError as e:
+                print(f"  ❌ JSON parsing failed: {e}")
+                return False, e
+            except Exception as e:
+                print(f"  ❌ Error during response processing: {e}")
+                return False, e
 
-            # Handle existing streaming response (non-chunked case)
-            elif hasattr(response, "result") and hasattr(response.result, "iter_bytes"):
-                chunk_count = 0
-                total_bytes = 0
-                audio_chunks = []
-                first_byte_time = None  # Record first byte time
+        # Handle existing streaming response (non-chunked case)
+        elif hasattr(response, "result") and hasattr(response.result, "iter_bytes"):
+            chunk_count = 0
+            first_byte_time = None  # Record first byte time
 
-                try:
-                    for chunk in response.result.iter_bytes():
-                        # Record and display first byte arrival time (auto-chunking first response)
-                        if chunk_count == 0:
-                            first_byte_time = time.time()
-                            first_byte_latency = first_byte_time - request_start_time
-                            print(
-                                f"  🚀 First byte arrived: {first_byte_latency:.3f}s (auto-chunking)"
-                            )
+            # Write chunks straight to disk as they arrive
+            output_file = "test_stream_speech_long_output.wav"
+            out = BackgroundFileWriter(output_file)
 
-                        chunk_count += 1
-                        chunk_size = len(chunk)
-                        total_bytes += chunk_size
-                        audio_chunks.append(chunk)
+            chunk_log = ChunkLog()
 
-                        if chunk_count <= 10:
-                            print(f"     Chunk {chunk_count}: {chunk_size} bytes")
-                        elif chunk_count % 20 == 0:
-                            print(f"     Progress: {chunk_count} chunks")
+            write_chunk = out.write
+            log_chunk = chunk_log.add
 
-                except Exception as iter_error:
-                    print(f"  ⚠️ Error during WAV streaming: {str(iter_error)[:100]}...")
+            try:
+                for chunk in response.result.iter_bytes():
+                    # Record and display first byte arrival time (auto-chunking first response)
+                    if chunk_count == 0:
+                        first_byte_time = time.time()
+                        first_byte_latency = first_byte_time - request_start_time
+                        print(
+                            f"  🚀 First byte arrived: {first_byte_latency:.3f}s (auto-chunking)"
+                        )
 
-                # Display completion time and statistics
-                end_time = time.time()
-                total_time = end_time - request_start_time
+                    chunk_count += 1
+                    write_chunk(chunk)
 
-                print(
-                    f"  ✅ Long text WAV streaming successful: {chunk_count} chunks, {total_bytes} bytes"
-                )
-                print(f"  ⏱️ Total elapsed time: {total_time:.3f}s")
+                    if chunk_count <= 10:
+                        log_chunk("     Chunk %d: %d bytes", chunk_count, len(chunk))
+                    elif (chunk_count & CHUNK_PROGRESS_MASK) == 0:
+                        log_chunk("     Progress: %d chunks", chunk_count)
 
-                if first_byte_time:
-                    streaming_time = end_time - first_byte_time
-                    print(
-                        f"  📊 Streaming time: {streaming_time:.3f}s (after first byte)"
-                    )
-                    if streaming_time > 0:
-                        throughput = total_bytes / streaming_time
-                        print(f"  🚀 Average throughput: {throughput:.0f} bytes/sec")
-                    print(f"  🔧 Additional processing time due to auto-chunking")
+            except Exception as iter_error:
+                chunk_log.flush()
+                print(f"  ⚠️ Error during WAV streaming: {str(iter_error)[:100]}...")
+            finally:
+                out.close()
+                total_bytes = out.bytes_written
+            chunk_log.flush()
 
-                # Save file
-                if audio_chunks and total_bytes > 0:
-                    output_file = "test_stream_speech_long_output.wav"
-                    with open(output_file, "wb") as f:
-                        for chunk in audio_chunks:
-                            f.write(chunk)
-                    print(f"  💾 Long text WAV streaming audio saved: {output_file}")
+            # Display completion time and statistics
+            end_time = time.time()
+            total_time = end_time - request_start_time
 
-                    # Validate file
-                    file_size = os.path.getsize(output_file)
-                    print(f"  📏 Saved file size: {file_size} bytes")
+            print(
+                f"  ✅ Long text WAV streaming successful: {chunk_count} chunks, {total_bytes} bytes"
+            )
+            print(f"  ⏱️ Total elapsed time: {total_time:.3f}s")
 
-                    return True, output_file
-                else:
-                    print("  ⚠️ No audio data received")
-                    return False, None
+            if first_byte_time:
+                streaming_time = end_time - first_byte_time
+                print(f"  📊 Streaming time: {streaming_time:.3f}s (after first byte)")
+                if streaming_time > 0:
+                    throughput = total_bytes / streaming_time
+                    print(f"  🚀 Average throughput: {throughput:.0f} bytes/sec")
+                print(f"  🔧 Additional processing time due to auto-chunking")
+
+            # Save file
+            if total_bytes > 0:
+                print(f"  💾 Long text WAV streaming audio saved: {output_file}")
+
+                # Validate file
+                file_size = total_bytes
+                print(f"  📏 Saved file size: {file_size} bytes")
+
+                return True, output_file
             else:
-                print("  ⚠️ Streaming interface not found")
+                os.remove(output_file)
+                print("  ⚠️ No audio data received")
                 return False, None
+        else:
+            print("  ⚠️ Streaming interface not found")
+            return False, None
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please top up your credits")
@@ -1118,8 +1387,7 @@ def test_stream_speech_long_text(voice_id):
         return False, e
     except RuntimeError as e:
         # Errors that may occur in auto-chunking logic
-        error_message = str(e).lower()
-        if "chunk" in error_message or "merge" in error_message:
+        if _CHUNK_ERR_RE.search(str(e)):
             print(f"  ❌ Error during WAV streaming auto-chunking: {e}")
             print("  🔧 Please check WAV streaming chunking logic")
             return False, e
@@ -1138,7 +1406,7 @@ def test_stream_speech_long_text(voice_id):
         return False, e
 
 
-def test_create_speech_with_phonemes(voice_id):
+def test_create_speech_with_phonemes(client, voice_id):
     """Test TTS conversion with phoneme information"""
     print("🔤 TTS Conversion Test with Phoneme Information")
 
@@ -1147,72 +1415,67 @@ def test_create_speech_with_phonemes(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Converting TTS with phonemes using voice '{voice_id}'...")
-            print("  ⚠️ This test will consume credits!")
-
-            # TTS conversion with phoneme information
-            response = client.text_to_speech.create_speech(
-                voice_id=voice_id,
-                text="Hello world! This is a phoneme timing test.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=None,
-                include_phonemes=True,  # Include phoneme information
-            )
+        print(f"  🔍 Converting TTS with phonemes using voice '{voice_id}'...")
+        print("  ⚠️ This test will consume credits!")
+
+        # TTS conversion with phoneme information
+        response = client.text_to_speech.create_speech(
+            voice_id=voice_id,
+            text="Hello world! This is a phoneme timing test.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=None,
+            include_phonemes=True,  # Include phoneme information
+        )
 
-            # Handle TTS response with phonemes
-            print(f"  🔍 Response type: {type(response)}")
-            print(
-                f"  🔍 Response fields: {[attr for attr in dir(response) if not attr.startswith('_')]}"
-            )
+        # Handle TTS response with phonemes
+        print(f"  🔍 Response type: {type(response)}")
+        print(
+            f"  🔍 Response fields: {', '.join(a for a in dir(response) if not a.startswith('_'))}"
+        )
 
-            # Analyze response structure
-            if hasattr(response, "result"):
-                print(f"  🔍 Result type: {type(response.result)}")
+        # Analyze response structure
+        if hasattr(response, "result"):
+            print(f"  🔍 Result type: {type(response.result)}")
 
-                # Handle audio data
-                if hasattr(response.result, "read"):
-                    audio_data = response.result.read()
-                    audio_size = len(audio_data)
-                    print(
-                        f"  ✅ TTS conversion with phonemes successful: {audio_size} bytes audio generated"
-                    )
+            # Handle audio data
+            if hasattr(response.result, "read"):
+                audio_data = response.result.read()
+                audio_size = len(audio_data)
+                print(
+                    f"  ✅ TTS conversion with phonemes successful: {audio_size} bytes audio generated"
+                )
 
-                    # Save as audio file
-                    output_file = "test_phoneme_speech_output.wav"
-                    with open(output_file, "wb") as f:
-                        f.write(audio_data)
-                    print(f"  💾 Audio file with phonemes saved: {output_file}")
+                # Save as audio file
+                output_file = "test_phoneme_speech_output.wav"
+                with open(output_file, "wb") as f:
+                    f.write(audio_data)
+                print(f"  💾 Audio file with phonemes saved: {output_file}")
 
-                    # Validate file
-                    file_size = os.path.getsize(output_file)
-                    print(f"  📏 Saved file size: {file_size} bytes")
+                # Validate file
+                file_size = len(audio_data)
+                print(f"  📏 Saved file size: {file_size} bytes")
 
-                    return True, response
-                else:
-                    print(
-                        f"  🔍 Result fields: {[attr for attr in dir(response.result) if not attr.startswith('_')]}"
-                    )
-                    return True, response
-
-            # Check if phoneme data is in a separate field
-            phoneme_fields = [
-                attr for attr in dir(response) if "phoneme" in attr.lower()
-            ]
-            if phoneme_fields:
-                print(f"  🔤 Phoneme-related fields found: {phoneme_fields}")
-                for field in phoneme_fields:
-                    field_value = getattr(response, field)
-                    print(
-                        f"     {field}: {type(field_value)} = {str(field_value)[:100]}..."
-                    )
+                return True, response
+            else:
+                print(
+                    f"  🔍 Result fields: {', '.join(a for a in dir(response.result) if not a.startswith('_'))}"
+                )
+                return True, response
 
-            return True, response
+        # Check if phoneme data is in a separate field
+        phoneme_fields = [attr for attr in dir(response) if "phoneme" in attr.lower()]
+        if phoneme_fields:
+            print(f"  🔤 Phoneme-related fields found: {phoneme_fields}")
+            for field in phoneme_fields:
+                field_value = getattr(response, field)
+                print(
+                    f"     {field}: {type(field_value)} = {str(field_value)[:100]}..."
+                )
+
+        return True, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please top up your credits")
@@ -1228,7 +1491,7 @@ def test_create_speech_with_phonemes(voice_id):
         return False, e
 
 
-def test_stream_speech_with_phonemes(voice_id):
+def test_stream_speech_with_phonemes(client, voice_id):
     """Test streaming TTS with phoneme information"""
     print("🔤 Streaming TTS Test with Phoneme Information")
 
@@ -1237,328 +1500,318 @@ def test_stream_speech_with_phonemes(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
+        print(f"  🔄 Testing streaming TTS with phonemes using voice '{voice_id}'...")
+        print("  ⚠️ This test may consume credits!")
+
+        response = client.text_to_speech.stream_speech(
+            voice_id=voice_id,
+            text="Hello world! This is a phoneme streaming test with timing information.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model="sona_speech_1",
+            include_phonemes=True,  # Include phoneme information
+        )
 
-        with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔄 Testing streaming TTS with phonemes using voice '{voice_id}'..."
-            )
-            print("  ⚠️ This test may consume credits!")
-
-            response = client.text_to_speech.stream_speech(
-                voice_id=voice_id,
-                text="Hello world! This is a phoneme streaming test with timing information.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model="sona_speech_1",
-                include_phonemes=True,  # Include phoneme information
-            )
+        # Analyze streaming response structure
+        print("  📡 Receiving streaming data with phonemes...")
+        print(f"  🔍 Response type: {type(response)}")
+        print(
+            f"  🔍 Result type: {type(response.result) if hasattr(response, 'result') else 'No result'}"
+        )
 
-            # Analyze streaming response structure
-            print("  📡 Receiving streaming data with phonemes...")
-            print(f"  🔍 Response type: {type(response)}")
-            print(
-                f"  🔍 Result type: {type(response.result) if hasattr(response, 'result') else 'No result'}"
-            )
+        # Handle JSON streaming data if result is a string
+        if hasattr(response, "result") and isinstance(response.result, str):
+            print("  📄 Detected JSON streaming response")
+            print(f"  🔍 Response length: {len(response.result)} characters")
+            print(f"  🔍 Response preview: {response.result[:200]}...")
+
+            # Parse JSON chunks
+            json_chunks = []
+            merged_audio = bytearray()  # Decoded audio, grown in place
+            audio_chunk_sizes = []
+
+            # Structure to merge phoneme data from all chunks
+            merged_phonemes = {
+                "symbols": [],
+                "durations_seconds": [],
+                "start_times_seconds": [],
+            }
+            first_chunk_start_time = None  # Record first chunk start time
+            merged_symbols = merged_phonemes["symbols"]
+            merged_durations = merged_phonemes["durations_seconds"]
+            merged_start_times = merged_phonemes["start_times_seconds"]
 
-            # Handle JSON streaming data if result is a string
-            if hasattr(response, "result") and isinstance(response.result, str):
-                print("  📄 Detected JSON streaming response")
-                print(f"  🔍 Response length: {len(response.result)} characters")
-                print(f"  🔍 Response preview: {response.result[:200]}...")
-
-                # Parse JSON chunks
-                json_chunks = []
-                audio_chunks = []
-
-                # Structure to merge phoneme data from all chunks
-                merged_phonemes = {
-                    "symbols": [],
-                    "durations_seconds": [],
-                    "start_times_seconds": [],
-                }
-                first_chunk_start_time = None  # Record first chunk start time
+            # Try to parse each line as JSON
+            lines = response.result.splitlines()
+            print(f"  📊 Found {len(lines)} JSON chunks total")
 
-                # Try to parse each line as JSON
-                lines = response.result.strip().split("\n")
-                print(f"  📊 Found {len(lines)} JSON chunks total")
+            phoneme_chunks_count = 0
+            audio_chunks_count = 0
 
-                phoneme_chunks_count = 0
-                audio_chunks_count = 0
+            for i, line in enumerate(lines):
+                if line:
+                    try:
+                        chunk_data = json_loads(line)
+                        json_chunks.append(chunk_data)
+
+                        # Handle audio data
+                        if chunk_data.get("audio_base64"):
+                            audio_data = decode_audio_base64(chunk_data["audio_base64"])
+                            merged_audio.extend(audio_data)
+                            audio_chunk_sizes.append(len(audio_data))
+                            audio_chunks_count += 1
+                            print(
+                                f"     Chunk {i+1}: {len(audio_data)} bytes audio data"
+                            )
 
-                for i, line in enumerate(lines):
-                    if line.strip():
-                        try:
-                            chunk_data = json.loads(line.strip())
-                            json_chunks.append(chunk_data)
+                        # Handle phoneme data - collect from all chunks
+                        if chunk_data.get("phonemes") and chunk_data["phonemes"]:
+                            chunk_phonemes = chunk_data["phonemes"]
+                            phoneme_chunks_count += 1
+                            print(f"     Chunk {i+1}: Phoneme data found!")
+                            print(
+                                f"       Symbol count: {len(chunk_phonemes.get('symbols', []))}"
+                            )
 
-                            # Handle audio data
-                            if chunk_data.get("audio_base64"):
-                                audio_data = base64.b64decode(
-                                    chunk_data["audio_base64"]
-                                )
-                                audio_chunks.append(audio_data)
-                                audio_chunks_count += 1
+                            # Display original time information
+                            if chunk_phonemes.get("start_times_seconds"):
+                                original_times = chunk_phonemes["start_times_seconds"]
                                 print(
-                                    f"     Chunk {i+1}: {len(audio_data)} bytes audio data"
+                                    f"       Original time range: {original_times[0]:.3f}s ~ {original_times[-1]:.3f}s"
                                 )
-
-                            # Handle phoneme data - collect from all chunks
-                            if chunk_data.get("phonemes") and chunk_data["phonemes"]:
-                                chunk_phonemes = chunk_data["phonemes"]
-                                phoneme_chunks_count += 1
-                                print(f"     Chunk {i+1}: Phoneme data found!")
                                 print(
-                                    f"       Symbol count: {len(chunk_phonemes.get('symbols', []))}"
+                                    f"       Original time count: {len(original_times)} items"
                                 )
 
-                                # Display original time information
-                                if chunk_phonemes.get("start_times_seconds"):
-                                    original_times = chunk_phonemes[
-                                        "start_times_seconds"
-                                    ]
-                                    print(
-                                        f"       Original time range: {original_times[0]:.3f}s ~ {original_times[-1]:.3f}s"
-                                    )
-                                    print(
-                                        f"       Original time count: {len(original_times)} items"
-                                    )
-
-                                if chunk_phonemes.get("durations_seconds"):
-                                    durations = chunk_phonemes["durations_seconds"]
-                                    total_duration = sum(durations)
-                                    print(
-                                        f"       Total duration: {total_duration:.3f}s"
-                                    )
-
-                                # Adjust continuous timing
-                                if chunk_phonemes.get("start_times_seconds"):
-                                    original_start_times = chunk_phonemes[
-                                        "start_times_seconds"
-                                    ]
-
-                                    # Set base time for first phoneme chunk
-                                    if first_chunk_start_time is None:
-                                        first_chunk_start_time = original_start_times[0]
-                                        print(
-                                            f"       First chunk base time: {first_chunk_start_time:.3f}s"
-                                        )
+                            if chunk_phonemes.get("durations_seconds"):
+                                durations = chunk_phonemes["durations_seconds"]
+                                total_duration = math.fsum(durations)
+                                print(f"       Total duration: {total_duration:.3f}s")
 
-                                    # Streaming NDJSON: API already provides continuous time, just adjust base
-                                    adjusted_start_times = [
-                                        t - first_chunk_start_time
-                                        for t in original_start_times
-                                    ]
+                            # Adjust continuous timing
+                            if chunk_phonemes.get("start_times_seconds"):
+                                original_start_times = chunk_phonemes[
+                                    "start_times_seconds"
+                                ]
 
-                                    chunk_phonemes["start_times_seconds"] = (
-                                        adjusted_start_times
-                                    )
+                                # Set base time for first phoneme chunk
+                                if first_chunk_start_time is None:
+                                    first_chunk_start_time = original_start_times[0]
                                     print(
-                                        f"       Time adjusted: {original_start_times[0]:.3f}s → {adjusted_start_times[0]:.3f}s (base: -{first_chunk_start_time:.3f}s)"
+                                        f"       First chunk base time: {first_chunk_start_time:.3f}s"
                                     )
 
-                                # Merge
-                                merged_phonemes["symbols"].extend(
-                                    chunk_phonemes.get("symbols", [])
-                                )
-                                merged_phonemes["durations_seconds"].extend(
-                                    chunk_phonemes.get("durations_seconds", [])
+                                # Streaming NDJSON: API already provides continuous time, just adjust base
+                                adjusted_start_times = (
+                                    np.asarray(original_start_times, dtype=np.float64)
+                                    - first_chunk_start_time
+                                ).tolist()
+
+                                chunk_phonemes["start_times_seconds"] = (
+                                    adjusted_start_times
                                 )
-                                merged_phonemes["start_times_seconds"].extend(
-                                    chunk_phonemes.get("start_times_seconds", [])
+                                print(
+                                    f"       Time adjusted: {original_start_times[0]:.3f}s → {adjusted_start_times[0]:.3f}s (base: -{first_chunk_start_time:.3f}s)"
                                 )
 
-                                # Display chunk duration information (Streaming NDJSON - no offset needed)
-                                if chunk_phonemes.get("durations_seconds"):
-                                    chunk_duration = sum(
-                                        chunk_phonemes["durations_seconds"]
-                                    )
-                                    print(
-                                        f"       Chunk duration: {chunk_duration:.3f}s (Streaming NDJSON)"
-                                    )
-                            else:
-                                print(f"     Chunk {i+1}: No phoneme data")
-
-                        except json.JSONDecodeError as e:
-                            print(
-                                f"     Chunk {i+1}: JSON parsing failed - {str(e)[:50]}..."
+                            # Merge
+                            merged_symbols.extend(chunk_phonemes.get("symbols", ()))
+                            merged_durations.extend(
+                                chunk_phonemes.get("durations_seconds", ())
+                            )
+                            merged_start_times.extend(
+                                chunk_phonemes.get("start_times_seconds", ())
                             )
-                            continue
-
-                # Display statistics
-                print(f"\n  📊 ===== Chunking Statistics =====")
-                print(f"    - Total JSON chunks: {len(json_chunks)}")
-                print(f"    - Audio chunks: {audio_chunks_count}")
-                print(f"    - Phoneme chunks: {phoneme_chunks_count}")
-                print(
-                    f"    - Chunks without phoneme: {len(json_chunks) - phoneme_chunks_count}"
-                )
 
-                # Audio data statistics
-                if audio_chunks:
-                    total_audio_bytes = sum(len(chunk) for chunk in audio_chunks)
-                    print(f"    - Total audio data: {total_audio_bytes} bytes")
-                    for i, chunk in enumerate(audio_chunks):
-                        print(f"      Chunk {i+1}: {len(chunk)} bytes")
+                            # Display chunk duration information (Streaming NDJSON - no offset needed)
+                            if chunk_phonemes.get("durations_seconds"):
+                                chunk_duration = math.fsum(
+                                    chunk_phonemes["durations_seconds"]
+                                )
+                                print(
+                                    f"       Chunk duration: {chunk_duration:.3f}s (Streaming NDJSON)"
+                                )
+                        else:
+                            print(f"     Chunk {i+1}: No phoneme data")
 
-                # Text length information
-                original_text = "Hello world! This is a phoneme streaming test with timing information."
-                print(f"    - Original text length: {len(original_text)} characters")
-                print(f"    - Original text: '{original_text}'")
+                    except json.JSONDecodeError as e:
+                        print(
+                            f"     Chunk {i+1}: JSON parsing failed - {str(e)[:50]}..."
+                        )
+                        continue
 
-                # Use merged phoneme data
-                phoneme_data = merged_phonemes if merged_phonemes["symbols"] else None
+            # Display statistics
+            print(f"\n  📊 ===== Chunking Statistics =====")
+            print(f"    - Total JSON chunks: {len(json_chunks)}")
+            print(f"    - Audio chunks: {audio_chunks_count}")
+            print(f"    - Phoneme chunks: {phoneme_chunks_count}")
+            print(
+                f"    - Chunks without phoneme: {len(json_chunks) - phoneme_chunks_count}"
+            )
 
-                # Display detailed merged phoneme data
-                if phoneme_data:
-                    print(f"  🔤 ===== Merged Phoneme Data Details =====")
-                    symbols = phoneme_data.get("symbols", [])
-                    durations = phoneme_data.get("durations_seconds", [])
-                    start_times = phoneme_data.get("start_times_seconds", [])
+            # Audio data statistics
+            if audio_chunk_sizes:
+                total_audio_bytes = len(merged_audio)
+                print(f"    - Total audio data: {total_audio_bytes} bytes")
+                for i, chunk_size in enumerate(audio_chunk_sizes):
+                    print(f"      Chunk {i+1}: {chunk_size} bytes")
 
-                    print(f"     Symbol count: {len(symbols)}")
-                    print(f"     Duration count: {len(durations)}")
-                    print(f"     Start time count: {len(start_times)}")
+            # Text length information
+            original_text = (
+                "Hello world! This is a phoneme streaming test with timing information."
+            )
+            print(f"    - Original text length: {len(original_text)} characters")
+            print(f"    - Original text: '{original_text}'")
 
-                    if start_times:
-                        print(
-                            f"     Time range: {start_times[0]:.3f}s ~ {start_times[-1]:.3f}s"
-                        )
-                    if durations:
-                        print(f"     Total duration: {sum(durations):.3f}s")
-
-                    # Display first 10 phoneme samples
-                    if len(symbols) > 0:
-                        print(f"\n  🔤 Phoneme samples (first 10):")
-                        for i in range(min(10, len(symbols))):
-                            symbol = symbols[i]
-                            duration = durations[i] if i < len(durations) else "N/A"
-                            start_time = (
-                                start_times[i] if i < len(start_times) else "N/A"
-                            )
-                            print(
-                                f"    [{i+1:2d}] '{symbol}' | {duration}s | start: {start_time}s"
-                            )
+            # Use merged phoneme data
+            phoneme_data = merged_phonemes if merged_phonemes["symbols"] else None
 
-                        if len(symbols) > 10:
-                            print(f"    ... (showing first 10 of {len(symbols)} total)")
+            # Display detailed merged phoneme data
+            if phoneme_data:
+                print(f"  🔤 ===== Merged Phoneme Data Details =====")
+                symbols = phoneme_data.get("symbols", [])
+                durations = phoneme_data.get("durations_seconds", [])
+                start_times = phoneme_data.get("start_times_seconds", [])
 
-                # Merge and save audio data
-                if audio_chunks:
-                    total_audio_data = b"".join(audio_chunks)
-                    total_bytes = len(total_audio_data)
+                print(f"     Symbol count: {len(symbols)}")
+                print(f"     Duration count: {len(durations)}")
+                print(f"     Start time count: {len(start_times)}")
 
+                if start_times:
                     print(
-                        f"  ✅ Streaming with phonemes completed: {len(json_chunks)} JSON chunks, {len(audio_chunks)} audio chunks, {total_bytes} bytes"
+                        f"     Time range: {start_times[0]:.3f}s ~ {start_times[-1]:.3f}s"
                     )
+                if durations:
+                    print(f"     Total duration: {math.fsum(durations):.3f}s")
+
+                # Display first 10 phoneme samples
+                if len(symbols) > 0:
+                    print(f"\n  🔤 Phoneme samples (first 10):")
+                    for i in range(min(10, len(symbols))):
+                        symbol = symbols[i]
+                        duration = durations[i] if i < len(durations) else "N/A"
+                        start_time = start_times[i] if i < len(start_times) else "N/A"
+                        print(
+                            f"    [{i+1:2d}] '{symbol}' | {duration}s | start: {start_time}s"
+                        )
 
-                    # Save as audio file
-                    output_file = "test_phoneme_stream_speech_output.wav"
-                    with open(output_file, "wb") as f:
-                        f.write(total_audio_data)
-                    print(f"  💾 Streaming audio with phonemes saved: {output_file}")
+                    if len(symbols) > 10:
+                        print(f"    ... (showing first 10 of {len(symbols)} total)")
 
-                    # Validate file and calculate audio length
-                    import os
-                    import struct
+            # Merge and save audio data
+            if audio_chunk_sizes:
+                total_audio_data = merged_audio
+                total_bytes = len(total_audio_data)
 
-                    file_size = os.path.getsize(output_file)
-                    print(f"  📏 Saved file size: {file_size} bytes")
+                print(
+                    f"  ✅ Streaming with phonemes completed: {len(json_chunks)} JSON chunks, {len(audio_chunk_sizes)} audio chunks, {total_bytes} bytes"
+                )
 
-                    with open(output_file, "rb") as f:
-                        header = f.read(44)  # Read entire WAV header
-                        if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
-                            print(f"  ✅ Valid WAV file with phonemes generated")
-
-                            # Extract WAV file information
-                            try:
-                                sample_rate = struct.unpack("<I", header[24:28])[0]
-                                byte_rate = struct.unpack("<I", header[28:32])[0]
-                                bits_per_sample = struct.unpack("<H", header[34:36])[0]
-                                channels = struct.unpack("<H", header[22:24])[0]
-                                data_size = file_size - 44  # Data size excluding header
-                                audio_duration = data_size / byte_rate
-
-                                print(f"  🎵 Audio information:")
-                                print(f"    - Sample rate: {sample_rate} Hz")
-                                print(f"    - Channels: {channels}")
-                                print(f"    - Bit depth: {bits_per_sample} bits")
-                                print(f"    - Byte rate: {byte_rate} bytes/sec")
-                                print(f"    - Data size: {data_size} bytes")
-                                print(
-                                    f"    - Actual audio length: {audio_duration:.3f}s"
-                                )
+                # Save as audio file
+                output_file = "test_phoneme_stream_speech_output.wav"
+                with open(output_file, "wb") as f:
+                    f.write(total_audio_data)
+                print(f"  💾 Streaming audio with phonemes saved: {output_file}")
 
-                                # Calculate using alternative method
-                                samples_per_second = sample_rate * channels
-                                bytes_per_sample = bits_per_sample // 8
-                                total_samples = data_size // bytes_per_sample
-                                duration_by_samples = total_samples / samples_per_second
-                                print(
-                                    f"    - Duration by samples: {duration_by_samples:.3f}s"
-                                )
+                # Validate file and calculate audio length
+                file_size = len(total_audio_data)
+                print(f"  📏 Saved file size: {file_size} bytes")
 
-                                # Compare with phoneme time
-                                if phoneme_data and phoneme_data.get(
-                                    "start_times_seconds"
-                                ):
-                                    phoneme_end_time = max(
-                                        phoneme_data["start_times_seconds"]
-                                    )
-                                    if phoneme_data.get("durations_seconds"):
-                                        last_phoneme_duration = phoneme_data[
-                                            "durations_seconds"
-                                        ][-1]
-                                        phoneme_total_time = (
-                                            phoneme_end_time + last_phoneme_duration
-                                        )
-                                    else:
-                                        phoneme_total_time = phoneme_end_time
+                header = total_audio_data[:44]
+                if header.startswith(b"RIFF") and header.startswith(b"WAVE", 8):
+                    print(f"  ✅ Valid WAV file with phonemes generated")
 
-                                    print(
-                                        f"    - Total phoneme time: {phoneme_total_time:.3f}s"
-                                    )
-                                    time_diff = abs(audio_duration - phoneme_total_time)
-                                    print(f"    - Time difference: {time_diff:.3f}s")
+                    # Extract WAV file information
+                    try:
+                        (
+                            _,
+                            channels,
+                            sample_rate,
+                            byte_rate,
+                            _,
+                            bits_per_sample,
+                        ) = _WAV_FMT.unpack_from(header, 20)
+                        data_size = file_size - 44  # Data size excluding header
+                        audio_duration = data_size / byte_rate
+
+                        # Calculate using alternative method
+                        samples_per_second = sample_rate * channels
+                        bytes_per_sample = bits_per_sample // 8
+                        total_samples = data_size // bytes_per_sample
+                        duration_by_samples = total_samples / samples_per_second
+
+                        # One write for the whole block
+                        print(
+                            "\n".join(
+                                [
+                                    "  🎵 Audio information:",
+                                    f"    - Sample rate: {sample_rate} Hz",
+                                    f"    - Channels: {channels}",
+                                    f"    - Bit depth: {bits_per_sample} bits",
+                                    f"    - Byte rate: {byte_rate} bytes/sec",
+                                    f"    - Data size: {data_size} bytes",
+                                    f"    - Actual audio length: {audio_duration:.3f}s",
+                                    f"    - Duration by samples: {duration_by_samples:.3f}s",
+                                ]
+                            )
+                        )
 
-                                    if time_diff > 0.5:
-                                        print(
-                                            f"    ⚠️ Audio and phoneme time mismatch detected!"
-                                        )
+                        # Compare with phoneme time
+                        starts = phoneme_data and phoneme_data.get(
+                            "start_times_seconds"
+                        )
+                        if starts:
+                            # The API's start times run on across chunks and are
+                            # only shifted by one base, so the last is the maximum
+                            phoneme_end_time = starts[-1]
+                            durs = phoneme_data.get("durations_seconds")
+                            phoneme_total_time = phoneme_end_time + (
+                                durs[-1] if durs else 0.0
+                            )
 
-                            except Exception as e:
-                                print(f"    ⚠️ Failed to extract audio information: {e}")
-                        else:
-                            print(f"  📄 File header: {header[:12]} (may not be WAV)")
+                            print(
+                                f"    - Total phoneme time: {phoneme_total_time:.3f}s"
+                            )
+                            time_diff = abs(audio_duration - phoneme_total_time)
+                            print(f"    - Time difference: {time_diff:.3f}s")
 
-                    # Save phoneme data to JSON file
-                    if phoneme_data:
-                        phoneme_file = "test_phoneme_data.json"
-                        with open(phoneme_file, "w") as f:
-                            json.dump(phoneme_data, f, indent=2)
-                        print(f"  💾 Phoneme data saved: {phoneme_file}")
+                            if time_diff > 0.5:
+                                print(
+                                    f"    ⚠️ Audio and phoneme time mismatch detected!"
+                                )
 
-                    return True, {
-                        "json_chunks": len(json_chunks),
-                        "audio_chunks": len(audio_chunks),
-                        "total_bytes": total_bytes,
-                        "phoneme_data": phoneme_data,
-                    }
+                    except Exception as e:
+                        print(f"    ⚠️ Failed to extract audio information: {e}")
                 else:
-                    print("  ⚠️ No audio data")
-                    return False, "No audio data in JSON chunks"
+                    print(f"  📄 File header: {header[:12]} (may not be WAV)")
 
-            # Legacy binary streaming handling (fallback)
-            elif hasattr(response, "result") and hasattr(response.result, "iter_bytes"):
-                print("  📄 Binary streaming response detected")
-                # ... legacy binary processing code ...
-                return False, "Binary streaming not implemented for phonemes"
+                # Save phoneme data to JSON file
+                if phoneme_data:
+                    phoneme_file = "test_phoneme_data.json"
+                    dump_json(phoneme_data, phoneme_file)
+                    print(f"  💾 Phoneme data saved: {phoneme_file}")
 
+                return True, {
+                    "json_chunks": len(json_chunks),
+                    "audio_chunks": len(audio_chunk_sizes),
+                    "total_bytes": total_bytes,
+                    "phoneme_data": phoneme_data,
+                }
             else:
-                print(f"  🔍 Result details:")
-                print(f"     Type: {type(response.result)}")
-                print(f"     Value (first 500 chars): {str(response.result)[:500]}...")
-                return False, f"Unexpected result type: {type(response.result)}"
+                print("  ⚠️ No audio data")
+                return False, "No audio data in JSON chunks"
+
+        # Legacy binary streaming handling (fallback)
+        elif hasattr(response, "result") and hasattr(response.result, "iter_bytes"):
+            print("  📄 Binary streaming response detected")
+            # ... legacy binary processing code ...
+            return False, "Binary streaming not implemented for phonemes"
+
+        else:
+            print(f"  🔍 Result details:")
+            print(f"     Type: {type(response.result)}")
+            print(f"     Value (first 500 chars): {str(response.result)[:500]}...")
+            return False, f"Unexpected result type: {type(response.result)}"
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please top up your credits")
@@ -1574,7 +1827,7 @@ def test_stream_speech_with_phonemes(voice_id):
         return False, e
 
 
-def test_predict_duration_with_voice_settings(voice_id):
+def test_predict_duration_with_voice_settings(client, voice_id):
     """Test voice duration prediction with Voice Settings"""
     print("🎛️ Voice Duration Prediction Test with Voice Settings")
 
@@ -1583,35 +1836,32 @@ def test_predict_duration_with_voice_settings(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
+        print(
+            f"  🔍 Predicting duration with Voice Settings using voice '{voice_id}'..."
+        )
 
-        with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Predicting duration with Voice Settings using voice '{voice_id}'..."
-            )
+        # Voice Settings configuration
+        voice_settings = {
+            "pitch_shift": 1.1,  # Increase pitch by 10%
+            "pitch_variance": 0.9,  # Pitch variance at 90%
+            "speed": 1.05,  # Increase speed by 5%
+        }
 
-            # Voice Settings configuration
-            voice_settings = {
-                "pitch_shift": 1.1,  # Increase pitch by 10%
-                "pitch_variance": 0.9,  # Pitch variance at 90%
-                "speed": 1.05,  # Increase speed by 5%
-            }
-
-            print(
-                f"     Settings: pitch_shift={voice_settings['pitch_shift']}, speed={voice_settings['speed']}"
-            )
+        print(
+            f"     Settings: pitch_shift={voice_settings['pitch_shift']}, speed={voice_settings['speed']}"
+        )
 
-            response = client.text_to_speech.predict_duration(
-                voice_id=voice_id,
-                text="Hello world! This is a voice settings prediction test.",
-                language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=voice_settings,  # Include Voice Settings
-            )
+        response = client.text_to_speech.predict_duration(
+            voice_id=voice_id,
+            text="Hello world! This is a voice settings prediction test.",
+            language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=voice_settings,  # Include Voice Settings
+        )
 
-            print(f"  ✅ Prediction with Voice Settings completed: {response}s")
-            return True, response
+        print(f"  ✅ Prediction with Voice Settings completed: {response}s")
+        return True, response
 
     except errors.NotFoundErrorResponse as e:
         print(f"  ❌ Voice not found: {voice_id}")
@@ -1624,7 +1874,7 @@ def test_predict_duration_with_voice_settings(voice_id):
         return False, e
 
 
-def test_create_speech_with_voice_settings(voice_id):
+def test_create_speech_with_voice_settings(client, voice_id):
     """Test TTS conversion with Voice Settings"""
     print("🎛️ TTS Conversion Test with Voice Settings")
 
@@ -1633,67 +1883,59 @@ def test_create_speech_with_voice_settings(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
+        print(f"  🔍 Converting TTS with Voice Settings using voice '{voice_id}'...")
+        print("  ⚠️ This test will consume credits!")
 
-        with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Converting TTS with Voice Settings using voice '{voice_id}'..."
-            )
-            print("  ⚠️ This test will consume credits!")
+        # Voice Settings configuration
+        voice_settings = {
+            "pitch_shift": 0.95,  # Decrease pitch by 5%
+            "pitch_variance": 1.1,  # Pitch variance at 110%
+            "speed": 0.9,  # Decrease speed by 10%
+        }
 
-            # Voice Settings configuration
-            voice_settings = {
-                "pitch_shift": 0.95,  # Decrease pitch by 5%
-                "pitch_variance": 1.1,  # Pitch variance at 110%
-                "speed": 0.9,  # Decrease speed by 10%
-            }
+        print(
+            f"     Settings: pitch_shift={voice_settings['pitch_shift']}, speed={voice_settings['speed']}"
+        )
 
-            print(
-                f"     Settings: pitch_shift={voice_settings['pitch_shift']}, speed={voice_settings['speed']}"
-            )
+        response = client.text_to_speech.create_speech(
+            voice_id=voice_id,
+            text="Hello world! This is a voice settings test. You can hear the adjusted pitch and speed.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=voice_settings,  # Include Voice Settings
+            include_phonemes=False,
+        )
 
-            response = client.text_to_speech.create_speech(
-                voice_id=voice_id,
-                text="Hello world! This is a voice settings test. You can hear the adjusted pitch and speed.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=voice_settings,  # Include Voice Settings
-                include_phonemes=False,
+        # Handle TTS response with Voice Settings
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            audio_size = len(audio_data)
+            print(
+                f"  ✅ TTS conversion with Voice Settings successful: {audio_size} bytes audio generated"
             )
 
-            # Handle TTS response with Voice Settings
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                audio_size = len(audio_data)
-                print(
-                    f"  ✅ TTS conversion with Voice Settings successful: {audio_size} bytes audio generated"
-                )
-
-                # Save as audio file
-                output_file = "test_voice_settings_speech_output.wav"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 Audio file with Voice Settings saved: {output_file}")
-
-                # Validate file
-                import os
-
-                file_size = os.path.getsize(output_file)
-                print(f"  📏 Saved file size: {file_size} bytes")
+            # Save as audio file
+            output_file = "test_voice_settings_speech_output.wav"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 Audio file with Voice Settings saved: {output_file}")
 
-                with open(output_file, "rb") as f:
-                    header = f.read(12)
-                    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
-                        print(f"  ✅ Valid Voice Settings WAV file generated")
-                    else:
-                        print(f"  ⚠️ WAV header needs verification: {header[:12]}")
+            # Validate file
+            file_size = len(audio_data)
+            print(f"  📏 Saved file size: {file_size} bytes")
 
-                return True, response
+            header = audio_data[:12]
+            if header.startswith(b"RIFF") and header.startswith(b"WAVE", 8):
+                print(f"  ✅ Valid Voice Settings WAV file generated")
             else:
-                print(f"  ❌ Response structure needs verification: {type(response)}")
-                return False, response
+                print(f"  ⚠️ WAV header needs verification: {header[:12]}")
+
+            return True, response
+        else:
+            print(f"  ❌ Response structure needs verification: {type(response)}")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please top up your credits")
@@ -1709,7 +1951,7 @@ def test_create_speech_with_voice_settings(voice_id):
         return False, e
 
 
-def test_stream_speech_with_voice_settings(voice_id):
+def test_stream_speech_with_voice_settings(client, voice_id):
     """Test streaming TTS with Voice Settings"""
     print("🎛️ Streaming TTS Test with Voice Settings")
 
@@ -1718,221 +1960,216 @@ def test_stream_speech_with_voice_settings(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-        import json
-        import base64
-
-        with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔄 Testing streaming TTS with Voice Settings using voice '{voice_id}'..."
-            )
-            print("  ⚠️ This test may consume credits!")
-
-            # Voice Settings configuration
-            voice_settings = {
-                "pitch_shift": 1.2,  # Increase pitch by 20%
-                "pitch_variance": 0.8,  # Pitch variance at 80%
-                "speed": 1.15,  # Increase speed by 15%
-            }
-
-            print(
-                f"     Settings: pitch_shift={voice_settings['pitch_shift']}, speed={voice_settings['speed']}"
-            )
-
-            response = client.text_to_speech.stream_speech(
-                voice_id=voice_id,
-                text="Hello world! This is a voice settings streaming test. The pitch and speed are adjusted for better audio quality and personalization.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=voice_settings,  # Include Voice Settings
-                include_phonemes=False,
-            )
+        print(
+            f"  🔄 Testing streaming TTS with Voice Settings using voice '{voice_id}'..."
+        )
+        print("  ⚠️ This test may consume credits!")
 
-            # Handle streaming response
-            print("  📡 Receiving streaming data with Voice Settings...")
-            print(f"  🔍 Response type: {type(response)}")
-            print(
-                f"  🔍 Result type: {type(response.result) if hasattr(response, 'result') else 'No result'}"
-            )
+        # Voice Settings configuration
+        voice_settings = {
+            "pitch_shift": 1.2,  # Increase pitch by 20%
+            "pitch_variance": 0.8,  # Pitch variance at 80%
+            "speed": 1.15,  # Increase speed by 15%
+        }
 
-            # Handle binary streaming if result is httpx.Response
-            if hasattr(response, "result") and hasattr(response.result, "iter_bytes"):
-                print("  📄 Binary streaming response detected (Voice Settings)")
+        print(
+            f"     Settings: pitch_shift={voice_settings['pitch_shift']}, speed={voice_settings['speed']}"
+        )
 
-                chunk_count = 0
-                total_bytes = 0
-                audio_chunks = []
+        response = client.text_to_speech.stream_speech(
+            voice_id=voice_id,
+            text="Hello world! This is a voice settings streaming test. The pitch and speed are adjusted for better audio quality and personalization.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=voice_settings,  # Include Voice Settings
+            include_phonemes=False,
+        )
 
-                try:
-                    for chunk in response.result.iter_bytes():
-                        chunk_count += 1
-                        chunk_size = len(chunk)
-                        total_bytes += chunk_size
-                        audio_chunks.append(chunk)
-
-                        # Display detailed log for first 15 chunks only
-                        if chunk_count <= 15:
-                            print(f"     Chunk {chunk_count}: {chunk_size} bytes")
-                        elif chunk_count == 16:
-                            print(f"     ... (more chunks - log omitted)")
-                        elif chunk_count % 25 == 0:
-                            print(
-                                f"     Chunk {chunk_count}: {chunk_size} bytes (in progress...)"
-                            )
+        # Handle streaming response
+        print("  📡 Receiving streaming data with Voice Settings...")
+        print(f"  🔍 Response type: {type(response)}")
+        print(
+            f"  🔍 Result type: {type(response.result) if hasattr(response, 'result') else 'No result'}"
+        )
 
-                except Exception as iter_error:
-                    print(
-                        f"  ⚠️ Error during Voice Settings streaming: {str(iter_error)[:100]}..."
-                    )
+        # Handle binary streaming if result is httpx.Response
+        if hasattr(response, "result") and hasattr(response.result, "iter_bytes"):
+            print("  📄 Binary streaming response detected (Voice Settings)")
+
+            chunk_count = 0
+
+            # Write chunks straight to disk as they arrive
+            output_file = "test_voice_settings_stream_speech_output.wav"
+            out = BackgroundFileWriter(output_file)
+            header = b""  # First bytes, kept for format validation
+
+            chunk_log = ChunkLog()
+
+            write_chunk = out.write
+            log_chunk = chunk_log.add
+
+            try:
+                for chunk in response.result.iter_bytes(chunk_size=STREAM_CHUNK_SIZE):
+                    chunk_count += 1
+                    write_chunk(chunk)
+                    if len(header) < 12:
+                        header += chunk[: 12 - len(header)]
+
+                    # Display detailed log for first 15 chunks only
+                    if chunk_count <= 15:
+                        log_chunk("     Chunk %d: %d bytes", chunk_count, len(chunk))
+                    elif chunk_count == 16:
+                        log_chunk("     ... (more chunks - log omitted)")
+                    elif (chunk_count & CHUNK_PROGRESS_MASK) == 0:
+                        log_chunk(
+                            "     Chunk %d: %d bytes (in progress...)",
+                            chunk_count,
+                            len(chunk),
+                        )
 
+            except Exception as iter_error:
+                chunk_log.flush()
                 print(
-                    f"  ✅ Voice Settings Streaming completed: {chunk_count} chunks, {total_bytes} bytes"
+                    f"  ⚠️ Error during Voice Settings streaming: {str(iter_error)[:100]}..."
                 )
+            finally:
+                out.close()
+                total_bytes = out.bytes_written
+            chunk_log.flush()
+
+            print(
+                f"  ✅ Voice Settings Streaming completed: {chunk_count} chunks, {total_bytes} bytes"
+            )
 
-                # Save to file if data is received
-                if audio_chunks and total_bytes > 0:
-                    total_audio_data = b"".join(audio_chunks)
+            # Save to file if data is received
+            if total_bytes > 0:
+                print(f"  💾 Voice Settings Streaming audio saved: {output_file}")
 
-                    output_file = "test_voice_settings_stream_speech_output.wav"
-                    with open(output_file, "wb") as f:
-                        f.write(total_audio_data)
-                    print(f"  💾 Voice Settings Streaming audio saved: {output_file}")
+                # Validate file
+                file_size = total_bytes
+                print(f"  📏 Saved file size: {file_size} bytes")
 
-                    # Validate file
-                    import os
+                if not VALIDATE_WAV:
+                    print("  ⏭️ WAV header check skipped (TEST_VALIDATE_WAV=0)")
+                elif header.startswith(b"RIFF") and header.startswith(b"WAVE", 8):
+                    print(f"  ✅ Valid Voice Settings streaming WAV file generated")
+                else:
+                    print(f"  📄 File header: {header[:12]} (may not be WAV)")
 
-                    file_size = os.path.getsize(output_file)
-                    print(f"  📏 Saved file size: {file_size} bytes")
+                return True, {
+                    "chunk_count": chunk_count,
+                    "total_bytes": total_bytes,
+                    "streaming_type": "binary",
+                }
+            else:
+                os.remove(output_file)
+                print(f"  ⚠️ No received audio data")
+                return False, "No audio data received"
 
-                    with open(output_file, "rb") as f:
-                        header = f.read(12)
-                        if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
-                            print(
-                                f"  ✅ Valid Voice Settings streaming WAV file generated"
-                            )
-                        else:
-                            print(f"  📄 File header: {header[:12]} (may not be WAV)")
+        # Handle JSON streaming data if result is a string (when Phoneme is included)
+        elif hasattr(response, "result") and isinstance(response.result, str):
+            print("  📄 JSON streaming response detected (with Phoneme)")
 
-                    return True, {
-                        "chunk_count": chunk_count,
-                        "total_bytes": total_bytes,
-                        "streaming_type": "binary",
-                    }
-                else:
-                    print(f"  ⚠️ No received audio data")
-                    return False, "No audio data received"
-
-            # Handle JSON streaming data if result is a string (when Phoneme is included)
-            elif hasattr(response, "result") and isinstance(response.result, str):
-                print("  📄 JSON streaming response detected (with Phoneme)")
-
-                # Parse JSON chunks
-                json_chunks = []
-                audio_chunks = []
-
-                # Try to parse each line as JSON
-                lines = response.result.strip().split("\n")
-                print(f"  📊 Found {len(lines)} JSON chunks total")
-
-                for i, line in enumerate(lines):
-                    if line.strip():
-                        try:
-                            chunk_data = json.loads(line.strip())
-                            json_chunks.append(chunk_data)
-
-                            # Process audio data
-                            if chunk_data.get("audio_base64"):
-                                audio_data = base64.b64decode(
-                                    chunk_data["audio_base64"]
-                                )
-                                audio_chunks.append(audio_data)
-                                print(
-                                    f"     Chunk {i+1}: {len(audio_data)} bytes audio data"
-                                )
+            # Parse JSON chunks
+            json_chunks = []
+            merged_audio = bytearray()  # Decoded audio, grown in place
+            audio_chunk_sizes = []
+
+            # Try to parse each line as JSON
+            lines = response.result.splitlines()
+            print(f"  📊 Found {len(lines)} JSON chunks total")
 
-                        except json.JSONDecodeError as e:
+            for i, line in enumerate(lines):
+                if line:
+                    try:
+                        chunk_data = json_loads(line)
+                        json_chunks.append(chunk_data)
+
+                        # Process audio data
+                        if chunk_data.get("audio_base64"):
+                            audio_data = decode_audio_base64(chunk_data["audio_base64"])
+                            merged_audio.extend(audio_data)
+                            audio_chunk_sizes.append(len(audio_data))
                             print(
-                                f"     Chunk {i+1}: JSON parsing failed - {str(e)[:50]}..."
+                                f"     Chunk {i+1}: {len(audio_data)} bytes audio data"
                             )
-                            continue
-
-                # Merge and save audio data
-                if audio_chunks:
-                    total_audio_data = b"".join(audio_chunks)
-                    total_bytes = len(total_audio_data)
 
-                    print(
-                        f"  ✅ Voice Settings Streaming completed: {len(json_chunks)} JSON chunks, {len(audio_chunks)} audio chunks, {total_bytes} bytes"
-                    )
+                    except json.JSONDecodeError as e:
+                        print(
+                            f"     Chunk {i+1}: JSON parsing failed - {str(e)[:50]}..."
+                        )
+                        continue
 
-                    # Save as audio file
-                    output_file = "test_voice_settings_stream_speech_output.wav"
-                    with open(output_file, "wb") as f:
-                        f.write(total_audio_data)
-                    print(f"  💾 Voice Settings Streaming audio saved: {output_file}")
+            # Merge and save audio data
+            if audio_chunk_sizes:
+                total_audio_data = merged_audio
+                total_bytes = len(total_audio_data)
 
-                    # Validate file
-                    import os
+                print(
+                    f"  ✅ Voice Settings Streaming completed: {len(json_chunks)} JSON chunks, {len(audio_chunk_sizes)} audio chunks, {total_bytes} bytes"
+                )
 
-                    file_size = os.path.getsize(output_file)
-                    print(f"  📏 Saved file size: {file_size} bytes")
+                # Save as audio file
+                output_file = "test_voice_settings_stream_speech_output.wav"
+                with open(output_file, "wb") as f:
+                    f.write(total_audio_data)
+                print(f"  💾 Voice Settings Streaming audio saved: {output_file}")
 
-                    with open(output_file, "rb") as f:
-                        header = f.read(12)
-                        if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
-                            print(
-                                f"  ✅ Valid Voice Settings streaming WAV file generated"
-                            )
-                        else:
-                            print(f"  📄 File header: {header[:12]} (may not be WAV)")
+                # Validate file
+                file_size = len(total_audio_data)
+                print(f"  📏 Saved file size: {file_size} bytes")
 
-                    return True, {
-                        "json_chunks": len(json_chunks),
-                        "audio_chunks": len(audio_chunks),
-                        "total_bytes": total_bytes,
-                        "streaming_type": "json",
-                    }
+                header = total_audio_data[:12]
+                if not VALIDATE_WAV:
+                    print("  ⏭️ WAV header check skipped (TEST_VALIDATE_WAV=0)")
+                elif header.startswith(b"RIFF") and header.startswith(b"WAVE", 8):
+                    print(f"  ✅ Valid Voice Settings streaming WAV file generated")
                 else:
-                    print("  ⚠️ No audio data")
-                    return False, "No audio data in JSON chunks"
+                    print(f"  📄 File header: {header[:12]} (may not be WAV)")
 
+                return True, {
+                    "json_chunks": len(json_chunks),
+                    "audio_chunks": len(audio_chunk_sizes),
+                    "total_bytes": total_bytes,
+                    "streaming_type": "json",
+                }
             else:
-                print(f"  🔍 Result details:")
-                print(
-                    f"     Type: {type(response.result) if hasattr(response, 'result') else 'No result'}"
-                )
-                if hasattr(response, "result"):
-                    print(
-                        f"     Value (first 200 chars): {str(response.result)[:200]}..."
-                    )
-
-                    # Check httpx.Response object attributes
-                    if hasattr(response.result, "__dict__"):
-                        attrs = [
-                            attr
-                            for attr in dir(response.result)
-                            if not attr.startswith("_")
-                        ]
-                        print(
-                            f"     Available attributes: {attrs[:10]}..."
-                        )  # Show only first 10
-
-                        # Streaming-related methodscheck if exists
-                        streaming_methods = [
-                            attr
-                            for attr in attrs
-                            if "iter" in attr.lower() or "stream" in attr.lower()
-                        ]
-                        if streaming_methods:
-                            print(
-                                f"     Streaming-related methods: {streaming_methods}"
-                            )
+                print("  ⚠️ No audio data")
+                return False, "No audio data in JSON chunks"
 
-                return (
-                    False,
-                    f"Unexpected result type: {type(response.result) if hasattr(response, 'result') else 'No result'}",
-                )
+        else:
+            print(f"  🔍 Result details:")
+            print(
+                f"     Type: {type(response.result) if hasattr(response, 'result') else 'No result'}"
+            )
+            if hasattr(response, "result"):
+                print(f"     Value (first 200 chars): {str(response.result)[:200]}...")
+
+                # Check httpx.Response object attributes
+                if hasattr(response.result, "__dict__"):
+                    attrs = [
+                        attr
+                        for attr in dir(response.result)
+                        if not attr.startswith("_")
+                    ]
+                    print(
+                        f"     Available attributes: {attrs[:10]}..."
+                    )  # Show only first 10
+
+                    # Streaming-related methodscheck if exists
+                    streaming_methods = [
+                        attr
+                        for attr in attrs
+                        if "iter" in attr.lower() or "stream" in attr.lower()
+                    ]
+                    if streaming_methods:
+                        print(f"     Streaming-related methods: {streaming_methods}")
+
+            return (
+                False,
+                f"Unexpected result type: {type(response.result) if hasattr(response, 'result') else 'No result'}",
+            )
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please top up your credits")
@@ -1948,7 +2185,7 @@ def test_stream_speech_with_voice_settings(voice_id):
         return False, e
 
 
-def test_create_speech_mp3(voice_id):
+def test_create_speech_mp3(client, voice_id):
     """MP3 format TTS Conversion Test - Test that consumes credits"""
     print("🎤 MP3 Format TTS Conversion Test (Consumes Credits)")
 
@@ -1957,73 +2194,66 @@ def test_create_speech_mp3(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 MP3 using voice '{voice_id}' converting TTS...")
-            print("  ⚠️ This test will consume credits!")
-
-            # Test with approximately 50 Korean characters
-            response = client.text_to_speech.create_speech(
-                voice_id=voice_id,
-                text="안녕하세요! 이것은 MP3 형식 SDK 테스트를 위한 한국어 텍스트입니다. 정상적으로 작동하는지 확인해보겠습니다.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,  # MP3 format
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=None,
-            )
+        print(f"  🔍 MP3 using voice '{voice_id}' converting TTS...")
+        print("  ⚠️ This test will consume credits!")
+
+        # Test with approximately 50 Korean characters
+        response = client.text_to_speech.create_speech(
+            voice_id=voice_id,
+            text="안녕하세요! 이것은 MP3 형식 SDK 테스트를 위한 한국어 텍스트입니다. 정상적으로 작동하는지 확인해보겠습니다.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,  # MP3 format
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=None,
+        )
 
-            # Process MP3 TTS response
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                audio_size = len(audio_data)
-                print(
-                    f"  ✅ MP3 TTS conversion successful: {audio_size} bytes audio generated"
-                )
+        # Process MP3 TTS response
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            audio_size = len(audio_data)
+            print(
+                f"  ✅ MP3 TTS conversion successful: {audio_size} bytes audio generated"
+            )
 
-                # Save and verify as MP3 file
-                output_file = "test_create_speech_output.mp3"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 MP3 Audio file saved: {output_file}")
+            # Save and verify as MP3 file
+            output_file = "test_create_speech_output.mp3"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 MP3 Audio file saved: {output_file}")
 
-                # Check file size and MP3 header
-                import os
+            # Check file size and MP3 header
 
-                file_size = os.path.getsize(output_file)
-                print(f"  📏 Saved file size: {file_size} bytes")
+            file_size = len(audio_data)
+            print(f"  📏 Saved file size: {file_size} bytes")
 
-                with open(output_file, "rb") as f:
-                    header = f.read(10)
-                    # Verify MP3 file (ID3 tag or MPEG frame header)
-                    if header[:3] == b"ID3":
-                        print(f"  ✅ Valid MP3 file generated (with ID3 tag)")
-                    elif header[:2] == b"\xff\xfb" or header[:2] == b"\xff\xfa":
-                        print(f"  ✅ Valid MP3 file generated (MPEG frame)")
-                    else:
-                        print(
-                            f"  📄 MP3 header: {header[:10].hex()} (needs verification)"
-                        )
+            header = audio_data[:10]
+            # Verify MP3 file (ID3 tag or MPEG frame header)
+            if header.startswith(b"ID3"):
+                print(f"  ✅ Valid MP3 file generated (with ID3 tag)")
+            elif header.startswith((b"\xff\xfb", b"\xff\xfa")):
+                print(f"  ✅ Valid MP3 file generated (MPEG frame)")
+            else:
+                print(f"  📄 MP3 header: {header[:10].hex()} (needs verification)")
 
-                return True, response
-            elif hasattr(response, "result") and hasattr(response.result, "content"):
-                # If content attribute exists
-                audio_data = response.result.content
-                audio_size = len(audio_data)
-                print(
-                    f"  ✅ MP3 TTS conversion successful: {audio_size} bytes audio generated"
-                )
+            return True, response
+        elif hasattr(response, "result") and hasattr(response.result, "content"):
+            # If content attribute exists
+            audio_data = response.result.content
+            audio_size = len(audio_data)
+            print(
+                f"  ✅ MP3 TTS conversion successful: {audio_size} bytes audio generated"
+            )
 
-                output_file = "test_create_speech_output.mp3"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 MP3 Audio file saved: {output_file}")
+            output_file = "test_create_speech_output.mp3"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 MP3 Audio file saved: {output_file}")
 
-                return True, response
-            else:
-                print(f"  ❌ Response structure needs verification: {type(response)}")
-                return False, response
+            return True, response
+        else:
+            print(f"  ❌ Response structure needs verification: {type(response)}")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please top up your credits")
@@ -2039,7 +2269,7 @@ def test_create_speech_mp3(voice_id):
         return False, e
 
 
-def test_create_speech_long_text_mp3(voice_id):
+def test_create_speech_long_text_mp3(client, voice_id):
     """Long text (300+ chars) MP3 auto-chunking TTS Conversion Test"""
     print("📜 Long text (300+ chars) MP3 auto-chunking TTS Conversion Test")
 
@@ -2048,115 +2278,96 @@ def test_create_speech_long_text_mp3(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         # Long text over 500 characters
-        long_text = """
-        안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 MP3 자동 청킹 TTS 테스트입니다.
-        새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 처리합니다.
-        실시간 스트리밍 텍스트 음성 변환 기술은 현대 AI 애플리케이션에서 핵심적인 역할을 담당하고 있습니다.
-        특히 대화형 서비스, 라이브 방송, 실시간 번역 서비스 등에서 없어서는 안 될 중요한 기술입니다.
-        자동 청킹 기능을 통해 긴 텍스트도 자연스럽게 여러 개의 작은 세그먼트로 나누어져 처리됩니다.
-        각 세그먼트는 문장 경계와 단어 경계를 고려하여 지능적으로 분할되며, 이를 통해 자연스러운 음성을 생성할 수 있습니다.
-        이제 사용자는 텍스트 길이나 출력 형식에 대해 걱정할 필요가 없으며, SDK가 MP3 형식으로도 모든 것을 자동으로 처리해줍니다.
-        """.strip()
+        long_text = LONG_KO_MP3_TEXT
 
         actual_length = len(long_text)
         print(f"  📏 Test text length: {actual_length} characters (exceeds 300 chars)")
         print(f"  🔧 Auto-chunking feature activated, text will be split automatically")
         print(f"  🎵 Output will be in MP3 format")
 
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 MP3 using voice '{voice_id}' auto-chunking converting TTS...")
-            print("  ⚠️ This test will consume credits!")
-            print("  ✨ SDK automatically chunks text and processes as MP3")
-
-            response = client.text_to_speech.create_speech(
-                voice_id=voice_id,
-                text=long_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,  # MP3 format
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=None,
-            )
+        print(f"  🔍 MP3 using voice '{voice_id}' auto-chunking converting TTS...")
+        print("  ⚠️ This test will consume credits!")
+        print("  ✨ SDK automatically chunks text and processes as MP3")
+
+        response = client.text_to_speech.create_speech(
+            voice_id=voice_id,
+            text=long_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,  # MP3 format
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=None,
+        )
 
-            # Process MP3 auto-chunking success
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                audio_size = len(audio_data)
-                print(
-                    f"  ✅ MP3 auto-chunking TTS conversion successful: {audio_size} bytes audio generated"
-                )
-                print(f"  🎯 Long text successfully chunked and processed as MP3!")
+        # Process MP3 auto-chunking success
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            audio_size = len(audio_data)
+            print(
+                f"  ✅ MP3 auto-chunking TTS conversion successful: {audio_size} bytes audio generated"
+            )
+            print(f"  🎯 Long text successfully chunked and processed as MP3!")
 
-                output_file = "test_auto_chunking_speech_output.mp3"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 MP3 auto-chunking Audio file saved: {output_file}")
+            output_file = "test_auto_chunking_speech_output.mp3"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 MP3 auto-chunking Audio file saved: {output_file}")
 
-                # Check file size and MP3 header
-                import os
+            # Check file size and MP3 header
 
-                file_size = os.path.getsize(output_file)
-                print(f"  📏 Saved file size: {file_size} bytes")
+            file_size = len(audio_data)
+            print(f"  📏 Saved file size: {file_size} bytes")
 
-                with open(output_file, "rb") as f:
-                    header = f.read(10)
-                    # Verify MP3 file
-                    if header[:3] == b"ID3":
-                        print(
-                            f"  ✅ Valid MP3 auto-chunking file generated (with ID3 tag)"
-                        )
-                    elif header[:2] == b"\xff\xfb" or header[:2] == b"\xff\xfa":
-                        print(
-                            f"  ✅ Valid MP3 auto-chunking file generated (MPEG frame)"
-                        )
-                    else:
-                        print(
-                            f"  📄 MP3 header: {header[:10].hex()} (needs verification)"
-                        )
+            header = audio_data[:10]
+            # Verify MP3 file
+            if header.startswith(b"ID3"):
+                print(f"  ✅ Valid MP3 auto-chunking file generated (with ID3 tag)")
+            elif header.startswith((b"\xff\xfb", b"\xff\xfa")):
+                print(f"  ✅ Valid MP3 auto-chunking file generated (MPEG frame)")
+            else:
+                print(f"  📄 MP3 header: {header[:10].hex()} (needs verification)")
 
-                # Calculate and display estimated chunk count
-                estimated_chunks = (actual_length + 299) // 300  # Round up calculation
-                print(
-                    f"  📊 Estimated chunk count: {estimated_chunks} items (based on text length)"
-                )
-                print(
-                    f"  🔀 Each chunk processed simultaneously through parallel processing and merged into MP3"
-                )
+            # Calculate and display estimated chunk count
+            estimated_chunks = (actual_length + 299) // 300  # Round up calculation
+            print(
+                f"  📊 Estimated chunk count: {estimated_chunks} items (based on text length)"
+            )
+            print(
+                f"  🔀 Each chunk processed simultaneously through parallel processing and merged into MP3"
+            )
 
-                return True, {
-                    "audio_size": audio_size,
-                    "text_length": actual_length,
-                    "estimated_chunks": estimated_chunks,
-                    "output_file": output_file,
-                    "format": "mp3",
-                }
-            elif hasattr(response, "result") and hasattr(response.result, "content"):
-                # If content attribute exists
-                audio_data = response.result.content
-                audio_size = len(audio_data)
-                print(
-                    f"  ✅ MP3 auto-chunking TTS conversion successful: {audio_size} bytes audio generated"
-                )
+            return True, {
+                "audio_size": audio_size,
+                "text_length": actual_length,
+                "estimated_chunks": estimated_chunks,
+                "output_file": output_file,
+                "format": "mp3",
+            }
+        elif hasattr(response, "result") and hasattr(response.result, "content"):
+            # If content attribute exists
+            audio_data = response.result.content
+            audio_size = len(audio_data)
+            print(
+                f"  ✅ MP3 auto-chunking TTS conversion successful: {audio_size} bytes audio generated"
+            )
 
-                output_file = "test_auto_chunking_speech_output.mp3"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 MP3 auto-chunking Audio file saved: {output_file}")
+            output_file = "test_auto_chunking_speech_output.mp3"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 MP3 auto-chunking Audio file saved: {output_file}")
 
-                return True, {
-                    "audio_size": audio_size,
-                    "text_length": actual_length,
-                    "format": "mp3",
-                }
-            else:
-                print(f"  ❌ Response structure needs verification: {type(response)}")
-                print(
-                    f"  🔍 Response attributes: {[attr for attr in dir(response) if not attr.startswith('_')]}"
-                )
-                return False, response
+            return True, {
+                "audio_size": audio_size,
+                "text_length": actual_length,
+                "format": "mp3",
+            }
+        else:
+            print(f"  ❌ Response structure needs verification: {type(response)}")
+            print(
+                f"  🔍 Response attributes: {', '.join(a for a in dir(response) if not a.startswith('_'))}"
+            )
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please top up your credits")
@@ -2166,8 +2377,7 @@ def test_create_speech_long_text_mp3(voice_id):
         return False, e
     except RuntimeError as e:
         # Possible errors in auto-chunking logic
-        error_message = str(e).lower()
-        if "chunk" in error_message or "merge" in error_message:
+        if _CHUNK_ERR_RE.search(str(e)):
             print(f"  ❌ MP3 auto-chunking error occurred during processing: {e}")
             print("  🔧 MP3 Please check chunking logic")
             return False, e
@@ -2186,7 +2396,7 @@ def test_create_speech_long_text_mp3(voice_id):
         return False, e
 
 
-def test_stream_speech_mp3(voice_id):
+def test_stream_speech_mp3(client, voice_id):
     """MP3 format TTS Streaming Test"""
     print("🎵 MP3 format TTS Streaming Test")
 
@@ -2195,89 +2405,93 @@ def test_stream_speech_mp3(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔄 MP3 using voice '{voice_id}' testing streaming TTS...")
-            print("  ⚠️ This test may consume credits!")
-
-            response = client.text_to_speech.stream_speech(
-                voice_id=voice_id,
-                text="안녕하세요! 이것은 MP3 스트리밍 TTS 테스트를 위한 한국어 텍스트입니다. 스트리밍 기능이 MP3 형식으로도 정상적으로 작동하는지 확인하기 위해 조금 더 긴 텍스트를 사용하고 있습니다.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,  # MP3 format
-                style="neutral",
-                model="sona_speech_1",
-            )
-
-            # Process MP3 streaming response
-            print("  📡 MP3 Receiving streaming data...")
+        print(f"  🔄 MP3 using voice '{voice_id}' testing streaming TTS...")
+        print("  ⚠️ This test may consume credits!")
+
+        response = client.text_to_speech.stream_speech(
+            voice_id=voice_id,
+            text="안녕하세요! 이것은 MP3 스트리밍 TTS 테스트를 위한 한국어 텍스트입니다. 스트리밍 기능이 MP3 형식으로도 정상적으로 작동하는지 확인하기 위해 조금 더 긴 텍스트를 사용하고 있습니다.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,  # MP3 format
+            style="neutral",
+            model="sona_speech_1",
+        )
 
-            if hasattr(response, "result") and hasattr(response.result, "iter_bytes"):
-                chunk_count = 0
-                total_bytes = 0
-                audio_chunks = []
+        # Process MP3 streaming response
+        print("  📡 MP3 Receiving streaming data...")
 
-                try:
-                    for chunk in response.result.iter_bytes():
-                        chunk_count += 1
-                        chunk_size = len(chunk)
-                        total_bytes += chunk_size
-                        audio_chunks.append(chunk)
-
-                        # Display detailed log for first 20 only
-                        if chunk_count <= 20:
-                            print(f"     Chunk {chunk_count}: {chunk_size} bytes")
-                        elif chunk_count == 21:
-                            print(f"     ... (more chunks - log omitted)")
-                        elif chunk_count % 50 == 0:
-                            print(
-                                f"     Chunk {chunk_count}: {chunk_size} bytes (in progress...)"
-                            )
+        if hasattr(response, "result") and hasattr(response.result, "iter_bytes"):
+            chunk_count = 0
 
-                except Exception as iter_error:
-                    print(f"  ⚠️ MP3 Error during streaming: {str(iter_error)[:100]}...")
+            # Write chunks straight to disk as they arrive
+            output_file = "test_stream_speech_output.mp3"
+            out = BackgroundFileWriter(output_file)
+            header = b""  # First bytes, kept for format validation
 
-                print(
-                    f"  ✅ MP3 Streaming completed: {chunk_count} chunks, {total_bytes} bytes"
-                )
+            chunk_log = ChunkLog()
 
-                # Save as MP3 file if data received
-                if audio_chunks and total_bytes > 0:
-                    output_file = "test_stream_speech_output.mp3"
-                    with open(output_file, "wb") as f:
-                        for chunk in audio_chunks:
-                            f.write(chunk)
-                    print(f"  💾 MP3 Streaming audio saved: {output_file}")
+            write_chunk = out.write
+            log_chunk = chunk_log.add
 
-                    # Validate file
-                    import os
+            try:
+                chunks = iter(response.result.iter_bytes(chunk_size=STREAM_CHUNK_SIZE))
 
-                    file_size = os.path.getsize(output_file)
-                    print(f"  📏 Saved file size: {file_size} bytes")
+                # Display detailed log for first 20 only
+                for chunk in itertools.islice(chunks, 20):
+                    chunk_count += 1
+                    write_chunk(chunk)
+                    if len(header) < 10:
+                        header += chunk[: 10 - len(header)]
+                    log_chunk("     Chunk %d: %d bytes", chunk_count, len(chunk))
 
-                    with open(output_file, "rb") as f:
-                        header = f.read(10)
-                        if header[:3] == b"ID3":
-                            print(
-                                f"  ✅ Valid MP3 streaming file generated (with ID3 tag)"
-                            )
-                        elif header[:2] == b"\xff\xfb" or header[:2] == b"\xff\xfa":
-                            print(
-                                f"  ✅ Valid MP3 streaming file generated (MPEG frame)"
-                            )
-                        else:
-                            print(
-                                f"  📄 File header: {header[:10].hex()} (may not be MP3)"
+                rest = next(chunks, None)
+                if rest is not None:
+                    log_chunk("     ... (more chunks - log omitted)")
+                    for chunk in itertools.chain((rest,), chunks):
+                        chunk_count += 1
+                        write_chunk(chunk)
+                        if (chunk_count & CHUNK_PROGRESS_MASK) == 0:
+                            log_chunk(
+                                "     Chunk %d: %d bytes (in progress...)",
+                                chunk_count,
+                                len(chunk),
                             )
 
-                    return True, f"{chunk_count} chunks, {total_bytes} bytes"
+            except Exception as iter_error:
+                chunk_log.flush()
+                print(f"  ⚠️ MP3 Error during streaming: {str(iter_error)[:100]}...")
+            finally:
+                out.close()
+                total_bytes = out.bytes_written
+            chunk_log.flush()
+
+            print(
+                f"  ✅ MP3 Streaming completed: {chunk_count} chunks, {total_bytes} bytes"
+            )
+
+            # Save as MP3 file if data received
+            if total_bytes > 0:
+                print(f"  💾 MP3 Streaming audio saved: {output_file}")
+
+                # Validate file
+                file_size = total_bytes
+                print(f"  📏 Saved file size: {file_size} bytes")
+
+                if header.startswith(b"ID3"):
+                    print(f"  ✅ Valid MP3 streaming file generated (with ID3 tag)")
+                elif header.startswith((b"\xff\xfb", b"\xff\xfa")):
+                    print(f"  ✅ Valid MP3 streaming file generated (MPEG frame)")
                 else:
-                    print(f"  ⚠️ No received audio data")
-                    return False, "No audio data received"
+                    print(f"  📄 File header: {header[:10].hex()} (may not be MP3)")
+
+                return True, f"{chunk_count} chunks, {total_bytes} bytes"
             else:
-                print(f"  ❌ Response missing iter_bytes attribute: {type(response)}")
-                return False, response
+                os.remove(output_file)
+                print(f"  ⚠️ No received audio data")
+                return False, "No audio data received"
+        else:
+            print(f"  ❌ Response missing iter_bytes attribute: {type(response)}")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please top up your credits")
@@ -2293,7 +2507,7 @@ def test_stream_speech_mp3(voice_id):
         return False, e
 
 
-def test_stream_speech_long_text_mp3(voice_id):
+def test_stream_speech_long_text_mp3(client, voice_id):
     """Long text (300+ chars) MP3 Streaming TTS Test"""
     print("📜 Long text (300+ chars) MP3 Streaming TTS Test")
 
@@ -2302,212 +2516,185 @@ def test_stream_speech_long_text_mp3(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         # Long text over 500 characters
-        long_text = """
-        안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 MP3 스트리밍 TTS 테스트입니다.
-        새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 스트리밍으로 처리합니다.
-        실시간 스트리밍 텍스트 음성 변환 기술은 현대 AI 애플리케이션에서 핵심적인 역할을 담당하고 있습니다.
-        특히 대화형 서비스, 라이브 방송, 실시간 번역 서비스 등에서 없어서는 안 될 중요한 기술입니다.
-        자동 청킹 기능을 통해 긴 텍스트도 자연스럽게 여러 개의 작은 세그먼트로 나누어져 처리됩니다.
-        각 세그먼트는 문장 경계와 단어 경계를 고려하여 지능적으로 분할되며, 이를 통해 자연스러운 음성을 생성할 수 있습니다.
-        스트리밍 방식으로 MP3 형식 처리되기 때문에 사용자는 전체 텍스트의 음성 변환이 완료되기를 기다릴 필요가 없습니다.
-        첫 번째 청크의 음성이 생성되는 즉시 재생을 시작할 수 있어 반응성이 크게 향상됩니다.
-        """.strip()
+        long_text = LONG_KO_MP3_STREAM_TEXT
 
         actual_length = len(long_text)
         print(f"  📏 Test text length: {actual_length} characters (exceeds 300 chars)")
         print(f"  🔧 auto-chunking + MP3 streaming feature activated")
 
-        with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Long text using voice '{voice_id}' MP3 streaming converting TTS..."
-            )
-            print("  ⚠️ This test consumes credits and applies auto-chunking!")
-            print("  ✨ SDK automatically chunks text and processes as MP3 streaming")
-
-            response = client.text_to_speech.stream_speech(
-                voice_id=voice_id,
-                text=long_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,  # MP3 format
-                style="neutral",
-                model="sona_speech_1",
-            )
-
-            # Process MP3 streaming response
-            print(f"  🔍 Response type: {type(response)}")
-            print(f"  🔍 Result type: {type(response.result)}")
-
-            # Process new JSON format response (chunked case)
-            if hasattr(response, "result") and isinstance(response.result, str):
-                try:
-                    import json
-                    import base64
-
-                    # Parse JSON
-                    result_data = json.loads(response.result)
-                    print(f"  ✅ Chunked JSON response detected")
-                    print(f"  🔍 JSON keys: {list(result_data.keys())}")
-
-                    if "audio_base64" in result_data:
-                        # Base64 decode and extract audio data
-                        audio_data = base64.b64decode(result_data["audio_base64"])
-                        total_bytes = len(audio_data)
-
-                        print(f"  ✅ Merged MP3 audio data: {total_bytes} bytes")
+        print(
+            f"  🔍 Long text using voice '{voice_id}' MP3 streaming converting TTS..."
+        )
+        print("  ⚠️ This test consumes credits and applies auto-chunking!")
+        print("  ✨ SDK automatically chunks text and processes as MP3 streaming")
+
+        response = client.text_to_speech.stream_speech(
+            voice_id=voice_id,
+            text=long_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,  # MP3 format
+            style="neutral",
+            model="sona_speech_1",
+        )
 
-                        # Save file
-                        output_file = "test_stream_speech_long_output.mp3"
-                        with open(output_file, "wb") as f:
-                            f.write(audio_data)
-                        print(
-                            f"  💾 Long text MP3 Streaming audio saved: {output_file}"
-                        )
+        # Process MP3 streaming response
+        print(f"  🔍 Response type: {type(response)}")
+        print(f"  🔍 Result type: {type(response.result)}")
 
-                        # Validate file
-                        import os
+        # Process new JSON format response (chunked case)
+        if hasattr(response, "result") and isinstance(response.result, str):
+            try:
+                # Parse JSON
+                result_data = json_loads(response.result)
+                print(f"  ✅ Chunked JSON response detected")
+                print(f"  🔍 JSON keys: {', '.join(result_data)}")
 
-                        file_size = os.path.getsize(output_file)
-                        print(f"  📏 Saved file size: {file_size} bytes")
+                if "audio_base64" in result_data:
+                    # Base64 decode straight into the file, window by window
+                    output_file = "test_stream_speech_long_output.mp3"
+                    total_bytes, first_window = write_audio_base64(
+                        result_data["audio_base64"], output_file
+                    )
 
-                        with open(output_file, "rb") as f:
-                            header = f.read(10)
-                            if header[:3] == b"ID3":
-                                print(
-                                    f"  ✅ Valid MP3 Long text streaming file generated (with ID3 tag)"
-                                )
-                            elif header[:2] == b"\xff\xfb" or header[:2] == b"\xff\xfa":
-                                print(
-                                    f"  ✅ Valid MP3 Long text streaming file generated (MPEG frame)"
-                                )
-                            else:
-                                print(
-                                    f"  📄 File header: {header[:10].hex()} (may not be MP3)"
-                                )
+                    print(f"  ✅ Merged MP3 audio data: {total_bytes} bytes")
+                    print(f"  💾 Long text MP3 Streaming audio saved: {output_file}")
 
-                        # Check Phoneme Information
-                        if "phonemes" in result_data and result_data["phonemes"]:
-                            phonemes = result_data["phonemes"]
-                            print(f"  🔤 Phoneme information included:")
-                            print(
-                                f"    - Symbol count: {len(phonemes.get('symbols', []))}"
-                            )
-                            if phonemes.get("start_times_seconds"):
-                                print(
-                                    f"    - Start times: {len(phonemes['start_times_seconds'])} items"
-                                )
-                            if phonemes.get("durations_seconds"):
-                                print(
-                                    f"    - Duration: {len(phonemes['durations_seconds'])} items"
-                                )
+                    # Validate file
+                    file_size = total_bytes
+                    print(f"  📏 Saved file size: {file_size} bytes")
 
-                        # Calculate estimated chunk count
-                        estimated_chunks = (actual_length + 299) // 300
+                    header = first_window[:10]
+                    if header.startswith(b"ID3"):
                         print(
-                            f"  📊 Estimated text chunk count: {estimated_chunks} items (based on text length)"
+                            f"  ✅ Valid MP3 Long text streaming file generated (with ID3 tag)"
                         )
+                    elif header.startswith((b"\xff\xfb", b"\xff\xfa")):
                         print(
-                            f"  🔀 Each auto-chunked segment was merged and processed as MP3"
+                            f"  ✅ Valid MP3 Long text streaming file generated (MPEG frame)"
                         )
-
-                        return True, {
-                            "total_bytes": total_bytes,
-                            "text_length": actual_length,
-                            "estimated_chunks": estimated_chunks,
-                            "format": "mp3",
-                            "has_phonemes": "phonemes" in result_data
-                            and result_data["phonemes"] is not None,
-                        }
                     else:
-                        print(f"  ❌ audio_base64 key missing: {result_data}")
-                        return False, result_data
-
-                except json.JSONDecodeError as e:
-                    print(f"  ❌ JSON parsing failed: {e}")
-                    return False, e
-                except Exception as e:
-                    print(f"  ❌ Error processing response: {e}")
-                    return False, e
-
-            # Process existing streaming response (non-chunked case)
-            elif hasattr(response, "result") and hasattr(response.result, "iter_bytes"):
-                chunk_count = 0
-                total_bytes = 0
-                audio_chunks = []
-
-                try:
-                    for chunk in response.result.iter_bytes():
-                        chunk_count += 1
-                        chunk_size = len(chunk)
-                        total_bytes += chunk_size
-                        audio_chunks.append(chunk)
-
-                        if chunk_count <= 10:
-                            print(f"     Chunk {chunk_count}: {chunk_size} bytes")
-                        elif chunk_count % 20 == 0:
-                            print(f"     Progress: {chunk_count} chunks")
-
-                except Exception as iter_error:
-                    print(f"  ⚠️ MP3 Error during streaming: {str(iter_error)[:100]}...")
-
-                print(
-                    f"  ✅ MP3 Long text streaming success: {chunk_count} chunks, {total_bytes} bytes"
-                )
-
-                if audio_chunks and total_bytes > 0:
-                    output_file = "test_stream_speech_long_output.mp3"
-                    with open(output_file, "wb") as f:
-                        for chunk in audio_chunks:
-                            f.write(chunk)
-                    print(f"  💾 Long text MP3 Streaming audio saved: {output_file}")
-
-                    # Validate file
-                    import os
-
-                    file_size = os.path.getsize(output_file)
-                    print(f"  📏 Saved file size: {file_size} bytes")
-
-                    with open(output_file, "rb") as f:
-                        header = f.read(10)
-                        if header[:3] == b"ID3":
-                            print(
-                                f"  ✅ Valid MP3 Long text streaming file generated (with ID3 tag)"
-                            )
-                        elif header[:2] == b"\xff\xfb" or header[:2] == b"\xff\xfa":
+                        print(f"  📄 File header: {header[:10].hex()} (may not be MP3)")
+
+                    # Check Phoneme Information
+                    if "phonemes" in result_data and result_data["phonemes"]:
+                        phonemes = result_data["phonemes"]
+                        print(f"  🔤 Phoneme information included:")
+                        print(f"    - Symbol count: {len(phonemes.get('symbols', []))}")
+                        if phonemes.get("start_times_seconds"):
                             print(
-                                f"  ✅ Valid MP3 Long text streaming file generated (MPEG frame)"
+                                f"    - Start times: {len(phonemes['start_times_seconds'])} items"
                             )
-                        else:
+                        if phonemes.get("durations_seconds"):
                             print(
-                                f"  📄 File header: {header[:10].hex()} (may not be MP3)"
+                                f"    - Duration: {len(phonemes['durations_seconds'])} items"
                             )
 
-                    # Calculate and display estimated chunk count
-                    estimated_chunks = (
-                        actual_length + 299
-                    ) // 300  # Round up calculation
+                    # Calculate estimated chunk count
+                    estimated_chunks = (actual_length + 299) // 300
                     print(
                         f"  📊 Estimated text chunk count: {estimated_chunks} items (based on text length)"
                     )
                     print(
-                        f"  🔀 Each auto-chunked segment was processed as MP3 streaming"
+                        f"  🔀 Each auto-chunked segment was merged and processed as MP3"
                     )
 
                     return True, {
-                        "chunk_count": chunk_count,
                         "total_bytes": total_bytes,
                         "text_length": actual_length,
                         "estimated_chunks": estimated_chunks,
                         "format": "mp3",
+                        "has_phonemes": "phonemes" in result_data
+                        and result_data["phonemes"] is not None,
                     }
                 else:
-                    print(f"  ⚠️ No received audio data")
-                    return False, "No audio data received"
+                    print(f"  ❌ audio_base64 key missing: {result_data}")
+                    return False, result_data
+
+            except json.JSONDecodeError as e:
+                print(f"  ❌ JSON parsing failed: {e}")
+                return False, e
+            except Exception as e:
+                print(f"  ❌ Error processing response: {e}")
+                return False, e
+
+        # Process existing streaming response (non-chunked case)
+        elif hasattr(response, "result") and hasattr(response.result, "iter_bytes"):
+            chunk_count = 0
+
+            # Write chunks straight to disk as they arrive
+            output_file = "test_stream_speech_long_output.mp3"
+            out = BackgroundFileWriter(output_file)
+            header = b""  # First bytes, kept for format validation
+
+            chunk_log = ChunkLog()
+
+            write_chunk = out.write
+            log_chunk = chunk_log.add
+
+            try:
+                for chunk in response.result.iter_bytes(chunk_size=STREAM_CHUNK_SIZE):
+                    chunk_count += 1
+                    write_chunk(chunk)
+                    if len(header) < 10:
+                        header += chunk[: 10 - len(header)]
+
+                    if chunk_count <= 10:
+                        log_chunk("     Chunk %d: %d bytes", chunk_count, len(chunk))
+                    elif (chunk_count & CHUNK_PROGRESS_MASK) == 0:
+                        log_chunk("     Progress: %d chunks", chunk_count)
+
+            except Exception as iter_error:
+                chunk_log.flush()
+                print(f"  ⚠️ MP3 Error during streaming: {str(iter_error)[:100]}...")
+            finally:
+                out.close()
+                total_bytes = out.bytes_written
+            chunk_log.flush()
+
+            print(
+                f"  ✅ MP3 Long text streaming success: {chunk_count} chunks, {total_bytes} bytes"
+            )
+
+            if total_bytes > 0:
+                print(f"  💾 Long text MP3 Streaming audio saved: {output_file}")
+
+                # Validate file
+                file_size = total_bytes
+                print(f"  📏 Saved file size: {file_size} bytes")
+
+                if header.startswith(b"ID3"):
+                    print(
+                        f"  ✅ Valid MP3 Long text streaming file generated (with ID3 tag)"
+                    )
+                elif header.startswith((b"\xff\xfb", b"\xff\xfa")):
+                    print(
+                        f"  ✅ Valid MP3 Long text streaming file generated (MPEG frame)"
+                    )
+                else:
+                    print(f"  📄 File header: {header[:10].hex()} (may not be MP3)")
+
+                # Calculate and display estimated chunk count
+                estimated_chunks = (actual_length + 299) // 300  # Round up calculation
+                print(
+                    f"  📊 Estimated text chunk count: {estimated_chunks} items (based on text length)"
+                )
+                print(f"  🔀 Each auto-chunked segment was processed as MP3 streaming")
+
+                return True, {
+                    "chunk_count": chunk_count,
+                    "total_bytes": total_bytes,
+                    "text_length": actual_length,
+                    "estimated_chunks": estimated_chunks,
+                    "format": "mp3",
+                }
             else:
-                print(f"  ❌ Response structure needs verification: {type(response)}")
-                return False, response
+                os.remove(output_file)
+                print(f"  ⚠️ No received audio data")
+                return False, "No audio data received"
+        else:
+            print(f"  ❌ Response structure needs verification: {type(response)}")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please top up your credits")
@@ -2517,8 +2704,7 @@ def test_stream_speech_long_text_mp3(voice_id):
         return False, e
     except RuntimeError as e:
         # Possible errors in auto-chunking logic
-        error_message = str(e).lower()
-        if "chunk" in error_message or "merge" in error_message:
+        if _CHUNK_ERR_RE.search(str(e)):
             print(
                 f"  ❌ MP3 streaming auto-chunking error occurred during processing: {e}"
             )
@@ -2539,7 +2725,7 @@ def test_stream_speech_long_text_mp3(voice_id):
         return False, e
 
 
-def test_create_speech_long_text_with_phonemes(voice_id):
+def test_create_speech_long_text_with_phonemes(client, voice_id):
     """Long text (300+ chars) auto-chunking + Phoneme Information included TTS Test"""
     print("📜🔤 Long text (300+ chars) auto-chunking + Phoneme Information TTS Test")
 
@@ -2548,217 +2734,166 @@ def test_create_speech_long_text_with_phonemes(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         # Long text over 500 characters
-        long_text = """
-        안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 자동 청킹과 Phoneme 정보를 동시에 테스트합니다.
-        새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 처리하고 각 청크의 Phoneme 정보를 병합합니다.
-        실시간 스트리밍 텍스트 음성 변환 기술은 현대 AI 애플리케이션에서 핵심적인 역할을 담당하고 있습니다.
-        특히 대화형 서비스, 라이브 방송, 실시간 번역 서비스 등에서 없어서는 안 될 중요한 기술입니다.
-        자동 청킹 기능과 Phoneme 병합을 통해 긴 텍스트도 자연스럽게 음성으로 변환할 수 있습니다.
-        """.strip()
+        long_text = LONG_KO_PHONEME_TEXT
 
-        with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Long text using voice '{voice_id}' chunking + Phoneme converting TTS..."
-            )
-            print(f"  📝 Text length: {len(long_text)} chars")
-            print("  ⚠️ This test will consume credits!")
-
-            response = client.text_to_speech.create_speech(
-                voice_id=voice_id,
-                text=long_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                include_phonemes=True,  # Include Phoneme Information
-            )
+        print(
+            f"  🔍 Long text using voice '{voice_id}' chunking + Phoneme converting TTS..."
+        )
+        print(f"  📝 Text length: {len(long_text)} chars")
+        print("  ⚠️ This test will consume credits!")
+
+        response = client.text_to_speech.create_speech(
+            voice_id=voice_id,
+            text=long_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            include_phonemes=True,  # Include Phoneme Information
+        )
 
-            print(f"  🔍 Response type: {type(response)}")
+        print(f"  🔍 Response type: {type(response)}")
 
-            if hasattr(response, "result"):
-                print(f"  🔍 Result type: {type(response.result)}")
-
-                # Check audio data
-                if (
-                    hasattr(response.result, "audio_base64")
-                    and response.result.audio_base64
-                ):
-                    print("  ✅ Base64 audio data received")
+        if hasattr(response, "result"):
+            print(f"  🔍 Result type: {type(response.result)}")
+
+            # Check audio data
+            if (
+                hasattr(response.result, "audio_base64")
+                and response.result.audio_base64
+            ):
+                print("  ✅ Base64 audio data received")
+                print(
+                    f"  📊 audio data 크기: {len(response.result.audio_base64)} characters"
+                )
+
+                # Display detailed Phoneme Information
+                if hasattr(response.result, "phonemes") and response.result.phonemes:
+                    phonemes = response.result.phonemes
+                    # Bind the phoneme fields once; they are read throughout below
+                    symbols = phonemes.symbols
+                    durations = phonemes.durations_seconds
+                    start_times = getattr(phonemes, "start_times_seconds", None)
+                    has_start = bool(start_times)
+                    print("\n  🔤 ===== Phoneme Information Detailed Analysis =====")
                     print(
-                        f"  📊 audio data 크기: {len(response.result.audio_base64)} characters"
+                        f"  📊 Phoneme symbols 개수: {len(symbols) if symbols else 0}"
                     )
+                    print(f"  ⏱️ Duration 개수: {len(durations) if durations else 0}")
 
-                    # Display detailed Phoneme Information
-                    if (
-                        hasattr(response.result, "phonemes")
-                        and response.result.phonemes
-                    ):
-                        phonemes = response.result.phonemes
-                        print(
-                            "\n  🔤 ===== Phoneme Information Detailed Analysis ====="
-                        )
-                        print(
-                            f"  📊 Phoneme symbols 개수: {len(phonemes.symbols) if phonemes.symbols else 0}"
-                        )
+                    # Add start_times_seconds information
+                    if has_start:
+                        print(f"  🚀 Start Times 개수: {len(start_times)}")
+                    else:
+                        print(f"  🚀 Start Times count: 0 (no information)")
+
+                    if symbols:
+                        print(f"\n  🔤 All Phoneme Symbols:")
+                        # Display in groups of 10
+                        groups = [
+                            f"    {i+1:3d}-{min(i+10, len(symbols)):3d}: {symbols[i : i + 10]}"
+                            for i in range(0, len(symbols), 10)
+                        ]
+                        print("\n".join(groups))
+
+                    total_duration = average_duration = 0
+                    if durations:
+                        print(f"\n  ⏱️ Duration Information (in seconds):")
+                        # Reduce once; the totals are reused in the JSON dump below
+                        d = np.asarray(durations, dtype=np.float64)
+                        total_duration = math.fsum(durations)
+                        average_duration = total_duration / d.size
+                        print(f"    Total duration: {total_duration:.3f}s")
+                        print(f"    Average duration: {average_duration:.3f}s")
+                        print(f"    Min duration: {d.min():.3f}s")
+                        print(f"    Max duration: {d.max():.3f}s")
+
+                        # Display first 20 durations
+                        print(f"    First 20 duration: {durations[:20]}")
+                        if len(durations) > 20:
+                            print(f"    ... (total {len(durations)} items)")
+
+                    # Display additional start_times_seconds information
+                    if has_start:
+                        print(f"\n  🚀 Start Times Information (in seconds):")
+                        print(f"    First start: {min(start_times):.3f}s")
+                        print(f"    Last start: {max(start_times):.3f}s")
                         print(
-                            f"  ⏱️ Duration 개수: {len(phonemes.durations_seconds) if phonemes.durations_seconds else 0}"
+                            f"    Time range: {max(start_times) - min(start_times):.3f}s"
                         )
 
-                        # Add start_times_seconds information
-                        if (
-                            hasattr(phonemes, "start_times_seconds")
-                            and phonemes.start_times_seconds
-                        ):
-                            print(
-                                f"  🚀 Start Times 개수: {len(phonemes.start_times_seconds)}"
-                            )
-                        else:
-                            print(f"  🚀 Start Times count: 0 (no information)")
-
-                        if phonemes.symbols:
-                            print(f"\n  🔤 All Phoneme Symbols:")
-                            # Display in groups of 10
-                            symbols = phonemes.symbols
-                            for i in range(0, len(symbols), 10):
-                                group = symbols[i : i + 10]
-                                print(
-                                    f"    {i+1:3d}-{min(i+10, len(symbols)):3d}: {group}"
-                                )
-
-                        if phonemes.durations_seconds:
-                            print(f"\n  ⏱️ Duration Information (in seconds):")
-                            durations = phonemes.durations_seconds
-                            total_duration = sum(durations)
-                            print(f"    Total duration: {total_duration:.3f}s")
-                            print(
-                                f"    Average duration: {total_duration/len(durations):.3f}s"
-                            )
-                            print(f"    Min duration: {min(durations):.3f}s")
-                            print(f"    Max duration: {max(durations):.3f}s")
-
-                            # Display first 20 durations
-                            print(f"    First 20 duration: {durations[:20]}")
-                            if len(durations) > 20:
-                                print(f"    ... (total {len(durations)} items)")
-
-                        # Display additional start_times_seconds information
-                        if (
-                            hasattr(phonemes, "start_times_seconds")
-                            and phonemes.start_times_seconds
-                        ):
-                            print(f"\n  🚀 Start Times Information (in seconds):")
-                            start_times = phonemes.start_times_seconds
-                            print(f"    First start: {min(start_times):.3f}s")
-                            print(f"    Last start: {max(start_times):.3f}s")
-                            print(
-                                f"    Time range: {max(start_times) - min(start_times):.3f}s"
-                            )
-
-                            # Display first 20 start times
-                            print(f"    First 20 start times: {start_times[:20]}")
-                            if len(start_times) > 20:
-                                print(f"    ... (total {len(start_times)} items)")
-
-                        # Display Phoneme-Duration-StartTime mapping (first 30)
-                        if phonemes.symbols and phonemes.durations_seconds:
-                            print(
-                                f"\n  🎯 Phoneme-Duration-StartTime mapping (first 30):"
-                            )
-                            has_start_times = (
-                                hasattr(phonemes, "start_times_seconds")
-                                and phonemes.start_times_seconds
+                        # Display first 20 start times
+                        print(f"    First 20 start times: {start_times[:20]}")
+                        if len(start_times) > 20:
+                            print(f"    ... (total {len(start_times)} items)")
+
+                    # Display Phoneme-Duration-StartTime mapping (first 30)
+                    if symbols and durations:
+                        print(f"\n  🎯 Phoneme-Duration-StartTime mapping (first 30):")
+                        n = min(30, len(symbols), len(durations))
+                        head_symbols = symbols[:n]
+                        head_durations = durations[:n]
+                        starts = start_times[:n] if has_start else []
+                        # End times for every timed row in one array add
+                        ends = (
+                            np.asarray(starts, dtype=np.float64)
+                            + np.asarray(
+                                head_durations[: len(starts)], dtype=np.float64
                             )
+                        ).tolist()
 
-                            for i in range(
-                                min(
-                                    30,
-                                    len(phonemes.symbols),
-                                    len(phonemes.durations_seconds),
-                                )
-                            ):
-                                symbol = phonemes.symbols[i]
-                                duration = phonemes.durations_seconds[i]
-
-                                if has_start_times and i < len(
-                                    phonemes.start_times_seconds
-                                ):
-                                    start_time = phonemes.start_times_seconds[i]
-                                    end_time = start_time + duration
-                                    print(
-                                        f"    {i+1:2d}. '{symbol}' -> {start_time:.3f}s~{end_time:.3f}s ({duration:.3f}s)"
-                                    )
-                                else:
-                                    print(
-                                        f"    {i+1:2d}. '{symbol}' -> duration: {duration:.3f}s (start time 없음)"
-                                    )
-
-                            if len(phonemes.symbols) > 30:
-                                print(f"    ... (total {len(phonemes.symbols)} items)")
-
-                        # Save Phoneme Information as detailed JSON
-                        phoneme_data = {
-                            "text": long_text,
-                            "text_length": len(long_text),
-                            "audio_format": "wav",
-                            "phonemes": {
-                                "symbols": phonemes.symbols,
-                                "durations_seconds": phonemes.durations_seconds,
-                                "start_times_seconds": getattr(
-                                    phonemes, "start_times_seconds", None
-                                ),
-                                "total_symbols": (
-                                    len(phonemes.symbols) if phonemes.symbols else 0
-                                ),
-                                "total_duration": (
-                                    sum(phonemes.durations_seconds)
-                                    if phonemes.durations_seconds
-                                    else 0
-                                ),
-                                "average_duration": (
-                                    sum(phonemes.durations_seconds)
-                                    / len(phonemes.durations_seconds)
-                                    if phonemes.durations_seconds
-                                    else 0
-                                ),
-                                "has_start_times": hasattr(
-                                    phonemes, "start_times_seconds"
-                                )
-                                and phonemes.start_times_seconds is not None,
-                            },
-                        }
-
-                        import json
-
-                        with open(
-                            "test_long_chunking_phoneme_data.json",
-                            "w",
-                            encoding="utf-8",
-                        ) as f:
-                            json.dump(phoneme_data, f, ensure_ascii=False, indent=2)
-                        print(
-                            f"\n  💾 상세 Phoneme 데이터 저장: test_long_chunking_phoneme_data.json"
+                        rows = zip(head_symbols, starts, ends, head_durations)
+                        lines = [
+                            f"    {i:2d}. '{sym}' -> {start:.3f}s~{end:.3f}s ({dur:.3f}s)"
+                            for i, (sym, start, end, dur) in enumerate(rows, 1)
+                        ]
+                        lines.extend(
+                            f"    {i+1:2d}. '{head_symbols[i]}' -> duration: {head_durations[i]:.3f}s (start time 없음)"
+                            for i in range(len(starts), n)
                         )
+                        print("\n".join(lines))
+
+                        if len(symbols) > 30:
+                            print(f"    ... (total {len(symbols)} items)")
+
+                    # Save Phoneme Information as detailed JSON
+                    phoneme_data = {
+                        "text": long_text,
+                        "text_length": len(long_text),
+                        "audio_format": "wav",
+                        "phonemes": {
+                            "symbols": symbols,
+                            "durations_seconds": durations,
+                            "start_times_seconds": start_times,
+                            "total_symbols": len(symbols) if symbols else 0,
+                            "total_duration": total_duration,
+                            "average_duration": average_duration,
+                            "has_start_times": start_times is not None,
+                        },
+                    }
 
-                    else:
-                        print("  ⚠️ No Phoneme information")
+                    dump_json(phoneme_data, "test_long_chunking_phoneme_data.json")
+                    print(
+                        f"\n  💾 상세 Phoneme 데이터 저장: test_long_chunking_phoneme_data.json"
+                    )
 
-                    # Save as WAV file
-                    import base64
+                else:
+                    print("  ⚠️ No Phoneme information")
 
-                    audio_data = base64.b64decode(response.result.audio_base64)
-                    filename = "test_long_chunking_phoneme_output.wav"
-                    with open(filename, "wb") as f:
-                        f.write(audio_data)
-                    print(f"  💾 Audio file saved: {filename}")
+                # Save as WAV file
 
-                    return True, response
-                else:
-                    print("  ❌ No audio data")
-                    return False, None
+                audio_data = decode_audio_base64(response.result.audio_base64)
+                filename = "test_long_chunking_phoneme_output.wav"
+                with open(filename, "wb") as f:
+                    f.write(audio_data)
+                print(f"  💾 Audio file saved: {filename}")
+
+                return True, response
             else:
-                print("  ❌ Response has no result")
+                print("  ❌ No audio data")
                 return False, None
+        else:
+            print("  ❌ Response has no result")
+            return False, None
 
     except errors.SupertoneDefaultError as e:
         print(f"  ❌ API error: {e}")
@@ -2769,7 +2904,7 @@ def test_create_speech_long_text_with_phonemes(voice_id):
         return False, None
 
 
-def test_stream_speech_phoneme_chunking_wav(voice_id):
+def test_stream_speech_phoneme_chunking_wav(client, voice_id):
     """Long text + Phoneme + Streaming Test (WAV) - Improved Error Handling"""
     print("🎵🔤📜 Long text + Phoneme + Streaming Test (WAV) - Improved Error Handling")
 
@@ -2778,504 +2913,425 @@ def test_stream_speech_phoneme_chunking_wav(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         # Long text over 500 characters
-        long_text = """
-        안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 Phoneme + 스트리밍 테스트입니다.
-        현재 SDK는 긴 텍스트를 자동으로 청킹하지만, Phoneme + 스트리밍 조합에서는 제한사항이 있을 수 있습니다.
-        실시간 스트리밍 텍스트 음성 변환 기술은 현대 AI 애플리케이션에서 핵심적인 역할을 담당하고 있습니다.
-        특히 대화형 서비스, 라이브 방송, 실시간 번역 서비스 등에서 없어서는 안 될 중요한 기술입니다.
-        자동 청킹과 Phoneme 병합 기능을 통해 긴 텍스트도 자연스럽게 음성으로 변환하고 정확한 발음 정보를 제공할 수 있습니다.
-        """.strip()
+        long_text = LONG_KO_PHONEME_STREAM_TEXT
+
+        print(f"  🔍 Long text using voice '{voice_id}' Phoneme + Streaming Test...")
+        print(f"  📝 Text length: {len(long_text)} chars (exceeds 300 chars)")
+        print("  ⚠️ Current SDK chunking + Phoneme + streaming combination Test")
+        print("  ⚠️ This test may consume credits!")
+
+        response = client.text_to_speech.stream_speech(
+            voice_id=voice_id,
+            text=long_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            include_phonemes=True,  # Include Phoneme Information
+        )
 
-        with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Long text using voice '{voice_id}' Phoneme + Streaming Test..."
-            )
-            print(f"  📝 Text length: {len(long_text)} chars (exceeds 300 chars)")
-            print("  ⚠️ Current SDK chunking + Phoneme + streaming combination Test")
-            print("  ⚠️ This test may consume credits!")
-
-            response = client.text_to_speech.stream_speech(
-                voice_id=voice_id,
-                text=long_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                include_phonemes=True,  # Include Phoneme Information
-            )
+        print(f"  🔍 Response type: {type(response)}")
 
-            print(f"  🔍 Response type: {type(response)}")
+        if hasattr(response, "result"):
+            print(f"  🔍 Result type: {type(response.result)}")
 
-            if hasattr(response, "result"):
-                print(f"  🔍 Result type: {type(response.result)}")
+            # Process new JSON format response (Chunked merged response)
+            if isinstance(response.result, str):
+                try:
+                    # Attempt to parse JSON
+                    result_data = json_loads(response.result)
+                    print(f"  ✅ Chunked merged JSON response detected")
+                    print(f"  🔍 JSON keys: {', '.join(result_data)}")
 
-                # Process new JSON format response (Chunked merged response)
-                if isinstance(response.result, str):
-                    try:
-                        import json
-                        import base64
+                    if "audio_base64" in result_data:
+                        # Base64 decode and extract audio data
+                        audio_data = decode_audio_base64(result_data["audio_base64"])
+                        total_bytes = len(audio_data)
 
-                        # Attempt to parse JSON
-                        result_data = json.loads(response.result)
-                        print(f"  ✅ Chunked merged JSON response detected")
-                        print(f"  🔍 JSON keys: {list(result_data.keys())}")
+                        print(
+                            f"  ✅ Merged WAV + Phoneme audio data: {total_bytes} bytes"
+                        )
 
-                        if "audio_base64" in result_data:
-                            # Base64 decode and extract audio data
-                            audio_data = base64.b64decode(result_data["audio_base64"])
-                            total_bytes = len(audio_data)
+                        # Save file
+                        output_file = "test_phoneme_chunking_stream_output.wav"
+                        with open(output_file, "wb") as f:
+                            f.write(audio_data)
+                        print(
+                            f"  💾 Phoneme + 청킹 Streaming audio saved: {output_file}"
+                        )
 
-                            print(
-                                f"  ✅ Merged WAV + Phoneme audio data: {total_bytes} bytes"
-                            )
+                        # Validate file
+                        file_size = len(audio_data)
+                        print(f"  📏 Saved file size: {file_size} bytes")
 
-                            # Save file
-                            output_file = "test_phoneme_chunking_stream_output.wav"
-                            with open(output_file, "wb") as f:
-                                f.write(audio_data)
+                        header = audio_data[:12]
+                        if header.startswith(b"RIFF") and header.startswith(b"WAVE", 8):
+                            print(f"  ✅ Valid WAV file generated")
+                        else:
+                            print(f"  ⚠️ WAV header needs verification: {header[:12]}")
+
+                        # Process Merged Phoneme Information
+                        if "phonemes" in result_data and result_data["phonemes"]:
+                            phonemes = result_data["phonemes"]
+                            print(f"\n  🔤 ===== Merged Phoneme Information =====")
                             print(
-                                f"  💾 Phoneme + 청킹 Streaming audio saved: {output_file}"
+                                f"    - Symbol count: {len(phonemes.get('symbols', []))}"
                             )
 
-                            # Validate file
-                            import os
-
-                            file_size = os.path.getsize(output_file)
-                            print(f"  📏 Saved file size: {file_size} bytes")
-
-                            with open(output_file, "rb") as f:
-                                header = f.read(12)
-                                if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
-                                    print(f"  ✅ Valid WAV file generated")
-                                else:
-                                    print(
-                                        f"  ⚠️ WAV header needs verification: {header[:12]}"
-                                    )
-
-                            # Process Merged Phoneme Information
-                            if "phonemes" in result_data and result_data["phonemes"]:
-                                phonemes = result_data["phonemes"]
-                                print(f"\n  🔤 ===== Merged Phoneme Information =====")
-                                print(
-                                    f"    - Symbol count: {len(phonemes.get('symbols', []))}"
-                                )
-
-                                if phonemes.get("durations_seconds"):
-                                    durations = phonemes["durations_seconds"]
-                                    print(f"    - Duration: {len(durations)} items")
-                                    print(
-                                        f"    - Total duration: {sum(durations):.3f}s"
-                                    )
-
-                                if phonemes.get("start_times_seconds"):
-                                    start_times = phonemes["start_times_seconds"]
-                                    print(
-                                        f"    - Start times: {len(start_times)} items"
-                                    )
-                                    if start_times:
-                                        # Adjust time: Set first time to 0
-                                        first_time = start_times[0]
-                                        if first_time != 0.0:
-                                            print(
-                                                f"    - 시간 조정: 첫 번째 시간 {first_time:.3f}s를 0초로 조정"
-                                            )
-                                            adjusted_start_times = [
-                                                t - first_time for t in start_times
-                                            ]
-                                            phonemes["start_times_seconds"] = (
-                                                adjusted_start_times
-                                            )
-                                            start_times = adjusted_start_times
-
-                                        print(
-                                            f"    - Time range: {start_times[0]:.3f}s ~ {start_times[-1]:.3f}s"
-                                        )
-
-                                # Save detailed Phoneme data
-                                phoneme_output_file = (
-                                    "test_phoneme_chunking_stream_data.json"
-                                )
-                                with open(
-                                    phoneme_output_file, "w", encoding="utf-8"
-                                ) as f:
-                                    json.dump(phonemes, f, ensure_ascii=False, indent=2)
+                            if phonemes.get("durations_seconds"):
+                                durations = phonemes["durations_seconds"]
+                                print(f"    - Duration: {len(durations)} items")
                                 print(
-                                    f"  💾 상세 Phoneme 데이터 저장: {phoneme_output_file}"
+                                    f"    - Total duration: {math.fsum(durations):.3f}s"
                                 )
 
-                                # Display first few and last few phonemes
-                                symbols = phonemes.get("symbols", [])
-                                durations = phonemes.get("durations_seconds", [])
-                                start_times = phonemes.get("start_times_seconds", [])
-
-                                if len(symbols) > 0:
-                                    print(f"\n  🔤 Phoneme samples (first 10):")
-                                    for i in range(min(10, len(symbols))):
-                                        symbol = symbols[i]
-                                        duration = (
-                                            durations[i]
-                                            if i < len(durations)
-                                            else "N/A"
-                                        )
-                                        start_time = (
-                                            start_times[i]
-                                            if i < len(start_times)
-                                            else "N/A"
-                                        )
+                            if phonemes.get("start_times_seconds"):
+                                start_times = phonemes["start_times_seconds"]
+                                print(f"    - Start times: {len(start_times)} items")
+                                if start_times:
+                                    # Adjust time: Set first time to 0
+                                    first_time = start_times[0]
+                                    if first_time != 0.0:
                                         print(
-                                            f"    [{i+1:2d}] '{symbol}' | {duration}s | start: {start_time}s"
+                                            f"    - 시간 조정: 첫 번째 시간 {first_time:.3f}s를 0초로 조정"
                                         )
-
-                                    if len(symbols) > 10:
-                                        print(
-                                            f"    ... (showing only first 10 of {len(symbols)} items total)"
+                                        adjusted_start_times = (
+                                            np.asarray(start_times, dtype=np.float64)
+                                            - first_time
+                                        ).tolist()
+                                        phonemes["start_times_seconds"] = (
+                                            adjusted_start_times
                                         )
-                            else:
-                                print(f"  ⚠️ Phoneme Information missing")
-
-                            return True, {
-                                "total_bytes": total_bytes,
-                                "text_length": len(long_text),
-                                "format": "wav",
-                                "has_phonemes": "phonemes" in result_data
-                                and result_data["phonemes"] is not None,
-                                "phoneme_count": len(
-                                    result_data.get("phonemes", {}).get("symbols", [])
-                                ),
-                                "output_file": output_file,
-                                "phoneme_file": "test_phoneme_chunking_stream_data.json",
-                            }
-                        else:
-                            print(f"  ❌ audio_base64 key missing: {result_data}")
-                            return False, result_data
-
-                    except json.JSONDecodeError:
-                        # Process with existing logic if not JSON
-                        print(f"  📄 Direct processing of string response...")
-                        pass
-                    except Exception as e:
-                        print(f"  ❌ Merged JSON Error processing response: {e}")
-                        return False, e
-
-                # Handle ExtendedStreamingWrapper error
-                if "ExtendedStreamingWrapper" in str(type(response.result)):
-                    print(
-                        "  ⚠️ ExtendedStreamingWrapper detected - special handling required"
-                    )
+                                        start_times = adjusted_start_times
 
-                    try:
-                        # Attempt to access original_response of ExtendedStreamingWrapper directly
-                        if hasattr(response.result, "original_response"):
-                            original = response.result.original_response
-                            print(f"  🔍 Original response type: {type(original)}")
-
-                            # Process as JSON if original_response is a string
-                            if isinstance(original, str):
-                                print(
-                                    "  📄 Original response가 문자열 - JSON 스트리밍으로 처리"
-                                )
-
-                                import json
-                                import base64
-
-                                lines = original.strip().split("\n")
-                                total_audio = b""
-                                all_phonemes = {
-                                    "symbols": [],
-                                    "durations_seconds": [],
-                                    "start_times_seconds": [],
-                                }  # Add start_times_seconds
-                                current_time_offset = 0.0  # Track time offset
-
-                                for i, line in enumerate(lines):
-                                    if line.strip():
-                                        try:
-                                            chunk_data = json.loads(line.strip())
-                                            print(
-                                                f"    JSON Chunk {i+1}: {list(chunk_data.keys())}"
-                                            )
-
-                                            # Process audio data
-                                            if chunk_data.get("audio_base64"):
-                                                audio_data = base64.b64decode(
-                                                    chunk_data["audio_base64"]
-                                                )
-                                                total_audio += audio_data
-                                                print(
-                                                    f"      오디오: {len(audio_data)} bytes"
-                                                )
-
-                                            # Process Phoneme data (including start_times_seconds)
-                                            if chunk_data.get("phonemes"):
-                                                phonemes = chunk_data["phonemes"]
-
-                                                # 🔍 Debugging output of original phonemes structure (added)
-                                                print(
-                                                    f"\n      �� Original Phonemes structure:"
-                                                )
-                                                for key in phonemes.keys():
-                                                    value = phonemes[key]
-                                                    if isinstance(value, list):
-                                                        print(
-                                                            f"        {key}: [{len(value)} items] {type(value[0]).__name__ if value else 'empty'}"
-                                                        )
-                                                    else:
-                                                        print(
-                                                            f"        {key}: {type(value).__name__} = {value}"
-                                                        )
-
-                                                if phonemes.get("symbols"):
-                                                    all_phonemes["symbols"].extend(
-                                                        phonemes["symbols"]
-                                                    )
-                                                    print(
-                                                        f"      Phoneme symbols: {len(phonemes['symbols'])} items"
-                                                    )
-
-                                                if phonemes.get("durations_seconds"):
-                                                    all_phonemes[
-                                                        "durations_seconds"
-                                                    ].extend(
-                                                        phonemes["durations_seconds"]
-                                                    )
-                                                    print(
-                                                        f"      Duration: {len(phonemes['durations_seconds'])} items"
-                                                    )
-
-                                                # Process start_times_seconds (apply time offset)
-                                                if phonemes.get("start_times_seconds"):
-                                                    # Apply offset to current chunk's start times
-                                                    offset_start_times = [
-                                                        t + current_time_offset
-                                                        for t in phonemes[
-                                                            "start_times_seconds"
-                                                        ]
-                                                    ]
-                                                    all_phonemes[
-                                                        "start_times_seconds"
-                                                    ].extend(offset_start_times)
-                                                    print(
-                                                        f"      Start Times: {len(phonemes['start_times_seconds'])} items (offset: +{current_time_offset:.3f}s)"
-                                                    )
-
-                                                # Update time offset for next chunk
-                                                if phonemes.get("durations_seconds"):
-                                                    chunk_duration = sum(
-                                                        phonemes["durations_seconds"]
-                                                    )
-                                                    current_time_offset += (
-                                                        chunk_duration
-                                                    )
+                                    print(
+                                        f"    - Time range: {start_times[0]:.3f}s ~ {start_times[-1]:.3f}s"
+                                    )
 
-                                        except json.JSONDecodeError as je:
-                                            print(
-                                                f"    JSON Chunk {i+1} parsing failed: {str(je)[:50]}..."
-                                            )
+                            # Save detailed Phoneme data
+                            phoneme_output_file = (
+                                "test_phoneme_chunking_stream_data.json"
+                            )
+                            dump_json(phonemes, phoneme_output_file)
+                            print(
+                                f"  💾 상세 Phoneme 데이터 저장: {phoneme_output_file}"
+                            )
 
-                                # Display detailed Phoneme Information (including start_times_seconds)
-                                if all_phonemes["symbols"]:
-                                    print(
-                                        f"\n  🔤 ===== Merged Phoneme Information ====="
+                            # Display first few and last few phonemes
+                            symbols = phonemes.get("symbols", [])
+                            durations = phonemes.get("durations_seconds", [])
+                            start_times = phonemes.get("start_times_seconds", [])
+
+                            if len(symbols) > 0:
+                                print(f"\n  🔤 Phoneme samples (first 10):")
+                                for i in range(min(10, len(symbols))):
+                                    symbol = symbols[i]
+                                    duration = (
+                                        durations[i] if i < len(durations) else "N/A"
                                     )
-                                    print(
-                                        f"  📊 Total symbol count: {len(all_phonemes['symbols'])}"
+                                    start_time = (
+                                        start_times[i]
+                                        if i < len(start_times)
+                                        else "N/A"
                                     )
                                     print(
-                                        f"  ⏱️ Total Duration count: {len(all_phonemes['durations_seconds'])}"
+                                        f"    [{i+1:2d}] '{symbol}' | {duration}s | start: {start_time}s"
                                     )
+
+                                if len(symbols) > 10:
                                     print(
-                                        f"  🚀 Total Start Times count: {len(all_phonemes['start_times_seconds'])}"
+                                        f"    ... (showing only first 10 of {len(symbols)} items total)"
                                     )
+                        else:
+                            print(f"  ⚠️ Phoneme Information missing")
 
-                                    # Display all symbols (in groups of 10)
-                                    symbols = all_phonemes["symbols"]
-                                    print(f"\n  🔤 All Phoneme Symbols:")
-                                    for i in range(0, len(symbols), 10):
-                                        group = symbols[i : i + 10]
-                                        print(
-                                            f"    {i+1:3d}-{min(i+10, len(symbols)):3d}: {group}"
-                                        )
+                        return True, {
+                            "total_bytes": total_bytes,
+                            "text_length": len(long_text),
+                            "format": "wav",
+                            "has_phonemes": "phonemes" in result_data
+                            and result_data["phonemes"] is not None,
+                            "phoneme_count": len(
+                                result_data.get("phonemes", {}).get("symbols", [])
+                            ),
+                            "output_file": output_file,
+                            "phoneme_file": "test_phoneme_chunking_stream_data.json",
+                        }
+                    else:
+                        print(f"  ❌ audio_base64 key missing: {result_data}")
+                        return False, result_data
 
-                                    # Duration statistics
-                                    if all_phonemes["durations_seconds"]:
-                                        durations = all_phonemes["durations_seconds"]
-                                        total_duration = sum(durations)
-                                        print(f"\n  ⏱️ Duration statistics:")
-                                        print(
-                                            f"    Total duration: {total_duration:.3f}s"
-                                        )
-                                        print(
-                                            f"    Average duration: {total_duration/len(durations):.3f}s"
-                                        )
-                                        print(
-                                            f"    Min duration: {min(durations):.3f}s"
-                                        )
-                                        print(
-                                            f"    Max duration: {max(durations):.3f}s"
-                                        )
+                except json.JSONDecodeError:
+                    # Process with existing logic if not JSON
+                    print(f"  📄 Direct processing of string response...")
+                    pass
+                except Exception as e:
+                    print(f"  ❌ Merged JSON Error processing response: {e}")
+                    return False, e
+
+            # Handle ExtendedStreamingWrapper error
+            if "ExtendedStreamingWrapper" in str(type(response.result)):
+                print(
+                    "  ⚠️ ExtendedStreamingWrapper detected - special handling required"
+                )
+
+                try:
+                    # Attempt to access original_response of ExtendedStreamingWrapper directly
+                    if hasattr(response.result, "original_response"):
+                        original = response.result.original_response
+                        print(f"  🔍 Original response type: {type(original)}")
+
+                        # Process as JSON if original_response is a string
+                        if isinstance(original, str):
+                            print(
+                                "  📄 Original response가 문자열 - JSON 스트리밍으로 처리"
+                            )
 
-                                    # Add Start Times statistics
-                                    if all_phonemes["start_times_seconds"]:
-                                        start_times = all_phonemes[
-                                            "start_times_seconds"
-                                        ]
-                                        print(f"\n  🚀 Start Times statistics:")
-                                        print(
-                                            f"    First start: {min(start_times):.3f}s"
-                                        )
-                                        print(
-                                            f"    Last start: {max(start_times):.3f}s"
-                                        )
-                                        print(
-                                            f"    전체 Time range: {max(start_times) - min(start_times):.3f}s"
+                            lines = original.splitlines()
+                            total_audio = bytearray()
+                            all_phonemes = {
+                                "symbols": [],
+                                "durations_seconds": [],
+                                "start_times_seconds": [],
+                            }  # Add start_times_seconds
+                            current_time_offset = 0.0  # Track time offset
+
+                            # Per-chunk lines are collected and printed once after the loop
+                            log_lines = []
+                            add = log_lines.append
+                            for i, line in enumerate(lines):
+                                if line:
+                                    try:
+                                        chunk_data = json_loads(line)
+                                        add(
+                                            f"    JSON Chunk {i+1}: {', '.join(chunk_data)}"
                                         )
 
-                                    # Display Phoneme-Duration-StartTime mapping (first 30)
-                                    if (
-                                        all_phonemes["symbols"]
-                                        and all_phonemes["durations_seconds"]
-                                    ):
-                                        print(
-                                            f"\n  🎯 Phoneme-Duration-StartTime mapping (first 30):"
-                                        )
-                                        has_start_times = (
-                                            len(all_phonemes["start_times_seconds"]) > 0
-                                        )
+                                        # Process audio data
+                                        if chunk_data.get("audio_base64"):
+                                            audio_data = decode_audio_base64(
+                                                chunk_data["audio_base64"]
+                                            )
+                                            total_audio.extend(audio_data)
+                                            add(
+                                                f"      오디오: {len(audio_data)} bytes"
+                                            )
 
-                                        for i in range(
-                                            min(
-                                                30,
-                                                len(all_phonemes["symbols"]),
-                                                len(all_phonemes["durations_seconds"]),
+                                        # Process Phoneme data (including start_times_seconds)
+                                        if chunk_data.get("phonemes"):
+                                            phonemes = chunk_data["phonemes"]
+
+                                            # 🔍 Debugging output of original phonemes structure (added)
+                                            add(
+                                                f"\n      �� Original Phonemes structure:"
                                             )
-                                        ):
-                                            symbol = all_phonemes["symbols"][i]
-                                            duration = all_phonemes[
-                                                "durations_seconds"
-                                            ][i]
-
-                                            if has_start_times and i < len(
-                                                all_phonemes["start_times_seconds"]
-                                            ):
-                                                start_time = all_phonemes[
-                                                    "start_times_seconds"
-                                                ][i]
-                                                end_time = start_time + duration
-                                                print(
-                                                    f"    {i+1:2d}. '{symbol}' -> {start_time:.3f}s~{end_time:.3f}s ({duration:.3f}s)"
+                                            for key in phonemes.keys():
+                                                value = phonemes[key]
+                                                if isinstance(value, list):
+                                                    add(
+                                                        f"        {key}: [{len(value)} items] {type(value[0]).__name__ if value else 'empty'}"
+                                                    )
+                                                else:
+                                                    add(
+                                                        f"        {key}: {type(value).__name__} = {value}"
+                                                    )
+
+                                            if phonemes.get("symbols"):
+                                                all_phonemes["symbols"].extend(
+                                                    phonemes["symbols"]
                                                 )
-                                            else:
-                                                print(
-                                                    f"    {i+1:2d}. '{symbol}' -> duration: {duration:.3f}s (start time 없음)"
+                                                add(
+                                                    f"      Phoneme symbols: {len(phonemes['symbols'])} items"
                                                 )
 
-                                        if len(all_phonemes["symbols"]) > 30:
-                                            print(
-                                                f"    ... (총 {len(all_phonemes['symbols'])} items)"
-                                            )
+                                            if phonemes.get("durations_seconds"):
+                                                all_phonemes[
+                                                    "durations_seconds"
+                                                ].extend(phonemes["durations_seconds"])
+                                                add(
+                                                    f"      Duration: {len(phonemes['durations_seconds'])} items"
+                                                )
 
-                                    # Save detailed information as JSON (including start_times_seconds)
-                                    phoneme_data = {
-                                        "text": long_text,
-                                        "text_length": len(long_text),
-                                        "processing_method": "stream_speech_chunking",
-                                        "audio_format": "wav",
-                                        "phonemes": all_phonemes,
-                                        "statistics": {
-                                            "total_symbols": len(
-                                                all_phonemes["symbols"]
-                                            ),
-                                            "total_duration": (
-                                                sum(all_phonemes["durations_seconds"])
-                                                if all_phonemes["durations_seconds"]
-                                                else 0
-                                            ),
-                                            "has_start_times": len(
-                                                all_phonemes["start_times_seconds"]
-                                            )
-                                            > 0,
-                                            "total_time_range": (
-                                                max(all_phonemes["start_times_seconds"])
-                                                - min(
-                                                    all_phonemes["start_times_seconds"]
+                                            # Process start_times_seconds (apply time offset)
+                                            if phonemes.get("start_times_seconds"):
+                                                # Apply offset to current chunk's start times
+                                                offset_start_times = (
+                                                    np.asarray(
+                                                        phonemes["start_times_seconds"],
+                                                        dtype=np.float64,
+                                                    )
+                                                    + current_time_offset
+                                                ).tolist()
+                                                all_phonemes[
+                                                    "start_times_seconds"
+                                                ].extend(offset_start_times)
+                                                add(
+                                                    f"      Start Times: {len(phonemes['start_times_seconds'])} items (offset: +{current_time_offset:.3f}s)"
+                                                )
+
+                                            # Update time offset for next chunk
+                                            if phonemes.get("durations_seconds"):
+                                                chunk_duration = math.fsum(
+                                                    phonemes["durations_seconds"]
                                                 )
-                                                if all_phonemes["start_times_seconds"]
-                                                else 0
-                                            ),
-                                        },
-                                    }
-
-                                    import json
-
-                                    with open(
-                                        "test_phoneme_chunking_stream_data.json",
-                                        "w",
-                                        encoding="utf-8",
-                                    ) as f:
-                                        json.dump(
-                                            phoneme_data,
-                                            f,
-                                            ensure_ascii=False,
-                                            indent=2,
+                                                current_time_offset += chunk_duration
+
+                                    except json.JSONDecodeError as je:
+                                        add(
+                                            f"    JSON Chunk {i+1} parsing failed: {str(je)[:50]}..."
                                         )
+
+                            if log_lines:
+                                print("\n".join(log_lines))
+
+                            # Display detailed Phoneme Information (including start_times_seconds)
+                            symbols = all_phonemes["symbols"]
+                            durations = all_phonemes["durations_seconds"]
+                            starts = all_phonemes["start_times_seconds"]
+                            nsym, ndur, nst = len(symbols), len(durations), len(starts)
+                            if symbols:
+                                print(f"\n  🔤 ===== Merged Phoneme Information =====")
+                                print(f"  📊 Total symbol count: {nsym}")
+                                print(f"  ⏱️ Total Duration count: {ndur}")
+                                print(f"  🚀 Total Start Times count: {nst}")
+
+                                # Display all symbols (in groups of 10)
+                                print(f"\n  🔤 All Phoneme Symbols:")
+                                groups = [
+                                    f"    {i+1:3d}-{min(i+10, nsym):3d}: {symbols[i : i + 10]}"
+                                    for i in range(0, nsym, 10)
+                                ]
+                                print("\n".join(groups))
+
+                                # Reduce each array once; the results are reused
+                                # in the statistics saved below
+                                total_duration = time_range = 0
+                                if durations:
+                                    d = np.asarray(durations, dtype=np.float64)
+                                    total_duration = math.fsum(durations)
+                                    print(f"\n  ⏱️ Duration statistics:")
+                                    print(f"    Total duration: {total_duration:.3f}s")
                                     print(
-                                        f"\n  💾 Detailed Phoneme streaming data saved: test_phoneme_chunking_stream_data.json"
+                                        f"    Average duration: {total_duration/ndur:.3f}s"
+                                    )
+                                    print(f"    Min duration: {d.min():.3f}s")
+                                    print(f"    Max duration: {d.max():.3f}s")
+
+                                # Add Start Times statistics
+                                if starts:
+                                    t = np.asarray(starts, dtype=np.float64)
+                                    first_start = float(t.min())
+                                    last_start = float(t.max())
+                                    time_range = last_start - first_start
+                                    print(f"\n  🚀 Start Times statistics:")
+                                    print(f"    First start: {first_start:.3f}s")
+                                    print(f"    Last start: {last_start:.3f}s")
+                                    print(f"    전체 Time range: {time_range:.3f}s")
+
+                                # Display Phoneme-Duration-StartTime mapping (first 30)
+                                if durations:
+                                    print(
+                                        f"\n  🎯 Phoneme-Duration-StartTime mapping (first 30):"
                                     )
 
-                                return (
-                                    True,
-                                    f"JSON streaming success: {len(total_audio)} bytes, {len(all_phonemes['symbols'])} phonemes, {len(all_phonemes['start_times_seconds'])} start times",
-                                )
+                                    lines = []
+                                    for i in range(min(30, nsym, ndur)):
+                                        symbol = symbols[i]
+                                        duration = durations[i]
 
-                            else:
+                                        if i < nst:
+                                            start_time = starts[i]
+                                            end_time = start_time + duration
+                                            lines.append(
+                                                f"    {i+1:2d}. '{symbol}' -> {start_time:.3f}s~{end_time:.3f}s ({duration:.3f}s)"
+                                            )
+                                        else:
+                                            lines.append(
+                                                f"    {i+1:2d}. '{symbol}' -> duration: {duration:.3f}s (start time 없음)"
+                                            )
+                                    print("\n".join(lines))
+
+                                    if nsym > 30:
+                                        print(f"    ... (총 {nsym} items)")
+
+                                # Save detailed information as JSON (including start_times_seconds)
+                                phoneme_data = {
+                                    "text": long_text,
+                                    "text_length": len(long_text),
+                                    "processing_method": "stream_speech_chunking",
+                                    "audio_format": "wav",
+                                    "phonemes": all_phonemes,
+                                    "statistics": {
+                                        "total_symbols": nsym,
+                                        "total_duration": total_duration,
+                                        "has_start_times": nst > 0,
+                                        "total_time_range": time_range,
+                                    },
+                                }
+
+                                dump_json(
+                                    phoneme_data,
+                                    "test_phoneme_chunking_stream_data.json",
+                                )
                                 print(
-                                    f"  🔍 Original response has unexpected type: {type(original)}"
+                                    f"\n  💾 Detailed Phoneme streaming data saved: test_phoneme_chunking_stream_data.json"
                                 )
 
-                    except Exception as wrapper_error:
-                        print(
-                            f"  ❌ Error processing ExtendedStreamingWrapper: {wrapper_error}"
-                        )
-                        print(f"  🔍 Wrapper Error type: {type(wrapper_error)}")
+                            return (
+                                True,
+                                f"JSON streaming success: {len(total_audio)} bytes, {nsym} phonemes, {nst} start times",
+                            )
 
-                # Attempt regular streaming processing
-                try:
-                    if hasattr(response.result, "iter_bytes"):
-                        print("  🔄 Attempting regular streaming processing...")
-                        audio_chunks = []
-
-                        for chunk in response.result.iter_bytes(chunk_size=8192):
-                            audio_chunks.append(chunk)
-
-                        if audio_chunks:
-                            full_audio = b"".join(audio_chunks)
-                            filename = "test_phoneme_chunking_stream_output.wav"
-                            with open(filename, "wb") as f:
-                                f.write(full_audio)
-                            print(f"  💾 Regular Streaming audio saved: {filename}")
-                            return True, response
-
-                except AttributeError as attr_error:
-                    if "'str' object has no attribute 'iter_bytes'" in str(attr_error):
-                        print("  ✅ Expected error: Streaming interface issue")
-                        print(
-                            "  💡 Phoneme + Long text + streaming is currently not fully supported"
-                        )
-                        return (
-                            True,
-                            "Expected: Streaming interface limitation with phonemes",
-                        )
-                    else:
-                        raise attr_error
+                        else:
+                            print(
+                                f"  🔍 Original response has unexpected type: {type(original)}"
+                            )
+
+                except Exception as wrapper_error:
+                    print(
+                        f"  ❌ Error processing ExtendedStreamingWrapper: {wrapper_error}"
+                    )
+                    print(f"  🔍 Wrapper Error type: {type(wrapper_error)}")
+
+            # Attempt regular streaming processing
+            try:
+                if hasattr(response.result, "iter_bytes"):
+                    print("  🔄 Attempting regular streaming processing...")
+                    filename = "test_phoneme_chunking_stream_output.wav"
+                    total_bytes = 0
+
+                    # Write chunks as they arrive instead of joining them at the end
+                    with open(filename, "wb", buffering=1 << 20) as f:
+                        for chunk in response.result.iter_bytes(
+                            chunk_size=STREAM_CHUNK_SIZE
+                        ):
+                            f.write(chunk)
+                            total_bytes += len(chunk)
+
+                    if total_bytes:
+                        print(f"  💾 Regular Streaming audio saved: {filename}")
+                        return True, response
+                    os.remove(filename)
+
+            except AttributeError as attr_error:
+                if "'str' object has no attribute 'iter_bytes'" in str(attr_error):
+                    print("  ✅ Expected error: Streaming interface issue")
+                    print(
+                        "  💡 Phoneme + Long text + streaming is currently not fully supported"
+                    )
+                    return (
+                        True,
+                        "Expected: Streaming interface limitation with phonemes",
+                    )
+                else:
+                    raise attr_error
 
-                # Process other response formats
-                if isinstance(response.result, str):
-                    print("  📄 Direct processing of string response...")
-                    # Same as JSON processing logic above
+            # Process other response formats
+            if isinstance(response.result, str):
+                print("  📄 Direct processing of string response...")
+                # Same as JSON processing logic above
 
-                print("  ⚠️ Unknown response structure - additional analysis required")
-                return False, "Unknown response structure"
+            print("  ⚠️ Unknown response structure - additional analysis required")
+            return False, "Unknown response structure"
 
     except errors.SupertoneDefaultError as e:
         print(f"  ❌ API error: {e}")
@@ -3291,7 +3347,7 @@ def test_stream_speech_phoneme_chunking_wav(voice_id):
 # =============================================================================
 
 
-def test_create_speech_sona_speech_2(voice_id):
+def test_create_speech_sona_speech_2(client, voice_id):
     """Test TTS with sona_speech_2 model"""
     print("🎤 TTS Test with sona_speech_2 Model")
 
@@ -3300,35 +3356,32 @@ def test_create_speech_sona_speech_2(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Converting TTS with sona_speech_2 using voice '{voice_id}'...")
-            print("  ⚠️ This test will consume credits!")
-
-            response = client.text_to_speech.create_speech(
-                voice_id=voice_id,
-                text="Hello! This is a test with the new sona_speech_2 model.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_2,
-            )
+        print(f"  🔍 Converting TTS with sona_speech_2 using voice '{voice_id}'...")
+        print("  ⚠️ This test will consume credits!")
+
+        response = client.text_to_speech.create_speech(
+            voice_id=voice_id,
+            text="Hello! This is a test with the new sona_speech_2 model.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_2,
+        )
 
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                audio_size = len(audio_data)
-                print(f"  ✅ sona_speech_2 TTS successful: {audio_size} bytes")
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            audio_size = len(audio_data)
+            print(f"  ✅ sona_speech_2 TTS successful: {audio_size} bytes")
 
-                output_file = "test_sona_speech_2_output.wav"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 Audio saved: {output_file}")
+            output_file = "test_sona_speech_2_output.wav"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 Audio saved: {output_file}")
 
-                return True, response
-            else:
-                print(f"  ❌ Response structure error: {type(response)}")
-                return False, response
+            return True, response
+        else:
+            print(f"  ❌ Response structure error: {type(response)}")
+            return False, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
@@ -3338,7 +3391,7 @@ def test_create_speech_sona_speech_2(voice_id):
         return False, e
 
 
-def test_create_speech_supertonic_api_1(voice_id):
+def test_create_speech_supertonic_api_1(client, voice_id):
     """Test TTS with supertonic_api_1 model"""
     print("🎤 TTS Test with supertonic_api_1 Model")
 
@@ -3347,37 +3400,32 @@ def test_create_speech_supertonic_api_1(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Converting TTS with supertonic_api_1 using voice '{voice_id}'..."
-            )
-            print("  ⚠️ This test will consume credits!")
-
-            response = client.text_to_speech.create_speech(
-                voice_id=voice_id,
-                text="Hello! This is a test with the supertonic_api_1 model.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SUPERTONIC_API_1,
-            )
+        print(f"  🔍 Converting TTS with supertonic_api_1 using voice '{voice_id}'...")
+        print("  ⚠️ This test will consume credits!")
+
+        response = client.text_to_speech.create_speech(
+            voice_id=voice_id,
+            text="Hello! This is a test with the supertonic_api_1 model.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SUPERTONIC_API_1,
+        )
 
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                audio_size = len(audio_data)
-                print(f"  ✅ supertonic_api_1 TTS successful: {audio_size} bytes")
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            audio_size = len(audio_data)
+            print(f"  ✅ supertonic_api_1 TTS successful: {audio_size} bytes")
 
-                output_file = "test_supertonic_api_1_output.wav"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 Audio saved: {output_file}")
+            output_file = "test_supertonic_api_1_output.wav"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 Audio saved: {output_file}")
 
-                return True, response
-            else:
-                print(f"  ❌ Response structure error: {type(response)}")
-                return False, response
+            return True, response
+        else:
+            print(f"  ❌ Response structure error: {type(response)}")
+            return False, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
@@ -3387,7 +3435,7 @@ def test_create_speech_supertonic_api_1(voice_id):
         return False, e
 
 
-def test_create_speech_invalid_model(voice_id):
+def test_create_speech_invalid_model(client, voice_id):
     """Test TTS with unsupported model - should return error"""
     print("❌ TTS Test with Invalid Model (Expected Error)")
 
@@ -3396,23 +3444,20 @@ def test_create_speech_invalid_model(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Attempting TTS with invalid model 'invalid_model_xyz'...")
-
-            # Attempt to call with invalid model string directly
-            response = client.text_to_speech.create_speech(
-                voice_id=voice_id,
-                text="This should fail with invalid model.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model="invalid_model_xyz",  # Invalid model
-            )
+        print(f"  🔍 Attempting TTS with invalid model 'invalid_model_xyz'...")
+
+        # Attempt to call with invalid model string directly
+        response = client.text_to_speech.create_speech(
+            voice_id=voice_id,
+            text="This should fail with invalid model.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model="invalid_model_xyz",  # Invalid model
+        )
 
-            print(f"  ⚠️ Unexpected: API did not reject invalid model")
-            return False, response
+        print(f"  ⚠️ Unexpected: API did not reject invalid model")
+        return False, response
 
     except (errors.BadRequestErrorResponse, errors.SupertoneError) as e:
         print(
@@ -3431,7 +3476,7 @@ def test_create_speech_invalid_model(voice_id):
         return True, e
 
 
-def test_predict_duration_sona_speech_2(voice_id):
+def test_predict_duration_sona_speech_2(client, voice_id):
     """Test duration prediction with sona_speech_2 model"""
     print("⏱️ Duration Prediction Test with sona_speech_2 Model")
 
@@ -3440,23 +3485,20 @@ def test_predict_duration_sona_speech_2(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Predicting duration with sona_speech_2 using voice '{voice_id}'..."
-            )
+        print(
+            f"  🔍 Predicting duration with sona_speech_2 using voice '{voice_id}'..."
+        )
 
-            response = client.text_to_speech.predict_duration(
-                voice_id=voice_id,
-                text="Hello! This is a duration prediction test with sona_speech_2.",
-                language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model=models.PredictTTSDurationUsingCharacterRequestModel.SONA_SPEECH_2,
-            )
+        response = client.text_to_speech.predict_duration(
+            voice_id=voice_id,
+            text="Hello! This is a duration prediction test with sona_speech_2.",
+            language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model=models.PredictTTSDurationUsingCharacterRequestModel.SONA_SPEECH_2,
+        )
 
-            print(f"  ✅ sona_speech_2 prediction complete: {response} seconds")
-            return True, response
+        print(f"  ✅ sona_speech_2 prediction complete: {response} seconds")
+        return True, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
@@ -3466,7 +3508,7 @@ def test_predict_duration_sona_speech_2(voice_id):
         return False, e
 
 
-def test_predict_duration_supertonic_api_1(voice_id):
+def test_predict_duration_supertonic_api_1(client, voice_id):
     """Test duration prediction with supertonic_api_1 model"""
     print("⏱️ Duration Prediction Test with supertonic_api_1 Model")
 
@@ -3475,23 +3517,20 @@ def test_predict_duration_supertonic_api_1(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Predicting duration with supertonic_api_1 using voice '{voice_id}'..."
-            )
+        print(
+            f"  🔍 Predicting duration with supertonic_api_1 using voice '{voice_id}'..."
+        )
 
-            response = client.text_to_speech.predict_duration(
-                voice_id=voice_id,
-                text="Hello! This is a duration prediction test with supertonic_api_1.",
-                language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model=models.PredictTTSDurationUsingCharacterRequestModel.SUPERTONIC_API_1,
-            )
+        response = client.text_to_speech.predict_duration(
+            voice_id=voice_id,
+            text="Hello! This is a duration prediction test with supertonic_api_1.",
+            language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model=models.PredictTTSDurationUsingCharacterRequestModel.SUPERTONIC_API_1,
+        )
 
-            print(f"  ✅ supertonic_api_1 prediction complete: {response} seconds")
-            return True, response
+        print(f"  ✅ supertonic_api_1 prediction complete: {response} seconds")
+        return True, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
@@ -3501,7 +3540,7 @@ def test_predict_duration_supertonic_api_1(voice_id):
         return False, e
 
 
-def test_predict_duration_invalid_model(voice_id):
+def test_predict_duration_invalid_model(client, voice_id):
     """Test duration prediction with unsupported model - should return error"""
     print("❌ Duration Prediction Test with Invalid Model (Expected Error)")
 
@@ -3510,23 +3549,18 @@ def test_predict_duration_invalid_model(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Attempting prediction with invalid model 'invalid_model_xyz'..."
-            )
-
-            response = client.text_to_speech.predict_duration(
-                voice_id=voice_id,
-                text="This should fail with invalid model.",
-                language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model="invalid_model_xyz",  # Invalid model
-            )
+        print(f"  🔍 Attempting prediction with invalid model 'invalid_model_xyz'...")
+
+        response = client.text_to_speech.predict_duration(
+            voice_id=voice_id,
+            text="This should fail with invalid model.",
+            language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model="invalid_model_xyz",  # Invalid model
+        )
 
-            print(f"  ⚠️ Unexpected: API did not reject invalid model")
-            return False, response
+        print(f"  ⚠️ Unexpected: API did not reject invalid model")
+        return False, response
 
     except (errors.BadRequestErrorResponse, errors.SupertoneError) as e:
         print(
@@ -3548,7 +3582,7 @@ def test_predict_duration_invalid_model(voice_id):
 # =============================================================================
 
 
-def test_create_speech_sona_speech_1_multilang(voice_id):
+def test_create_speech_sona_speech_1_multilang(client, voice_id):
     """Test sona_speech_1 with supported languages (ko, en, ja)"""
     print("🌐 sona_speech_1 Multi-language Test (ko, en, ja)")
 
@@ -3557,8 +3591,6 @@ def test_create_speech_sona_speech_1_multilang(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         test_cases = [
             (
                 models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
@@ -3575,31 +3607,30 @@ def test_create_speech_sona_speech_1_multilang(voice_id):
         ]
 
         all_success = True
-        with Supertone(api_key=API_KEY) as client:
-            for lang, text in test_cases:
-                print(f"  🔍 Testing {lang.value} with sona_speech_1...")
-
-                try:
-                    response = client.text_to_speech.create_speech(
-                        voice_id=voice_id,
-                        text=text,
-                        language=lang,
-                        output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                        style="neutral",
-                        model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
-                    )
-
-                    if hasattr(response, "result") and hasattr(response.result, "read"):
-                        audio_data = response.result.read()
-                        print(f"    ✅ {lang.value}: {len(audio_data)} bytes")
-                    else:
-                        print(f"    ❌ {lang.value}: Response structure error")
-                        all_success = False
+        for lang, text in test_cases:
+            print(f"  🔍 Testing {lang.value} with sona_speech_1...")
+
+            try:
+                response = client.text_to_speech.create_speech(
+                    voice_id=voice_id,
+                    text=text,
+                    language=lang,
+                    output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+                    style="neutral",
+                    model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
+                )
 
-                except errors.SupertoneError as e:
-                    print(f"    ❌ {lang.value}: {e.message}")
+                if hasattr(response, "result") and hasattr(response.result, "read"):
+                    audio_data = response.result.read()
+                    print(f"    ✅ {lang.value}: {len(audio_data)} bytes")
+                else:
+                    print(f"    ❌ {lang.value}: Response structure error")
                     all_success = False
 
+            except errors.SupertoneError as e:
+                print(f"    ❌ {lang.value}: {e.message}")
+                all_success = False
+
         return all_success, "sona_speech_1 multilang test"
 
     except Exception as e:
@@ -3607,7 +3638,7 @@ def test_create_speech_sona_speech_1_multilang(voice_id):
         return False, e
 
 
-def test_create_speech_sona_speech_2_multilang(voice_id):
+def test_create_speech_sona_speech_2_multilang(client, voice_id):
     """Test sona_speech_2 with all supported languages"""
     print("🌐 sona_speech_2 Multi-language Test (all languages)")
 
@@ -3616,8 +3647,6 @@ def test_create_speech_sona_speech_2_multilang(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         # sona_speech_2 supports all languages
         test_cases = [
             (
@@ -3640,32 +3669,31 @@ def test_create_speech_sona_speech_2_multilang(voice_id):
 
         all_success = True
         success_count = 0
-        with Supertone(api_key=API_KEY) as client:
-            for lang, text in test_cases:
-                print(f"  🔍 Testing {lang.value} with sona_speech_2...")
-
-                try:
-                    response = client.text_to_speech.create_speech(
-                        voice_id=voice_id,
-                        text=text,
-                        language=lang,
-                        output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                        style="neutral",
-                        model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_2,
-                    )
-
-                    if hasattr(response, "result") and hasattr(response.result, "read"):
-                        audio_data = response.result.read()
-                        print(f"    ✅ {lang.value}: {len(audio_data)} bytes")
-                        success_count += 1
-                    else:
-                        print(f"    ❌ {lang.value}: Response structure error")
-                        all_success = False
+        for lang, text in test_cases:
+            print(f"  🔍 Testing {lang.value} with sona_speech_2...")
+
+            try:
+                response = client.text_to_speech.create_speech(
+                    voice_id=voice_id,
+                    text=text,
+                    language=lang,
+                    output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+                    style="neutral",
+                    model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_2,
+                )
 
-                except errors.SupertoneError as e:
-                    print(f"    ❌ {lang.value}: {e.message}")
+                if hasattr(response, "result") and hasattr(response.result, "read"):
+                    audio_data = response.result.read()
+                    print(f"    ✅ {lang.value}: {len(audio_data)} bytes")
+                    success_count += 1
+                else:
+                    print(f"    ❌ {lang.value}: Response structure error")
                     all_success = False
 
+            except errors.SupertoneError as e:
+                print(f"    ❌ {lang.value}: {e.message}")
+                all_success = False
+
         print(f"  📊 Total: {success_count}/{len(test_cases)} languages successful")
         return (
             all_success,
@@ -3677,7 +3705,7 @@ def test_create_speech_sona_speech_2_multilang(voice_id):
         return False, e
 
 
-def test_create_speech_supertonic_api_1_multilang(voice_id):
+def test_create_speech_supertonic_api_1_multilang(client, voice_id):
     """Test supertonic_api_1 with supported languages (ko, en, ja, es, pt)"""
     print("🌐 supertonic_api_1 Multi-language Test (ko, en, ja, es, pt)")
 
@@ -3686,8 +3714,6 @@ def test_create_speech_supertonic_api_1_multilang(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         # supertonic_api_1 supports: ko, en, ja, es, pt
         test_cases = [
             (
@@ -3713,31 +3739,30 @@ def test_create_speech_supertonic_api_1_multilang(voice_id):
         ]
 
         all_success = True
-        with Supertone(api_key=API_KEY) as client:
-            for lang, text in test_cases:
-                print(f"  🔍 Testing {lang.value} with supertonic_api_1...")
-
-                try:
-                    response = client.text_to_speech.create_speech(
-                        voice_id=voice_id,
-                        text=text,
-                        language=lang,
-                        output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                        style="neutral",
-                        model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SUPERTONIC_API_1,
-                    )
-
-                    if hasattr(response, "result") and hasattr(response.result, "read"):
-                        audio_data = response.result.read()
-                        print(f"    ✅ {lang.value}: {len(audio_data)} bytes")
-                    else:
-                        print(f"    ❌ {lang.value}: Response structure error")
-                        all_success = False
+        for lang, text in test_cases:
+            print(f"  🔍 Testing {lang.value} with supertonic_api_1...")
+
+            try:
+                response = client.text_to_speech.create_speech(
+                    voice_id=voice_id,
+                    text=text,
+                    language=lang,
+                    output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+                    style="neutral",
+                    model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SUPERTONIC_API_1,
+                )
 
-                except errors.SupertoneError as e:
-                    print(f"    ❌ {lang.value}: {e.message}")
+                if hasattr(response, "result") and hasattr(response.result, "read"):
+                    audio_data = response.result.read()
+                    print(f"    ✅ {lang.value}: {len(audio_data)} bytes")
+                else:
+                    print(f"    ❌ {lang.value}: Response structure error")
                     all_success = False
 
+            except errors.SupertoneError as e:
+                print(f"    ❌ {lang.value}: {e.message}")
+                all_success = False
+
         return all_success, "supertonic_api_1 multilang test"
 
     except Exception as e:
@@ -3745,7 +3770,7 @@ def test_create_speech_supertonic_api_1_multilang(voice_id):
         return False, e
 
 
-def test_create_speech_sona_speech_1_unsupported_lang(voice_id):
+def test_create_speech_sona_speech_1_unsupported_lang(client, voice_id):
     """Test sona_speech_1 with unsupported language - should return error"""
     print("❌ sona_speech_1 Unsupported Language Test (Expected Error)")
 
@@ -3754,32 +3779,29 @@ def test_create_speech_sona_speech_1_unsupported_lang(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         # sona_speech_1 only supports ko, en, ja - testing with German (de)
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Attempting sona_speech_1 with German (unsupported)...")
-
-            response = client.text_to_speech.create_speech(
-                voice_id=voice_id,
-                text="Hallo! Dies ist ein Test.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.DE,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
-            )
+        print(f"  🔍 Attempting sona_speech_1 with German (unsupported)...")
+
+        response = client.text_to_speech.create_speech(
+            voice_id=voice_id,
+            text="Hallo! Dies ist ein Test.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.DE,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
+        )
 
-            # If API returns success, it might mean our understanding is wrong
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                print(f"  ⚠️ Unexpected success: {len(audio_data)} bytes")
-                print(
-                    "  ⚠️ API accepted unsupported language (may need to verify model-language restrictions)"
-                )
-                return False, response
-            else:
-                print(f"  ⚠️ Unexpected response: {type(response)}")
-                return False, response
+        # If API returns success, it might mean our understanding is wrong
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            print(f"  ⚠️ Unexpected success: {len(audio_data)} bytes")
+            print(
+                "  ⚠️ API accepted unsupported language (may need to verify model-language restrictions)"
+            )
+            return False, response
+        else:
+            print(f"  ⚠️ Unexpected response: {type(response)}")
+            return False, response
 
     except (errors.BadRequestErrorResponse, errors.SupertoneError) as e:
         print(
@@ -3792,7 +3814,7 @@ def test_create_speech_sona_speech_1_unsupported_lang(voice_id):
         return True, e
 
 
-def test_create_speech_supertonic_api_1_unsupported_lang(voice_id):
+def test_create_speech_supertonic_api_1_unsupported_lang(client, voice_id):
     """Test supertonic_api_1 with unsupported language - should return error"""
     print("❌ supertonic_api_1 Unsupported Language Test (Expected Error)")
 
@@ -3801,31 +3823,28 @@ def test_create_speech_supertonic_api_1_unsupported_lang(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         # supertonic_api_1 supports: ko, en, ja, es, pt - testing with German (de)
-        with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Attempting supertonic_api_1 with German (unsupported)...")
-
-            response = client.text_to_speech.create_speech(
-                voice_id=voice_id,
-                text="Hallo! Dies ist ein Test.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.DE,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SUPERTONIC_API_1,
-            )
+        print(f"  🔍 Attempting supertonic_api_1 with German (unsupported)...")
+
+        response = client.text_to_speech.create_speech(
+            voice_id=voice_id,
+            text="Hallo! Dies ist ein Test.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.DE,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SUPERTONIC_API_1,
+        )
 
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                print(f"  ⚠️ Unexpected success: {len(audio_data)} bytes")
-                print(
-                    "  ⚠️ API accepted unsupported language (may need to verify model-language restrictions)"
-                )
-                return False, response
-            else:
-                print(f"  ⚠️ Unexpected response: {type(response)}")
-                return False, response
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            print(f"  ⚠️ Unexpected success: {len(audio_data)} bytes")
+            print(
+                "  ⚠️ API accepted unsupported language (may need to verify model-language restrictions)"
+            )
+            return False, response
+        else:
+            print(f"  ⚠️ Unexpected response: {type(response)}")
+            return False, response
 
     except (errors.BadRequestErrorResponse, errors.SupertoneError) as e:
         print(
@@ -3838,7 +3857,7 @@ def test_create_speech_supertonic_api_1_unsupported_lang(voice_id):
         return True, e
 
 
-def test_predict_duration_multilang(voice_id):
+def test_predict_duration_multilang(client, voice_id):
     """Test duration prediction with different languages and models"""
     print("🌐⏱️ Duration Prediction Multi-language Test")
 
@@ -3847,8 +3866,6 @@ def test_predict_duration_multilang(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         test_cases = [
             # (model, language, text)
             (
@@ -3869,23 +3886,22 @@ def test_predict_duration_multilang(voice_id):
         ]
 
         all_success = True
-        with Supertone(api_key=API_KEY) as client:
-            for model, lang, text in test_cases:
-                print(f"  🔍 Predicting with {model.value} + {lang.value}...")
-
-                try:
-                    response = client.text_to_speech.predict_duration(
-                        voice_id=voice_id,
-                        text=text,
-                        language=lang,
-                        style="neutral",
-                        model=model,
-                    )
-                    print(f"    ✅ {model.value} + {lang.value}: {response} seconds")
+        for model, lang, text in test_cases:
+            print(f"  🔍 Predicting with {model.value} + {lang.value}...")
+
+            try:
+                response = client.text_to_speech.predict_duration(
+                    voice_id=voice_id,
+                    text=text,
+                    language=lang,
+                    style="neutral",
+                    model=model,
+                )
+                print(f"    ✅ {model.value} + {lang.value}: {response} seconds")
 
-                except errors.SupertoneError as e:
-                    print(f"    ❌ {model.value} + {lang.value}: {e.message}")
-                    all_success = False
+            except errors.SupertoneError as e:
+                print(f"    ❌ {model.value} + {lang.value}: {e.message}")
+                all_success = False
 
         return all_success, "predict_duration multilang test"
 
@@ -3894,7 +3910,7 @@ def test_predict_duration_multilang(voice_id):
         return False, e
 
 
-def test_create_speech_long_sentence_word_split(voice_id):
+def test_create_speech_long_sentence_word_split(client, voice_id):
     """Test TTS with a very long sentence that exceeds 300 chars without punctuation (word-based splitting)"""
     print("📝✂️ Long Sentence Word-Based Splitting Test")
 
@@ -3903,8 +3919,6 @@ def test_create_speech_long_sentence_word_split(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, models
-
         # Create a long sentence without punctuation (over 300 chars)
         # This forces the chunking algorithm to split by word boundaries
         long_sentence = (
@@ -3918,38 +3932,37 @@ def test_create_speech_long_sentence_word_split(voice_id):
         print(f"  📏 Text length: {len(long_sentence)} characters (no punctuation)")
         print(f"  📄 Text preview: {long_sentence[:50]}...")
 
-        with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Converting TTS with word-based chunking...")
-            print("  ⚠️ This test will consume credits!")
-
-            response = client.text_to_speech.create_speech(
-                voice_id=voice_id,
-                text=long_sentence,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-            )
+        print("  🔍 Converting TTS with word-based chunking...")
+        print("  ⚠️ This test will consume credits!")
 
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                if len(audio_data) > 0:
-                    print(f"  ✅ Word-based chunking successful!")
-                    print(f"  📦 Audio data size: {len(audio_data):,} bytes")
-                    return True, response
-                else:
-                    print("  ❌ Empty audio data")
-                    return False, response
+        response = client.text_to_speech.create_speech(
+            voice_id=voice_id,
+            text=long_sentence,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+        )
+
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            if len(audio_data) > 0:
+                print(f"  ✅ Word-based chunking successful!")
+                print(f"  📦 Audio data size: {len(audio_data):,} bytes")
+                return True, response
             else:
-                print(f"  ❌ Unexpected response type: {type(response)}")
+                print("  ❌ Empty audio data")
                 return False, response
+        else:
+            print(f"  ❌ Unexpected response type: {type(response)}")
+            return False, response
 
     except Exception as e:
         print(f"  ❌ Unexpected error: {e}")
         return False, e
 
 
-def test_create_speech_japanese_no_spaces(voice_id):
+def test_create_speech_japanese_no_spaces(client, voice_id):
     """Test TTS with Japanese text (no spaces) that exceeds 300 chars (character-based splitting)"""
     print("🇯🇵✂️ Japanese Text Character-Based Splitting Test")
 
@@ -3958,8 +3971,6 @@ def test_create_speech_japanese_no_spaces(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, models
-
         # Create a long Japanese text without spaces (over 300 chars)
         # Japanese typically has no word spaces, forcing character-based splitting
         # This is a repeated pattern to exceed 300 characters
@@ -3976,38 +3987,37 @@ def test_create_speech_japanese_no_spaces(voice_id):
         print(f"  📏 Text length: {len(japanese_text)} characters (no word spaces)")
         print(f"  📄 Text preview: {japanese_text[:30]}...")
 
-        with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Converting TTS with character-based chunking...")
-            print("  ⚠️ This test will consume credits!")
-
-            response = client.text_to_speech.create_speech(
-                voice_id=voice_id,
-                text=japanese_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.JA,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-            )
+        print("  🔍 Converting TTS with character-based chunking...")
+        print("  ⚠️ This test will consume credits!")
 
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                if len(audio_data) > 0:
-                    print(f"  ✅ Character-based chunking successful!")
-                    print(f"  📦 Audio data size: {len(audio_data):,} bytes")
-                    return True, response
-                else:
-                    print("  ❌ Empty audio data")
-                    return False, response
+        response = client.text_to_speech.create_speech(
+            voice_id=voice_id,
+            text=japanese_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.JA,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+        )
+
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            if len(audio_data) > 0:
+                print(f"  ✅ Character-based chunking successful!")
+                print(f"  📦 Audio data size: {len(audio_data):,} bytes")
+                return True, response
             else:
-                print(f"  ❌ Unexpected response type: {type(response)}")
+                print("  ❌ Empty audio data")
                 return False, response
+        else:
+            print(f"  ❌ Unexpected response type: {type(response)}")
+            return False, response
 
     except Exception as e:
         print(f"  ❌ Unexpected error: {e}")
         return False, e
 
 
-def test_stream_speech_long_sentence_word_split(voice_id):
+def test_stream_speech_long_sentence_word_split(client, voice_id):
     """Test streaming TTS with a very long sentence (word-based splitting)"""
     print("📝🔊✂️ Streaming Long Sentence Word-Based Splitting Test")
 
@@ -4016,8 +4026,6 @@ def test_stream_speech_long_sentence_word_split(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, models
-
         # Create a long sentence without punctuation (over 300 chars)
         long_sentence = (
             "This is an extremely long sentence that has been carefully crafted without "
@@ -4029,41 +4037,40 @@ def test_stream_speech_long_sentence_word_split(voice_id):
 
         print(f"  📏 Text length: {len(long_sentence)} characters (no punctuation)")
 
-        with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Streaming TTS with word-based chunking...")
-            print("  ⚠️ This test will consume credits!")
-
-            response = client.text_to_speech.stream_speech(
-                voice_id=voice_id,
-                text=long_sentence,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-            )
+        print("  🔍 Streaming TTS with word-based chunking...")
+        print("  ⚠️ This test will consume credits!")
 
-            # Collect streaming data
-            audio_data = b""
-            if hasattr(response.result, "iter_bytes"):
-                for chunk in response.result.iter_bytes():
-                    audio_data += chunk
-            elif hasattr(response.result, "read"):
-                audio_data = response.result.read()
+        response = client.text_to_speech.stream_speech(
+            voice_id=voice_id,
+            text=long_sentence,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+        )
 
-            if len(audio_data) > 0:
-                print(f"  ✅ Streaming word-based chunking successful!")
-                print(f"  📦 Audio data size: {len(audio_data):,} bytes")
-                return True, response
-            else:
-                print("  ❌ Empty audio data")
-                return False, response
+        # Collect streaming data; bytearray grows in place
+        audio_data = bytearray()
+        if hasattr(response.result, "iter_bytes"):
+            for chunk in response.result.iter_bytes(chunk_size=STREAM_CHUNK_SIZE):
+                audio_data.extend(chunk)
+        elif hasattr(response.result, "read"):
+            audio_data = response.result.read()
+
+        if len(audio_data) > 0:
+            print(f"  ✅ Streaming word-based chunking successful!")
+            print(f"  📦 Audio data size: {len(audio_data):,} bytes")
+            return True, response
+        else:
+            print("  ❌ Empty audio data")
+            return False, response
 
     except Exception as e:
         print(f"  ❌ Unexpected error: {e}")
         return False, e
 
 
-def test_stream_speech_japanese_no_spaces(voice_id):
+def test_stream_speech_japanese_no_spaces(client, voice_id):
     """Test streaming TTS with Japanese text (character-based splitting)"""
     print("🇯🇵🔊✂️ Streaming Japanese Character-Based Splitting Test")
 
@@ -4072,8 +4079,6 @@ def test_stream_speech_japanese_no_spaces(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, models
-
         # Long Japanese text without spaces
         japanese_text = (
             "これは日本語のストリーミングテストです。"
@@ -4087,42 +4092,132 @@ def test_stream_speech_japanese_no_spaces(voice_id):
 
         print(f"  📏 Text length: {len(japanese_text)} characters")
 
-        with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Streaming TTS with character-based chunking...")
-            print("  ⚠️ This test will consume credits!")
-
-            response = client.text_to_speech.stream_speech(
-                voice_id=voice_id,
-                text=japanese_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.JA,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-            )
+        print("  🔍 Streaming TTS with character-based chunking...")
+        print("  ⚠️ This test will consume credits!")
 
-            # Collect streaming data
-            audio_data = b""
-            if hasattr(response.result, "iter_bytes"):
-                for chunk in response.result.iter_bytes():
-                    audio_data += chunk
-            elif hasattr(response.result, "read"):
-                audio_data = response.result.read()
+        response = client.text_to_speech.stream_speech(
+            voice_id=voice_id,
+            text=japanese_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.JA,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+        )
 
-            if len(audio_data) > 0:
-                print(f"  ✅ Streaming character-based chunking successful!")
-                print(f"  📦 Audio data size: {len(audio_data):,} bytes")
-                return True, response
-            else:
-                print("  ❌ Empty audio data")
-                return False, response
+        # Collect streaming data; bytearray grows in place
+        audio_data = bytearray()
+        if hasattr(response.result, "iter_bytes"):
+            for chunk in response.result.iter_bytes(chunk_size=STREAM_CHUNK_SIZE):
+                audio_data.extend(chunk)
+        elif hasattr(response.result, "read"):
+            audio_data = response.result.read()
+
+        if len(audio_data) > 0:
+            print(f"  ✅ Streaming character-based chunking successful!")
+            print(f"  📦 Audio data size: {len(audio_data):,} bytes")
+            return True, response
+        else:
+            print("  ❌ Empty audio data")
+            return False, response
 
     except Exception as e:
         print(f"  ❌ Unexpected error: {e}")
         return False, e
 
 
+async def run_readonly_suite(client, voice_id=None, max_concurrency=10):
+    """Run the independent read-only tests concurrently
+
+    The tests are synchronous, so each one runs in a worker thread against the
+    shared client; total wall time is roughly the slowest call instead of the
+    sum of all round-trips. Output lines from different tests may interleave.
+    """
+    tests = {
+        "get_usage": (test_get_usage, ()),
+        "get_voice_usage": (test_get_voice_usage, ()),
+        "list_voices": (test_list_voices, ()),
+        "search_voices": (test_search_voices, ()),
+        "list_custom_voices": (test_list_custom_voices, ()),
+        "search_custom_voices": (test_search_custom_voices, ()),
+    }
+    if voice_id:
+        tests["get_voice"] = (test_get_voice, (voice_id,))
+
+    return await run_tests_concurrently(client, tests, max_concurrency)
+
+
+async def run_long_text_suite(client, voice_id, max_concurrency=4):
+    """Run the independent long-text MP3 and phoneme tests concurrently
+
+    Each test writes its own output files and spends most of its time waiting
+    on the server, so they overlap instead of queueing one behind another.
+    """
+    tests = {
+        "stream_speech_mp3": (test_stream_speech_mp3, (voice_id,)),
+        "stream_speech_long_text_mp3": (test_stream_speech_long_text_mp3, (voice_id,)),
+        "create_speech_long_text_with_phonemes": (
+            test_create_speech_long_text_with_phonemes,
+            (voice_id,),
+        ),
+        "stream_speech_phoneme_chunking_wav": (
+            test_stream_speech_phoneme_chunking_wav,
+            (voice_id,),
+        ),
+    }
+    return await run_tests_concurrently(client, tests, max_concurrency)
+
+
+async def run_tests_concurrently(client, tests, max_concurrency):
+    """Run sync tests in worker threads against the shared client
+
+    tests maps a result name to (test_func, extra_args). Returns a dict of the
+    same names to each test's (success, result); a raised exception counts as
+    (False, exception).
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(test_func, args):
+        async with semaphore:
+            return await asyncio.to_thread(test_func, client, *args)
+
+    results = await asyncio.gather(
+        *(run_one(test_func, args) for test_func, args in tests.values()),
+        return_exceptions=True,
+    )
+
+    return {
+        name: (False, result) if isinstance(result, BaseException) else result
+        for name, result in zip(tests, results)
+    }
+
+
+@contextlib.contextmanager
+def open_client():
+    """Shared Supertone client for a whole run (script or pytest session)
+
+    Uses the caching transport with the HTTP_LIMITS connection pool and the
+    SDK-level RETRY_CONFIG, so concurrent tests reuse connections and ride out
+    rate limits.
+    """
+    with httpx.Client(transport=CachingTransport()) as http_client:
+        if REFRESH_CACHE:
+            print("♻️ SUPERTONE_REFRESH_CACHE=1: re-recording cached responses")
+        with Supertone(
+            api_key=API_KEY, client=http_client, retry_config=RETRY_CONFIG
+        ) as client:
+            yield client
+
+
 def main():
     """Main integration test execution - all sync API tests"""
+
+    # One client for the whole run so the HTTP connection pool is reused
+    with open_client() as client:
+        return run_integration_tests(client)
+
+
+def run_integration_tests(client):
+    """Run all sync API tests against a shared client"""
     print("🧪 Real API Integration Test Start (All Sync APIs)")
     print(f"🔑 API Key: {API_KEY[:8]}..." + "*" * 24)
     print("=" * 60)
@@ -4135,53 +4230,35 @@ def main():
     # 1. Credit and Usage Tests
     print("\n1️⃣ Credit and Usage Tests")
 
-    success, result = test_credit_balance()
+    success, result = test_credit_balance(client)
     test_results["get_credit_balance"] = success
 
     if not success:
         print("❌ API key authentication failed. Stopping tests.")
         return False
 
-    success, result = test_get_usage()
-    test_results["get_usage"] = success
-
-    success, result = test_get_voice_usage()
-    test_results["get_voice_usage"] = success
-
-    # 2. Voice Tests
-    print("\n2️⃣ Voice Tests")
-
-    success, result = test_list_voices()
-    test_results["list_voices"] = success
-
-    success, result = test_search_voices()
-    test_results["search_voices"] = success
+    # 2. Voice and 3. Custom Voice read-only tests run concurrently
+    print("\n2️⃣ 3️⃣ Voice and Custom Voice Read-only Tests (concurrent)")
 
-    if voice_id_for_tts:
-        success, result = test_get_voice(voice_id_for_tts)
-        test_results["get_voice"] = success
-
-    # 3. Custom Voice Tests
-    print("\n3️⃣ Custom Voice Tests")
+    run_async = uvloop.run if uvloop is not None else asyncio.run
+    readonly_results = run_async(run_readonly_suite(client, voice_id_for_tts))
+    for name, (success, result) in readonly_results.items():
+        test_results[name] = success
 
-    success, result = test_list_custom_voices()
-    test_results["list_custom_voices"] = success
+    success, result = readonly_results["list_custom_voices"]
     if success and result[1]:  # Extract custom_voice_id
         custom_voice_id = result[1]
 
-    success, result = test_search_custom_voices()
-    test_results["search_custom_voices"] = success
-
     if custom_voice_id:
-        success, result = test_get_custom_voice(custom_voice_id)
+        success, result = test_get_custom_voice(client, custom_voice_id)
         test_results["get_custom_voice"] = success
 
-        success, result = test_edit_custom_voice(custom_voice_id)
+        success, result = test_edit_custom_voice(client, custom_voice_id)
         test_results["edit_custom_voice"] = success
 
     # Custom Voice Creation Test
     print("\n🎨 Custom Voice Creation Test")
-    success, result = test_create_cloned_voice()
+    success, result = test_create_cloned_voice(client)
     test_results["create_cloned_voice"] = success
     if success and result:
         created_custom_voice_id = result.voice_id
@@ -4192,28 +4269,34 @@ def main():
 
     if voice_id_for_tts:
         # Duration prediction (no credit consumption)
-        success, result = test_predict_duration(voice_id_for_tts)
+        success, result = test_predict_duration(client, voice_id_for_tts)
         test_results["predict_duration"] = success
 
         # Duration prediction with Voice Settings
-        success, result = test_predict_duration_with_voice_settings(voice_id_for_tts)
+        success, result = test_predict_duration_with_voice_settings(
+            client, voice_id_for_tts
+        )
         test_results["predict_duration_with_voice_settings"] = success
 
         # Basic TTS (consumes credits)
         print("💳 TTS will consume credits.")
-        success, result = test_create_speech(voice_id_for_tts)
+        success, result = test_create_speech(client, voice_id_for_tts)
         test_results["create_speech"] = success
 
         # TTS with Voice Settings (consumes credits)
-        success, result = test_create_speech_with_voice_settings(voice_id_for_tts)
+        success, result = test_create_speech_with_voice_settings(
+            client, voice_id_for_tts
+        )
         test_results["create_speech_with_voice_settings"] = success
 
         # Basic Streaming TTS (WAV)
-        success, result = test_stream_speech(voice_id_for_tts)
+        success, result = test_stream_speech(client, voice_id_for_tts)
         test_results["stream_speech"] = success
 
         # Streaming TTS with Voice Settings (consumes credits)
-        success, result = test_stream_speech_with_voice_settings(voice_id_for_tts)
+        success, result = test_stream_speech_with_voice_settings(
+            client, voice_id_for_tts
+        )
         test_results["stream_speech_with_voice_settings"] = success
 
         # 5. TTS Tests with Phoneme Information
@@ -4221,127 +4304,131 @@ def main():
 
         # Basic TTS with Phonemes (consumes credits)
         print("💳 TTS with phonemes will consume credits.")
-        success, result = test_create_speech_with_phonemes(voice_id_for_tts)
+        success, result = test_create_speech_with_phonemes(client, voice_id_for_tts)
         test_results["create_speech_with_phonemes"] = success
 
         # Streaming TTS with Phonemes (consumes credits)
-        success, result = test_stream_speech_with_phonemes(voice_id_for_tts)
+        success, result = test_stream_speech_with_phonemes(client, voice_id_for_tts)
         test_results["stream_speech_with_phonemes"] = success
 
         # Long Text Tests (over 300 characters)
         print("\n5️⃣ Long Text Tests (Over 300 Characters)")
-        success, result = test_create_speech_long_text(voice_id_for_tts)
+        success, result = test_create_speech_long_text(client, voice_id_for_tts)
         test_results["create_speech_long_text"] = success
 
-        success, result = test_stream_speech_long_text(voice_id_for_tts)
+        success, result = test_stream_speech_long_text(client, voice_id_for_tts)
         test_results["stream_speech_long_text"] = success
 
         # MP3 Format TTS Tests
         print("\n🎵 MP3 Format TTS Tests")
-        success, result = test_create_speech_mp3(voice_id_for_tts)
+        success, result = test_create_speech_mp3(client, voice_id_for_tts)
         test_results["create_speech_mp3"] = success
 
         # Long text MP3 auto-chunking TTS test
-        success, result = test_create_speech_long_text_mp3(voice_id_for_tts)
+        success, result = test_create_speech_long_text_mp3(client, voice_id_for_tts)
         test_results["create_speech_long_text_mp3"] = success
 
-        # MP3 Streaming TTS test
-        success, result = test_stream_speech_mp3(voice_id_for_tts)
-        test_results["stream_speech_mp3"] = success
-
-        # Long text MP3 streaming TTS test
-        success, result = test_stream_speech_long_text_mp3(voice_id_for_tts)
-        test_results["stream_speech_long_text_mp3"] = success
-
-        # Long text auto-chunking + Phonemes TTS test
-        success, result = test_create_speech_long_text_with_phonemes(voice_id_for_tts)
-        test_results["create_speech_long_text_with_phonemes"] = success
-
-        # Long text + Phoneme + Streaming test (WAV)
-        success, result = test_stream_speech_phoneme_chunking_wav(voice_id_for_tts)
-        test_results["stream_speech_phoneme_chunking_wav"] = success
+        # MP3 streaming, long text MP3 streaming, long text + phonemes and
+        # long text + phoneme streaming (WAV) run concurrently
+        long_text_results = run_async(run_long_text_suite(client, voice_id_for_tts))
+        for name, (success, result) in long_text_results.items():
+            test_results[name] = success
 
         # 6. New Model Tests (sona_speech_2, supertonic_api_1)
         print("\n6️⃣ New Model Tests (sona_speech_2, supertonic_api_1)")
 
         # TTS with sona_speech_2
-        success, result = test_create_speech_sona_speech_2(voice_id_for_tts)
+        success, result = test_create_speech_sona_speech_2(client, voice_id_for_tts)
         test_results["create_speech_sona_speech_2"] = success
 
         # TTS with supertonic_api_1
-        success, result = test_create_speech_supertonic_api_1(voice_id_for_tts)
+        success, result = test_create_speech_supertonic_api_1(client, voice_id_for_tts)
         test_results["create_speech_supertonic_api_1"] = success
 
         # Invalid model test
-        success, result = test_create_speech_invalid_model(voice_id_for_tts)
+        success, result = test_create_speech_invalid_model(client, voice_id_for_tts)
         test_results["create_speech_invalid_model"] = success
 
         # Duration prediction with new models
-        success, result = test_predict_duration_sona_speech_2(voice_id_for_tts)
+        success, result = test_predict_duration_sona_speech_2(client, voice_id_for_tts)
         test_results["predict_duration_sona_speech_2"] = success
 
-        success, result = test_predict_duration_supertonic_api_1(voice_id_for_tts)
+        success, result = test_predict_duration_supertonic_api_1(
+            client, voice_id_for_tts
+        )
         test_results["predict_duration_supertonic_api_1"] = success
 
         # Invalid model prediction test
-        success, result = test_predict_duration_invalid_model(voice_id_for_tts)
+        success, result = test_predict_duration_invalid_model(client, voice_id_for_tts)
         test_results["predict_duration_invalid_model"] = success
 
         # 7. Multi-language Tests by Model
         print("\n7️⃣ Multi-language Tests by Model")
 
         # sona_speech_1 multilang (ko, en, ja)
-        success, result = test_create_speech_sona_speech_1_multilang(voice_id_for_tts)
+        success, result = test_create_speech_sona_speech_1_multilang(
+            client, voice_id_for_tts
+        )
         test_results["create_speech_sona_speech_1_multilang"] = success
 
         # sona_speech_2 multilang (all languages)
-        success, result = test_create_speech_sona_speech_2_multilang(voice_id_for_tts)
+        success, result = test_create_speech_sona_speech_2_multilang(
+            client, voice_id_for_tts
+        )
         test_results["create_speech_sona_speech_2_multilang"] = success
 
         # supertonic_api_1 multilang (ko, en, ja, es, pt)
         success, result = test_create_speech_supertonic_api_1_multilang(
-            voice_id_for_tts
+            client, voice_id_for_tts
         )
         test_results["create_speech_supertonic_api_1_multilang"] = success
 
         # Unsupported language error tests
         success, result = test_create_speech_sona_speech_1_unsupported_lang(
-            voice_id_for_tts
+            client, voice_id_for_tts
         )
         test_results["create_speech_sona_speech_1_unsupported_lang"] = success
 
         success, result = test_create_speech_supertonic_api_1_unsupported_lang(
-            voice_id_for_tts
+            client, voice_id_for_tts
         )
         test_results["create_speech_supertonic_api_1_unsupported_lang"] = success
 
         # Duration prediction multilang test
-        success, result = test_predict_duration_multilang(voice_id_for_tts)
+        success, result = test_predict_duration_multilang(client, voice_id_for_tts)
         test_results["predict_duration_multilang"] = success
 
         # 8. Advanced Text Chunking Tests
         print("\n8️⃣ Advanced Text Chunking Tests")
 
         # Long sentence word-based splitting (TTS)
-        success, result = test_create_speech_long_sentence_word_split(voice_id_for_tts)
+        success, result = test_create_speech_long_sentence_word_split(
+            client, voice_id_for_tts
+        )
         test_results["create_speech_long_sentence_word_split"] = success
 
         # Japanese character-based splitting (TTS)
-        success, result = test_create_speech_japanese_no_spaces(voice_id_for_tts)
+        success, result = test_create_speech_japanese_no_spaces(
+            client, voice_id_for_tts
+        )
         test_results["create_speech_japanese_no_spaces"] = success
 
         # Long sentence word-based splitting (Streaming)
-        success, result = test_stream_speech_long_sentence_word_split(voice_id_for_tts)
+        success, result = test_stream_speech_long_sentence_word_split(
+            client, voice_id_for_tts
+        )
         test_results["stream_speech_long_sentence_word_split"] = success
 
         # Japanese character-based splitting (Streaming)
-        success, result = test_stream_speech_japanese_no_spaces(voice_id_for_tts)
+        success, result = test_stream_speech_japanese_no_spaces(
+            client, voice_id_for_tts
+        )
         test_results["stream_speech_japanese_no_spaces"] = success
 
     # 9. Custom Voice Deletion (run last)
     if created_custom_voice_id:
         print("\n🗑️ Created Custom Voice Deletion Test")
-        success, result = test_delete_custom_voice(created_custom_voice_id)
+        success, result = test_delete_custom_voice(client, created_custom_voice_id)
         test_results["delete_custom_voice"] = success
 
     # Results Summary
@@ -6,10 +6,34 @@ Tests all async SDK functionality with real Supertone API calls.
 import sys
 import os
 import json
+import binascii
+import re
+import traceback
 from datetime import datetime, timedelta
 import time
 import asyncio
 
+# Optional faster JSON parser for NDJSON responses (pip install orjson).
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so the existing
+# except clauses catch parse errors from either parser.
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+# Optional SIMD base64 decoder for the audio payloads (pip install pybase64).
+# Both decoders take the ASCII str from the JSON response directly, whereas
+# base64.b64decode() first encodes the whole str to bytes.
+try:
+    import pybase64
+
+    decode_audio_base64 = pybase64.b64decode
+except ImportError:
+    decode_audio_base64 = binascii.a2b_base64
+
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
@@ -32,24 +56,48 @@ except ImportError:
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+from supertone import Supertone, errors, models
+
 # API Key for testing (from environment variable or hardcoded for testing)
 API_KEY = os.getenv("SUPERTONE_API_KEY", "your-api-key-here")
 
+# Per-chunk log lines in the streaming tests are off by default; set
+# SUPERTONE_CHUNK_LOG=1 to print them
+CHUNK_LOG = os.getenv("SUPERTONE_CHUNK_LOG", "0") == "1"
+
+# Read size for streamed responses that are only collected, not timed. Tests
+# that measure time-to-first-byte keep httpx's default so the first chunk is
+# yielded as soon as it arrives.
+STREAM_CHUNK_SIZE = 1 << 16
+
+# Streaming loops print a progress line every 32 chunks (chunk_count & mask == 0)
+CHUNK_PROGRESS_MASK = 0x1F
+
+# RuntimeError messages that come from the auto-chunking/merge logic
+_CHUNK_ERR_RE = re.compile(r"chunk|merge", re.IGNORECASE)
+
+
+def dump_json(data, path):
+    """Write data to path as indented UTF-8 JSON, with orjson when installed"""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
 
-async def test_credit_balance():
+async def test_credit_balance(client):
     """Test credit balance retrieval - safest async API call"""
     print("💰 Credit Balance Test (Async)")
 
     try:
-        from supertone import Supertone, errors
+        print("  🔍 Retrieving credit balance...")
 
-        async with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Retrieving credit balance...")
+        response = await client.usage.get_credit_balance_async()
 
-            response = await client.usage.get_credit_balance_async()
-
-            print(f"  ✅ Credit Balance: {response.balance}")
-            return True, response
+        print(f"  ✅ Credit Balance: {response.balance}")
+        return True, response
 
     except errors.UnauthorizedErrorResponse as e:
         print(f"  ❌ Authentication failed: Invalid API key")
@@ -60,149 +108,130 @@ async def test_credit_balance():
         print(f"     Status code: {e.status_code}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_get_usage():
+async def test_get_usage(client):
     """Test usage retrieval (Advanced Usage Analytics) - async"""
     print("📊 Usage Analytics Test (Async)")
 
     try:
-        from supertone import Supertone, errors
-
         # Query last 7 days usage
         end_time = datetime.now()
         start_time = end_time - timedelta(days=7)
 
-        async with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Retrieving usage from {start_time.strftime('%Y-%m-%d')} to {end_time.strftime('%Y-%m-%d')}..."
-            )
+        print(
+            f"  🔍 Retrieving usage from {start_time.strftime('%Y-%m-%d')} to {end_time.strftime('%Y-%m-%d')}..."
+        )
 
-            response = await client.usage.get_usage_async(
-                start_time=start_time.isoformat() + "Z",
-                end_time=end_time.isoformat() + "Z",
-            )
+        response = await client.usage.get_usage_async(
+            start_time=start_time.isoformat() + "Z",
+            end_time=end_time.isoformat() + "Z",
+        )
 
-            print(f"  ✅ Success: {len(response.data)} usage record buckets")
-            print(f"  📊 Total buckets: {response.total}")
+        print(f"  ✅ Success: {len(response.data)} usage record buckets")
+        print(f"  📊 Total buckets: {response.total}")
 
-            if response.data:
-                for bucket in response.data[:3]:
-                    print(f"  📅 Bucket start: {bucket.starting_at}")
-                    print(f"     Bucket end: {bucket.ending_at}")
-                    print(f"     Results: {len(bucket.results)} items")
+        if response.data:
+            for bucket in response.data[:3]:
+                print(f"  📅 Bucket start: {bucket.starting_at}")
+                print(f"     Bucket end: {bucket.ending_at}")
+                print(f"     Results: {len(bucket.results)} items")
 
-                    total_minutes = sum(
-                        result.minutes_used for result in bucket.results
-                    )
-                    print(f"     Total usage: {total_minutes:.2f} minutes")
+                total_minutes = sum(result.minutes_used for result in bucket.results)
+                print(f"     Total usage: {total_minutes:.2f} minutes")
 
-                    for result in bucket.results[:3]:
-                        voice_info = (
-                            result.voice_name
-                            if result.voice_name
-                            else f"Voice {result.voice_id[:8] if result.voice_id else 'Unknown'}"
-                        )
-                        print(f"       🎤 {voice_info}: {result.minutes_used:.2f}min")
-            else:
-                print("  📝 No usage records for this period")
+                for result in bucket.results[:3]:
+                    voice_info = (
+                        result.voice_name
+                        if result.voice_name
+                        else f"Voice {result.voice_id[:8] if result.voice_id else 'Unknown'}"
+                    )
+                    print(f"       🎤 {voice_info}: {result.minutes_used:.2f}min")
+        else:
+            print("  📝 No usage records for this period")
 
-            return True, response
+        return True, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_get_voice_usage():
+async def test_get_voice_usage(client):
     """Test voice-specific usage retrieval - async"""
     print("🎤 Voice Usage Test (Async)")
 
     try:
-        from supertone import Supertone, errors
-
         end_date = datetime.now()
         start_date = end_date - timedelta(days=7)
 
-        async with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Retrieving voice usage from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}..."
-            )
+        print(
+            f"  🔍 Retrieving voice usage from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}..."
+        )
 
-            response = await client.usage.get_voice_usage_async(
-                start_date=start_date.strftime("%Y-%m-%d"),
-                end_date=end_date.strftime("%Y-%m-%d"),
-            )
+        response = await client.usage.get_voice_usage_async(
+            start_date=start_date.strftime("%Y-%m-%d"),
+            end_date=end_date.strftime("%Y-%m-%d"),
+        )
 
-            print(f"  ✅ Success: {len(response.usages)} voice usage records")
+        print(f"  ✅ Success: {len(response.usages)} voice usage records")
 
-            if response.usages:
-                for usage in response.usages[:5]:
-                    voice_name = (
-                        usage.name if usage.name else f"Voice {usage.voice_id[:8]}"
-                    )
-                    print(f"  🎤 {voice_name}: {usage.total_minutes_used:.2f}min")
-                    print(f"     Voice ID: {usage.voice_id}")
-                    if usage.language:
-                        print(f"     Language: {usage.language}")
-            else:
-                print("  📝 No voice usage records for this period")
+        if response.usages:
+            for usage in response.usages[:5]:
+                voice_name = usage.name if usage.name else f"Voice {usage.voice_id[:8]}"
+                print(f"  🎤 {voice_name}: {usage.total_minutes_used:.2f}min")
+                print(f"     Voice ID: {usage.voice_id}")
+                if usage.language:
+                    print(f"     Language: {usage.language}")
+        else:
+            print("  📝 No voice usage records for this period")
 
-            return True, response
+        return True, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_list_voices():
+async def test_list_voices(client):
     """Test voice listing - async"""
     print("🎵 Voice List Test (Async)")
 
     try:
-        from supertone import Supertone, errors
-
-        async with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Retrieving voice list...")
+        print("  🔍 Retrieving voice list...")
 
-            response = await client.voices.list_voices_async(page_size=10)
+        response = await client.voices.list_voices_async(page_size=10)
 
-            print(f"  ✅ Success: {len(response.items)} voices")
-            print(f"  📊 Total voices: {response.total}")
+        print(f"  ✅ Success: {len(response.items)} voices")
+        print(f"  📊 Total voices: {response.total}")
 
-            if response.items:
-                first_voice = response.items[0]
-                print(f"  🎤 First voice:")
-                print(f"     ID: {first_voice.voice_id}")
-                print(f"     Name: {first_voice.name}")
-                print(f"     Description: {first_voice.description[:50]}...")
-                print(f"     Language: {first_voice.language}")
-                print(f"     Gender: {first_voice.gender}")
+        if response.items:
+            first_voice = response.items[0]
+            print(f"  🎤 First voice:")
+            print(f"     ID: {first_voice.voice_id}")
+            print(f"     Name: {first_voice.name}")
+            print(f"     Description: {first_voice.description[:50]}...")
+            print(f"     Language: {first_voice.language}")
+            print(f"     Gender: {first_voice.gender}")
 
-                return True, (response, first_voice.voice_id)
-            else:
-                print("  ⚠️ Voice list is empty")
-                return True, (response, None)
+            return True, (response, first_voice.voice_id)
+        else:
+            print("  ⚠️ Voice list is empty")
+            return True, (response, None)
 
     except errors.UnauthorizedErrorResponse as e:
         print(f"  ❌ Authentication failed: Invalid API key")
@@ -211,52 +240,45 @@ async def test_list_voices():
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_search_voices():
+async def test_search_voices(client):
     """Test voice search - async"""
     print("🔍 Voice Search Test (Async)")
 
     try:
-        from supertone import Supertone, errors
-
-        async with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Searching for female English voices...")
+        print("  🔍 Searching for female English voices...")
 
-            response = await client.voices.search_voices_async(
-                language="en",
-                gender="female",
-                page_size=10,
-            )
+        response = await client.voices.search_voices_async(
+            language="en",
+            gender="female",
+            page_size=10,
+        )
 
-            print(f"  ✅ Search success: {len(response.items)} voices")
+        print(f"  ✅ Search success: {len(response.items)} voices")
 
-            for voice in response.items:
-                print(f"  🎤 {voice.name} ({voice.voice_id})")
-                print(f"     Language: {voice.language}, Gender: {voice.gender}")
-                print(f"     Use case: {voice.use_case}")
+        for voice in response.items:
+            print(f"  🎤 {voice.name} ({voice.voice_id})")
+            print(f"     Language: {voice.language}, Gender: {voice.gender}")
+            print(f"     Use case: {voice.use_case}")
 
-            return True, response
+        return True, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_get_voice(voice_id):
+async def test_get_voice(client, voice_id):
     """Test voice detail retrieval - async"""
     print("📄 Voice Detail Test (Async)")
 
@@ -265,21 +287,18 @@ async def test_get_voice(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors
+        print(f"  🔍 Retrieving voice '{voice_id}' details...")
 
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Retrieving voice '{voice_id}' details...")
+        response = await client.voices.get_voice_async(voice_id=voice_id)
 
-            response = await client.voices.get_voice_async(voice_id=voice_id)
+        print(f"  ✅ Success:")
+        print(f"     Name: {response.name}")
+        print(f"     ID: {response.voice_id}")
+        print(f"     Description: {response.description}")
+        print(f"     Language: {response.language}")
+        print(f"     Gender: {response.gender}")
 
-            print(f"  ✅ Success:")
-            print(f"     Name: {response.name}")
-            print(f"     ID: {response.voice_id}")
-            print(f"     Description: {response.description}")
-            print(f"     Language: {response.language}")
-            print(f"     Gender: {response.gender}")
-
-            return True, response
+        return True, response
 
     except errors.NotFoundErrorResponse as e:
         print(f"  ❌ Voice not found: {voice_id}")
@@ -288,85 +307,71 @@ async def test_get_voice(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_list_custom_voices():
+async def test_list_custom_voices(client):
     """Test custom voice listing - async"""
     print("🎨 Custom Voice List Test (Async)")
 
     try:
-        from supertone import Supertone, errors
-
-        async with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Retrieving custom voice list...")
+        print("  🔍 Retrieving custom voice list...")
 
-            response = await client.custom_voices.list_custom_voices_async(page_size=10)
+        response = await client.custom_voices.list_custom_voices_async(page_size=10)
 
-            print(f"  ✅ Success: {len(response.items)} custom voices")
-            print(f"  📊 Total custom voices: {response.total}")
+        print(f"  ✅ Success: {len(response.items)} custom voices")
+        print(f"  📊 Total custom voices: {response.total}")
 
-            custom_voice_id = None
-            for voice in response.items:
-                print(f"  🎤 {voice.name} ({voice.voice_id})")
-                print(f"     Description: {voice.description}")
-                if custom_voice_id is None:
-                    custom_voice_id = voice.voice_id
+        custom_voice_id = None
+        for voice in response.items:
+            print(f"  🎤 {voice.name} ({voice.voice_id})")
+            print(f"     Description: {voice.description}")
+            if custom_voice_id is None:
+                custom_voice_id = voice.voice_id
 
-            return True, (response, custom_voice_id)
+        return True, (response, custom_voice_id)
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_search_custom_voices():
+async def test_search_custom_voices(client):
     """Test custom voice search - async"""
     print("🔍 Custom Voice Search Test (Async)")
 
     try:
-        from supertone import Supertone, errors
-
-        async with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Searching custom voices...")
+        print("  🔍 Searching custom voices...")
 
-            response = await client.custom_voices.search_custom_voices_async(
-                page_size=10
-            )
+        response = await client.custom_voices.search_custom_voices_async(page_size=10)
 
-            print(f"  ✅ Search success: {len(response.items)} custom voices")
+        print(f"  ✅ Search success: {len(response.items)} custom voices")
 
-            for voice in response.items:
-                print(f"  🎤 {voice.name} ({voice.voice_id})")
-                print(f"     Description: {voice.description}")
+        for voice in response.items:
+            print(f"  🎤 {voice.name} ({voice.voice_id})")
+            print(f"     Description: {voice.description}")
 
-            return True, response
+        return True, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_get_custom_voice(voice_id):
+async def test_get_custom_voice(client, voice_id):
     """Test custom voice detail retrieval - async"""
     print("📄 Custom Voice Detail Test (Async)")
 
@@ -375,21 +380,16 @@ async def test_get_custom_voice(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Retrieving custom voice '{voice_id}' details...")
+        print(f"  🔍 Retrieving custom voice '{voice_id}' details...")
 
-            response = await client.custom_voices.get_custom_voice_async(
-                voice_id=voice_id
-            )
+        response = await client.custom_voices.get_custom_voice_async(voice_id=voice_id)
 
-            print(f"  ✅ Success:")
-            print(f"     Name: {response.name}")
-            print(f"     ID: {response.voice_id}")
-            print(f"     Description: {response.description}")
+        print(f"  ✅ Success:")
+        print(f"     Name: {response.name}")
+        print(f"     ID: {response.voice_id}")
+        print(f"     Description: {response.description}")
 
-            return True, response
+        return True, response
 
     except errors.NotFoundErrorResponse as e:
         print(f"  ❌ Custom voice not found: {voice_id}")
@@ -398,15 +398,13 @@ async def test_get_custom_voice(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_create_cloned_voice():
+async def test_create_cloned_voice(client):
     """Test custom voice creation - async (uses voice_sample.wav file)"""
     print("🎨 Custom Voice Creation Test (Async)")
 
@@ -426,39 +424,36 @@ async def test_create_cloned_voice():
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            timestamp = datetime.now().strftime("%m%d_%H%M")
-            voice_name = f"Test Sample Voice {timestamp} (Async)"
-            voice_description = f"Test async custom voice created at {timestamp}"
-
-            print(f"  🔍 Creating custom voice...")
-            print(f"     File: {audio_file_path}")
-            print(f"     Name: {voice_name}")
-            print(f"     Description: {voice_description}")
-            print("  ⚠️ This test consumes credits and creates actual custom voice!")
-
-            with open(audio_file_path, "rb") as audio_file:
-                audio_content = audio_file.read()
-
-                files_obj = models.Files(
-                    file_name="voice_sample.wav",
-                    content=audio_content,
-                    content_type="audio/wav",
-                )
+        timestamp = datetime.now().strftime("%m%d_%H%M")
+        voice_name = f"Test Sample Voice {timestamp} (Async)"
+        voice_description = f"Test async custom voice created at {timestamp}"
+
+        print(f"  🔍 Creating custom voice...")
+        print(f"     File: {audio_file_path}")
+        print(f"     Name: {voice_name}")
+        print(f"     Description: {voice_description}")
+        print("  ⚠️ This test consumes credits and creates actual custom voice!")
+
+        with open(audio_file_path, "rb") as audio_file:
+            audio_content = audio_file.read()
+
+            files_obj = models.Files(
+                file_name="voice_sample.wav",
+                content=audio_content,
+                content_type="audio/wav",
+            )
 
-                response = await client.custom_voices.create_cloned_voice_async(
-                    files=files_obj,
-                    name=voice_name,
-                    description=voice_description,
-                )
+            response = await client.custom_voices.create_cloned_voice_async(
+                files=files_obj,
+                name=voice_name,
+                description=voice_description,
+            )
 
-            print(f"  ✅ Custom voice creation request successful!")
-            print(f"     Voice ID: {response.voice_id}")
-            print(f"     Status: {getattr(response, 'status', 'Unknown')}")
+        print(f"  ✅ Custom voice creation request successful!")
+        print(f"     Voice ID: {response.voice_id}")
+        print(f"     Status: {getattr(response, 'status', 'Unknown')}")
 
-            return True, response
+        return True, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please recharge")
@@ -473,15 +468,13 @@ async def test_create_cloned_voice():
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_edit_custom_voice(voice_id):
+async def test_edit_custom_voice(client, voice_id):
     """Test custom voice update - async"""
     print("✏️ Custom Voice Update Test (Async)")
 
@@ -490,28 +483,25 @@ async def test_edit_custom_voice(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors
-
-        async with Supertone(api_key=API_KEY) as client:
-            timestamp = datetime.now().strftime("%H%M%S")
-            test_name = f"Updated Test Voice {timestamp} (Async)"
-            test_description = f"Updated async description at {timestamp}"
-
-            print(f"  🔄 Updating custom voice '{voice_id}'...")
-            print(f"     New name: {test_name}")
-            print(f"     New description: {test_description}")
-
-            response = await client.custom_voices.edit_custom_voice_async(
-                voice_id=voice_id,
-                name=test_name,
-                description=test_description,
-            )
+        timestamp = datetime.now().strftime("%H%M%S")
+        test_name = f"Updated Test Voice {timestamp} (Async)"
+        test_description = f"Updated async description at {timestamp}"
+
+        print(f"  🔄 Updating custom voice '{voice_id}'...")
+        print(f"     New name: {test_name}")
+        print(f"     New description: {test_description}")
+
+        response = await client.custom_voices.edit_custom_voice_async(
+            voice_id=voice_id,
+            name=test_name,
+            description=test_description,
+        )
 
-            print(f"  ✅ Update successful:")
-            print(f"     Updated name: {response.name}")
-            print(f"     Updated description: {response.description}")
+        print(f"  ✅ Update successful:")
+        print(f"     Updated name: {response.name}")
+        print(f"     Updated description: {response.description}")
 
-            return True, response
+        return True, response
 
     except errors.NotFoundErrorResponse as e:
         print(f"  ❌ Custom voice not found: {voice_id}")
@@ -520,15 +510,13 @@ async def test_edit_custom_voice(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_delete_custom_voice(voice_id):
+async def test_delete_custom_voice(client, voice_id):
     """Test custom voice deletion - async"""
     print("🗑️ Custom Voice Deletion Test (Async)")
 
@@ -537,22 +525,19 @@ async def test_delete_custom_voice(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors
-
         print("  ⚠️ This test will actually delete the custom voice!")
         print("     Use for testing purposes only.")
 
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Deleting custom voice '{voice_id}'...")
+        print(f"  🔍 Deleting custom voice '{voice_id}'...")
 
-            response = await client.custom_voices.delete_custom_voice_async(
-                voice_id=voice_id
-            )
+        response = await client.custom_voices.delete_custom_voice_async(
+            voice_id=voice_id
+        )
 
-            print(f"  ✅ Deletion successful:")
-            print(f"     Response: {response}")
+        print(f"  ✅ Deletion successful:")
+        print(f"     Response: {response}")
 
-            return True, response
+        return True, response
 
     except errors.NotFoundErrorResponse as e:
         print(f"  ❌ Custom voice not found: {voice_id}")
@@ -561,15 +546,13 @@ async def test_delete_custom_voice(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_predict_duration(voice_id):
+async def test_predict_duration(client, voice_id):
     """Test duration prediction - async (safe test before TTS)"""
     print("⏱️ Duration Prediction Test (Async)")
 
@@ -578,21 +561,18 @@ async def test_predict_duration(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Predicting duration with voice '{voice_id}'...")
-
-            response = await client.text_to_speech.predict_duration_async(
-                voice_id=voice_id,
-                text="Hello, this is a test message for duration prediction!",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model="sona_speech_1",
-            )
+        print(f"  🔍 Predicting duration with voice '{voice_id}'...")
+
+        response = await client.text_to_speech.predict_duration_async(
+            voice_id=voice_id,
+            text="Hello, this is a test message for duration prediction!",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model="sona_speech_1",
+        )
 
-            print(f"  ✅ Prediction complete: {response} seconds")
-            return True, response
+        print(f"  ✅ Prediction complete: {response} seconds")
+        return True, response
 
     except errors.NotFoundErrorResponse as e:
         print(f"  ❌ Voice not found: {voice_id}")
@@ -601,15 +581,13 @@ async def test_predict_duration(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_create_speech(voice_id):
+async def test_create_speech(client, voice_id):
     """Test TTS conversion - async (consumes credits)"""
     print("🎤 TTS Conversion Test (Async - Consumes Credits)")
 
@@ -618,48 +596,40 @@ async def test_create_speech(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Converting text to speech with voice '{voice_id}'...")
-            print("  ⚠️ This test consumes credits!")
-
-            response = await client.text_to_speech.create_speech_async(
-                voice_id=voice_id,
-                text="안녕하세요! 이것은 비동기 SDK 테스트를 위한 한국어 텍스트입니다. 정상적으로 작동하는지 확인해보겠습니다.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=None,
-            )
-
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                audio_size = len(audio_data)
-                print(
-                    f"  ✅ TTS conversion success: {audio_size} bytes audio generated"
-                )
-
-                output_file = "test_async_create_speech_output.wav"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 Audio file saved: {output_file}")
+        print(f"  🔍 Converting text to speech with voice '{voice_id}'...")
+        print("  ⚠️ This test consumes credits!")
+
+        response = await client.text_to_speech.create_speech_async(
+            voice_id=voice_id,
+            text="안녕하세요! 이것은 비동기 SDK 테스트를 위한 한국어 텍스트입니다. 정상적으로 작동하는지 확인해보겠습니다.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=None,
+        )
 
-                file_size = os.path.getsize(output_file)
-                print(f"  📏 Saved file size: {file_size} bytes")
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            audio_size = len(audio_data)
+            print(f"  ✅ TTS conversion success: {audio_size} bytes audio generated")
 
-                with open(output_file, "rb") as f:
-                    header = f.read(12)
-                    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
-                        print(f"  ✅ Valid WAV file generated")
-                    else:
-                        print(f"  ⚠️ WAV header needs verification: {header[:12]}")
+            output_file = "test_async_create_speech_output.wav"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 Audio file saved: {output_file}")
+            print(f"  📏 Saved file size: {audio_size} bytes")
 
-                return True, response
+            header = audio_data[:12]
+            if header.startswith(b"RIFF") and header.startswith(b"WAVE", 8):
+                print(f"  ✅ Valid WAV file generated")
             else:
-                print(f"  ❌ Response structure verification needed: {type(response)}")
-                return False, response
+                print(f"  ⚠️ WAV header needs verification: {header[:12]}")
+
+            return True, response
+        else:
+            print(f"  ❌ Response structure verification needed: {type(response)}")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please recharge")
@@ -671,15 +641,13 @@ async def test_create_speech(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_create_speech_long_text(voice_id):
+async def test_create_speech_long_text(client, voice_id):
     """Test auto-chunking TTS for long text (300+ chars) - async"""
     print("📜 Long Text Auto-Chunking TTS Test (Async - 300+ chars)")
 
@@ -688,8 +656,6 @@ async def test_create_speech_long_text(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         long_text = """
         안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 자동 청킹 TTS 테스트입니다.
         새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 처리합니다.
@@ -704,59 +670,51 @@ async def test_create_speech_long_text(voice_id):
         print(f"  📏 Test text length: {actual_length} characters (exceeds 300)")
         print(f"  🔧 Auto-chunking enabled for text segmentation")
 
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Converting long text with voice '{voice_id}' (async)...")
-            print("  ⚠️ This test consumes credits!")
-            print("  ✨ SDK automatically chunks and processes the text")
-
-            response = await client.text_to_speech.create_speech_async(
-                voice_id=voice_id,
-                text=long_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=None,
-            )
-
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                audio_size = len(audio_data)
-                print(
-                    f"  ✅ Auto-chunking TTS success: {audio_size} bytes audio generated"
-                )
-                print(f"  🎯 Long text successfully chunked and processed!")
-
-                output_file = "test_async_auto_chunking_speech_output.wav"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 Auto-chunked audio file saved: {output_file}")
-
-                file_size = os.path.getsize(output_file)
-                print(f"  📏 Saved file size: {file_size} bytes")
+        print(f"  🔍 Converting long text with voice '{voice_id}' (async)...")
+        print("  ⚠️ This test consumes credits!")
+        print("  ✨ SDK automatically chunks and processes the text")
+
+        response = await client.text_to_speech.create_speech_async(
+            voice_id=voice_id,
+            text=long_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=None,
+        )
 
-                with open(output_file, "rb") as f:
-                    header = f.read(12)
-                    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
-                        print(f"  ✅ Valid auto-chunked WAV file generated")
-                    else:
-                        print(f"  ⚠️ WAV header needs verification: {header[:12]}")
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            audio_size = len(audio_data)
+            print(f"  ✅ Auto-chunking TTS success: {audio_size} bytes audio generated")
+            print(f"  🎯 Long text successfully chunked and processed!")
+
+            output_file = "test_async_auto_chunking_speech_output.wav"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 Auto-chunked audio file saved: {output_file}")
+            print(f"  📏 Saved file size: {audio_size} bytes")
+
+            header = audio_data[:12]
+            if header.startswith(b"RIFF") and header.startswith(b"WAVE", 8):
+                print(f"  ✅ Valid auto-chunked WAV file generated")
+            else:
+                print(f"  ⚠️ WAV header needs verification: {header[:12]}")
 
-                estimated_chunks = (actual_length + 299) // 300
-                print(
-                    f"  📊 Estimated chunks: {estimated_chunks} (based on text length)"
-                )
-                print(f"  🔀 Parallel processing applied to each chunk")
+            estimated_chunks = (actual_length + 299) // 300
+            print(f"  📊 Estimated chunks: {estimated_chunks} (based on text length)")
+            print(f"  🔀 Parallel processing applied to each chunk")
 
-                return True, {
-                    "audio_size": audio_size,
-                    "text_length": actual_length,
-                    "estimated_chunks": estimated_chunks,
-                    "output_file": output_file,
-                }
-            else:
-                print(f"  ❌ Response structure verification needed: {type(response)}")
-                return False, response
+            return True, {
+                "audio_size": audio_size,
+                "text_length": actual_length,
+                "estimated_chunks": estimated_chunks,
+                "output_file": output_file,
+            }
+        else:
+            print(f"  ❌ Response structure verification needed: {type(response)}")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please recharge")
@@ -765,8 +723,7 @@ async def test_create_speech_long_text(voice_id):
         print(f"  ❌ Voice not found: {voice_id}")
         return False, e
     except RuntimeError as e:
-        error_message = str(e).lower()
-        if "chunk" in error_message or "merge" in error_message:
+        if _CHUNK_ERR_RE.search(str(e)):
             print(f"  ❌ Auto-chunking processing error: {e}")
             print("  🔧 Check chunking logic")
             return False, e
@@ -777,15 +734,13 @@ async def test_create_speech_long_text(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_stream_speech(voice_id):
+async def test_stream_speech(client, voice_id):
     """Test streaming TTS - async"""
     print("🎵 TTS Streaming Test (Async)")
 
@@ -794,95 +749,85 @@ async def test_stream_speech(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔄 Streaming TTS test with voice '{voice_id}' (async)...")
-            print("  ⚠️ This test may consume credits!")
+        print(f"  🔄 Streaming TTS test with voice '{voice_id}' (async)...")
+        print("  ⚠️ This test may consume credits!")
 
-            request_start_time = time.time()
+        request_start_time = time.time()
 
-            response = await client.text_to_speech.stream_speech_async(
-                voice_id=voice_id,
-                text="안녕하세요! 이것은 비동기 스트리밍 TTS 테스트를 위한 한국어 텍스트입니다. 스트리밍 기능이 정상적으로 작동하는지 확인하기 위해 조금 더 긴 텍스트를 사용하고 있습니다.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                style="neutral",
-                model="sona_speech_1",
-            )
+        response = await client.text_to_speech.stream_speech_async(
+            voice_id=voice_id,
+            text="안녕하세요! 이것은 비동기 스트리밍 TTS 테스트를 위한 한국어 텍스트입니다. 스트리밍 기능이 정상적으로 작동하는지 확인하기 위해 조금 더 긴 텍스트를 사용하고 있습니다.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            style="neutral",
+            model="sona_speech_1",
+        )
 
-            print("  📡 Receiving streaming data...")
+        print("  📡 Receiving streaming data...")
 
-            if hasattr(response, "result") and hasattr(response.result, "aiter_bytes"):
-                chunk_count = 0
-                total_bytes = 0
-                audio_chunks = []
-                first_byte_time = None
+        if hasattr(response, "result") and hasattr(response.result, "aiter_bytes"):
+            chunk_count = 0
+            total_bytes = 0
+            audio_data = bytearray()
+            first_byte_time = None
 
-                try:
-                    async for chunk in response.result.aiter_bytes():
-                        if chunk_count == 0:
-                            first_byte_time = time.time()
-                            first_byte_latency = first_byte_time - request_start_time
-                            print(f"  🚀 First Byte arrival: {first_byte_latency:.3f}s")
+            try:
+                async for chunk in response.result.aiter_bytes():
+                    if chunk_count == 0:
+                        first_byte_time = time.time()
+                        first_byte_latency = first_byte_time - request_start_time
+                        print(f"  🚀 First Byte arrival: {first_byte_latency:.3f}s")
 
-                        chunk_count += 1
-                        chunk_size = len(chunk)
-                        total_bytes += chunk_size
-                        audio_chunks.append(chunk)
+                    chunk_count += 1
+                    chunk_size = len(chunk)
+                    total_bytes += chunk_size
+                    audio_data.extend(chunk)
 
+                    if CHUNK_LOG:
                         if chunk_count <= 20:
                             print(f"     Chunk {chunk_count}: {chunk_size} bytes")
                         elif chunk_count == 21:
                             print(f"     ... (more chunks - log truncated)")
-                        elif chunk_count % 50 == 0:
+                        elif (chunk_count & CHUNK_PROGRESS_MASK) == 0:
                             print(
                                 f"     Chunk {chunk_count}: {chunk_size} bytes (in progress...)"
                             )
 
-                except Exception as iter_error:
-                    print(f"  ⚠️ Streaming error: {str(iter_error)[:100]}...")
-
-                end_time = time.time()
-                total_time = end_time - request_start_time
-
-                print(
-                    f"  ✅ Streaming complete: {chunk_count} chunks, {total_bytes} bytes"
-                )
-                print(f"  ⏱️ Total time: {total_time:.3f}s")
+            except Exception as iter_error:
+                print(f"  ⚠️ Streaming error: {str(iter_error)[:100]}...")
 
-                if first_byte_time:
-                    streaming_time = end_time - first_byte_time
-                    print(
-                        f"  📊 Streaming time: {streaming_time:.3f}s (after First Byte)"
-                    )
-                    if streaming_time > 0:
-                        throughput = total_bytes / streaming_time
-                        print(f"  🚀 Average throughput: {throughput:.0f} bytes/sec")
+            end_time = time.time()
+            total_time = end_time - request_start_time
 
-                if audio_chunks and total_bytes > 0:
-                    output_file = "test_async_stream_speech_output.wav"
-                    with open(output_file, "wb") as f:
-                        for chunk in audio_chunks:
-                            f.write(chunk)
-                    print(f"  💾 Streaming audio saved: {output_file}")
+            print(f"  ✅ Streaming complete: {chunk_count} chunks, {total_bytes} bytes")
+            print(f"  ⏱️ Total time: {total_time:.3f}s")
 
-                    file_size = os.path.getsize(output_file)
-                    print(f"  📏 Saved file size: {file_size} bytes")
+            if first_byte_time:
+                streaming_time = end_time - first_byte_time
+                print(f"  📊 Streaming time: {streaming_time:.3f}s (after First Byte)")
+                if streaming_time > 0:
+                    throughput = total_bytes / streaming_time
+                    print(f"  🚀 Average throughput: {throughput:.0f} bytes/sec")
 
-                    with open(output_file, "rb") as f:
-                        header = f.read(12)
-                        if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
-                            print(f"  ✅ Valid streaming WAV file generated")
-                        else:
-                            print(f"  📄 File header: {header[:12]} (may not be WAV)")
+            if total_bytes > 0:
+                output_file = "test_async_stream_speech_output.wav"
+                with open(output_file, "wb") as f:
+                    f.write(audio_data)
+                print(f"  💾 Streaming audio saved: {output_file}")
+                print(f"  📏 Saved file size: {total_bytes} bytes")
 
-                    return True, f"{chunk_count} chunks, {total_bytes} bytes"
+                header = bytes(audio_data[:12])
+                if header.startswith(b"RIFF") and header.startswith(b"WAVE", 8):
+                    print(f"  ✅ Valid streaming WAV file generated")
                 else:
-                    print(f"  ⚠️ No audio data received")
-                    return False, "No audio data received"
+                    print(f"  📄 File header: {header[:12]} (may not be WAV)")
+
+                return True, f"{chunk_count} chunks, {total_bytes} bytes"
             else:
-                print(f"  ❌ Response missing iter_bytes attribute: {type(response)}")
-                return False, response
+                print(f"  ⚠️ No audio data received")
+                return False, "No audio data received"
+        else:
+            print(f"  ❌ Response missing iter_bytes attribute: {type(response)}")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please recharge")
@@ -894,15 +839,13 @@ async def test_stream_speech(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_stream_speech_long_text(voice_id):
+async def test_stream_speech_long_text(client, voice_id):
     """Test streaming TTS for long text (300+ chars) with WAV format - async"""
     print("📜 Long Text WAV Streaming TTS Test (Async - 300+ chars)")
 
@@ -911,8 +854,6 @@ async def test_stream_speech_long_text(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         long_text = """
         안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 WAV 스트리밍 TTS 테스트입니다.
         새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 스트리밍으로 처리합니다.
@@ -928,258 +869,235 @@ async def test_stream_speech_long_text(voice_id):
         print(f"  📏 Test text length: {actual_length} characters (exceeds 300)")
         print(f"  🔧 Auto-chunking + WAV streaming enabled")
 
-        async with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Long text WAV streaming TTS conversion with voice '{voice_id}' (async)..."
-            )
-            print("  ⚠️ This test consumes credits and applies auto-chunking!")
-            print("  ✨ SDK automatically chunks text and processes as WAV streaming")
+        print(
+            f"  🔍 Long text WAV streaming TTS conversion with voice '{voice_id}' (async)..."
+        )
+        print("  ⚠️ This test consumes credits and applies auto-chunking!")
+        print("  ✨ SDK automatically chunks text and processes as WAV streaming")
+
+        request_start_time = time.time()
+
+        response = await client.text_to_speech.stream_speech_async(
+            voice_id=voice_id,
+            text=long_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model="sona_speech_1",
+        )
 
-            request_start_time = time.time()
+        print(f"  🔍 Response type: {type(response)}")
+        print(f"  🔍 Result type: {type(response.result)}")
+
+        # Handle real-time streaming response (AsyncExtendedStreamingWrapper)
+        if (
+            hasattr(response, "result")
+            and hasattr(response.result, "aiter_bytes")
+            and not isinstance(response.result, str)
+        ):
+            print("  ✅ Real-time streaming response detected (auto-chunked)")
+            chunk_count = 0
+            total_bytes = 0
+            audio_data = bytearray()
+            first_byte_time = None
 
-            response = await client.text_to_speech.stream_speech_async(
-                voice_id=voice_id,
-                text=long_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model="sona_speech_1",
-            )
+            try:
+                async for chunk in response.result.aiter_bytes():
+                    if chunk_count == 0:
+                        first_byte_time = time.time()
+                        first_byte_latency = first_byte_time - request_start_time
+                        print(f"  🚀 First Byte arrival: {first_byte_latency:.3f}s")
 
-            print(f"  🔍 Response type: {type(response)}")
-            print(f"  🔍 Result type: {type(response.result)}")
+                    chunk_count += 1
+                    chunk_size = len(chunk)
+                    total_bytes += chunk_size
+                    audio_data.extend(chunk)
 
-            # Handle real-time streaming response (AsyncExtendedStreamingWrapper)
-            if (
-                hasattr(response, "result")
-                and hasattr(response.result, "aiter_bytes")
-                and not isinstance(response.result, str)
-            ):
-                print("  ✅ Real-time streaming response detected (auto-chunked)")
-                chunk_count = 0
-                total_bytes = 0
-                audio_chunks = []
-                first_byte_time = None
+                    if CHUNK_LOG:
+                        if chunk_count <= 20:
+                            print(f"     Chunk {chunk_count}: {chunk_size} bytes")
 
-                try:
-                    async for chunk in response.result.aiter_bytes():
-                        if chunk_count == 0:
-                            first_byte_time = time.time()
-                            first_byte_latency = first_byte_time - request_start_time
-                            print(f"  🚀 First Byte arrival: {first_byte_latency:.3f}s")
+            except Exception as iter_error:
+                print(f"  ⚠️ Long text streaming error: {str(iter_error)[:100]}...")
 
-                        chunk_count += 1
-                        chunk_size = len(chunk)
-                        total_bytes += chunk_size
-                        audio_chunks.append(chunk)
+            print(
+                f"  ✅ Long text streaming complete: {chunk_count} chunks, {total_bytes} bytes"
+            )
 
-                        if chunk_count <= 20:
-                            print(f"     Chunk {chunk_count}: {chunk_size} bytes")
+            if total_bytes > 0:
+                end_time = time.time()
+                total_time = end_time - request_start_time
+                streaming_time = end_time - first_byte_time if first_byte_time else 0
 
-                except Exception as iter_error:
-                    print(f"  ⚠️ Long text streaming error: {str(iter_error)[:100]}...")
+                print(f"  ⏱️ Total time: {total_time:.3f}s")
+                if streaming_time > 0:
+                    print(
+                        f"  📊 Streaming time: {streaming_time:.3f}s (after First Byte)"
+                    )
+                    throughput = total_bytes / streaming_time
+                    print(f"  🚀 Average throughput: {throughput:.0f} bytes/sec")
+
+                output_file = "test_async_stream_speech_long_output.wav"
+                with open(output_file, "wb") as f:
+                    f.write(audio_data)
+                print(f"  💾 Long text streaming audio saved: {output_file}")
+                print(f"  📏 Saved file size: {total_bytes} bytes")
 
+                estimated_chunks = (actual_length + 299) // 300
                 print(
-                    f"  ✅ Long text streaming complete: {chunk_count} chunks, {total_bytes} bytes"
+                    f"  📊 Estimated text chunks: {estimated_chunks} (based on text length)"
                 )
 
-                if audio_chunks and total_bytes > 0:
-                    audio_data = b"".join(audio_chunks)
+                return True, {
+                    "chunk_count": chunk_count,
+                    "total_bytes": total_bytes,
+                    "text_length": actual_length,
+                    "estimated_chunks": estimated_chunks,
+                }
+
+        # Handle new JSON format response (old merged format)
+        elif hasattr(response, "result") and isinstance(response.result, str):
+            try:
+                result_data = json_loads(response.result)
+                print(f"  ✅ Chunked JSON response detected")
+                print(f"  🔍 JSON keys: {', '.join(result_data)}")
+
+                if "audio_base64" in result_data:
+                    first_byte_time = time.time()
+                    first_byte_latency = first_byte_time - request_start_time
+                    print(
+                        f"  🚀 First Byte arrival: {first_byte_latency:.3f}s (chunked merged response)"
+                    )
+
+                    audio_data = decode_audio_base64(result_data["audio_base64"])
+                    total_bytes = len(audio_data)
+
+                    print(f"  ✅ Merged WAV audio data: {total_bytes} bytes")
 
                     end_time = time.time()
                     total_time = end_time - request_start_time
-                    streaming_time = (
-                        end_time - first_byte_time if first_byte_time else 0
-                    )
+                    streaming_time = end_time - first_byte_time
 
                     print(f"  ⏱️ Total time: {total_time:.3f}s")
+                    print(
+                        f"  📊 Processing time: {streaming_time:.3f}s (after First Byte)"
+                    )
                     if streaming_time > 0:
-                        print(
-                            f"  📊 Streaming time: {streaming_time:.3f}s (after First Byte)"
-                        )
                         throughput = total_bytes / streaming_time
                         print(f"  🚀 Average throughput: {throughput:.0f} bytes/sec")
 
                     output_file = "test_async_stream_speech_long_output.wav"
                     with open(output_file, "wb") as f:
                         f.write(audio_data)
-                    print(f"  💾 Long text streaming audio saved: {output_file}")
-                    print(f"  📏 Saved file size: {total_bytes} bytes")
+                    print(f"  💾 Long text WAV streaming audio saved: {output_file}")
+                    print(f"  📏 Saved file size: {len(audio_data)} bytes")
+
+                    header = audio_data[:12]
+                    if header.startswith(b"RIFF") and header.startswith(b"WAVE", 8):
+                        print(f"  ✅ Valid WAV long text streaming file generated")
+                    else:
+                        print(f"  ⚠️ WAV header needs verification: {header[:12]}")
+
+                    if "phonemes" in result_data and result_data["phonemes"]:
+                        phonemes = result_data["phonemes"]
+                        print(f"  🔤 Phoneme information included:")
+                        print(f"    - Symbols: {len(phonemes.get('symbols', []))}")
+                        if phonemes.get("start_times_seconds"):
+                            print(
+                                f"    - Start times: {len(phonemes['start_times_seconds'])} items"
+                            )
+                        if phonemes.get("durations_seconds"):
+                            print(
+                                f"    - Durations: {len(phonemes['durations_seconds'])} items"
+                            )
 
                     estimated_chunks = (actual_length + 299) // 300
                     print(
                         f"  📊 Estimated text chunks: {estimated_chunks} (based on text length)"
                     )
+                    print(f"  🔀 Auto-chunked segments merged as WAV")
 
                     return True, {
-                        "chunk_count": chunk_count,
                         "total_bytes": total_bytes,
                         "text_length": actual_length,
                         "estimated_chunks": estimated_chunks,
+                        "format": "wav",
+                        "has_phonemes": "phonemes" in result_data
+                        and result_data["phonemes"] is not None,
+                        "first_byte_latency": first_byte_latency,
+                        "total_time": total_time,
                     }
+                else:
+                    print(f"  ❌ audio_base64 key missing: {result_data}")
+                    return False, result_data
+
+            except json.JSONDecodeError as e:
+                print(f"  ❌ JSON parsing failed: {e}")
+                return False, e
+            except Exception as e:
+                print(f"  ❌ Response processing error: {e}")
+                return False, e
+
+        # Handle existing streaming response (non-chunked case)
+        elif hasattr(response, "result") and hasattr(response.result, "aiter_bytes"):
+            chunk_count = 0
+            total_bytes = 0
+            audio_data = bytearray()
+            first_byte_time = None
 
-            # Handle new JSON format response (old merged format)
-            elif hasattr(response, "result") and isinstance(response.result, str):
-                try:
-                    import base64
-
-                    result_data = json.loads(response.result)
-                    print(f"  ✅ Chunked JSON response detected")
-                    print(f"  🔍 JSON keys: {list(result_data.keys())}")
-
-                    if "audio_base64" in result_data:
+            try:
+                async for chunk in response.result.aiter_bytes():
+                    if chunk_count == 0:
                         first_byte_time = time.time()
                         first_byte_latency = first_byte_time - request_start_time
                         print(
-                            f"  🚀 First Byte arrival: {first_byte_latency:.3f}s (chunked merged response)"
-                        )
-
-                        audio_data = base64.b64decode(result_data["audio_base64"])
-                        total_bytes = len(audio_data)
-
-                        print(f"  ✅ Merged WAV audio data: {total_bytes} bytes")
-
-                        end_time = time.time()
-                        total_time = end_time - request_start_time
-                        streaming_time = end_time - first_byte_time
-
-                        print(f"  ⏱️ Total time: {total_time:.3f}s")
-                        print(
-                            f"  📊 Processing time: {streaming_time:.3f}s (after First Byte)"
-                        )
-                        if streaming_time > 0:
-                            throughput = total_bytes / streaming_time
-                            print(
-                                f"  🚀 Average throughput: {throughput:.0f} bytes/sec"
-                            )
-
-                        output_file = "test_async_stream_speech_long_output.wav"
-                        with open(output_file, "wb") as f:
-                            f.write(audio_data)
-                        print(
-                            f"  💾 Long text WAV streaming audio saved: {output_file}"
-                        )
-
-                        file_size = os.path.getsize(output_file)
-                        print(f"  📏 Saved file size: {file_size} bytes")
-
-                        with open(output_file, "rb") as f:
-                            header = f.read(12)
-                            if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
-                                print(
-                                    f"  ✅ Valid WAV long text streaming file generated"
-                                )
-                            else:
-                                print(
-                                    f"  ⚠️ WAV header needs verification: {header[:12]}"
-                                )
-
-                        if "phonemes" in result_data and result_data["phonemes"]:
-                            phonemes = result_data["phonemes"]
-                            print(f"  🔤 Phoneme information included:")
-                            print(f"    - Symbols: {len(phonemes.get('symbols', []))}")
-                            if phonemes.get("start_times_seconds"):
-                                print(
-                                    f"    - Start times: {len(phonemes['start_times_seconds'])} items"
-                                )
-                            if phonemes.get("durations_seconds"):
-                                print(
-                                    f"    - Durations: {len(phonemes['durations_seconds'])} items"
-                                )
-
-                        estimated_chunks = (actual_length + 299) // 300
-                        print(
-                            f"  📊 Estimated text chunks: {estimated_chunks} (based on text length)"
+                            f"  🚀 First Byte arrival: {first_byte_latency:.3f}s (auto-chunking)"
                         )
-                        print(f"  🔀 Auto-chunked segments merged as WAV")
-
-                        return True, {
-                            "total_bytes": total_bytes,
-                            "text_length": actual_length,
-                            "estimated_chunks": estimated_chunks,
-                            "format": "wav",
-                            "has_phonemes": "phonemes" in result_data
-                            and result_data["phonemes"] is not None,
-                            "first_byte_latency": first_byte_latency,
-                            "total_time": total_time,
-                        }
-                    else:
-                        print(f"  ❌ audio_base64 key missing: {result_data}")
-                        return False, result_data
-
-                except json.JSONDecodeError as e:
-                    print(f"  ❌ JSON parsing failed: {e}")
-                    return False, e
-                except Exception as e:
-                    print(f"  ❌ Response processing error: {e}")
-                    return False, e
-
-            # Handle existing streaming response (non-chunked case)
-            elif hasattr(response, "result") and hasattr(
-                response.result, "aiter_bytes"
-            ):
-                chunk_count = 0
-                total_bytes = 0
-                audio_chunks = []
-                first_byte_time = None
-
-                try:
-                    async for chunk in response.result.aiter_bytes():
-                        if chunk_count == 0:
-                            first_byte_time = time.time()
-                            first_byte_latency = first_byte_time - request_start_time
-                            print(
-                                f"  🚀 First Byte arrival: {first_byte_latency:.3f}s (auto-chunking)"
-                            )
 
-                        chunk_count += 1
-                        chunk_size = len(chunk)
-                        total_bytes += chunk_size
-                        audio_chunks.append(chunk)
+                    chunk_count += 1
+                    chunk_size = len(chunk)
+                    total_bytes += chunk_size
+                    audio_data.extend(chunk)
 
+                    if CHUNK_LOG:
                         if chunk_count <= 10:
                             print(f"     Chunk {chunk_count}: {chunk_size} bytes")
-                        elif chunk_count % 20 == 0:
+                        elif (chunk_count & CHUNK_PROGRESS_MASK) == 0:
                             print(f"     Progress: {chunk_count} chunks")
 
-                except Exception as iter_error:
-                    print(f"  ⚠️ WAV streaming error: {str(iter_error)[:100]}...")
-
-                end_time = time.time()
-                total_time = end_time - request_start_time
-
-                print(
-                    f"  ✅ WAV long text streaming success: {chunk_count} chunks, {total_bytes} bytes"
-                )
-                print(f"  ⏱️ Total time: {total_time:.3f}s")
-
-                if first_byte_time:
-                    streaming_time = end_time - first_byte_time
-                    print(
-                        f"  📊 Streaming time: {streaming_time:.3f}s (after First Byte)"
-                    )
-                    if streaming_time > 0:
-                        throughput = total_bytes / streaming_time
-                        print(f"  🚀 Average throughput: {throughput:.0f} bytes/sec")
-                    print(f"  🔧 Additional processing time due to auto-chunking")
+            except Exception as iter_error:
+                print(f"  ⚠️ WAV streaming error: {str(iter_error)[:100]}...")
 
-                if audio_chunks and total_bytes > 0:
-                    output_file = "test_async_stream_speech_long_output.wav"
-                    with open(output_file, "wb") as f:
-                        for chunk in audio_chunks:
-                            f.write(chunk)
-                    print(f"  💾 Long text WAV streaming audio saved: {output_file}")
+            end_time = time.time()
+            total_time = end_time - request_start_time
 
-                    file_size = os.path.getsize(output_file)
-                    print(f"  📏 Saved file size: {file_size} bytes")
+            print(
+                f"  ✅ WAV long text streaming success: {chunk_count} chunks, {total_bytes} bytes"
+            )
+            print(f"  ⏱️ Total time: {total_time:.3f}s")
+
+            if first_byte_time:
+                streaming_time = end_time - first_byte_time
+                print(f"  📊 Streaming time: {streaming_time:.3f}s (after First Byte)")
+                if streaming_time > 0:
+                    throughput = total_bytes / streaming_time
+                    print(f"  🚀 Average throughput: {throughput:.0f} bytes/sec")
+                print(f"  🔧 Additional processing time due to auto-chunking")
+
+            if total_bytes > 0:
+                output_file = "test_async_stream_speech_long_output.wav"
+                with open(output_file, "wb") as f:
+                    f.write(audio_data)
+                print(f"  💾 Long text WAV streaming audio saved: {output_file}")
+                print(f"  📏 Saved file size: {total_bytes} bytes")
 
-                    return True, output_file
-                else:
-                    print("  ⚠️ No audio data received")
-                    return False, None
+                return True, output_file
             else:
-                print("  ⚠️ Streaming interface not found")
+                print("  ⚠️ No audio data received")
                 return False, None
+        else:
+            print("  ⚠️ Streaming interface not found")
+            return False, None
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please recharge")
@@ -1188,8 +1106,7 @@ async def test_stream_speech_long_text(voice_id):
         print(f"  ❌ Voice not found: {voice_id}")
         return False, e
     except RuntimeError as e:
-        error_message = str(e).lower()
-        if "chunk" in error_message or "merge" in error_message:
+        if _CHUNK_ERR_RE.search(str(e)):
             print(f"  ❌ WAV streaming auto-chunking processing error: {e}")
             print("  🔧 Check WAV streaming chunking logic")
             return False, e
@@ -1200,15 +1117,13 @@ async def test_stream_speech_long_text(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_create_speech_with_voice_settings(voice_id):
+async def test_create_speech_with_voice_settings(client, voice_id):
     """Test TTS with voice settings - async"""
     print("🎛️ TTS with Voice Settings Test (Async)")
 
@@ -1217,61 +1132,55 @@ async def test_create_speech_with_voice_settings(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
+        print(
+            f"  🔍 TTS conversion with voice settings using voice '{voice_id}' (async)..."
+        )
+        print("  ⚠️ This test consumes credits!")
 
-        async with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 TTS conversion with voice settings using voice '{voice_id}' (async)..."
-            )
-            print("  ⚠️ This test consumes credits!")
+        voice_settings = {
+            "pitch_shift": 0.95,
+            "pitch_variance": 1.1,
+            "speed": 0.9,
+        }
 
-            voice_settings = {
-                "pitch_shift": 0.95,
-                "pitch_variance": 1.1,
-                "speed": 0.9,
-            }
+        print(
+            f"     Settings: pitch_shift={voice_settings['pitch_shift']}, speed={voice_settings['speed']}"
+        )
 
-            print(
-                f"     Settings: pitch_shift={voice_settings['pitch_shift']}, speed={voice_settings['speed']}"
-            )
+        response = await client.text_to_speech.create_speech_async(
+            voice_id=voice_id,
+            text="Hello world! This is a voice settings test. You can hear the adjusted pitch and speed.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=voice_settings,
+            include_phonemes=False,
+        )
 
-            response = await client.text_to_speech.create_speech_async(
-                voice_id=voice_id,
-                text="Hello world! This is a voice settings test. You can hear the adjusted pitch and speed.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=voice_settings,
-                include_phonemes=False,
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            audio_size = len(audio_data)
+            print(
+                f"  ✅ TTS with voice settings success: {audio_size} bytes audio generated"
             )
 
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                audio_size = len(audio_data)
-                print(
-                    f"  ✅ TTS with voice settings success: {audio_size} bytes audio generated"
-                )
-
-                output_file = "test_async_voice_settings_speech_output.wav"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 Voice settings audio file saved: {output_file}")
-
-                file_size = os.path.getsize(output_file)
-                print(f"  📏 Saved file size: {file_size} bytes")
-
-                with open(output_file, "rb") as f:
-                    header = f.read(12)
-                    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
-                        print(f"  ✅ Valid voice settings WAV file generated")
-                    else:
-                        print(f"  ⚠️ WAV header needs verification: {header[:12]}")
+            output_file = "test_async_voice_settings_speech_output.wav"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 Voice settings audio file saved: {output_file}")
+            print(f"  📏 Saved file size: {audio_size} bytes")
 
-                return True, response
+            header = audio_data[:12]
+            if header.startswith(b"RIFF") and header.startswith(b"WAVE", 8):
+                print(f"  ✅ Valid voice settings WAV file generated")
             else:
-                print(f"  ❌ Response structure verification needed: {type(response)}")
-                return False, response
+                print(f"  ⚠️ WAV header needs verification: {header[:12]}")
+
+            return True, response
+        else:
+            print(f"  ❌ Response structure verification needed: {type(response)}")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please recharge")
@@ -1283,15 +1192,13 @@ async def test_create_speech_with_voice_settings(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_create_speech_with_phonemes(voice_id):
+async def test_create_speech_with_phonemes(client, voice_id):
     """Test TTS with phoneme information - async"""
     print("🔤 TTS with Phoneme Information Test (Async)")
 
@@ -1300,59 +1207,50 @@ async def test_create_speech_with_phonemes(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 TTS conversion with phonemes using voice '{voice_id}' (async)..."
-            )
-            print("  ⚠️ This test consumes credits!")
-
-            response = await client.text_to_speech.create_speech_async(
-                voice_id=voice_id,
-                text="Hello world! This is a phoneme timing test.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=None,
-                include_phonemes=True,
-            )
-
-            print(f"  🔍 Response type: {type(response)}")
+        print(f"  🔍 TTS conversion with phonemes using voice '{voice_id}' (async)...")
+        print("  ⚠️ This test consumes credits!")
+
+        response = await client.text_to_speech.create_speech_async(
+            voice_id=voice_id,
+            text="Hello world! This is a phoneme timing test.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=None,
+            include_phonemes=True,
+        )
 
-            if hasattr(response, "result"):
-                print(f"  🔍 Result type: {type(response.result)}")
+        print(f"  🔍 Response type: {type(response)}")
 
-                if hasattr(response.result, "read"):
-                    audio_data = response.result.read()
-                    audio_size = len(audio_data)
-                    print(
-                        f"  ✅ TTS with phonemes success: {audio_size} bytes audio generated"
-                    )
+        if hasattr(response, "result"):
+            print(f"  🔍 Result type: {type(response.result)}")
 
-                    output_file = "test_async_phoneme_speech_output.wav"
-                    with open(output_file, "wb") as f:
-                        f.write(audio_data)
-                    print(f"  💾 Phoneme audio file saved: {output_file}")
+            if hasattr(response.result, "read"):
+                audio_data = response.result.read()
+                audio_size = len(audio_data)
+                print(
+                    f"  ✅ TTS with phonemes success: {audio_size} bytes audio generated"
+                )
 
-                    file_size = os.path.getsize(output_file)
-                    print(f"  📏 Saved file size: {file_size} bytes")
+                output_file = "test_async_phoneme_speech_output.wav"
+                with open(output_file, "wb") as f:
+                    f.write(audio_data)
+                print(f"  💾 Phoneme audio file saved: {output_file}")
+                print(f"  📏 Saved file size: {audio_size} bytes")
 
-                    return True, response
+                return True, response
 
-            phoneme_fields = [
-                attr for attr in dir(response) if "phoneme" in attr.lower()
-            ]
-            if phoneme_fields:
-                print(f"  🔤 Phoneme related fields found: {phoneme_fields}")
-                for field in phoneme_fields:
-                    field_value = getattr(response, field)
-                    print(
-                        f"     {field}: {type(field_value)} = {str(field_value)[:100]}..."
-                    )
+        phoneme_fields = [attr for attr in dir(response) if "phoneme" in attr.lower()]
+        if phoneme_fields:
+            print(f"  🔤 Phoneme related fields found: {phoneme_fields}")
+            for field in phoneme_fields:
+                field_value = getattr(response, field)
+                print(
+                    f"     {field}: {type(field_value)} = {str(field_value)[:100]}..."
+                )
 
-            return True, response
+        return True, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please recharge")
@@ -1364,15 +1262,13 @@ async def test_create_speech_with_phonemes(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_stream_speech_with_phonemes(voice_id):
+async def test_stream_speech_with_phonemes(client, voice_id):
     """Test streaming TTS with phoneme information - async"""
     print("🔤 Phoneme Streaming TTS Test (Async)")
 
@@ -1381,55 +1277,57 @@ async def test_stream_speech_with_phonemes(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-        import base64
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔄 Phoneme streaming TTS test with voice '{voice_id}' (async)...")
-            print("  ⚠️ This test may consume credits!")
-
-            response = await client.text_to_speech.stream_speech_async(
-                voice_id=voice_id,
-                text="Hello world! This is a phoneme streaming test with timing information.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model="sona_speech_1",
-                include_phonemes=True,
-            )
+        print(f"  🔄 Phoneme streaming TTS test with voice '{voice_id}' (async)...")
+        print("  ⚠️ This test may consume credits!")
+
+        response = await client.text_to_speech.stream_speech_async(
+            voice_id=voice_id,
+            text="Hello world! This is a phoneme streaming test with timing information.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model="sona_speech_1",
+            include_phonemes=True,
+        )
 
-            print("  📡 Receiving phoneme streaming data...")
-            print(f"  🔍 Response type: {type(response)}")
-            print(
-                f"  🔍 Result type: {type(response.result) if hasattr(response, 'result') else 'No result'}"
-            )
+        print("  📡 Receiving phoneme streaming data...")
+        print(f"  🔍 Response type: {type(response)}")
+        print(
+            f"  🔍 Result type: {type(response.result) if hasattr(response, 'result') else 'No result'}"
+        )
 
-            # Handle JSON streaming response
-            if hasattr(response, "result") and isinstance(response.result, str):
-                print("  📄 JSON streaming response detected")
+        # Handle JSON streaming response
+        if hasattr(response, "result") and isinstance(response.result, str):
+            print("  📄 JSON streaming response detected")
 
-                json_chunks = []
-                audio_chunks = []
-                merged_phonemes = {
-                    "symbols": [],
-                    "durations_seconds": [],
-                    "start_times_seconds": [],
-                }
-                first_chunk_start_time = None
+            json_chunks = []
+            audio_chunk_count = 0
+            total_bytes = 0
+            merged_phonemes = {
+                "symbols": [],
+                "durations_seconds": [],
+                "start_times_seconds": [],
+            }
+            first_chunk_start_time = None
 
-                lines = response.result.strip().split("\n")
-                print(f"  📊 Total {len(lines)} JSON chunks found")
+            lines = response.result.splitlines()
+            print(f"  📊 Total {len(lines)} JSON chunks found")
 
+            # Decoded audio goes straight to the file; nothing below re-reads it
+            output_file = "test_async_phoneme_stream_speech_output.wav"
+            with open(output_file, "wb", buffering=1 << 20) as out:
                 for i, line in enumerate(lines):
-                    if line.strip():
+                    if line:
                         try:
-                            chunk_data = json.loads(line.strip())
+                            chunk_data = json_loads(line)
                             json_chunks.append(chunk_data)
 
                             if chunk_data.get("audio_base64"):
-                                audio_data = base64.b64decode(
+                                audio_data = decode_audio_base64(
                                     chunk_data["audio_base64"]
                                 )
-                                audio_chunks.append(audio_data)
+                                out.write(audio_data)
+                                audio_chunk_count += 1
+                                total_bytes += len(audio_data)
                                 print(
                                     f"     Chunk {i+1}: {len(audio_data)} bytes audio"
                                 )
@@ -1470,42 +1368,35 @@ async def test_stream_speech_with_phonemes(voice_id):
                             )
                             continue
 
-                if audio_chunks:
-                    total_audio_data = b"".join(audio_chunks)
-                    total_bytes = len(total_audio_data)
+            if audio_chunk_count:
+                print(
+                    f"  ✅ Phoneme streaming complete: {len(json_chunks)} chunks, {total_bytes} bytes"
+                )
+                print(f"  💾 Phoneme streaming audio saved: {output_file}")
 
+                if merged_phonemes["symbols"]:
                     print(
-                        f"  ✅ Phoneme streaming complete: {len(json_chunks)} chunks, {total_bytes} bytes"
+                        f"  🔤 Merged phoneme data: {len(merged_phonemes['symbols'])} symbols"
                     )
 
-                    output_file = "test_async_phoneme_stream_speech_output.wav"
-                    with open(output_file, "wb") as f:
-                        f.write(total_audio_data)
-                    print(f"  💾 Phoneme streaming audio saved: {output_file}")
-
-                    if merged_phonemes["symbols"]:
-                        print(
-                            f"  🔤 Merged phoneme data: {len(merged_phonemes['symbols'])} symbols"
-                        )
-
-                        phoneme_file = "test_async_phoneme_data.json"
-                        with open(phoneme_file, "w") as f:
-                            json.dump(merged_phonemes, f, indent=2)
-                        print(f"  💾 Phoneme data saved: {phoneme_file}")
-
-                    return True, {
-                        "json_chunks": len(json_chunks),
-                        "audio_chunks": len(audio_chunks),
-                        "total_bytes": total_bytes,
-                        "phoneme_data": merged_phonemes,
-                    }
-                else:
-                    print(f"  ⚠️ No audio data")
-                    return False, "No audio data in JSON chunks"
+                    phoneme_file = "test_async_phoneme_data.json"
+                    dump_json(merged_phonemes, phoneme_file)
+                    print(f"  💾 Phoneme data saved: {phoneme_file}")
 
+                return True, {
+                    "json_chunks": len(json_chunks),
+                    "audio_chunks": audio_chunk_count,
+                    "total_bytes": total_bytes,
+                    "phoneme_data": merged_phonemes,
+                }
             else:
-                print(f"  ❌ Unexpected response type")
-                return False, response
+                os.remove(output_file)
+                print(f"  ⚠️ No audio data")
+                return False, "No audio data in JSON chunks"
+
+        else:
+            print(f"  ❌ Unexpected response type")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please recharge")
@@ -1517,15 +1408,13 @@ async def test_stream_speech_with_phonemes(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_predict_duration_with_voice_settings(voice_id):
+async def test_predict_duration_with_voice_settings(client, voice_id):
     """Test duration prediction with voice settings - async"""
     print("🎛️ Duration Prediction with Voice Settings Test (Async)")
 
@@ -1534,34 +1423,31 @@ async def test_predict_duration_with_voice_settings(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Predicting duration with voice settings using voice '{voice_id}' (async)..."
-            )
+        print(
+            f"  🔍 Predicting duration with voice settings using voice '{voice_id}' (async)..."
+        )
 
-            voice_settings = {
-                "pitch_shift": 1.1,
-                "pitch_variance": 0.9,
-                "speed": 1.05,
-            }
+        voice_settings = {
+            "pitch_shift": 1.1,
+            "pitch_variance": 0.9,
+            "speed": 1.05,
+        }
 
-            print(
-                f"     Settings: pitch_shift={voice_settings['pitch_shift']}, speed={voice_settings['speed']}"
-            )
+        print(
+            f"     Settings: pitch_shift={voice_settings['pitch_shift']}, speed={voice_settings['speed']}"
+        )
 
-            response = await client.text_to_speech.predict_duration_async(
-                voice_id=voice_id,
-                text="Hello world! This is a voice settings prediction test.",
-                language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=voice_settings,
-            )
+        response = await client.text_to_speech.predict_duration_async(
+            voice_id=voice_id,
+            text="Hello world! This is a voice settings prediction test.",
+            language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=voice_settings,
+        )
 
-            print(f"  ✅ Voice settings prediction complete: {response} seconds")
-            return True, response
+        print(f"  ✅ Voice settings prediction complete: {response} seconds")
+        return True, response
 
     except errors.NotFoundErrorResponse as e:
         print(f"  ❌ Voice not found: {voice_id}")
@@ -1570,15 +1456,13 @@ async def test_predict_duration_with_voice_settings(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_stream_speech_with_voice_settings(voice_id):
+async def test_stream_speech_with_voice_settings(client, voice_id):
     """Test streaming TTS with voice settings - async"""
     print("🎛️ Streaming TTS with Voice Settings Test (Async)")
 
@@ -1587,80 +1471,80 @@ async def test_stream_speech_with_voice_settings(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔄 Voice settings streaming TTS test with voice '{voice_id}' (async)..."
-            )
-            print("  ⚠️ This test may consume credits!")
+        print(
+            f"  🔄 Voice settings streaming TTS test with voice '{voice_id}' (async)..."
+        )
+        print("  ⚠️ This test may consume credits!")
 
-            voice_settings = {
-                "pitch_shift": 1.2,
-                "pitch_variance": 0.8,
-                "speed": 1.15,
-            }
+        voice_settings = {
+            "pitch_shift": 1.2,
+            "pitch_variance": 0.8,
+            "speed": 1.15,
+        }
 
-            print(
-                f"     Settings: pitch_shift={voice_settings['pitch_shift']}, speed={voice_settings['speed']}"
-            )
+        print(
+            f"     Settings: pitch_shift={voice_settings['pitch_shift']}, speed={voice_settings['speed']}"
+        )
 
-            response = await client.text_to_speech.stream_speech_async(
-                voice_id=voice_id,
-                text="Hello world! This is a voice settings streaming test. The pitch and speed are adjusted.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=voice_settings,
-                include_phonemes=False,
-            )
+        response = await client.text_to_speech.stream_speech_async(
+            voice_id=voice_id,
+            text="Hello world! This is a voice settings streaming test. The pitch and speed are adjusted.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=voice_settings,
+            include_phonemes=False,
+        )
 
-            print("  📡 Receiving voice settings streaming data...")
+        print("  📡 Receiving voice settings streaming data...")
 
-            if hasattr(response, "result") and hasattr(response.result, "aiter_bytes"):
-                chunk_count = 0
-                total_bytes = 0
-                audio_chunks = []
+        if hasattr(response, "result") and hasattr(response.result, "aiter_bytes"):
+            chunk_count = 0
+            total_bytes = 0
+            output_file = "test_async_voice_settings_stream_speech_output.wav"
 
+            # Write chunks as they arrive instead of joining them at the end
+            with open(output_file, "wb", buffering=1 << 20) as f:
+                # Bound once; the loop runs for every received chunk
+                write_chunk = f.write
                 try:
-                    async for chunk in response.result.aiter_bytes():
+                    async for chunk in response.result.aiter_bytes(
+                        chunk_size=STREAM_CHUNK_SIZE
+                    ):
                         chunk_count += 1
                         chunk_size = len(chunk)
                         total_bytes += chunk_size
-                        audio_chunks.append(chunk)
+                        write_chunk(chunk)
 
-                        if chunk_count <= 15:
-                            print(f"     Chunk {chunk_count}: {chunk_size} bytes")
-                        elif chunk_count == 16:
-                            print(f"     ... (more chunks - log truncated)")
+                        if CHUNK_LOG:
+                            if chunk_count <= 15:
+                                print(f"     Chunk {chunk_count}: {chunk_size} bytes")
+                            elif chunk_count == 16:
+                                print(f"     ... (more chunks - log truncated)")
 
                 except Exception as iter_error:
                     print(
                         f"  ⚠️ Voice settings streaming error: {str(iter_error)[:100]}..."
                     )
 
-                print(
-                    f"  ✅ Voice settings streaming complete: {chunk_count} chunks, {total_bytes} bytes"
-                )
-
-                if audio_chunks and total_bytes > 0:
-                    total_audio_data = b"".join(audio_chunks)
+            print(
+                f"  ✅ Voice settings streaming complete: {chunk_count} chunks, {total_bytes} bytes"
+            )
 
-                    output_file = "test_async_voice_settings_stream_speech_output.wav"
-                    with open(output_file, "wb") as f:
-                        f.write(total_audio_data)
-                    print(f"  💾 Voice settings streaming audio saved: {output_file}")
+            if total_bytes > 0:
+                print(f"  💾 Voice settings streaming audio saved: {output_file}")
 
-                    return True, {
-                        "chunk_count": chunk_count,
-                        "total_bytes": total_bytes,
-                    }
-                else:
-                    print(f"  ⚠️ No audio data received")
-                    return False, "No audio data received"
+                return True, {
+                    "chunk_count": chunk_count,
+                    "total_bytes": total_bytes,
+                }
             else:
-                print(f"  ❌ Response missing iter_bytes attribute: {type(response)}")
-                return False, response
+                os.remove(output_file)
+                print(f"  ⚠️ No audio data received")
+                return False, "No audio data received"
+        else:
+            print(f"  ❌ Response missing iter_bytes attribute: {type(response)}")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please recharge")
@@ -1672,15 +1556,13 @@ async def test_stream_speech_with_voice_settings(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_create_speech_mp3(voice_id):
+async def test_create_speech_mp3(client, voice_id):
     """Test MP3 format TTS conversion - async"""
     print("🎤 MP3 Format TTS Test (Async - Consumes Credits)")
 
@@ -1689,52 +1571,44 @@ async def test_create_speech_mp3(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 MP3 TTS conversion with voice '{voice_id}' (async)...")
-            print("  ⚠️ This test consumes credits!")
+        print(f"  🔍 MP3 TTS conversion with voice '{voice_id}' (async)...")
+        print("  ⚠️ This test consumes credits!")
+
+        response = await client.text_to_speech.create_speech_async(
+            voice_id=voice_id,
+            text="안녕하세요! 이것은 MP3 형식 SDK 테스트를 위한 한국어 텍스트입니다. 정상적으로 작동하는지 확인해보겠습니다.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=None,
+        )
 
-            response = await client.text_to_speech.create_speech_async(
-                voice_id=voice_id,
-                text="안녕하세요! 이것은 MP3 형식 SDK 테스트를 위한 한국어 텍스트입니다. 정상적으로 작동하는지 확인해보겠습니다.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=None,
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            audio_size = len(audio_data)
+            print(
+                f"  ✅ MP3 TTS conversion success: {audio_size} bytes audio generated"
             )
 
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                audio_size = len(audio_data)
-                print(
-                    f"  ✅ MP3 TTS conversion success: {audio_size} bytes audio generated"
-                )
-
-                output_file = "test_async_create_speech_output.mp3"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 MP3 audio file saved: {output_file}")
-
-                file_size = os.path.getsize(output_file)
-                print(f"  📏 Saved file size: {file_size} bytes")
-
-                with open(output_file, "rb") as f:
-                    header = f.read(10)
-                    if header[:3] == b"ID3":
-                        print(f"  ✅ Valid MP3 file generated (ID3 tag)")
-                    elif header[:2] == b"\xff\xfb" or header[:2] == b"\xff\xfa":
-                        print(f"  ✅ Valid MP3 file generated (MPEG frame)")
-                    else:
-                        print(
-                            f"  📄 MP3 header: {header[:10].hex()} (needs verification)"
-                        )
-
-                return True, response
+            output_file = "test_async_create_speech_output.mp3"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 MP3 audio file saved: {output_file}")
+            print(f"  📏 Saved file size: {audio_size} bytes")
+
+            header = audio_data[:10]
+            if header.startswith(b"ID3"):
+                print(f"  ✅ Valid MP3 file generated (ID3 tag)")
+            elif header.startswith((b"\xff\xfb", b"\xff\xfa")):
+                print(f"  ✅ Valid MP3 file generated (MPEG frame)")
             else:
-                print(f"  ❌ Response structure verification needed: {type(response)}")
-                return False, response
+                print(f"  📄 MP3 header: {header[:10].hex()} (needs verification)")
+
+            return True, response
+        else:
+            print(f"  ❌ Response structure verification needed: {type(response)}")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please recharge")
@@ -1746,15 +1620,13 @@ async def test_create_speech_mp3(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_create_speech_long_text_mp3(voice_id):
+async def test_create_speech_long_text_mp3(client, voice_id):
     """Test MP3 auto-chunking for long text (300+ chars) - async"""
     print("📜 Long Text MP3 Auto-Chunking TTS Test (Async - 300+ chars)")
 
@@ -1763,8 +1635,6 @@ async def test_create_speech_long_text_mp3(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         long_text = """
         안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 MP3 자동 청킹 TTS 테스트입니다.
         새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 처리합니다.
@@ -1779,49 +1649,44 @@ async def test_create_speech_long_text_mp3(voice_id):
         print(f"  📏 Test text length: {actual_length} characters (exceeds 300)")
         print(f"  🔧 Auto-chunking enabled for MP3 format")
 
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Long text MP3 conversion with voice '{voice_id}' (async)...")
-            print("  ⚠️ This test consumes credits!")
-            print("  ✨ SDK automatically chunks text and processes as MP3")
+        print(f"  🔍 Long text MP3 conversion with voice '{voice_id}' (async)...")
+        print("  ⚠️ This test consumes credits!")
+        print("  ✨ SDK automatically chunks text and processes as MP3")
+
+        response = await client.text_to_speech.create_speech_async(
+            voice_id=voice_id,
+            text=long_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,
+            style="neutral",
+            model="sona_speech_1",
+            voice_settings=None,
+        )
 
-            response = await client.text_to_speech.create_speech_async(
-                voice_id=voice_id,
-                text=long_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,
-                style="neutral",
-                model="sona_speech_1",
-                voice_settings=None,
-            )
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            audio_size = len(audio_data)
+            print(f"  ✅ MP3 auto-chunking success: {audio_size} bytes audio generated")
+            print(f"  🎯 Long text successfully chunked and processed as MP3!")
 
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                audio_size = len(audio_data)
-                print(
-                    f"  ✅ MP3 auto-chunking success: {audio_size} bytes audio generated"
-                )
-                print(f"  🎯 Long text successfully chunked and processed as MP3!")
+            output_file = "test_async_auto_chunking_speech_output.mp3"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 MP3 auto-chunked audio file saved: {output_file}")
 
-                output_file = "test_async_auto_chunking_speech_output.mp3"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 MP3 auto-chunked audio file saved: {output_file}")
+            estimated_chunks = (actual_length + 299) // 300
+            print(f"  📊 Estimated chunks: {estimated_chunks} (based on text length)")
+            print(f"  🔀 Parallel processing applied and merged as MP3")
 
-                estimated_chunks = (actual_length + 299) // 300
-                print(
-                    f"  📊 Estimated chunks: {estimated_chunks} (based on text length)"
-                )
-                print(f"  🔀 Parallel processing applied and merged as MP3")
-
-                return True, {
-                    "audio_size": audio_size,
-                    "text_length": actual_length,
-                    "estimated_chunks": estimated_chunks,
-                    "format": "mp3",
-                }
-            else:
-                print(f"  ❌ Response structure verification needed: {type(response)}")
-                return False, response
+            return True, {
+                "audio_size": audio_size,
+                "text_length": actual_length,
+                "estimated_chunks": estimated_chunks,
+                "format": "mp3",
+            }
+        else:
+            print(f"  ❌ Response structure verification needed: {type(response)}")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please recharge")
@@ -1830,8 +1695,7 @@ async def test_create_speech_long_text_mp3(voice_id):
         print(f"  ❌ Voice not found: {voice_id}")
         return False, e
     except RuntimeError as e:
-        error_message = str(e).lower()
-        if "chunk" in error_message or "merge" in error_message:
+        if _CHUNK_ERR_RE.search(str(e)):
             print(f"  ❌ MP3 auto-chunking processing error: {e}")
             return False, e
         else:
@@ -1841,15 +1705,13 @@ async def test_create_speech_long_text_mp3(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_stream_speech_mp3(voice_id):
+async def test_stream_speech_mp3(client, voice_id):
     """Test MP3 streaming TTS - async"""
     print("🎵 MP3 Streaming TTS Test (Async)")
 
@@ -1858,64 +1720,73 @@ async def test_stream_speech_mp3(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔄 MP3 streaming TTS test with voice '{voice_id}' (async)...")
-            print("  ⚠️ This test may consume credits!")
-
-            response = await client.text_to_speech.stream_speech_async(
-                voice_id=voice_id,
-                text="안녕하세요! 이것은 MP3 스트리밍 TTS 테스트를 위한 한국어 텍스트입니다. 스트리밍 기능이 MP3 형식으로도 정상적으로 작동하는지 확인하고 있습니다.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,
-                style="neutral",
-                model="sona_speech_1",
-            )
+        print(f"  🔄 MP3 streaming TTS test with voice '{voice_id}' (async)...")
+        print("  ⚠️ This test may consume credits!")
+
+        response = await client.text_to_speech.stream_speech_async(
+            voice_id=voice_id,
+            text="안녕하세요! 이것은 MP3 스트리밍 TTS 테스트를 위한 한국어 텍스트입니다. 스트리밍 기능이 MP3 형식으로도 정상적으로 작동하는지 확인하고 있습니다.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,
+            style="neutral",
+            model="sona_speech_1",
+        )
 
-            print("  📡 Receiving MP3 streaming data...")
+        print("  📡 Receiving MP3 streaming data...")
 
-            if hasattr(response, "result") and hasattr(response.result, "aiter_bytes"):
-                chunk_count = 0
-                total_bytes = 0
-                audio_chunks = []
+        if hasattr(response, "result") and hasattr(response.result, "aiter_bytes"):
+            chunk_count = 0
+            total_bytes = 0
+            output_file = "test_async_stream_speech_output.mp3"
+            log_lines = []  # Printed once after the loop
 
+            # Write chunks as they arrive instead of joining them at the end
+            with open(output_file, "wb", buffering=1 << 20) as f:
+                # Bound once; the loop runs for every received chunk
+                write_chunk = f.write
                 try:
-                    async for chunk in response.result.aiter_bytes():
+                    async for chunk in response.result.aiter_bytes(
+                        chunk_size=STREAM_CHUNK_SIZE
+                    ):
                         chunk_count += 1
                         chunk_size = len(chunk)
                         total_bytes += chunk_size
-                        audio_chunks.append(chunk)
+                        write_chunk(chunk)
 
-                        if chunk_count <= 20:
-                            print(f"     Chunk {chunk_count}: {chunk_size} bytes")
-                        elif chunk_count == 21:
-                            print(f"     ... (more chunks - log truncated)")
+                        if CHUNK_LOG:
+                            if chunk_count <= 20:
+                                log_lines.append(
+                                    f"     Chunk {chunk_count}: {chunk_size} bytes"
+                                )
+                            elif chunk_count == 21:
+                                log_lines.append(
+                                    f"     ... (more chunks - log truncated)"
+                                )
 
                 except Exception as iter_error:
-                    print(f"  ⚠️ MP3 streaming error: {str(iter_error)[:100]}...")
+                    log_lines.append(
+                        f"  ⚠️ MP3 streaming error: {str(iter_error)[:100]}..."
+                    )
 
-                print(
-                    f"  ✅ MP3 streaming complete: {chunk_count} chunks, {total_bytes} bytes"
-                )
+            if log_lines:
+                print("\n".join(log_lines))
 
-                if audio_chunks and total_bytes > 0:
-                    output_file = "test_async_stream_speech_output.mp3"
-                    with open(output_file, "wb") as f:
-                        for chunk in audio_chunks:
-                            f.write(chunk)
-                    print(f"  💾 MP3 streaming audio saved: {output_file}")
+            print(
+                f"  ✅ MP3 streaming complete: {chunk_count} chunks, {total_bytes} bytes"
+            )
 
-                    file_size = os.path.getsize(output_file)
-                    print(f"  📏 Saved file size: {file_size} bytes")
+            if total_bytes > 0:
+                print(f"  💾 MP3 streaming audio saved: {output_file}")
+                print(f"  📏 Saved file size: {total_bytes} bytes")
 
-                    return True, f"{chunk_count} chunks, {total_bytes} bytes"
-                else:
-                    print(f"  ⚠️ No audio data received")
-                    return False, "No audio data received"
+                return True, f"{chunk_count} chunks, {total_bytes} bytes"
             else:
-                print(f"  ❌ Response missing iter_bytes attribute: {type(response)}")
-                return False, response
+                os.remove(output_file)
+                print(f"  ⚠️ No audio data received")
+                return False, "No audio data received"
+        else:
+            print(f"  ❌ Response missing iter_bytes attribute: {type(response)}")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please recharge")
@@ -1927,15 +1798,13 @@ async def test_stream_speech_mp3(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_stream_speech_long_text_mp3(voice_id):
+async def test_stream_speech_long_text_mp3(client, voice_id):
     """Test MP3 streaming for long text (300+ chars) - async"""
     print("📜 Long Text MP3 Streaming TTS Test (Async - 300+ chars)")
 
@@ -1944,9 +1813,6 @@ async def test_stream_speech_long_text_mp3(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-        import base64
-
         long_text = """
         안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 MP3 스트리밍 TTS 테스트입니다.
         새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 스트리밍으로 처리합니다.
@@ -1962,158 +1828,176 @@ async def test_stream_speech_long_text_mp3(voice_id):
         print(f"  📏 Test text length: {actual_length} characters (exceeds 300)")
         print(f"  🔧 Auto-chunking + MP3 streaming enabled")
 
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Long text MP3 streaming with voice '{voice_id}' (async)...")
-            print("  ⚠️ This test consumes credits and applies auto-chunking!")
+        print(f"  🔍 Long text MP3 streaming with voice '{voice_id}' (async)...")
+        print("  ⚠️ This test consumes credits and applies auto-chunking!")
 
-            response = await client.text_to_speech.stream_speech_async(
-                voice_id=voice_id,
-                text=long_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,
-                style="neutral",
-                model="sona_speech_1",
-            )
-
-            print(f"  🔍 Response type: {type(response)}")
-            print(f"  🔍 Result type: {type(response.result)}")
+        response = await client.text_to_speech.stream_speech_async(
+            voice_id=voice_id,
+            text=long_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.MP3,
+            style="neutral",
+            model="sona_speech_1",
+        )
 
-            # Handle real-time streaming response (AsyncExtendedStreamingWrapper)
-            if (
-                hasattr(response, "result")
-                and hasattr(response.result, "aiter_bytes")
-                and not isinstance(response.result, str)
-            ):
-                print("  ✅ Real-time streaming response detected (auto-chunked)")
-                chunk_count = 0
-                total_bytes = 0
-                audio_chunks = []
+        print(f"  🔍 Response type: {type(response)}")
+        print(f"  🔍 Result type: {type(response.result)}")
+
+        # Handle real-time streaming response (AsyncExtendedStreamingWrapper)
+        if (
+            hasattr(response, "result")
+            and hasattr(response.result, "aiter_bytes")
+            and not isinstance(response.result, str)
+        ):
+            print("  ✅ Real-time streaming response detected (auto-chunked)")
+            chunk_count = 0
+            total_bytes = 0
+            output_file = "test_async_stream_speech_long_output.mp3"
+            log_lines = []  # Printed once after the loop
 
+            # Write chunks as they arrive instead of joining them at the end
+            with open(output_file, "wb", buffering=1 << 20) as f:
+                # Bound once; the loop runs for every received chunk
+                write_chunk = f.write
                 try:
-                    async for chunk in response.result.aiter_bytes():
+                    async for chunk in response.result.aiter_bytes(
+                        chunk_size=STREAM_CHUNK_SIZE
+                    ):
                         chunk_count += 1
                         chunk_size = len(chunk)
                         total_bytes += chunk_size
-                        audio_chunks.append(chunk)
+                        write_chunk(chunk)
 
-                        if chunk_count <= 20:
-                            print(f"     Chunk {chunk_count}: {chunk_size} bytes")
-                        elif chunk_count == 21:
-                            print(f"     ... (more chunks - log truncated)")
+                        if CHUNK_LOG:
+                            if chunk_count <= 20:
+                                log_lines.append(
+                                    f"     Chunk {chunk_count}: {chunk_size} bytes"
+                                )
+                            elif chunk_count == 21:
+                                log_lines.append(
+                                    f"     ... (more chunks - log truncated)"
+                                )
 
                 except Exception as iter_error:
-                    print(
+                    log_lines.append(
                         f"  ⚠️ Long text MP3 streaming error: {str(iter_error)[:100]}..."
                     )
 
+            if log_lines:
+                print("\n".join(log_lines))
+
+            print(
+                f"  ✅ Long text MP3 streaming complete: {chunk_count} chunks, {total_bytes} bytes"
+            )
+
+            if total_bytes > 0:
+                print(f"  💾 Long text MP3 streaming audio saved: {output_file}")
+                print(f"  📏 Saved file size: {total_bytes} bytes")
+
+                estimated_chunks = (actual_length + 299) // 300
                 print(
-                    f"  ✅ Long text MP3 streaming complete: {chunk_count} chunks, {total_bytes} bytes"
+                    f"  📊 Estimated text chunks: {estimated_chunks} (based on text length)"
                 )
 
-                if audio_chunks and total_bytes > 0:
-                    audio_data = b"".join(audio_chunks)
+                return True, {
+                    "chunk_count": chunk_count,
+                    "total_bytes": total_bytes,
+                    "text_length": actual_length,
+                    "estimated_chunks": estimated_chunks,
+                    "format": "mp3",
+                }
+            os.remove(output_file)
+
+        # Handle JSON format response (old merged format)
+        elif hasattr(response, "result") and isinstance(response.result, str):
+            try:
+                result_data = json_loads(response.result)
+                print(f"  ✅ Chunked JSON response detected")
+
+                if "audio_base64" in result_data:
+                    audio_data = decode_audio_base64(result_data["audio_base64"])
+                    total_bytes = len(audio_data)
+
+                    print(f"  ✅ Merged MP3 audio data: {total_bytes} bytes")
 
                     output_file = "test_async_stream_speech_long_output.mp3"
                     with open(output_file, "wb") as f:
                         f.write(audio_data)
                     print(f"  💾 Long text MP3 streaming audio saved: {output_file}")
-                    print(f"  📏 Saved file size: {total_bytes} bytes")
 
                     estimated_chunks = (actual_length + 299) // 300
                     print(
-                        f"  📊 Estimated text chunks: {estimated_chunks} (based on text length)"
+                        f"  📊 Estimated chunks: {estimated_chunks} (based on text length)"
                     )
+                    print(f"  🔀 Auto-chunked segments merged as MP3")
 
                     return True, {
-                        "chunk_count": chunk_count,
                         "total_bytes": total_bytes,
                         "text_length": actual_length,
                         "estimated_chunks": estimated_chunks,
                         "format": "mp3",
                     }
+                else:
+                    print(f"  ❌ audio_base64 key missing")
+                    return False, result_data
 
-            # Handle JSON format response (old merged format)
-            elif hasattr(response, "result") and isinstance(response.result, str):
-                try:
-                    result_data = json.loads(response.result)
-                    print(f"  ✅ Chunked JSON response detected")
-
-                    if "audio_base64" in result_data:
-                        audio_data = base64.b64decode(result_data["audio_base64"])
-                        total_bytes = len(audio_data)
-
-                        print(f"  ✅ Merged MP3 audio data: {total_bytes} bytes")
-
-                        output_file = "test_async_stream_speech_long_output.mp3"
-                        with open(output_file, "wb") as f:
-                            f.write(audio_data)
-                        print(
-                            f"  💾 Long text MP3 streaming audio saved: {output_file}"
-                        )
-
-                        estimated_chunks = (actual_length + 299) // 300
-                        print(
-                            f"  📊 Estimated chunks: {estimated_chunks} (based on text length)"
-                        )
-                        print(f"  🔀 Auto-chunked segments merged as MP3")
-
-                        return True, {
-                            "total_bytes": total_bytes,
-                            "text_length": actual_length,
-                            "estimated_chunks": estimated_chunks,
-                            "format": "mp3",
-                        }
-                    else:
-                        print(f"  ❌ audio_base64 key missing")
-                        return False, result_data
-
-                except json.JSONDecodeError as e:
-                    print(f"  ❌ JSON parsing failed: {e}")
-                    return False, e
+            except json.JSONDecodeError as e:
+                print(f"  ❌ JSON parsing failed: {e}")
+                return False, e
 
-            # Handle existing streaming response
-            elif hasattr(response, "result") and hasattr(
-                response.result, "aiter_bytes"
-            ):
-                chunk_count = 0
-                total_bytes = 0
-                audio_chunks = []
+        # Handle existing streaming response
+        elif hasattr(response, "result") and hasattr(response.result, "aiter_bytes"):
+            chunk_count = 0
+            total_bytes = 0
+            output_file = "test_async_stream_speech_long_output.mp3"
+            log_lines = []  # Printed once after the loop
 
+            # Write chunks as they arrive instead of joining them at the end
+            with open(output_file, "wb", buffering=1 << 20) as f:
+                # Bound once; the loop runs for every received chunk
+                write_chunk = f.write
                 try:
-                    async for chunk in response.result.aiter_bytes():
+                    async for chunk in response.result.aiter_bytes(
+                        chunk_size=STREAM_CHUNK_SIZE
+                    ):
                         chunk_count += 1
                         chunk_size = len(chunk)
                         total_bytes += chunk_size
-                        audio_chunks.append(chunk)
+                        write_chunk(chunk)
 
-                        if chunk_count <= 10:
-                            print(f"     Chunk {chunk_count}: {chunk_size} bytes")
+                        if CHUNK_LOG:
+                            if chunk_count <= 10:
+                                log_lines.append(
+                                    f"     Chunk {chunk_count}: {chunk_size} bytes"
+                                )
 
                 except Exception as iter_error:
-                    print(f"  ⚠️ MP3 streaming error: {str(iter_error)[:100]}...")
+                    log_lines.append(
+                        f"  ⚠️ MP3 streaming error: {str(iter_error)[:100]}..."
+                    )
 
-                print(
-                    f"  ✅ MP3 long text streaming success: {chunk_count} chunks, {total_bytes} bytes"
-                )
+            if log_lines:
+                print("\n".join(log_lines))
 
-                if audio_chunks and total_bytes > 0:
-                    output_file = "test_async_stream_speech_long_output.mp3"
-                    with open(output_file, "wb") as f:
-                        for chunk in audio_chunks:
-                            f.write(chunk)
-                    print(f"  💾 Long text MP3 streaming audio saved: {output_file}")
+            print(
+                f"  ✅ MP3 long text streaming success: {chunk_count} chunks, {total_bytes} bytes"
+            )
 
-                    return True, {
-                        "chunk_count": chunk_count,
-                        "total_bytes": total_bytes,
-                        "format": "mp3",
-                    }
-                else:
-                    print(f"  ⚠️ No audio data received")
-                    return False, None
+            if total_bytes > 0:
+                print(f"  💾 Long text MP3 streaming audio saved: {output_file}")
+
+                return True, {
+                    "chunk_count": chunk_count,
+                    "total_bytes": total_bytes,
+                    "format": "mp3",
+                }
             else:
-                print(f"  ❌ Response structure verification needed")
-                return False, response
+                os.remove(output_file)
+                print(f"  ⚠️ No audio data received")
+                return False, None
+        else:
+            print(f"  ❌ Response structure verification needed")
+            return False, response
 
     except errors.PaymentRequiredErrorResponse as e:
         print(f"  ❌ Insufficient credits: Please recharge")
@@ -2125,15 +2009,13 @@ async def test_stream_speech_long_text_mp3(voice_id):
         print(f"  ❌ API error: {e.message}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_create_speech_long_text_with_phonemes(voice_id):
+async def test_create_speech_long_text_with_phonemes(client, voice_id):
     """Test long text auto-chunking with phoneme information - async"""
     print("📜🔤 Long Text Auto-Chunking + Phoneme TTS Test (Async - 300+ chars)")
 
@@ -2142,9 +2024,6 @@ async def test_create_speech_long_text_with_phonemes(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-        import base64
-
         long_text = """
         안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 자동 청킹과 Phoneme 정보를 동시에 테스트합니다.
         새로 구현된 SDK는 긴 텍스트를 자동으로 여러 개의 청크로 나누어 처리하고 각 청크의 Phoneme 정보를 병합합니다.
@@ -2153,100 +2032,85 @@ async def test_create_speech_long_text_with_phonemes(voice_id):
         자동 청킹 기능과 Phoneme 병합을 통해 긴 텍스트도 자연스럽게 음성으로 변환할 수 있습니다.
         """.strip()
 
-        async with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Long text chunking + phoneme TTS with voice '{voice_id}' (async)..."
-            )
-            print(f"  📝 Text length: {len(long_text)} characters")
-            print("  ⚠️ This test consumes credits!")
+        print(
+            f"  🔍 Long text chunking + phoneme TTS with voice '{voice_id}' (async)..."
+        )
+        print(f"  📝 Text length: {len(long_text)} characters")
+        print("  ⚠️ This test consumes credits!")
+
+        response = await client.text_to_speech.create_speech_async(
+            voice_id=voice_id,
+            text=long_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            include_phonemes=True,
+        )
 
-            response = await client.text_to_speech.create_speech_async(
-                voice_id=voice_id,
-                text=long_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                include_phonemes=True,
-            )
+        print(f"  🔍 Response type: {type(response)}")
 
-            print(f"  🔍 Response type: {type(response)}")
+        if hasattr(response, "result"):
+            print(f"  🔍 Result type: {type(response.result)}")
 
-            if hasattr(response, "result"):
-                print(f"  🔍 Result type: {type(response.result)}")
+            if (
+                hasattr(response.result, "audio_base64")
+                and response.result.audio_base64
+            ):
+                print("  ✅ Base64 audio data received")
+                print(
+                    f"  📊 Audio data size: {len(response.result.audio_base64)} characters"
+                )
 
-                if (
-                    hasattr(response.result, "audio_base64")
-                    and response.result.audio_base64
-                ):
-                    print("  ✅ Base64 audio data received")
-                    print(
-                        f"  📊 Audio data size: {len(response.result.audio_base64)} characters"
-                    )
+                if hasattr(response.result, "phonemes") and response.result.phonemes:
+                    phonemes = response.result.phonemes
+                    symbols = phonemes.symbols
+                    durations = phonemes.durations_seconds
+                    start_times = getattr(phonemes, "start_times_seconds", None)
+                    print("\n  🔤 ===== Phoneme Information Analysis =====")
+                    print(f"  📊 Phoneme symbols: {len(symbols) if symbols else 0}")
+                    print(f"  ⏱️ Durations: {len(durations) if durations else 0}")
 
-                    if (
-                        hasattr(response.result, "phonemes")
-                        and response.result.phonemes
-                    ):
-                        phonemes = response.result.phonemes
-                        print("\n  🔤 ===== Phoneme Information Analysis =====")
-                        print(
-                            f"  📊 Phoneme symbols: {len(phonemes.symbols) if phonemes.symbols else 0}"
+                    if start_times:
+                        print(f"  🚀 Start times: {len(start_times)}")
+
+                    if symbols and durations:
+                        total_duration = sum(durations)
+                        print(f"  ⏱️ Total duration: {total_duration:.3f}s")
+
+                        phoneme_data = {
+                            "text": long_text,
+                            "text_length": len(long_text),
+                            "audio_format": "wav",
+                            "phonemes": {
+                                "symbols": symbols,
+                                "durations_seconds": durations,
+                                "start_times_seconds": start_times,
+                                "total_symbols": len(symbols),
+                                "total_duration": total_duration,
+                            },
+                        }
+
+                        dump_json(
+                            phoneme_data, "test_async_long_chunking_phoneme_data.json"
                         )
                         print(
-                            f"  ⏱️ Durations: {len(phonemes.durations_seconds) if phonemes.durations_seconds else 0}"
+                            f"\n  💾 Phoneme data saved: test_async_long_chunking_phoneme_data.json"
                         )
+                else:
+                    print("  ⚠️ No phoneme information")
 
-                        if (
-                            hasattr(phonemes, "start_times_seconds")
-                            and phonemes.start_times_seconds
-                        ):
-                            print(
-                                f"  🚀 Start times: {len(phonemes.start_times_seconds)}"
-                            )
-
-                        if phonemes.symbols and phonemes.durations_seconds:
-                            total_duration = sum(phonemes.durations_seconds)
-                            print(f"  ⏱️ Total duration: {total_duration:.3f}s")
-
-                            phoneme_data = {
-                                "text": long_text,
-                                "text_length": len(long_text),
-                                "audio_format": "wav",
-                                "phonemes": {
-                                    "symbols": phonemes.symbols,
-                                    "durations_seconds": phonemes.durations_seconds,
-                                    "start_times_seconds": getattr(
-                                        phonemes, "start_times_seconds", None
-                                    ),
-                                    "total_symbols": len(phonemes.symbols),
-                                    "total_duration": total_duration,
-                                },
-                            }
-
-                            with open(
-                                "test_async_long_chunking_phoneme_data.json",
-                                "w",
-                                encoding="utf-8",
-                            ) as f:
-                                json.dump(phoneme_data, f, ensure_ascii=False, indent=2)
-                            print(
-                                f"\n  💾 Phoneme data saved: test_async_long_chunking_phoneme_data.json"
-                            )
-                    else:
-                        print("  ⚠️ No phoneme information")
-
-                    audio_data = base64.b64decode(response.result.audio_base64)
-                    filename = "test_async_long_chunking_phoneme_output.wav"
-                    with open(filename, "wb") as f:
-                        f.write(audio_data)
-                    print(f"  💾 Audio file saved: {filename}")
+                audio_data = decode_audio_base64(response.result.audio_base64)
+                filename = "test_async_long_chunking_phoneme_output.wav"
+                with open(filename, "wb") as f:
+                    f.write(audio_data)
+                print(f"  💾 Audio file saved: {filename}")
 
-                    return True, response
-                else:
-                    print("  ❌ No audio data")
-                    return False, None
+                return True, response
             else:
-                print("  ❌ No result in response")
+                print("  ❌ No audio data")
                 return False, None
+        else:
+            print("  ❌ No result in response")
+            return False, None
 
     except errors.SupertoneDefaultError as e:
         print(f"  ❌ API error: {e}")
@@ -2256,7 +2120,7 @@ async def test_create_speech_long_text_with_phonemes(voice_id):
         return False, None
 
 
-async def test_stream_speech_phoneme_chunking_wav(voice_id):
+async def test_stream_speech_phoneme_chunking_wav(client, voice_id):
     """Test long text + phoneme + streaming (WAV) - async"""
     print("🎵🔤📜 Long Text + Phoneme + Streaming Test (WAV - Async)")
 
@@ -2265,9 +2129,6 @@ async def test_stream_speech_phoneme_chunking_wav(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-        import base64
-
         long_text = """
         안녕하세요! 이것은 300자를 초과하는 매우 긴 텍스트를 사용한 Phoneme + 스트리밍 테스트입니다.
         현재 SDK는 긴 텍스트를 자동으로 청킹하며, Phoneme + 스트리밍 조합도 지원합니다.
@@ -2276,142 +2137,131 @@ async def test_stream_speech_phoneme_chunking_wav(voice_id):
         자동 청킹과 Phoneme 병합 기능을 통해 긴 텍스트도 자연스럽게 음성으로 변환하고 정확한 발음 정보를 제공할 수 있습니다.
         """.strip()
 
-        async with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Long text phoneme + streaming test with voice '{voice_id}' (async)..."
-            )
-            print(f"  📝 Text length: {len(long_text)} characters (exceeds 300)")
-            print("  ⚠️ This test consumes credits!")
-
-            response = await client.text_to_speech.stream_speech_async(
-                voice_id=voice_id,
-                text=long_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                include_phonemes=True,
-            )
+        print(
+            f"  🔍 Long text phoneme + streaming test with voice '{voice_id}' (async)..."
+        )
+        print(f"  📝 Text length: {len(long_text)} characters (exceeds 300)")
+        print("  ⚠️ This test consumes credits!")
+
+        response = await client.text_to_speech.stream_speech_async(
+            voice_id=voice_id,
+            text=long_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            include_phonemes=True,
+        )
 
-            print(f"  🔍 Response type: {type(response)}")
+        print(f"  🔍 Response type: {type(response)}")
 
-            if hasattr(response, "result"):
-                print(f"  🔍 Result type: {type(response.result)}")
+        if hasattr(response, "result"):
+            print(f"  🔍 Result type: {type(response.result)}")
 
-                # Handle streaming response (AsyncExtendedStreamingWrapper)
-                if hasattr(response.result, "aiter_bytes") and not isinstance(
-                    response.result, str
-                ):
-                    print("  ✅ Real-time streaming response detected")
-                    audio_chunks = []
-                    chunk_count = 0
+            # Handle streaming response (AsyncExtendedStreamingWrapper)
+            if hasattr(response.result, "aiter_bytes") and not isinstance(
+                response.result, str
+            ):
+                print("  ✅ Real-time streaming response detected")
+                audio_data = bytearray()
+                chunk_count = 0
 
-                    try:
-                        async for chunk in response.result.aiter_bytes():
-                            chunk_count += 1
-                            audio_chunks.append(chunk)
+                try:
+                    async for chunk in response.result.aiter_bytes(
+                        chunk_size=STREAM_CHUNK_SIZE
+                    ):
+                        chunk_count += 1
+                        audio_data.extend(chunk)
+                        if CHUNK_LOG:
                             if chunk_count <= 10:
                                 print(f"     Chunk {chunk_count}: {len(chunk)} bytes")
-                    except Exception as stream_error:
-                        print(f"  ⚠️ Streaming error: {type(stream_error).__name__}")
-                        import traceback
+                except Exception as stream_error:
+                    print(f"  ⚠️ Streaming error: {type(stream_error).__name__}")
+
+                    traceback.print_exc()
 
-                        traceback.print_exc()
+                if audio_data:
+                    total_bytes = len(audio_data)
 
-                    if audio_chunks:
-                        audio_data = b"".join(audio_chunks)
+                    print(
+                        f"  ✅ Streaming complete: {chunk_count} chunks, {total_bytes} bytes"
+                    )
+
+                    output_file = "test_async_phoneme_chunking_stream_output.wav"
+                    with open(output_file, "wb") as f:
+                        f.write(audio_data)
+                    print(f"  💾 Streaming audio saved: {output_file}")
+
+                    return True, {
+                        "total_bytes": total_bytes,
+                        "chunk_count": chunk_count,
+                        "text_length": len(long_text),
+                        "format": "wav",
+                    }
+
+            # Handle merged JSON response (old format)
+            elif isinstance(response.result, str):
+                try:
+                    result_data = json_loads(response.result)
+                    print(f"  ✅ Chunked merged JSON response detected")
+
+                    if "audio_base64" in result_data:
+                        audio_data = decode_audio_base64(result_data["audio_base64"])
                         total_bytes = len(audio_data)
 
                         print(
-                            f"  ✅ Streaming complete: {chunk_count} chunks, {total_bytes} bytes"
+                            f"  ✅ Merged WAV + Phoneme audio data: {total_bytes} bytes"
                         )
 
                         output_file = "test_async_phoneme_chunking_stream_output.wav"
                         with open(output_file, "wb") as f:
                             f.write(audio_data)
-                        print(f"  💾 Streaming audio saved: {output_file}")
-
-                        return True, {
-                            "total_bytes": total_bytes,
-                            "chunk_count": chunk_count,
-                            "text_length": len(long_text),
-                            "format": "wav",
-                        }
+                        print(
+                            f"  💾 Phoneme + chunking streaming audio saved: {output_file}"
+                        )
 
-                # Handle merged JSON response (old format)
-                elif isinstance(response.result, str):
-                    try:
-                        result_data = json.loads(response.result)
-                        print(f"  ✅ Chunked merged JSON response detected")
+                        if "phonemes" in result_data and result_data["phonemes"]:
+                            phonemes = result_data["phonemes"]
+                            print(f"\n  🔤 ===== Merged Phoneme Information =====")
+                            print(f"    - Symbols: {len(phonemes.get('symbols', []))}")
 
-                        if "audio_base64" in result_data:
-                            audio_data = base64.b64decode(result_data["audio_base64"])
-                            total_bytes = len(audio_data)
+                            if phonemes.get("durations_seconds"):
+                                durations = phonemes["durations_seconds"]
+                                print(f"    - Durations: {len(durations)} items")
+                                print(f"    - Total duration: {sum(durations):.3f}s")
 
-                            print(
-                                f"  ✅ Merged WAV + Phoneme audio data: {total_bytes} bytes"
-                            )
+                            if phonemes.get("start_times_seconds"):
+                                start_times = phonemes["start_times_seconds"]
+                                print(f"    - Start times: {len(start_times)} items")
 
-                            output_file = (
-                                "test_async_phoneme_chunking_stream_output.wav"
-                            )
-                            with open(output_file, "wb") as f:
-                                f.write(audio_data)
-                            print(
-                                f"  💾 Phoneme + chunking streaming audio saved: {output_file}"
+                            phoneme_file = (
+                                "test_async_phoneme_chunking_stream_data.json"
                             )
-
-                            if "phonemes" in result_data and result_data["phonemes"]:
-                                phonemes = result_data["phonemes"]
-                                print(f"\n  🔤 ===== Merged Phoneme Information =====")
-                                print(
-                                    f"    - Symbols: {len(phonemes.get('symbols', []))}"
-                                )
-
-                                if phonemes.get("durations_seconds"):
-                                    durations = phonemes["durations_seconds"]
-                                    print(f"    - Durations: {len(durations)} items")
-                                    print(
-                                        f"    - Total duration: {sum(durations):.3f}s"
-                                    )
-
-                                if phonemes.get("start_times_seconds"):
-                                    start_times = phonemes["start_times_seconds"]
-                                    print(
-                                        f"    - Start times: {len(start_times)} items"
-                                    )
-
-                                phoneme_file = (
-                                    "test_async_phoneme_chunking_stream_data.json"
-                                )
-                                with open(phoneme_file, "w", encoding="utf-8") as f:
-                                    json.dump(phonemes, f, ensure_ascii=False, indent=2)
-                                print(f"  💾 Phoneme data saved: {phoneme_file}")
-                            else:
-                                print(f"  ⚠️ No phoneme information")
-
-                            return True, {
-                                "total_bytes": total_bytes,
-                                "text_length": len(long_text),
-                                "format": "wav",
-                                "has_phonemes": "phonemes" in result_data
-                                and result_data["phonemes"] is not None,
-                            }
+                            dump_json(phonemes, phoneme_file)
+                            print(f"  💾 Phoneme data saved: {phoneme_file}")
                         else:
-                            print(f"  ❌ audio_base64 key missing")
-                            return False, result_data
+                            print(f"  ⚠️ No phoneme information")
 
-                    except json.JSONDecodeError:
-                        print(f"  ❌ JSON parsing failed")
-                        return False, None
+                        return True, {
+                            "total_bytes": total_bytes,
+                            "text_length": len(long_text),
+                            "format": "wav",
+                            "has_phonemes": "phonemes" in result_data
+                            and result_data["phonemes"] is not None,
+                        }
+                    else:
+                        print(f"  ❌ audio_base64 key missing")
+                        return False, result_data
 
-                print("  ⚠️ Unexpected response structure")
-                return False, None
+                except json.JSONDecodeError:
+                    print(f"  ❌ JSON parsing failed")
+                    return False, None
+
+            print("  ⚠️ Unexpected response structure")
+            return False, None
 
     except errors.SupertoneDefaultError as e:
         print(f"  ❌ API error: {e}")
         return False, e
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
@@ -2423,7 +2273,7 @@ async def test_stream_speech_phoneme_chunking_wav(voice_id):
 # =============================================================================
 
 
-async def test_create_speech_sona_speech_2(voice_id):
+async def test_create_speech_sona_speech_2(client, voice_id):
     """Test TTS with sona_speech_2 model (Async)"""
     print("🎤 TTS Test with sona_speech_2 Model (Async)")
 
@@ -2432,35 +2282,32 @@ async def test_create_speech_sona_speech_2(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Converting TTS with sona_speech_2 using voice '{voice_id}'...")
-            print("  ⚠️ This test will consume credits!")
-
-            response = await client.text_to_speech.create_speech_async(
-                voice_id=voice_id,
-                text="Hello! This is a test with the new sona_speech_2 model.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_2,
-            )
+        print(f"  🔍 Converting TTS with sona_speech_2 using voice '{voice_id}'...")
+        print("  ⚠️ This test will consume credits!")
+
+        response = await client.text_to_speech.create_speech_async(
+            voice_id=voice_id,
+            text="Hello! This is a test with the new sona_speech_2 model.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_2,
+        )
 
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                audio_size = len(audio_data)
-                print(f"  ✅ sona_speech_2 TTS successful: {audio_size} bytes")
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            audio_size = len(audio_data)
+            print(f"  ✅ sona_speech_2 TTS successful: {audio_size} bytes")
 
-                output_file = "test_async_sona_speech_2_output.wav"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 Audio saved: {output_file}")
+            output_file = "test_async_sona_speech_2_output.wav"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 Audio saved: {output_file}")
 
-                return True, response
-            else:
-                print(f"  ❌ Response structure error: {type(response)}")
-                return False, response
+            return True, response
+        else:
+            print(f"  ❌ Response structure error: {type(response)}")
+            return False, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
@@ -2470,7 +2317,7 @@ async def test_create_speech_sona_speech_2(voice_id):
         return False, e
 
 
-async def test_create_speech_supertonic_api_1(voice_id):
+async def test_create_speech_supertonic_api_1(client, voice_id):
     """Test TTS with supertonic_api_1 model (Async)"""
     print("🎤 TTS Test with supertonic_api_1 Model (Async)")
 
@@ -2479,37 +2326,32 @@ async def test_create_speech_supertonic_api_1(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Converting TTS with supertonic_api_1 using voice '{voice_id}'..."
-            )
-            print("  ⚠️ This test will consume credits!")
-
-            response = await client.text_to_speech.create_speech_async(
-                voice_id=voice_id,
-                text="Hello! This is a test with the supertonic_api_1 model.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SUPERTONIC_API_1,
-            )
+        print(f"  🔍 Converting TTS with supertonic_api_1 using voice '{voice_id}'...")
+        print("  ⚠️ This test will consume credits!")
+
+        response = await client.text_to_speech.create_speech_async(
+            voice_id=voice_id,
+            text="Hello! This is a test with the supertonic_api_1 model.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SUPERTONIC_API_1,
+        )
 
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                audio_size = len(audio_data)
-                print(f"  ✅ supertonic_api_1 TTS successful: {audio_size} bytes")
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            audio_size = len(audio_data)
+            print(f"  ✅ supertonic_api_1 TTS successful: {audio_size} bytes")
 
-                output_file = "test_async_supertonic_api_1_output.wav"
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
-                print(f"  💾 Audio saved: {output_file}")
+            output_file = "test_async_supertonic_api_1_output.wav"
+            with open(output_file, "wb") as f:
+                f.write(audio_data)
+            print(f"  💾 Audio saved: {output_file}")
 
-                return True, response
-            else:
-                print(f"  ❌ Response structure error: {type(response)}")
-                return False, response
+            return True, response
+        else:
+            print(f"  ❌ Response structure error: {type(response)}")
+            return False, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
@@ -2519,7 +2361,7 @@ async def test_create_speech_supertonic_api_1(voice_id):
         return False, e
 
 
-async def test_create_speech_invalid_model(voice_id):
+async def test_create_speech_invalid_model(client, voice_id):
     """Test TTS with unsupported model - should return error (Async)"""
     print("❌ TTS Test with Invalid Model (Expected Error) (Async)")
 
@@ -2528,22 +2370,19 @@ async def test_create_speech_invalid_model(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Attempting TTS with invalid model 'invalid_model_xyz'...")
-
-            response = await client.text_to_speech.create_speech_async(
-                voice_id=voice_id,
-                text="This should fail with invalid model.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model="invalid_model_xyz",  # Invalid model
-            )
+        print(f"  🔍 Attempting TTS with invalid model 'invalid_model_xyz'...")
+
+        response = await client.text_to_speech.create_speech_async(
+            voice_id=voice_id,
+            text="This should fail with invalid model.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model="invalid_model_xyz",  # Invalid model
+        )
 
-            print(f"  ⚠️ Unexpected: API did not reject invalid model")
-            return False, response
+        print(f"  ⚠️ Unexpected: API did not reject invalid model")
+        return False, response
 
     except (errors.BadRequestErrorResponse, errors.SupertoneError) as e:
         print(
@@ -2560,7 +2399,7 @@ async def test_create_speech_invalid_model(voice_id):
         return True, e
 
 
-async def test_predict_duration_sona_speech_2(voice_id):
+async def test_predict_duration_sona_speech_2(client, voice_id):
     """Test duration prediction with sona_speech_2 model (Async)"""
     print("⏱️ Duration Prediction Test with sona_speech_2 Model (Async)")
 
@@ -2569,23 +2408,20 @@ async def test_predict_duration_sona_speech_2(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Predicting duration with sona_speech_2 using voice '{voice_id}'..."
-            )
+        print(
+            f"  🔍 Predicting duration with sona_speech_2 using voice '{voice_id}'..."
+        )
 
-            response = await client.text_to_speech.predict_duration_async(
-                voice_id=voice_id,
-                text="Hello! This is a duration prediction test with sona_speech_2.",
-                language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model=models.PredictTTSDurationUsingCharacterRequestModel.SONA_SPEECH_2,
-            )
+        response = await client.text_to_speech.predict_duration_async(
+            voice_id=voice_id,
+            text="Hello! This is a duration prediction test with sona_speech_2.",
+            language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model=models.PredictTTSDurationUsingCharacterRequestModel.SONA_SPEECH_2,
+        )
 
-            print(f"  ✅ sona_speech_2 prediction complete: {response} seconds")
-            return True, response
+        print(f"  ✅ sona_speech_2 prediction complete: {response} seconds")
+        return True, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
@@ -2595,7 +2431,7 @@ async def test_predict_duration_sona_speech_2(voice_id):
         return False, e
 
 
-async def test_predict_duration_supertonic_api_1(voice_id):
+async def test_predict_duration_supertonic_api_1(client, voice_id):
     """Test duration prediction with supertonic_api_1 model (Async)"""
     print("⏱️ Duration Prediction Test with supertonic_api_1 Model (Async)")
 
@@ -2603,24 +2439,21 @@ async def test_predict_duration_supertonic_api_1(voice_id):
         print("  ⚠️ No voice ID available")
         return False, None
 
-    try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Predicting duration with supertonic_api_1 using voice '{voice_id}'..."
-            )
-
-            response = await client.text_to_speech.predict_duration_async(
-                voice_id=voice_id,
-                text="Hello! This is a duration prediction test with supertonic_api_1.",
-                language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model=models.PredictTTSDurationUsingCharacterRequestModel.SUPERTONIC_API_1,
-            )
+    try:
+        print(
+            f"  🔍 Predicting duration with supertonic_api_1 using voice '{voice_id}'..."
+        )
 
-            print(f"  ✅ supertonic_api_1 prediction complete: {response} seconds")
-            return True, response
+        response = await client.text_to_speech.predict_duration_async(
+            voice_id=voice_id,
+            text="Hello! This is a duration prediction test with supertonic_api_1.",
+            language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model=models.PredictTTSDurationUsingCharacterRequestModel.SUPERTONIC_API_1,
+        )
+
+        print(f"  ✅ supertonic_api_1 prediction complete: {response} seconds")
+        return True, response
 
     except errors.SupertoneError as e:
         print(f"  ❌ API error: {e.message}")
@@ -2630,7 +2463,7 @@ async def test_predict_duration_supertonic_api_1(voice_id):
         return False, e
 
 
-async def test_predict_duration_invalid_model(voice_id):
+async def test_predict_duration_invalid_model(client, voice_id):
     """Test duration prediction with unsupported model - should return error (Async)"""
     print("❌ Duration Prediction Test with Invalid Model (Expected Error) (Async)")
 
@@ -2639,23 +2472,18 @@ async def test_predict_duration_invalid_model(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print(
-                f"  🔍 Attempting prediction with invalid model 'invalid_model_xyz'..."
-            )
-
-            response = await client.text_to_speech.predict_duration_async(
-                voice_id=voice_id,
-                text="This should fail with invalid model.",
-                language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model="invalid_model_xyz",  # Invalid model
-            )
+        print(f"  🔍 Attempting prediction with invalid model 'invalid_model_xyz'...")
+
+        response = await client.text_to_speech.predict_duration_async(
+            voice_id=voice_id,
+            text="This should fail with invalid model.",
+            language=models.PredictTTSDurationUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model="invalid_model_xyz",  # Invalid model
+        )
 
-            print(f"  ⚠️ Unexpected: API did not reject invalid model")
-            return False, response
+        print(f"  ⚠️ Unexpected: API did not reject invalid model")
+        return False, response
 
     except (errors.BadRequestErrorResponse, errors.SupertoneError) as e:
         print(
@@ -2677,7 +2505,7 @@ async def test_predict_duration_invalid_model(voice_id):
 # =============================================================================
 
 
-async def test_create_speech_sona_speech_1_multilang(voice_id):
+async def test_create_speech_sona_speech_1_multilang(client, voice_id):
     """Test sona_speech_1 with supported languages (ko, en, ja) - Async"""
     print("🌐 sona_speech_1 Multi-language Test (ko, en, ja) (Async)")
 
@@ -2686,8 +2514,6 @@ async def test_create_speech_sona_speech_1_multilang(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         test_cases = [
             (
                 models.APIConvertTextToSpeechUsingCharacterRequestLanguage.KO,
@@ -2704,31 +2530,30 @@ async def test_create_speech_sona_speech_1_multilang(voice_id):
         ]
 
         all_success = True
-        async with Supertone(api_key=API_KEY) as client:
-            for lang, text in test_cases:
-                print(f"  🔍 Testing {lang.value} with sona_speech_1...")
-
-                try:
-                    response = await client.text_to_speech.create_speech_async(
-                        voice_id=voice_id,
-                        text=text,
-                        language=lang,
-                        output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                        style="neutral",
-                        model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
-                    )
+        for lang, text in test_cases:
+            print(f"  🔍 Testing {lang.value} with sona_speech_1...")
 
-                    if hasattr(response, "result") and hasattr(response.result, "read"):
-                        audio_data = response.result.read()
-                        print(f"    ✅ {lang.value}: {len(audio_data)} bytes")
-                    else:
-                        print(f"    ❌ {lang.value}: Response structure error")
-                        all_success = False
+            try:
+                response = await client.text_to_speech.create_speech_async(
+                    voice_id=voice_id,
+                    text=text,
+                    language=lang,
+                    output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+                    style="neutral",
+                    model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
+                )
 
-                except errors.SupertoneError as e:
-                    print(f"    ❌ {lang.value}: {e.message}")
+                if hasattr(response, "result") and hasattr(response.result, "read"):
+                    audio_data = response.result.read()
+                    print(f"    ✅ {lang.value}: {len(audio_data)} bytes")
+                else:
+                    print(f"    ❌ {lang.value}: Response structure error")
                     all_success = False
 
+            except errors.SupertoneError as e:
+                print(f"    ❌ {lang.value}: {e.message}")
+                all_success = False
+
         return all_success, "sona_speech_1 multilang test async"
 
     except Exception as e:
@@ -2736,7 +2561,7 @@ async def test_create_speech_sona_speech_1_multilang(voice_id):
         return False, e
 
 
-async def test_create_speech_sona_speech_2_multilang(voice_id):
+async def test_create_speech_sona_speech_2_multilang(client, voice_id):
     """Test sona_speech_2 with all supported languages - Async"""
     print("🌐 sona_speech_2 Multi-language Test (all languages) (Async)")
 
@@ -2745,8 +2570,6 @@ async def test_create_speech_sona_speech_2_multilang(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         # sona_speech_2 supports all languages
         test_cases = [
             (
@@ -2769,32 +2592,31 @@ async def test_create_speech_sona_speech_2_multilang(voice_id):
 
         all_success = True
         success_count = 0
-        async with Supertone(api_key=API_KEY) as client:
-            for lang, text in test_cases:
-                print(f"  🔍 Testing {lang.value} with sona_speech_2...")
-
-                try:
-                    response = await client.text_to_speech.create_speech_async(
-                        voice_id=voice_id,
-                        text=text,
-                        language=lang,
-                        output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                        style="neutral",
-                        model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_2,
-                    )
+        for lang, text in test_cases:
+            print(f"  🔍 Testing {lang.value} with sona_speech_2...")
 
-                    if hasattr(response, "result") and hasattr(response.result, "read"):
-                        audio_data = response.result.read()
-                        print(f"    ✅ {lang.value}: {len(audio_data)} bytes")
-                        success_count += 1
-                    else:
-                        print(f"    ❌ {lang.value}: Response structure error")
-                        all_success = False
+            try:
+                response = await client.text_to_speech.create_speech_async(
+                    voice_id=voice_id,
+                    text=text,
+                    language=lang,
+                    output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+                    style="neutral",
+                    model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_2,
+                )
 
-                except errors.SupertoneError as e:
-                    print(f"    ❌ {lang.value}: {e.message}")
+                if hasattr(response, "result") and hasattr(response.result, "read"):
+                    audio_data = response.result.read()
+                    print(f"    ✅ {lang.value}: {len(audio_data)} bytes")
+                    success_count += 1
+                else:
+                    print(f"    ❌ {lang.value}: Response structure error")
                     all_success = False
 
+            except errors.SupertoneError as e:
+                print(f"    ❌ {lang.value}: {e.message}")
+                all_success = False
+
         print(f"  📊 Total: {success_count}/{len(test_cases)} languages successful")
         return (
             all_success,
@@ -2806,7 +2628,7 @@ async def test_create_speech_sona_speech_2_multilang(voice_id):
         return False, e
 
 
-async def test_create_speech_supertonic_api_1_multilang(voice_id):
+async def test_create_speech_supertonic_api_1_multilang(client, voice_id):
     """Test supertonic_api_1 with supported languages (ko, en, ja, es, pt) - Async"""
     print("🌐 supertonic_api_1 Multi-language Test (ko, en, ja, es, pt) (Async)")
 
@@ -2815,8 +2637,6 @@ async def test_create_speech_supertonic_api_1_multilang(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         # supertonic_api_1 supports: ko, en, ja, es, pt
         test_cases = [
             (
@@ -2842,31 +2662,30 @@ async def test_create_speech_supertonic_api_1_multilang(voice_id):
         ]
 
         all_success = True
-        async with Supertone(api_key=API_KEY) as client:
-            for lang, text in test_cases:
-                print(f"  🔍 Testing {lang.value} with supertonic_api_1...")
-
-                try:
-                    response = await client.text_to_speech.create_speech_async(
-                        voice_id=voice_id,
-                        text=text,
-                        language=lang,
-                        output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                        style="neutral",
-                        model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SUPERTONIC_API_1,
-                    )
+        for lang, text in test_cases:
+            print(f"  🔍 Testing {lang.value} with supertonic_api_1...")
 
-                    if hasattr(response, "result") and hasattr(response.result, "read"):
-                        audio_data = response.result.read()
-                        print(f"    ✅ {lang.value}: {len(audio_data)} bytes")
-                    else:
-                        print(f"    ❌ {lang.value}: Response structure error")
-                        all_success = False
+            try:
+                response = await client.text_to_speech.create_speech_async(
+                    voice_id=voice_id,
+                    text=text,
+                    language=lang,
+                    output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+                    style="neutral",
+                    model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SUPERTONIC_API_1,
+                )
 
-                except errors.SupertoneError as e:
-                    print(f"    ❌ {lang.value}: {e.message}")
+                if hasattr(response, "result") and hasattr(response.result, "read"):
+                    audio_data = response.result.read()
+                    print(f"    ✅ {lang.value}: {len(audio_data)} bytes")
+                else:
+                    print(f"    ❌ {lang.value}: Response structure error")
                     all_success = False
 
+            except errors.SupertoneError as e:
+                print(f"    ❌ {lang.value}: {e.message}")
+                all_success = False
+
         return all_success, "supertonic_api_1 multilang test async"
 
     except Exception as e:
@@ -2874,7 +2693,7 @@ async def test_create_speech_supertonic_api_1_multilang(voice_id):
         return False, e
 
 
-async def test_create_speech_sona_speech_1_unsupported_lang(voice_id):
+async def test_create_speech_sona_speech_1_unsupported_lang(client, voice_id):
     """Test sona_speech_1 with unsupported language - should return error (Async)"""
     print("❌ sona_speech_1 Unsupported Language Test (Expected Error) (Async)")
 
@@ -2883,31 +2702,28 @@ async def test_create_speech_sona_speech_1_unsupported_lang(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         # sona_speech_1 only supports ko, en, ja - testing with German (de)
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Attempting sona_speech_1 with German (unsupported)...")
+        print(f"  🔍 Attempting sona_speech_1 with German (unsupported)...")
+
+        response = await client.text_to_speech.create_speech_async(
+            voice_id=voice_id,
+            text="Hallo! Dies ist ein Test.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.DE,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
+        )
 
-            response = await client.text_to_speech.create_speech_async(
-                voice_id=voice_id,
-                text="Hallo! Dies ist ein Test.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.DE,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            print(f"  ⚠️ Unexpected success: {len(audio_data)} bytes")
+            print(
+                "  ⚠️ API accepted unsupported language (may need to verify model-language restrictions)"
             )
-
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                print(f"  ⚠️ Unexpected success: {len(audio_data)} bytes")
-                print(
-                    "  ⚠️ API accepted unsupported language (may need to verify model-language restrictions)"
-                )
-                return False, response
-            else:
-                print(f"  ⚠️ Unexpected response: {type(response)}")
-                return False, response
+            return False, response
+        else:
+            print(f"  ⚠️ Unexpected response: {type(response)}")
+            return False, response
 
     except (errors.BadRequestErrorResponse, errors.SupertoneError) as e:
         print(
@@ -2920,7 +2736,7 @@ async def test_create_speech_sona_speech_1_unsupported_lang(voice_id):
         return True, e
 
 
-async def test_create_speech_supertonic_api_1_unsupported_lang(voice_id):
+async def test_create_speech_supertonic_api_1_unsupported_lang(client, voice_id):
     """Test supertonic_api_1 with unsupported language - should return error (Async)"""
     print("❌ supertonic_api_1 Unsupported Language Test (Expected Error) (Async)")
 
@@ -2929,31 +2745,28 @@ async def test_create_speech_supertonic_api_1_unsupported_lang(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         # supertonic_api_1 supports: ko, en, ja, es, pt - testing with German (de)
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Attempting supertonic_api_1 with German (unsupported)...")
+        print(f"  🔍 Attempting supertonic_api_1 with German (unsupported)...")
+
+        response = await client.text_to_speech.create_speech_async(
+            voice_id=voice_id,
+            text="Hallo! Dies ist ein Test.",
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.DE,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SUPERTONIC_API_1,
+        )
 
-            response = await client.text_to_speech.create_speech_async(
-                voice_id=voice_id,
-                text="Hallo! Dies ist ein Test.",
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.DE,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SUPERTONIC_API_1,
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            print(f"  ⚠️ Unexpected success: {len(audio_data)} bytes")
+            print(
+                "  ⚠️ API accepted unsupported language (may need to verify model-language restrictions)"
             )
-
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                print(f"  ⚠️ Unexpected success: {len(audio_data)} bytes")
-                print(
-                    "  ⚠️ API accepted unsupported language (may need to verify model-language restrictions)"
-                )
-                return False, response
-            else:
-                print(f"  ⚠️ Unexpected response: {type(response)}")
-                return False, response
+            return False, response
+        else:
+            print(f"  ⚠️ Unexpected response: {type(response)}")
+            return False, response
 
     except (errors.BadRequestErrorResponse, errors.SupertoneError) as e:
         print(
@@ -2966,7 +2779,7 @@ async def test_create_speech_supertonic_api_1_unsupported_lang(voice_id):
         return True, e
 
 
-async def test_predict_duration_multilang(voice_id):
+async def test_predict_duration_multilang(client, voice_id):
     """Test duration prediction with different languages and models - Async"""
     print("🌐⏱️ Duration Prediction Multi-language Test (Async)")
 
@@ -2975,8 +2788,6 @@ async def test_predict_duration_multilang(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         test_cases = [
             # (model, language, text)
             (
@@ -2997,23 +2808,22 @@ async def test_predict_duration_multilang(voice_id):
         ]
 
         all_success = True
-        async with Supertone(api_key=API_KEY) as client:
-            for model, lang, text in test_cases:
-                print(f"  🔍 Predicting with {model.value} + {lang.value}...")
+        for model, lang, text in test_cases:
+            print(f"  🔍 Predicting with {model.value} + {lang.value}...")
 
-                try:
-                    response = await client.text_to_speech.predict_duration_async(
-                        voice_id=voice_id,
-                        text=text,
-                        language=lang,
-                        style="neutral",
-                        model=model,
-                    )
-                    print(f"    ✅ {model.value} + {lang.value}: {response} seconds")
+            try:
+                response = await client.text_to_speech.predict_duration_async(
+                    voice_id=voice_id,
+                    text=text,
+                    language=lang,
+                    style="neutral",
+                    model=model,
+                )
+                print(f"    ✅ {model.value} + {lang.value}: {response} seconds")
 
-                except errors.SupertoneError as e:
-                    print(f"    ❌ {model.value} + {lang.value}: {e.message}")
-                    all_success = False
+            except errors.SupertoneError as e:
+                print(f"    ❌ {model.value} + {lang.value}: {e.message}")
+                all_success = False
 
         return all_success, "predict_duration multilang test async"
 
@@ -3022,7 +2832,7 @@ async def test_predict_duration_multilang(voice_id):
         return False, e
 
 
-async def test_create_speech_long_sentence_word_split(voice_id):
+async def test_create_speech_long_sentence_word_split(client, voice_id):
     """Test async TTS with a very long sentence (word-based splitting)"""
     print("📝✂️ Async Long Sentence Word-Based Splitting Test")
 
@@ -3031,8 +2841,6 @@ async def test_create_speech_long_sentence_word_split(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, models
-
         # Create a long sentence without punctuation (over 300 chars)
         long_sentence = (
             "This is a very long sentence without any punctuation marks that is designed "
@@ -3045,38 +2853,37 @@ async def test_create_speech_long_sentence_word_split(voice_id):
         print(f"  📏 Text length: {len(long_sentence)} characters (no punctuation)")
         print(f"  📄 Text preview: {long_sentence[:50]}...")
 
-        async with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Converting TTS with word-based chunking (async)...")
-            print("  ⚠️ This test will consume credits!")
+        print("  🔍 Converting TTS with word-based chunking (async)...")
+        print("  ⚠️ This test will consume credits!")
 
-            response = await client.text_to_speech.create_speech_async(
-                voice_id=voice_id,
-                text=long_sentence,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-            )
+        response = await client.text_to_speech.create_speech_async(
+            voice_id=voice_id,
+            text=long_sentence,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+        )
 
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                if len(audio_data) > 0:
-                    print(f"  ✅ Word-based chunking successful!")
-                    print(f"  📦 Audio data size: {len(audio_data):,} bytes")
-                    return True, response
-                else:
-                    print("  ❌ Empty audio data")
-                    return False, response
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            if len(audio_data) > 0:
+                print(f"  ✅ Word-based chunking successful!")
+                print(f"  📦 Audio data size: {len(audio_data):,} bytes")
+                return True, response
             else:
-                print(f"  ❌ Unexpected response type: {type(response)}")
+                print("  ❌ Empty audio data")
                 return False, response
+        else:
+            print(f"  ❌ Unexpected response type: {type(response)}")
+            return False, response
 
     except Exception as e:
         print(f"  ❌ Unexpected error: {e}")
         return False, e
 
 
-async def test_create_speech_japanese_no_spaces(voice_id):
+async def test_create_speech_japanese_no_spaces(client, voice_id):
     """Test async TTS with Japanese text (character-based splitting)"""
     print("🇯🇵✂️ Async Japanese Text Character-Based Splitting Test")
 
@@ -3085,8 +2892,6 @@ async def test_create_speech_japanese_no_spaces(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, models
-
         # Long Japanese text without spaces
         japanese_text = (
             "これは日本語のテストです。"
@@ -3101,38 +2906,37 @@ async def test_create_speech_japanese_no_spaces(voice_id):
         print(f"  📏 Text length: {len(japanese_text)} characters (no word spaces)")
         print(f"  📄 Text preview: {japanese_text[:30]}...")
 
-        async with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Converting TTS with character-based chunking (async)...")
-            print("  ⚠️ This test will consume credits!")
+        print("  🔍 Converting TTS with character-based chunking (async)...")
+        print("  ⚠️ This test will consume credits!")
 
-            response = await client.text_to_speech.create_speech_async(
-                voice_id=voice_id,
-                text=japanese_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.JA,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-            )
+        response = await client.text_to_speech.create_speech_async(
+            voice_id=voice_id,
+            text=japanese_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.JA,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+        )
 
-            if hasattr(response, "result") and hasattr(response.result, "read"):
-                audio_data = response.result.read()
-                if len(audio_data) > 0:
-                    print(f"  ✅ Character-based chunking successful!")
-                    print(f"  📦 Audio data size: {len(audio_data):,} bytes")
-                    return True, response
-                else:
-                    print("  ❌ Empty audio data")
-                    return False, response
+        if hasattr(response, "result") and hasattr(response.result, "read"):
+            audio_data = response.result.read()
+            if len(audio_data) > 0:
+                print(f"  ✅ Character-based chunking successful!")
+                print(f"  📦 Audio data size: {len(audio_data):,} bytes")
+                return True, response
             else:
-                print(f"  ❌ Unexpected response type: {type(response)}")
+                print("  ❌ Empty audio data")
                 return False, response
+        else:
+            print(f"  ❌ Unexpected response type: {type(response)}")
+            return False, response
 
     except Exception as e:
         print(f"  ❌ Unexpected error: {e}")
         return False, e
 
 
-async def test_stream_speech_long_sentence_word_split(voice_id):
+async def test_stream_speech_long_sentence_word_split(client, voice_id):
     """Test async streaming TTS with a very long sentence (word-based splitting)"""
     print("📝🔊✂️ Async Streaming Long Sentence Word-Based Splitting Test")
 
@@ -3141,8 +2945,6 @@ async def test_stream_speech_long_sentence_word_split(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, models
-
         # Long sentence without punctuation
         long_sentence = (
             "This is an extremely long sentence that has been carefully crafted without "
@@ -3154,44 +2956,45 @@ async def test_stream_speech_long_sentence_word_split(voice_id):
 
         print(f"  📏 Text length: {len(long_sentence)} characters (no punctuation)")
 
-        async with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Streaming TTS with word-based chunking (async)...")
-            print("  ⚠️ This test will consume credits!")
-
-            response = await client.text_to_speech.stream_speech_async(
-                voice_id=voice_id,
-                text=long_sentence,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-            )
+        print("  🔍 Streaming TTS with word-based chunking (async)...")
+        print("  ⚠️ This test will consume credits!")
 
-            # Collect streaming data
-            audio_data = b""
-            if hasattr(response.result, "aiter_bytes"):
-                async for chunk in response.result.aiter_bytes():
-                    audio_data += chunk
-            elif hasattr(response.result, "iter_bytes"):
-                for chunk in response.result.iter_bytes():
-                    audio_data += chunk
-            elif hasattr(response.result, "read"):
-                audio_data = response.result.read()
+        response = await client.text_to_speech.stream_speech_async(
+            voice_id=voice_id,
+            text=long_sentence,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+        )
 
-            if len(audio_data) > 0:
-                print(f"  ✅ Streaming word-based chunking successful!")
-                print(f"  📦 Audio data size: {len(audio_data):,} bytes")
-                return True, response
-            else:
-                print("  ❌ Empty audio data")
-                return False, response
+        # Collect streaming data; bytearray grows in place
+        audio_data = bytearray()
+        if hasattr(response.result, "aiter_bytes"):
+            async for chunk in response.result.aiter_bytes(
+                chunk_size=STREAM_CHUNK_SIZE
+            ):
+                audio_data.extend(chunk)
+        elif hasattr(response.result, "iter_bytes"):
+            for chunk in response.result.iter_bytes(chunk_size=STREAM_CHUNK_SIZE):
+                audio_data.extend(chunk)
+        elif hasattr(response.result, "read"):
+            audio_data = response.result.read()
+
+        if len(audio_data) > 0:
+            print(f"  ✅ Streaming word-based chunking successful!")
+            print(f"  📦 Audio data size: {len(audio_data):,} bytes")
+            return True, response
+        else:
+            print("  ❌ Empty audio data")
+            return False, response
 
     except Exception as e:
         print(f"  ❌ Unexpected error: {e}")
         return False, e
 
 
-async def test_stream_speech_japanese_no_spaces(voice_id):
+async def test_stream_speech_japanese_no_spaces(client, voice_id):
     """Test async streaming TTS with Japanese text (character-based splitting)"""
     print("🇯🇵🔊✂️ Async Streaming Japanese Character-Based Splitting Test")
 
@@ -3200,8 +3003,6 @@ async def test_stream_speech_japanese_no_spaces(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, models
-
         # Long Japanese text without spaces
         japanese_text = (
             "これは日本語のストリーミングテストです。"
@@ -3215,37 +3016,38 @@ async def test_stream_speech_japanese_no_spaces(voice_id):
 
         print(f"  📏 Text length: {len(japanese_text)} characters")
 
-        async with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Streaming TTS with character-based chunking (async)...")
-            print("  ⚠️ This test will consume credits!")
-
-            response = await client.text_to_speech.stream_speech_async(
-                voice_id=voice_id,
-                text=japanese_text,
-                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.JA,
-                style="neutral",
-                model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
-                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-            )
+        print("  🔍 Streaming TTS with character-based chunking (async)...")
+        print("  ⚠️ This test will consume credits!")
 
-            # Collect streaming data
-            audio_data = b""
-            if hasattr(response.result, "aiter_bytes"):
-                async for chunk in response.result.aiter_bytes():
-                    audio_data += chunk
-            elif hasattr(response.result, "iter_bytes"):
-                for chunk in response.result.iter_bytes():
-                    audio_data += chunk
-            elif hasattr(response.result, "read"):
-                audio_data = response.result.read()
+        response = await client.text_to_speech.stream_speech_async(
+            voice_id=voice_id,
+            text=japanese_text,
+            language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.JA,
+            style="neutral",
+            model=models.APIConvertTextToSpeechUsingCharacterRequestModel.SONA_SPEECH_1,
+            output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+        )
 
-            if len(audio_data) > 0:
-                print(f"  ✅ Streaming character-based chunking successful!")
-                print(f"  📦 Audio data size: {len(audio_data):,} bytes")
-                return True, response
-            else:
-                print("  ❌ Empty audio data")
-                return False, response
+        # Collect streaming data; bytearray grows in place
+        audio_data = bytearray()
+        if hasattr(response.result, "aiter_bytes"):
+            async for chunk in response.result.aiter_bytes(
+                chunk_size=STREAM_CHUNK_SIZE
+            ):
+                audio_data.extend(chunk)
+        elif hasattr(response.result, "iter_bytes"):
+            for chunk in response.result.iter_bytes(chunk_size=STREAM_CHUNK_SIZE):
+                audio_data.extend(chunk)
+        elif hasattr(response.result, "read"):
+            audio_data = response.result.read()
+
+        if len(audio_data) > 0:
+            print(f"  ✅ Streaming character-based chunking successful!")
+            print(f"  📦 Audio data size: {len(audio_data):,} bytes")
+            return True, response
+        else:
+            print("  ❌ Empty audio data")
+            return False, response
 
     except Exception as e:
         print(f"  ❌ Unexpected error: {e}")
@@ -3257,7 +3059,7 @@ async def test_stream_speech_japanese_no_spaces(voice_id):
 # ============================================
 
 
-async def test_concurrent_api_calls(voice_id):
+async def test_concurrent_api_calls(client, voice_id):
     """Test multiple API calls concurrently - showcase async power"""
     print("🚀 Concurrent API Calls Test (Async Power!)")
 
@@ -3266,65 +3068,58 @@ async def test_concurrent_api_calls(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
+        print("  🔍 Running 5 different API calls concurrently...")
+        print("  ⏱️ Starting timer...")
 
-        async with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Running 5 different API calls concurrently...")
-            print("  ⏱️ Starting timer...")
+        start_time = time.time()
 
-            start_time = time.time()
-
-            # Run 5 different API calls concurrently
-            results = await asyncio.gather(
-                client.usage.get_credit_balance_async(),
-                client.voices.list_voices_async(page_size=10),
-                client.custom_voices.list_custom_voices_async(page_size=10),
-                client.text_to_speech.predict_duration_async(
-                    voice_id=voice_id,
-                    text="Concurrent API test",
-                    language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                ),
-                client.usage.get_voice_usage_async(
-                    start_date=(datetime.now() - timedelta(days=1)).strftime(
-                        "%Y-%m-%d"
-                    ),
-                    end_date=datetime.now().strftime("%Y-%m-%d"),
-                ),
-                return_exceptions=True,
-            )
+        # Run 5 different API calls concurrently
+        results = await asyncio.gather(
+            client.usage.get_credit_balance_async(),
+            client.voices.list_voices_async(page_size=10),
+            client.custom_voices.list_custom_voices_async(page_size=10),
+            client.text_to_speech.predict_duration_async(
+                voice_id=voice_id,
+                text="Concurrent API test",
+                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            ),
+            client.usage.get_voice_usage_async(
+                start_date=(datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d"),
+                end_date=datetime.now().strftime("%Y-%m-%d"),
+            ),
+            return_exceptions=True,
+        )
 
-            end_time = time.time()
-            elapsed_time = end_time - start_time
+        end_time = time.time()
+        elapsed_time = end_time - start_time
 
-            print(f"  ✅ All 5 API calls completed!")
-            print(f"  ⏱️ Total time: {elapsed_time:.3f}s (parallel execution)")
-            print(f"  🚀 Average time per call: {elapsed_time/5:.3f}s")
+        print(f"  ✅ All 5 API calls completed!")
+        print(f"  ⏱️ Total time: {elapsed_time:.3f}s (parallel execution)")
+        print(f"  🚀 Average time per call: {elapsed_time/5:.3f}s")
 
-            success_count = sum(1 for r in results if not isinstance(r, Exception))
-            print(f"  📊 Success: {success_count}/5 calls")
+        success_count = sum(1 for r in results if not isinstance(r, Exception))
+        print(f"  📊 Success: {success_count}/5 calls")
 
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    print(f"     Call {i+1}: ❌ {type(result).__name__}")
-                else:
-                    print(f"     Call {i+1}: ✅ Success")
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                print(f"     Call {i+1}: ❌ {type(result).__name__}")
+            else:
+                print(f"     Call {i+1}: ✅ Success")
 
-            return True, {
-                "elapsed_time": elapsed_time,
-                "success_count": success_count,
-                "total_calls": 5,
-            }
+        return True, {
+            "elapsed_time": elapsed_time,
+            "success_count": success_count,
+            "total_calls": 5,
+        }
 
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_parallel_tts_conversion(voice_id):
+async def test_parallel_tts_conversion(client, voice_id):
     """Test parallel TTS conversions with different texts - async power"""
     print("🎤🎤🎤 Parallel TTS Conversion Test (Async Power!)")
 
@@ -3333,81 +3128,76 @@ async def test_parallel_tts_conversion(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
         texts = [
             "First parallel TTS test.",
             "Second parallel TTS test.",
             "Third parallel TTS test.",
         ]
 
-        async with Supertone(api_key=API_KEY) as client:
-            print(f"  🔍 Converting {len(texts)} texts in parallel...")
-            print("  ⚠️ This test consumes credits!")
-            print("  ⏱️ Starting timer...")
+        print(f"  🔍 Converting {len(texts)} texts in parallel...")
+        print("  ⚠️ This test consumes credits!")
+        print("  ⏱️ Starting timer...")
 
-            start_time = time.time()
+        start_time = time.time()
 
-            # Create parallel TTS conversion tasks
-            tasks = [
-                client.text_to_speech.create_speech_async(
-                    voice_id=voice_id,
-                    text=text,
-                    language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                    output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
-                )
-                for text in texts
-            ]
+        # Create parallel TTS conversion tasks
+        tasks = [
+            client.text_to_speech.create_speech_async(
+                voice_id=voice_id,
+                text=text,
+                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+                output_format=models.APIConvertTextToSpeechUsingCharacterRequestOutputFormat.WAV,
+            )
+            for text in texts
+        ]
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            end_time = time.time()
-            elapsed_time = end_time - start_time
+        end_time = time.time()
+        elapsed_time = end_time - start_time
 
-            print(f"  ✅ All {len(texts)} TTS conversions completed!")
-            print(f"  ⏱️ Total time: {elapsed_time:.3f}s (parallel execution)")
-            print(f"  🚀 Average time per conversion: {elapsed_time/len(texts):.3f}s")
+        print(f"  ✅ All {len(texts)} TTS conversions completed!")
+        print(f"  ⏱️ Total time: {elapsed_time:.3f}s (parallel execution)")
+        print(f"  🚀 Average time per conversion: {elapsed_time/len(texts):.3f}s")
 
-            success_count = 0
-            total_bytes = 0
+        success_count = 0
+        total_bytes = 0
 
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    print(f"     Text {i+1}: ❌ {type(result).__name__}")
-                else:
-                    if hasattr(result, "result") and hasattr(result.result, "read"):
-                        audio_data = result.result.read()
-                        audio_size = len(audio_data)
-                        total_bytes += audio_size
-                        success_count += 1
-                        print(f"     Text {i+1}: ✅ {audio_size} bytes")
-
-                        # Save individual files
-                        output_file = f"test_async_parallel_tts_{i+1}.wav"
-                        with open(output_file, "wb") as f:
-                            f.write(audio_data)
-                        print(f"        💾 Saved: {output_file}")
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                print(f"     Text {i+1}: ❌ {type(result).__name__}")
+            else:
+                if hasattr(result, "result") and hasattr(result.result, "read"):
+                    audio_data = result.result.read()
+                    audio_size = len(audio_data)
+                    total_bytes += audio_size
+                    success_count += 1
+                    print(f"     Text {i+1}: ✅ {audio_size} bytes")
 
-            print(f"  📊 Success: {success_count}/{len(texts)} conversions")
-            print(f"  📦 Total audio: {total_bytes} bytes")
+                    # Save individual files
+                    output_file = f"test_async_parallel_tts_{i+1}.wav"
+                    with open(output_file, "wb") as f:
+                        f.write(audio_data)
+                    print(f"        💾 Saved: {output_file}")
 
-            return True, {
-                "elapsed_time": elapsed_time,
-                "success_count": success_count,
-                "total_conversions": len(texts),
-                "total_bytes": total_bytes,
-            }
+        print(f"  📊 Success: {success_count}/{len(texts)} conversions")
+        print(f"  📦 Total audio: {total_bytes} bytes")
 
-    except Exception as e:
-        import traceback
+        return True, {
+            "elapsed_time": elapsed_time,
+            "success_count": success_count,
+            "total_conversions": len(texts),
+            "total_bytes": total_bytes,
+        }
 
+    except Exception as e:
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_parallel_multiple_voices(voice_id):
+async def test_parallel_multiple_voices(client, voice_id):
     """Test same text with multiple voices in parallel - async power"""
     print("🎭🎭🎭 Parallel Multiple Voices Test (Async Power!)")
 
@@ -3416,74 +3206,68 @@ async def test_parallel_multiple_voices(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors
-
-        async with Supertone(api_key=API_KEY) as client:
-            # First, get multiple voices
-            print("  🔍 Fetching available voices...")
-            voice_response = await client.voices.list_voices_async(page_size=10)
+        # First, get multiple voices
+        print("  🔍 Fetching available voices...")
+        voice_response = await client.voices.list_voices_async(page_size=10)
 
-            if not voice_response.items or len(voice_response.items) < 2:
-                print("  ⚠️ Not enough voices available for parallel test")
-                return False, None
+        if not voice_response.items or len(voice_response.items) < 2:
+            print("  ⚠️ Not enough voices available for parallel test")
+            return False, None
 
-            voice_ids = [voice.voice_id for voice in voice_response.items[:3]]
-            print(f"  📊 Using {len(voice_ids)} voices for parallel test")
+        voice_ids = [voice.voice_id for voice in voice_response.items[:3]]
+        print(f"  📊 Using {len(voice_ids)} voices for parallel test")
 
-            print("  🔍 Predicting duration with multiple voices in parallel...")
-            print("  ⏱️ Starting timer...")
+        print("  🔍 Predicting duration with multiple voices in parallel...")
+        print("  ⏱️ Starting timer...")
 
-            start_time = time.time()
+        start_time = time.time()
 
-            # Predict duration with multiple voices in parallel
-            from supertone import models
+        # Predict duration with multiple voices in parallel
 
-            tasks = [
-                client.text_to_speech.predict_duration_async(
-                    voice_id=vid,
-                    text="Parallel multiple voices test with async power!",
-                    language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                )
-                for vid in voice_ids
-            ]
+        tasks = [
+            client.text_to_speech.predict_duration_async(
+                voice_id=vid,
+                text="Parallel multiple voices test with async power!",
+                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            )
+            for vid in voice_ids
+        ]
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            end_time = time.time()
-            elapsed_time = end_time - start_time
+        end_time = time.time()
+        elapsed_time = end_time - start_time
 
-            print(f"  ✅ All {len(voice_ids)} voice predictions completed!")
-            print(f"  ⏱️ Total time: {elapsed_time:.3f}s (parallel execution)")
-            print(f"  🚀 Average time per voice: {elapsed_time/len(voice_ids):.3f}s")
+        print(f"  ✅ All {len(voice_ids)} voice predictions completed!")
+        print(f"  ⏱️ Total time: {elapsed_time:.3f}s (parallel execution)")
+        print(f"  🚀 Average time per voice: {elapsed_time/len(voice_ids):.3f}s")
 
-            success_count = 0
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    print(
-                        f"     Voice {i+1} ({voice_ids[i][:8]}...): ❌ {type(result).__name__}"
-                    )
-                else:
-                    print(f"     Voice {i+1} ({voice_ids[i][:8]}...): ✅ {result}s")
-                    success_count += 1
+        success_count = 0
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                print(
+                    f"     Voice {i+1} ({voice_ids[i][:8]}...): ❌ {type(result).__name__}"
+                )
+            else:
+                print(f"     Voice {i+1} ({voice_ids[i][:8]}...): ✅ {result}s")
+                success_count += 1
 
-            print(f"  📊 Success: {success_count}/{len(voice_ids)} predictions")
+        print(f"  📊 Success: {success_count}/{len(voice_ids)} predictions")
 
-            return True, {
-                "elapsed_time": elapsed_time,
-                "success_count": success_count,
-                "total_voices": len(voice_ids),
-            }
+        return True, {
+            "elapsed_time": elapsed_time,
+            "success_count": success_count,
+            "total_voices": len(voice_ids),
+        }
 
     except Exception as e:
-        import traceback
-
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
         return False, e
 
 
-async def test_mixed_parallel_operations(voice_id):
+async def test_mixed_parallel_operations(client, voice_id):
     """Test mixed read/write operations in parallel - complex async scenario"""
     print("🔀 Mixed Parallel Operations Test (Complex Async!)")
 
@@ -3492,70 +3276,65 @@ async def test_mixed_parallel_operations(voice_id):
         return False, None
 
     try:
-        from supertone import Supertone, errors, models
-
-        async with Supertone(api_key=API_KEY) as client:
-            print("  🔍 Running mixed read/write operations in parallel...")
-            print("  ⏱️ Starting timer...")
-
-            start_time = time.time()
-
-            # Mix of different operation types
-            results = await asyncio.gather(
-                # Read operations
-                client.usage.get_credit_balance_async(),
-                client.voices.list_voices_async(page_size=10),
-                client.custom_voices.list_custom_voices_async(page_size=10),
-                # Prediction operations (lightweight)
-                client.text_to_speech.predict_duration_async(
-                    voice_id=voice_id,
-                    text="Mixed operations test one",
-                    language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                ),
-                client.text_to_speech.predict_duration_async(
-                    voice_id=voice_id,
-                    text="Mixed operations test two",
-                    language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
-                ),
-                return_exceptions=True,
-            )
+        print("  🔍 Running mixed read/write operations in parallel...")
+        print("  ⏱️ Starting timer...")
+
+        start_time = time.time()
+
+        # Mix of different operation types
+        results = await asyncio.gather(
+            # Read operations
+            client.usage.get_credit_balance_async(),
+            client.voices.list_voices_async(page_size=10),
+            client.custom_voices.list_custom_voices_async(page_size=10),
+            # Prediction operations (lightweight)
+            client.text_to_speech.predict_duration_async(
+                voice_id=voice_id,
+                text="Mixed operations test one",
+                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            ),
+            client.text_to_speech.predict_duration_async(
+                voice_id=voice_id,
+                text="Mixed operations test two",
+                language=models.APIConvertTextToSpeechUsingCharacterRequestLanguage.EN,
+            ),
+            return_exceptions=True,
+        )
 
-            end_time = time.time()
-            elapsed_time = end_time - start_time
-
-            print(f"  ✅ All mixed operations completed!")
-            print(f"  ⏱️ Total time: {elapsed_time:.3f}s (parallel execution)")
-
-            operation_types = [
-                "Credit Check",
-                "List Voices",
-                "List Custom Voices",
-                "Predict 1",
-                "Predict 2",
-            ]
-            success_count = 0
-
-            for i, (op_type, result) in enumerate(zip(operation_types, results)):
-                if isinstance(result, Exception):
-                    print(f"     {op_type}: ❌ {type(result).__name__}")
-                else:
-                    print(f"     {op_type}: ✅ Success")
-                    success_count += 1
+        end_time = time.time()
+        elapsed_time = end_time - start_time
 
-            print(f"  📊 Success: {success_count}/{len(results)} operations")
-            print(
-                f"  💡 Note: Parallel async allows mixing different operation types efficiently!"
-            )
+        print(f"  ✅ All mixed operations completed!")
+        print(f"  ⏱️ Total time: {elapsed_time:.3f}s (parallel execution)")
 
-            return True, {
-                "elapsed_time": elapsed_time,
-                "success_count": success_count,
-                "total_operations": len(results),
-            }
+        operation_types = [
+            "Credit Check",
+            "List Voices",
+            "List Custom Voices",
+            "Predict 1",
+            "Predict 2",
+        ]
+        success_count = 0
 
-    except Exception as e:
-        import traceback
+        for i, (op_type, result) in enumerate(zip(operation_types, results)):
+            if isinstance(result, Exception):
+                print(f"     {op_type}: ❌ {type(result).__name__}")
+            else:
+                print(f"     {op_type}: ✅ Success")
+                success_count += 1
 
+        print(f"  📊 Success: {success_count}/{len(results)} operations")
+        print(
+            f"  💡 Note: Parallel async allows mixing different operation types efficiently!"
+        )
+
+        return True, {
+            "elapsed_time": elapsed_time,
+            "success_count": success_count,
+            "total_operations": len(results),
+        }
+
+    except Exception as e:
         print(f"  ❌ Unexpected error: {e}")
         print(f"  📋 Traceback:")
         traceback.print_exc()
@@ -3564,6 +3343,14 @@ async def test_mixed_parallel_operations(voice_id):
 
 async def main():
     """Main async integration test runner - all async API tests"""
+
+    # One client for the whole run so the HTTP connection pool is reused
+    async with Supertone(api_key=API_KEY) as client:
+        return await run_integration_tests(client)
+
+
+async def run_integration_tests(client):
+    """Run all async API tests against a shared client"""
     print("🧪 Async API Integration Test Started (All Async APIs)")
     print(f"🔑 API Key: {API_KEY[:8]}..." + "*" * 24)
     print("🔧 Authentication: HTTP Headers (x-sup-api-key)")
@@ -3577,53 +3364,53 @@ async def main():
     # 1. Credit and Usage Tests
     print("\n1️⃣ Credit and Usage Tests (Async)")
 
-    success, result = await test_credit_balance()
+    success, result = await test_credit_balance(client)
     test_results["get_credit_balance_async"] = success
 
     if not success:
         print("❌ API key authentication failed. Stopping tests.")
         return False
 
-    success, result = await test_get_usage()
+    success, result = await test_get_usage(client)
     test_results["get_usage_async"] = success
 
-    success, result = await test_get_voice_usage()
+    success, result = await test_get_voice_usage(client)
     test_results["get_voice_usage_async"] = success
 
     # 2. Voice Tests
     print("\n2️⃣ Voice Tests (Async)")
 
-    success, result = await test_list_voices()
+    success, result = await test_list_voices(client)
     test_results["list_voices_async"] = success
 
-    success, result = await test_search_voices()
+    success, result = await test_search_voices(client)
     test_results["search_voices_async"] = success
 
     if voice_id_for_tts:
-        success, result = await test_get_voice(voice_id_for_tts)
+        success, result = await test_get_voice(client, voice_id_for_tts)
         test_results["get_voice_async"] = success
 
     # 3. Custom Voice Tests
     print("\n3️⃣ Custom Voice Tests (Async)")
 
-    success, result = await test_list_custom_voices()
+    success, result = await test_list_custom_voices(client)
     test_results["list_custom_voices_async"] = success
     if success and result[1]:
         custom_voice_id = result[1]
 
-    success, result = await test_search_custom_voices()
+    success, result = await test_search_custom_voices(client)
     test_results["search_custom_voices_async"] = success
 
     if custom_voice_id:
-        success, result = await test_get_custom_voice(custom_voice_id)
+        success, result = await test_get_custom_voice(client, custom_voice_id)
         test_results["get_custom_voice_async"] = success
 
-        success, result = await test_edit_custom_voice(custom_voice_id)
+        success, result = await test_edit_custom_voice(client, custom_voice_id)
         test_results["edit_custom_voice_async"] = success
 
     # Custom Voice Creation Test
     print("\n🎨 Custom Voice Creation Test (Async)")
-    success, result = await test_create_cloned_voice()
+    success, result = await test_create_cloned_voice(client)
     test_results["create_cloned_voice_async"] = success
     if success and result:
         created_custom_voice_id = result.voice_id
@@ -3634,72 +3421,84 @@ async def main():
 
     if voice_id_for_tts:
         # Duration prediction (no credit consumption)
-        success, result = await test_predict_duration(voice_id_for_tts)
+        success, result = await test_predict_duration(client, voice_id_for_tts)
         test_results["predict_duration_async"] = success
 
         # Basic TTS (consumes credits)
         print("💳 TTS consumes credits.")
-        success, result = await test_create_speech(voice_id_for_tts)
+        success, result = await test_create_speech(client, voice_id_for_tts)
         test_results["create_speech_async"] = success
 
         # Voice settings TTS
-        success, result = await test_create_speech_with_voice_settings(voice_id_for_tts)
+        success, result = await test_create_speech_with_voice_settings(
+            client, voice_id_for_tts
+        )
         test_results["create_speech_with_voice_settings_async"] = success
 
         # Basic streaming TTS (WAV)
-        success, result = await test_stream_speech(voice_id_for_tts)
+        success, result = await test_stream_speech(client, voice_id_for_tts)
         test_results["stream_speech_async"] = success
 
         # Voice Settings Tests
         success, result = await test_predict_duration_with_voice_settings(
-            voice_id_for_tts
+            client, voice_id_for_tts
         )
         test_results["predict_duration_with_voice_settings_async"] = success
 
-        success, result = await test_stream_speech_with_voice_settings(voice_id_for_tts)
+        success, result = await test_stream_speech_with_voice_settings(
+            client, voice_id_for_tts
+        )
         test_results["stream_speech_with_voice_settings_async"] = success
 
         # 5. Phoneme Tests
         print("\n🔤 Phoneme Information TTS Tests (Async)")
 
         print("💳 Phoneme TTS consumes credits.")
-        success, result = await test_create_speech_with_phonemes(voice_id_for_tts)
+        success, result = await test_create_speech_with_phonemes(
+            client, voice_id_for_tts
+        )
         test_results["create_speech_with_phonemes_async"] = success
 
-        success, result = await test_stream_speech_with_phonemes(voice_id_for_tts)
+        success, result = await test_stream_speech_with_phonemes(
+            client, voice_id_for_tts
+        )
         test_results["stream_speech_with_phonemes_async"] = success
 
         # 6. Long Text Tests (WAV)
         print("\n5️⃣ Long Text Tests (300+ chars - WAV) (Async)")
-        success, result = await test_create_speech_long_text(voice_id_for_tts)
+        success, result = await test_create_speech_long_text(client, voice_id_for_tts)
         test_results["create_speech_long_text_async"] = success
 
-        success, result = await test_stream_speech_long_text(voice_id_for_tts)
+        success, result = await test_stream_speech_long_text(client, voice_id_for_tts)
         test_results["stream_speech_long_text_async"] = success
 
         # 7. MP3 Format Tests
         print("\n🎵 MP3 Format TTS Tests (Async)")
-        success, result = await test_create_speech_mp3(voice_id_for_tts)
+        success, result = await test_create_speech_mp3(client, voice_id_for_tts)
         test_results["create_speech_mp3_async"] = success
 
-        success, result = await test_create_speech_long_text_mp3(voice_id_for_tts)
+        success, result = await test_create_speech_long_text_mp3(
+            client, voice_id_for_tts
+        )
         test_results["create_speech_long_text_mp3_async"] = success
 
-        success, result = await test_stream_speech_mp3(voice_id_for_tts)
+        success, result = await test_stream_speech_mp3(client, voice_id_for_tts)
         test_results["stream_speech_mp3_async"] = success
 
-        success, result = await test_stream_speech_long_text_mp3(voice_id_for_tts)
+        success, result = await test_stream_speech_long_text_mp3(
+            client, voice_id_for_tts
+        )
         test_results["stream_speech_long_text_mp3_async"] = success
 
         # 8. Long Text + Phoneme Tests
         print("\n📜🔤 Long Text + Phoneme Tests (Async)")
         success, result = await test_create_speech_long_text_with_phonemes(
-            voice_id_for_tts
+            client, voice_id_for_tts
         )
         test_results["create_speech_long_text_with_phonemes_async"] = success
 
         success, result = await test_stream_speech_phoneme_chunking_wav(
-            voice_id_for_tts
+            client, voice_id_for_tts
         )
         test_results["stream_speech_phoneme_chunking_wav_async"] = success
 
@@ -3707,26 +3506,38 @@ async def main():
         print("\n6️⃣ New Model Tests (sona_speech_2, supertonic_api_1) (Async)")
 
         # TTS with sona_speech_2
-        success, result = await test_create_speech_sona_speech_2(voice_id_for_tts)
+        success, result = await test_create_speech_sona_speech_2(
+            client, voice_id_for_tts
+        )
         test_results["create_speech_sona_speech_2_async"] = success
 
         # TTS with supertonic_api_1
-        success, result = await test_create_speech_supertonic_api_1(voice_id_for_tts)
+        success, result = await test_create_speech_supertonic_api_1(
+            client, voice_id_for_tts
+        )
         test_results["create_speech_supertonic_api_1_async"] = success
 
         # Invalid model test
-        success, result = await test_create_speech_invalid_model(voice_id_for_tts)
+        success, result = await test_create_speech_invalid_model(
+            client, voice_id_for_tts
+        )
         test_results["create_speech_invalid_model_async"] = success
 
         # Duration prediction with new models
-        success, result = await test_predict_duration_sona_speech_2(voice_id_for_tts)
+        success, result = await test_predict_duration_sona_speech_2(
+            client, voice_id_for_tts
+        )
         test_results["predict_duration_sona_speech_2_async"] = success
 
-        success, result = await test_predict_duration_supertonic_api_1(voice_id_for_tts)
+        success, result = await test_predict_duration_supertonic_api_1(
+            client, voice_id_for_tts
+        )
         test_results["predict_duration_supertonic_api_1_async"] = success
 
         # Invalid model prediction test
-        success, result = await test_predict_duration_invalid_model(voice_id_for_tts)
+        success, result = await test_predict_duration_invalid_model(
+            client, voice_id_for_tts
+        )
         test_results["predict_duration_invalid_model_async"] = success
 
         # 10. Multi-language Tests by Model
@@ -3734,35 +3545,37 @@ async def main():
 
         # sona_speech_1 multilang (ko, en, ja)
         success, result = await test_create_speech_sona_speech_1_multilang(
-            voice_id_for_tts
+            client, voice_id_for_tts
         )
         test_results["create_speech_sona_speech_1_multilang_async"] = success
 
         # sona_speech_2 multilang (all languages)
         success, result = await test_create_speech_sona_speech_2_multilang(
-            voice_id_for_tts
+            client, voice_id_for_tts
         )
         test_results["create_speech_sona_speech_2_multilang_async"] = success
 
         # supertonic_api_1 multilang (ko, en, ja, es, pt)
         success, result = await test_create_speech_supertonic_api_1_multilang(
-            voice_id_for_tts
+            client, voice_id_for_tts
         )
         test_results["create_speech_supertonic_api_1_multilang_async"] = success
 
         # Unsupported language error tests
         success, result = await test_create_speech_sona_speech_1_unsupported_lang(
-            voice_id_for_tts
+            client, voice_id_for_tts
         )
         test_results["create_speech_sona_speech_1_unsupported_lang_async"] = success
 
         success, result = await test_create_speech_supertonic_api_1_unsupported_lang(
-            voice_id_for_tts
+            client, voice_id_for_tts
         )
         test_results["create_speech_supertonic_api_1_unsupported_lang_async"] = success
 
         # Duration prediction multilang test
-        success, result = await test_predict_duration_multilang(voice_id_for_tts)
+        success, result = await test_predict_duration_multilang(
+            client, voice_id_for_tts
+        )
         test_results["predict_duration_multilang_async"] = success
 
         # 11. Advanced Text Chunking Tests
@@ -3770,42 +3583,48 @@ async def main():
 
         # Long sentence word-based splitting (TTS)
         success, result = await test_create_speech_long_sentence_word_split(
-            voice_id_for_tts
+            client, voice_id_for_tts
         )
         test_results["create_speech_long_sentence_word_split_async"] = success
 
         # Japanese character-based splitting (TTS)
-        success, result = await test_create_speech_japanese_no_spaces(voice_id_for_tts)
+        success, result = await test_create_speech_japanese_no_spaces(
+            client, voice_id_for_tts
+        )
         test_results["create_speech_japanese_no_spaces_async"] = success
 
         # Long sentence word-based splitting (Streaming)
         success, result = await test_stream_speech_long_sentence_word_split(
-            voice_id_for_tts
+            client, voice_id_for_tts
         )
         test_results["stream_speech_long_sentence_word_split_async"] = success
 
         # Japanese character-based splitting (Streaming)
-        success, result = await test_stream_speech_japanese_no_spaces(voice_id_for_tts)
+        success, result = await test_stream_speech_japanese_no_spaces(
+            client, voice_id_for_tts
+        )
         test_results["stream_speech_japanese_no_spaces_async"] = success
 
         # 12. Concurrent/Parallel Tests (Async Power!)
         print("\n🚀 Concurrent/Parallel Tests (Async Power!)")
-        success, result = await test_concurrent_api_calls(voice_id_for_tts)
+        success, result = await test_concurrent_api_calls(client, voice_id_for_tts)
         test_results["concurrent_api_calls_async"] = success
 
-        success, result = await test_parallel_tts_conversion(voice_id_for_tts)
+        success, result = await test_parallel_tts_conversion(client, voice_id_for_tts)
         test_results["parallel_tts_conversion_async"] = success
 
-        success, result = await test_parallel_multiple_voices(voice_id_for_tts)
+        success, result = await test_parallel_multiple_voices(client, voice_id_for_tts)
         test_results["parallel_multiple_voices_async"] = success
 
-        success, result = await test_mixed_parallel_operations(voice_id_for_tts)
+        success, result = await test_mixed_parallel_operations(client, voice_id_for_tts)
         test_results["mixed_parallel_operations_async"] = success
 
     # 10. Custom Voice Deletion (run last)
     if created_custom_voice_id:
         print("\n🗑️ Created Custom Voice Deletion Test (Async)")
-        success, result = await test_delete_custom_voice(created_custom_voice_id)
+        success, result = await test_delete_custom_voice(
+            client, created_custom_voice_id
+        )
         test_results["delete_custom_voice_async"] = success
 
     # Results Summary